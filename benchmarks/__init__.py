@@ -0,0 +1,4 @@
+"""Benchmarks comparing rewritten subsystems with the code they replaced.
+
+Run them from the repository root as modules, e.g. ``python -m benchmarks.wordle_benchmark``.
+"""
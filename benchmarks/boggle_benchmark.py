@@ -0,0 +1,75 @@
+"""Boggle: solving a board once against checking every guess with its own search.
+
+For 4x4, 5x5 and 6x6 boards, times :func:`solve` and then scoring every word on the board,
+against the search per word the boards used before (``board_contains``, copied below).
+
+    python -m benchmarks.boggle_benchmark --boards 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import statistics
+import time
+
+from interactions.buttons.__boggle import solve
+from interactions.buttons.__constants import BIG, DIAGRAPHS, ORIGINAL, SUPER_BIG
+from interactions.buttons.__games_utils import BoardBoogle
+from utilities.lexicon import lexicon
+
+
+def board_contains(board: BoardBoogle, word: str, pos: tuple[int, int] | None = None, passed: list | None = None) -> bool:
+    passed = passed or []
+    if not word:
+        return True
+    if pos is None:
+        return any(board_contains(board, word, (col, row)) for col in range(board.size) for row in range(board.size))
+    if pos in passed:
+        return False
+
+    letter = board.columns[pos[0]][pos[1]]
+    letter = DIAGRAPHS.get(letter, letter)
+    if word[: len(letter)] != letter:
+        return False
+    for x, y in itertools.product(range(-1, 2), range(-1, 2)):
+        new = (pos[0] + x, pos[1] + y)
+        if (x or y) and 0 <= new[0] < board.size and 0 <= new[1] < board.size:
+            if board_contains(board, word[len(letter) :], new, [*passed, pos]):
+                return True
+    return False
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--boards", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'size':<6} {'words':>6} {'solve':>9} {'lookups':>9} {'per word DFS':>13}")
+    for size in (ORIGINAL, BIG, SUPER_BIG):
+        words, solved, lookups, searched = [], [], [], []
+        for _ in range(args.boards):
+            board = BoardBoogle(size=size)
+
+            start = time.perf_counter()
+            legal = solve(board.columns, lexicon("boggle"))
+            solved.append(time.perf_counter() - start)
+            board.legal_words = legal
+
+            start = time.perf_counter()
+            board.total_points(legal)
+            lookups.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            sum(1 for word in legal if word in lexicon("boggle") and board_contains(board, word))
+            searched.append(time.perf_counter() - start)
+            words.append(len(legal))
+
+        print(
+            f"{size}x{size:<4} {statistics.median(words):>6.0f} {statistics.median(solved) * 1000:>7.2f}ms "
+            f"{statistics.median(lookups) * 1000:>7.3f}ms {statistics.median(searched) * 1000:>11.2f}ms",
+        )
+
+
+if __name__ == "__main__":
+    main()
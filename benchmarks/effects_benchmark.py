@@ -0,0 +1,132 @@
+"""Avatar effects: the NumPy easterify and mosaic against the per pixel and per tile ones they replaced.
+
+Runs both over the same random 1024x1024 avatars (what ``apply_effect`` resizes every avatar
+to), checks that they give the same image, and times them on one core.
+
+    python -m benchmarks.effects_benchmark --avatars 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import time
+
+import numpy as np
+from PIL import Image, ImageOps
+
+from cogs.fun._effects import PfpEffects, easter_table
+
+
+def easterify(image: Image.Image, overlay_image: Image.Image | None = None) -> Image.Image:
+    """easterify_effect as it was: ``closest()`` per distinct colour and a list of pixel tuples."""
+    if overlay_image:
+        ratio = 64 / overlay_image.height
+        overlay_image = overlay_image.resize((round(overlay_image.width * ratio), round(overlay_image.height * ratio)))
+        overlay_image = overlay_image.convert("RGBA")
+    else:
+        overlay_image = Image.open("extra/easter/chocolate_bunny.png")
+
+    alpha = image.getchannel("A").getdata()
+    image = image.convert("RGB")
+    image = ImageOps.posterize(image, 6)
+
+    data = image.getdata()
+    data_set = set(data)
+    easterified_data_set = {x: PfpEffects.closest(x) for x in data_set}
+
+    new_pixel_data = [(*easterified_data_set[x], alpha[i]) if x in easterified_data_set else x for i, x in enumerate(data)]
+
+    im = Image.new("RGBA", image.size)
+    im.putdata(new_pixel_data)
+    im.alpha_composite(overlay_image, (im.width - overlay_image.width, (im.height - overlay_image.height) // 2))
+    return im
+
+
+def mosaic(img: Image.Image, squares: int) -> Image.Image:
+    """mosaic_effect as it was: a crop and a paste per tile."""
+    width, height = img.size
+    xy = math.sqrt(squares)
+    x_frac, y_frac = width // xy, height // xy
+    left, top, right, bottom = 0, 0, x_frac, y_frac
+
+    images = []
+    for index in range(squares):
+        images.append(img.crop((left, top, right, bottom)))
+        if (index + 1) % xy == 0:
+            top += y_frac
+            bottom += y_frac
+            left, right = 0, x_frac
+        else:
+            left += x_frac
+            right += x_frac
+
+    random.shuffle(images)
+    single_width, single_height = images[0].size
+    multiplier = int(math.sqrt(len(images)))
+    new_image = Image.new("RGBA", (multiplier * single_width, multiplier * single_height), (250, 250, 250))
+
+    width_multiplier = height = 0
+    for index, image in enumerate(images):
+        new_image.paste(image, (single_width * width_multiplier, height))
+        width_multiplier += 1
+        if (index + 1) % xy == 0:
+            width_multiplier = 0
+            height += single_height
+    return new_image
+
+
+def avatar(seed: int) -> Image.Image:
+    """Smooth gradients and noise: avatars have many distinct colours, which is the slow case."""
+    rng = np.random.default_rng(seed)
+    small = rng.integers(0, 256, (16, 16, 4), dtype=np.uint8)
+    image = Image.fromarray(small).resize((1024, 1024), Image.BICUBIC)
+    noise = rng.integers(-8, 9, (1024, 1024, 4))
+    return Image.fromarray(np.clip(np.asarray(image) + noise, 0, 255).astype(np.uint8))
+
+
+def distinct_colours(image: Image.Image) -> int:
+    """After posterizing to 6 bits, the legacy easterify calls ``closest()`` once for each."""
+    rgb = np.asarray(image)[..., :3].astype(np.int32) >> 2
+    return len(np.unique(rgb[..., 0] << 12 | rgb[..., 1] << 6 | rgb[..., 2]))
+
+
+def timed(func, images: list[Image.Image]) -> tuple[float, list[Image.Image]]:
+    start = time.perf_counter()
+    results = [func(image) for image in images]
+    return (time.perf_counter() - start) / len(images), results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--avatars", type=int, default=5)
+    parser.add_argument("--squares", type=int, default=100)
+    args = parser.parse_args()
+
+    images = [avatar(seed) for seed in range(args.avatars)]
+    colours = sum(distinct_colours(image) for image in images) // len(images)
+    print(f"{args.avatars} avatars, 1024x1024, {colours:,} colours each after posterizing")
+
+    start = time.perf_counter()
+    easter_table()
+    print(f"colour table (once)    {(time.perf_counter() - start) * 1e3:8.1f}ms")
+
+    old, old_images = timed(easterify, images)
+    new, new_images = timed(PfpEffects.easterify_effect, images)
+    same = all(a.tobytes() == b.tobytes() for a, b in zip(old_images, new_images, strict=True))
+    print(f"easterify  per pixel   {old * 1e3:8.1f}ms")
+    print(f"           numpy       {new * 1e3:8.1f}ms  {old / new:5.1f}x  identical: {same}")
+
+    for squares in (16, args.squares, 10_000):
+        random.seed(squares)
+        old, old_images = timed(lambda image, squares=squares: mosaic(image, squares), images)
+        random.seed(squares)
+        new, new_images = timed(lambda image, squares=squares: PfpEffects.mosaic_effect(image, squares), images)
+        same = all(a.tobytes() == b.tobytes() and a.size == b.size for a, b in zip(old_images, new_images, strict=True))
+        print(f"mosaic {squares:>6} per tile    {old * 1e3:8.1f}ms")
+        print(f"              numpy       {new * 1e3:8.1f}ms  {old / new:5.1f}x  identical: {same}")
+
+
+if __name__ == "__main__":
+    main()
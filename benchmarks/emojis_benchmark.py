@@ -0,0 +1,118 @@
+"""Emojis: the indexed database and codepoint trie against the regex alternations they replaced.
+
+Times ``import emojis`` plus the first ``count()`` in fresh interpreters, then ``count()`` on
+an ASCII, an Emoji heavy and a non-ASCII message with both, and checks they agree. The legacy
+module (copied below) is built from ``emojis/db/db.py``, which is what it imported.
+
+    python -m benchmarks.emojis_benchmark --runs 5
+"""
+
+from __future__ import annotations
+
+import time
+
+STARTED = time.perf_counter()
+
+import argparse  # noqa: E402
+import importlib.util  # noqa: E402
+import json  # noqa: E402
+import os  # noqa: E402
+import re  # noqa: E402
+import statistics  # noqa: E402
+import subprocess  # noqa: E402
+import sys  # noqa: E402
+import timeit  # noqa: E402
+
+DB_PATH = os.path.join("emojis", "db", "db.py")
+
+MESSAGES = {
+    "ascii": "Has anyone tried the new release yet? The changelog says the cache is a lot faster now, ok.",
+    "emoji": "gg 🎉🎉 that was close 😅 next time 🐍🔥 👍🏽 🇬🇧 ❤️",
+    "non-ascii": "Привет всем! Сегодня мы обсуждаем новый релиз, 日本語のテキストもあります。 Ça marche très bien, merci 🙂",
+}
+
+
+class LegacyEmojis:
+    """emojis.emojis as it was: two regex alternations over every Emoji, built at import."""
+
+    def __init__(self) -> None:
+        # the generated module, without importing the emojis package
+        spec = importlib.util.spec_from_file_location("legacy_emoji_db", DB_PATH)
+        assert spec is not None and spec.loader is not None
+        db = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(db)
+
+        alias_to_emoji = {f":{alias}:": emoji.emoji for emoji in db.EMOJI_DB for alias in emoji.aliases}
+        self.emoji_to_alias = {v: k for k, v in alias_to_emoji.items()}
+        emoji_sorted = sorted(alias_to_emoji.values(), key=len, reverse=True)
+
+        self.re_text_to_emoji = re.compile("({})".format("|".join(re.escape(emoji) for emoji in alias_to_emoji)))
+        self.re_emoji_to_text = re.compile("({})".format("|".join(re.escape(emoji) for emoji in emoji_sorted)))
+
+    def decode(self, msg: str) -> str:
+        return self.re_emoji_to_text.sub(lambda match: self.emoji_to_alias[match.group(0)], msg)
+
+    def get(self, msg: str) -> set[str]:
+        return {match.group() for match in self.re_emoji_to_text.finditer(msg)}
+
+    def count(self, msg: str, unique: bool = False) -> int:
+        if unique:
+            return len({match.group() for match in self.re_emoji_to_text.finditer(msg)})
+        return len([match.group() for match in self.re_emoji_to_text.finditer(msg)])
+
+
+def child(legacy: bool) -> None:
+    if legacy:
+        LegacyEmojis().count(MESSAGES["emoji"])
+    else:
+        import emojis  # noqa: PLC0415
+
+        emojis.count(MESSAGES["emoji"])
+    print(json.dumps(time.perf_counter() - STARTED))
+
+
+def cold_start(legacy: bool, runs: int) -> float:
+    times = []
+    argv = [sys.executable, "-m", "benchmarks.emojis_benchmark", "--child"]
+    for _ in range(runs):
+        process = subprocess.run([*argv, "--legacy"] if legacy else argv, capture_output=True, text=True, check=True)
+        times.append(json.loads(process.stdout.splitlines()[-1]))
+    return statistics.median(times)
+
+
+def per_call(func, message: str, number: int) -> float:
+    return min(timeit.repeat(lambda: func(message), number=number, repeat=5)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--legacy", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.legacy)
+        return
+
+    import emojis  # noqa: PLC0415
+
+    # both cold starts include this script's own imports, the difference is what matters
+    print(f"import + first count()  legacy {cold_start(True, args.runs) * 1e3:8.1f}ms")
+    print(f"                        index  {cold_start(False, args.runs) * 1e3:8.1f}ms")
+
+    legacy = LegacyEmojis()
+    for name, message in MESSAGES.items():
+        same = (
+            legacy.count(message) == emojis.count(message)
+            and legacy.get(message) == emojis.get(message)
+            and legacy.decode(message) == emojis.decode(message)
+        )
+        print(f"count() {name:<10} {len(message):>3} chars  {emojis.count(message):>2} emoji  same: {same}")
+        print(f"    legacy {per_call(legacy.count, message, args.number) * 1e6:8.1f}µs")
+        print(f"    index  {per_call(emojis.count, message, args.number) * 1e6:8.1f}µs")
+
+
+if __name__ == "__main__":
+    main()
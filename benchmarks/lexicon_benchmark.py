@@ -0,0 +1,94 @@
+"""Word lists: one shared lexicon against a list or tuple per game.
+
+For every word list, the memory of the list of ``str`` the games kept before against the
+lexicon, how long loading takes (compiling once, then memory-mapping), membership, and what
+starting a game cost before and after: Verbal Memory loaded the whole English word set per game,
+Wordle checked guesses against a tuple, hangman filtered a list.
+
+    python -m benchmarks.lexicon_benchmark
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from english_words import get_english_words_set
+
+from utilities import lexicon as lexicon_module
+from utilities.lexicon import SOURCES, Source, lexicon
+
+
+def timed(func: Callable[[], object], repeat: int = 1) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def allocated(func: Callable[[], object]) -> int:
+    tracemalloc.start()
+    kept = func()  # noqa: F841
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def row(name: str, source: Source, lookups: int) -> None:
+    words = sorted(set(filter(None, source.load())))
+    # strings and list, as the games kept them
+    list_size = allocated(lambda: sorted(set(filter(None, source.load()))))
+
+    lexicon_module._lexicons.clear()
+    compile_time = timed(lambda: lexicon(name))
+    lexicon_module._lexicons.clear()
+    mmap_time = timed(lambda: lexicon(name))
+    words_lexicon = lexicon(name)
+
+    probes = random.choices(words, k=lookups)
+    as_tuple = tuple(words)
+    in_tuple = timed(lambda: [word in as_tuple for word in probes[:200]]) / 200
+    in_lexicon = timed(lambda: [word in words_lexicon for word in probes]) / lookups
+    print(
+        f"{name:<8} {len(words):>7} {list_size / 1e6:>8.1f} {words_lexicon.nbytes / 1e6:>11.1f} "
+        f"{compile_time * 1e3:>7.0f}ms {mmap_time * 1e3:>6.2f}ms {in_tuple * 1e6:>7.1f}µs {in_lexicon * 1e6:>9.2f}µs",
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lookups", type=int, default=20000)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    lexicon_module.LEXICON_DIRECTORY = directory
+    try:
+        print(f"{'list':<8} {'words':>7} {'list MB':>8} {'lexicon MB':>11} {'compile':>9} {'mmap':>8} {'in tuple':>9} {'in lexicon':>11}")
+        for name, source in SOURCES.items():
+            row(name, source, args.lookups)
+
+        print()
+        english = lexicon("english")
+        print(
+            "verbal memory start   before "
+            f"{timed(lambda: random.choices(list(get_english_words_set(['web2'], alpha=True, lower=True)), k=300), 5) * 1e3:7.1f}ms"
+            f"   after {timed(lambda: random.choices(english, k=300), 100) * 1e3:7.3f}ms",
+        )
+        hangman_words = list(lexicon("hangman"))
+        hangman = lexicon("hangman")
+        print(
+            "hangman filter        before "
+            f"{timed(lambda: [w for w in hangman_words if 4 < len(w) < 9 and 2 < len(set(w)) < 7], 100) * 1e3:7.3f}ms"
+            f"   after {timed(lambda: hangman.view(min_length=5, max_length=8, predicate=lambda w: 2 < len(set(w)) < 7), 100) * 1e3:7.3f}ms",
+        )
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Perlin noise for the snakes cog: the NumPy factory against the per point one it replaced.
+
+Compares the distribution of both over the same points (they draw different gradients, so the
+values differ, the statistics should not), then times a frame of ``snakes draw`` and a
+200x200 noise field with both.
+
+    python -m benchmarks.perlin_benchmark --samples 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import statistics
+import time
+from itertools import product
+
+import numpy as np
+
+from interactions.buttons.snakes._utils import PerlinNoiseFactory, create_snek_frame, lerp, smoothstep
+
+
+class PointPerlinNoise:
+    """The per point factory as it was, a gradient dict and ``product()`` per lookup."""
+
+    def __init__(self, dimension: int, octaves: int = 1, tile: tuple[int, ...] = ()) -> None:
+        self.dimension = dimension
+        self.octaves = octaves
+        self.tile = tile + (0,) * dimension
+        self.scale_factor = 2 * dimension**-0.5
+        self.gradient: dict[tuple[int, ...], tuple[float, ...]] = {}
+
+    def _generate_gradient(self) -> tuple[float, ...]:
+        if self.dimension == 1:
+            return (random.uniform(-1, 1),)
+        random_point = [random.gauss(0, 1) for _ in range(self.dimension)]
+        scale = sum(n * n for n in random_point) ** -0.5
+        return tuple(coord * scale for coord in random_point)
+
+    def get_plain_noise(self, *point: float) -> float:
+        grid_coords = [(math.floor(coord), math.floor(coord) + 1) for coord in point]
+        dots = []
+        for grid_point in product(*grid_coords):
+            if grid_point not in self.gradient:
+                self.gradient[grid_point] = self._generate_gradient()
+            gradient = self.gradient[grid_point]
+            dots.append(sum(gradient[i] * (point[i] - grid_point[i]) for i in range(self.dimension)))
+
+        dim = self.dimension
+        while len(dots) > 1:
+            dim -= 1
+            s = smoothstep(point[dim] - grid_coords[dim][0])
+            next_dots = []
+            while dots:
+                next_dots.append(lerp(s, dots.pop(0), dots.pop(0)))
+            dots = next_dots
+        return dots[0] * self.scale_factor
+
+    def __call__(self, *point: float) -> float:
+        ret = 0.0
+        for o in range(self.octaves):
+            o2 = 1 << o
+            new_point = []
+            for i, coord in enumerate(point):
+                scaled = coord * o2
+                if self.tile[i]:
+                    scaled %= self.tile[i] * o2
+                new_point.append(scaled)
+            ret += self.get_plain_noise(*new_point) / o2
+        return ret / (2 - 2 ** (1 - self.octaves))
+
+
+def describe(values: list[float]) -> str:
+    quartiles = statistics.quantiles(values, n=4)
+    return (
+        f"mean {statistics.fmean(values):+.3f} stdev {statistics.stdev(values):.3f} "
+        f"quartiles {quartiles[0]:+.3f} {quartiles[1]:+.3f} {quartiles[2]:+.3f} "
+        f"range {min(values):+.3f} {max(values):+.3f}"
+    )
+
+
+def timed(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=20000)
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args()
+
+    for dimension, octaves in ((1, 2), (2, 1), (2, 4), (3, 2)):
+        points = np.random.default_rng(0).uniform(0, 50, (args.samples, dimension))
+        # the distribution over many independent gradient sets, not one
+        old: list[float] = []
+        new: list[float] = []
+        for chunk in np.array_split(points, 20):
+            point_noise = PointPerlinNoise(dimension, octaves)
+            old.extend(point_noise(*point) for point in chunk.tolist())
+            new.extend(PerlinNoiseFactory(dimension, octaves)(chunk).tolist())
+        print(f"{dimension}D, {octaves} octaves")
+        print(f"  per point {describe(old)}")
+        print(f"  numpy     {describe(new)}")
+
+    print()
+    lookups = [(i + 1) / 23 for i in range(22)]
+    point_noise = PointPerlinNoise(1, 2)
+    factory = PerlinNoiseFactory(1, 2)
+    print(f"22 angle lookups    per point {timed(lambda: [point_noise.get_plain_noise(x) for x in lookups], args.frames) * 1e6:8.1f}µs")
+    print(f"                    numpy     {timed(lambda: factory.get_plain_noise(np.array(lookups)[:, None]), args.frames) * 1e6:8.1f}µs")
+    print(f"snakes draw frame   numpy     {timed(lambda: create_snek_frame(factory), args.frames) * 1e3:8.2f}ms")
+
+    field = np.stack(np.meshgrid(np.linspace(0, 8, 200), np.linspace(0, 8, 200)), axis=-1).reshape(-1, 2)
+    point_noise = PointPerlinNoise(2, 2)
+    factory = PerlinNoiseFactory(2, 2)
+    print(f"200x200 field       per point {timed(lambda: [point_noise(*p) for p in field.tolist()], 1) * 1e3:8.1f}ms")
+    print(f"                    numpy     {timed(lambda: factory(field), 10) * 1e3:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Cold start benchmark: how long until the bot is ready, over a few fresh processes.
+
+Needs the same environment as main.py (token, database). Every run is a new interpreter, so
+nothing is imported yet; it logs in, waits until READY and the deferred warm ups are done,
+prints its timings and exits.
+
+    python -m benchmarks.startup_benchmark --runs 5
+"""
+
+from __future__ import annotations
+
+import time
+
+STARTED = time.perf_counter()
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+import json  # noqa: E402
+import statistics  # noqa: E402
+import subprocess  # noqa: E402
+import sys  # noqa: E402
+
+MILESTONES = ("import", "extensions", "ready", "warm")
+
+
+async def child() -> None:
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    from core import Parrot
+    from updater import init
+    from utilities.config import DATABASE_KEY, DATABASE_URI, MINIMAL_BOOT, TOKEN
+
+    imported = time.perf_counter() - STARTED
+    last = "ready" if MINIMAL_BOOT else "warm"
+
+    bot = Parrot()
+    async with bot:
+        bot.sql = await init()
+        bot.mongo = AsyncIOMotorClient(DATABASE_URI.format(DATABASE_KEY))
+        await bot.init_db()
+
+        runner = asyncio.create_task(bot.start(TOKEN))
+        reached = asyncio.create_task(bot.startup.reached(last).wait())
+        # the runner only finishes first if the bot could not start
+        await asyncio.wait((runner, reached), return_when=asyncio.FIRST_COMPLETED)
+        reached.cancel()
+
+        offset = bot.startup.started - STARTED
+        result = {
+            "import": imported,
+            **{name: offset + elapsed for name, elapsed in bot.startup.milestones.items()},
+            "slowest": [(timing.name, round(timing.total, 3)) for timing in bot.startup.slowest(5)],
+        }
+        print(json.dumps(result))
+        await bot.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        asyncio.run(child())
+        return
+
+    from tabulate import tabulate
+
+    runs = []
+    for run in range(1, args.runs + 1):
+        process = subprocess.run([sys.executable, "-m", "benchmarks.startup_benchmark", "--child"], capture_output=True, text=True, check=False)
+        lines = [line for line in process.stdout.splitlines() if line.startswith("{")]
+        if process.returncode or not lines:
+            print(f"run {run} failed:\n{process.stderr[-2000:]}")
+            continue
+        runs.append(json.loads(lines[-1]))
+
+    if not runs:
+        sys.exit(1)
+
+    rows = [[index, *(f"{data[name]:.2f}s" if name in data else "-" for name in MILESTONES)] for index, data in enumerate(runs, 1)]
+    rows.append(
+        [
+            "median",
+            *(
+                f"{statistics.median(data[name] for data in runs if name in data):.2f}s" if any(name in data for data in runs) else "-"
+                for name in MILESTONES
+            ),
+        ],
+    )
+    print(tabulate(rows, headers=["run", *MILESTONES]))
+    print("\nslowest extensions of the last run:", ", ".join(f"{name} {elapsed}s" for name, elapsed in runs[-1]["slowest"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""How long dispatching one message takes with many pending ``wait_for``.
+
+Compares discord.py's own ``wait_for`` (every pending check runs on every event) with
+:class:`utilities.wait_for.WaitRegistry` (only the checks of the event's channel and user run).
+Every wait is a game waiting for its player in its own channel, as most of the bot's are.
+
+    python -m benchmarks.wait_for_benchmark --waits 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+
+import discord
+from utilities.wait_for import WaitRegistry
+
+
+def message(channel_id: int, author_id: int) -> SimpleNamespace:
+    return SimpleNamespace(channel=SimpleNamespace(id=channel_id), author=SimpleNamespace(id=author_id), content="e4")
+
+
+def make_check(channel_id: int, author_id: int):
+    def check(m: SimpleNamespace) -> bool:
+        return m.channel.id == channel_id and m.author.id == author_id and m.content == "e4"
+
+    return check
+
+
+async def run(waits: int, events: int) -> None:
+    client = discord.Client(intents=discord.Intents.none())
+    registry = WaitRegistry()
+    # nobody is playing in the channel the messages come from
+    unrelated = [message(waits + i % 50, waits + i % 50) for i in range(events)]
+
+    async with client:
+        pending = []
+        for i in range(waits):
+            pending.append(client.wait_for("message", check=make_check(i, i), timeout=60))
+            pending.append(registry.wait_for("message", check=make_check(i, i), timeout=60, channel_id=i, user_id=i))
+        tasks = [asyncio.ensure_future(wait) for wait in pending]
+        await asyncio.sleep(0)
+
+        start = time.perf_counter()
+        for event in unrelated:
+            client.dispatch("message", event)
+        discord_py = (time.perf_counter() - start) / events
+
+        start = time.perf_counter()
+        for event in unrelated:
+            registry.dispatch("message", (event,))
+        indexed = (time.perf_counter() - start) / events
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    print(f"{waits} pending waits, {events} messages")
+    print(f"discord.py   {discord_py * 1e6:>9.1f}µs per message")
+    print(f"WaitRegistry {indexed * 1e6:>9.1f}µs per message, {registry.checks} checks run")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--waits", type=int, default=1000)
+    parser.add_argument("--events", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(run(args.waits, args.events))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Wordle: drawing only the new row on cached tiles against redrawing the grid every guess.
+
+Plays games of six guesses and renders the grid after each one, with :class:`Wordle` and with
+the full redraw it replaced (copied below), on one core.
+
+    python -m benchmarks.wordle_benchmark --games 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from io import BytesIO
+
+from PIL import Image, ImageDraw, ImageFont
+
+from interactions.buttons.__wordle import BORDER, HEIGHT, LGRAY, SPACE, SQ, WIDTH, Wordle
+from utilities.lexicon import lexicon
+
+
+class FullRedraw(Wordle):
+    def __init__(self, *, text_size: int = 55) -> None:
+        super().__init__(text_size=text_size)
+        self._font = ImageFont.truetype(r"extra/HelveticaNeuBold.ttf", self._text_size)
+
+    def render_image(self) -> BytesIO:
+        with Image.new("RGB", (WIDTH, HEIGHT), (255, 255, 255)) as img:
+            cursor = ImageDraw.Draw(img)
+
+            x = y = BORDER
+            for i in range(6):
+                for j in range(5):
+                    try:
+                        letter = self.guesses[i][j]
+                        color = letter["color"]
+                        act_letter = letter["letter"]
+                    except (IndexError, KeyError):
+                        cursor.rectangle((x, y, x + SQ, y + SQ), outline=LGRAY, width=4)
+                    else:
+                        cursor.rectangle((x, y, x + SQ, y + SQ), width=0, fill=color)
+                        cursor.text(
+                            (x + SQ / 2, y + SQ / 2),
+                            act_letter.upper(),
+                            font=self._font,
+                            anchor="mm",
+                            fill=(255, 255, 255),
+                        )
+
+                    x += SQ + SPACE
+                x = BORDER
+                y += SQ + SPACE
+
+            buf = BytesIO()
+            img.save(buf, "PNG")
+        buf.seek(0)
+        return buf
+
+
+def play(game_class: type[Wordle], games: int) -> tuple[float, float, int]:
+    """Games started and guesses rendered per second, and the size of the last image."""
+    words = lexicon("wordle")
+    starts = guesses = 0.0
+    size = 0
+    for _ in range(games):
+        start = time.perf_counter()
+        game = game_class()
+        game.render_image()
+        starts += time.perf_counter() - start
+
+        for _ in range(6):
+            game.parse_guess(random.choice(words))
+            start = time.perf_counter()
+            size = len(game.render_image().getvalue())
+            guesses += time.perf_counter() - start
+    return games / starts, games * 6 / guesses, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=50)
+    args = parser.parse_args()
+
+    # warm the caches, as a running bot has them
+    play(Wordle, 1)
+    print(f"{'renderer':<12} {'games/s':>8} {'guesses/s':>10} {'PNG KB':>7}")
+    for name, game_class in (("full redraw", FullRedraw), ("incremental", Wordle)):
+        started, rendered, size = play(game_class, args.games)
+        print(f"{name:<12} {started:>8.0f} {rendered:>10.0f} {size / 1024:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-import base64
-import binascii
 import os
-import re
 from contextlib import suppress
 
 import yarl
@@ -12,8 +9,10 @@ import yarl
 import discord
 from core import Cog, Context, Parrot
 from discord.ext import commands
+from utilities.message_pipeline import MessageContext
+
+from .tokens import Finding, SeenTokens, TokenReporter, find_tokens
 
-TOKEN_REGEX = re.compile(r"[a-zA-Z0-9_-]{23,28}\.[a-zA-Z0-9_-]{6,7}\.[a-zA-Z0-9_-]{27,}")
 DISCORD_PY_ID = 336642139381301249
 
 
@@ -33,28 +32,26 @@ class GistContent:
                 self.source = code.rstrip("`").replace("```", "")
 
 
-def validate_token(token: str) -> bool:
-    try:
-        # Just check if the first part validates as a user ID
-        (user_id, _, _) = token.split(".")
-        user_id = int(base64.b64decode(f"{user_id}==", validate=True))
-    except (ValueError, binascii.Error):
-        return False
-    else:
-        return True
-
-
 class Gist(Cog, command_attrs={"hidden": True}):
     def __init__(self, bot: Parrot) -> None:
         self.bot = bot
         self._req_lock = asyncio.Lock()
         self.token = os.environ["GITHUB_TOKEN"]
 
-        self.__internal_token_caching = set()
+        self.seen_tokens = SeenTokens(bot.sql)
+        self.token_reporter = TokenReporter(
+            lambda content: self.create_gist(content, description="Discord tokens detected"),
+            self._notify_tokens,
+            on_flush=self.seen_tokens.flush,
+        )
+
+    async def cog_load(self) -> None:
+        await self.seen_tokens.load()
+        self.bot.message_pipeline.register("tokens", self._token_stage, order=5, budget=0.05, bots=True)
 
-    @property
-    def internal_token_cache(self) -> set[str]:
-        return self.__internal_token_caching
+    async def cog_unload(self) -> None:
+        self.bot.message_pipeline.unregister("tokens")
+        await self.token_reporter.close()
 
     async def github_request(self, method, url, *, params=None, data=None, headers=None, repo=None):
         hdrs = {
@@ -114,43 +111,32 @@ class Gist(Cog, command_attrs={"hidden": True}):
         return js["html_url"]
 
     def get_tokens(self, argument: str) -> list[str]:
-        return [token for token in TOKEN_REGEX.findall(argument) if validate_token(token)]
+        return find_tokens(argument)
 
-    @Cog.listener()
-    async def on_message(self, message: discord.Message) -> None:
-        await self.bot.wait_until_ready()
-        if not message.guild or message.guild.id == DISCORD_PY_ID:
+    async def _token_stage(self, ctx: MessageContext) -> None:
+        message = ctx.message
+        if message.guild.id == DISCORD_PY_ID:
             return
 
-        tokens = self.get_tokens(message.content)
+        tokens = find_tokens(ctx.content)
         if not tokens:
             return
 
-        if all(token in self.__internal_token_caching for token in tokens):
-            return
+        tokens = await self.seen_tokens.unseen(tokens)
+        if tokens:
+            self.token_reporter.add(Finding(tokens, message.channel.id, message.author.id))
 
-        _qs = ", ".join(["?" for _ in range(len(tokens))])
-        result = await self.bot.sql.execute(
-            f"""SELECT token FROM discord_tokens WHERE token IN ({_qs})""",
-            (*tokens,),
-        )
-        if await result.fetchall():
+    async def _notify_tokens(self, channel_id: int, author_ids: list[int], url: str) -> None:
+        channel = self.bot.get_channel(channel_id)
+        if channel is None:
             return
 
-        if tokens and message.author.id != self.bot.user.id:
-            url = await self.create_gist("\n".join(tokens), description="Discord tokens detected")
-            msg = f"{message.author.mention}, found tokens and sent them to <{url}> to be invalidated for you."
-            self.__internal_token_caching.update(set(tokens))
-
-            with suppress(discord.HTTPException):
-                await message.channel.send(msg)
-        await asyncio.gather(self.add_to_caching_db(tokens))
-
-    async def add_to_caching_db(self, tokens: list[str]):
-        asqlite = self.bot.sql
-        query = """INSERT INTO discord_tokens (token) VALUES (?) ON CONFLICT DO NOTHING"""
-        await asqlite.executemany(query, [tuple(tokens)])
-        await asqlite.commit()
+        mentions = ", ".join(f"<@{author_id}>" for author_id in author_ids)
+        with suppress(discord.HTTPException):
+            await channel.send(
+                f"{mentions}, found tokens and sent them to <{url}> to be invalidated for you.",
+                allowed_mentions=discord.AllowedMentions(users=True),
+            )
 
     @commands.group(name="gist")
     @commands.is_owner()
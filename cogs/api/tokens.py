@@ -0,0 +1,228 @@
+"""Finds Discord tokens in messages and reports them to a gist so they get invalidated.
+
+Most messages are rejected before any regex runs: a token is at least 58 characters long and has
+two dots. Seen tokens are remembered in a small LRU in front of a Bloom filter over the
+``discord_tokens`` table, so the database is only asked about tokens that might have been seen
+before. New tokens are written in batches, and every token found within a window goes into a
+single gist, so a raid that pastes the same token in a hundred channels creates one gist.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import binascii
+import hashlib
+import logging
+import math
+import re
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TYPE_CHECKING, NamedTuple
+
+from lru import LRU
+
+if TYPE_CHECKING:
+    from utilities.sqlite import Database
+
+log = logging.getLogger("cogs.api.tokens")
+
+__all__ = ("MIN_TOKEN_LENGTH", "TOKEN_REGEX", "BloomFilter", "Finding", "SeenTokens", "TokenReporter", "find_tokens", "validate_token")
+
+# user id (base64 of a decimal snowflake, so it starts with M, N or O) . timestamp . hmac
+TOKEN_REGEX = re.compile(r"(?<![\w-])[MNO][a-zA-Z0-9_-]{22,27}\.[a-zA-Z0-9_-]{6,7}\.[a-zA-Z0-9_-]{27,}")
+MIN_TOKEN_LENGTH = 23 + 1 + 6 + 1 + 27
+
+
+def validate_token(token: str) -> bool:
+    try:
+        # Just check if the first part validates as a user ID
+        (user_id, _, _) = token.split(".")
+        user_id = int(base64.b64decode(f"{user_id}==", validate=True))
+    except (ValueError, binascii.Error):
+        return False
+    else:
+        return True
+
+
+def find_tokens(content: str) -> list[str]:
+    """Every valid looking token in ``content``, without duplicates, in order."""
+    if len(content) < MIN_TOKEN_LENGTH or content.count(".") < 2:
+        return []
+    return list(dict.fromkeys(token for token in TOKEN_REGEX.findall(content) if validate_token(token)))
+
+
+class BloomFilter:
+    """A Bloom filter over strings. ``in`` is never wrong about a string that was added."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def __repr__(self) -> str:
+        return f"<BloomFilter size={self.size} hashes={self.hashes}>"
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little")
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class SeenTokens:
+    """The tokens already reported, in memory and in the ``discord_tokens`` table.
+
+    New tokens are held in memory and written with :meth:`flush`, in one ``executemany``, once
+    they were reported: a token in the table is never reported again, even after a restart.
+    """
+
+    def __init__(self, db: Database, *, capacity: int = 2**16, cache_size: int = 2**10) -> None:
+        self.db = db
+
+        self._recent: LRU = LRU(cache_size)
+        self._bloom = BloomFilter(capacity)
+        self._pending: list[str] = []
+        self.database_lookups = 0
+
+    def __repr__(self) -> str:
+        return f"<SeenTokens pending={len(self._pending)} lookups={self.database_lookups}>"
+
+    async def load(self) -> int:
+        """Fill the Bloom filter from the table, returns the number of tokens."""
+        rows = await self.db.fetchall("SELECT token FROM discord_tokens")
+        for (token,) in rows:
+            self._bloom.add(token)
+        return len(rows)
+
+    async def unseen(self, tokens: list[str]) -> list[str]:
+        """The tokens of ``tokens`` that were never seen before, and remember them."""
+        maybe_seen = [token for token in tokens if token not in self._recent and token in self._bloom]
+        known: set[str] = set()
+        if maybe_seen:
+            self.database_lookups += 1
+            placeholders = ", ".join("?" * len(maybe_seen))
+            rows = await self.db.fetchall(f"SELECT token FROM discord_tokens WHERE token IN ({placeholders})", maybe_seen)
+            known = {token for (token,) in rows}
+            # still waiting to be written
+            known.update(token for token in maybe_seen if token in self._pending)
+
+        new = []
+        for token in tokens:
+            if token in self._recent:
+                continue
+            self._recent[token] = True
+            if token in known:
+                continue
+
+            new.append(token)
+            self._bloom.add(token)
+            self._pending.append(token)
+        return new
+
+    async def flush(self, tokens: Iterable[str] | None = None) -> None:
+        """Write the pending tokens to the table, only those in ``tokens`` if given."""
+        if tokens is None:
+            written, self._pending = self._pending, []
+        else:
+            reported = set(tokens)
+            written = [token for token in self._pending if token in reported]
+            self._pending = [token for token in self._pending if token not in reported]
+        if not written:
+            return
+
+        await self.db.executemany(
+            "INSERT INTO discord_tokens (token) VALUES (?) ON CONFLICT DO NOTHING",
+            [(token,) for token in written],
+        )
+        await self.db.commit()
+
+
+class Finding(NamedTuple):
+    tokens: list[str]
+    channel_id: int
+    author_id: int
+
+
+class TokenReporter:
+    """Collects findings for ``window`` seconds and reports all of them with one gist.
+
+    ``create_gist(content)`` returns the url of the gist. ``notify(channel_id, author_ids, url)``
+    is called once per channel with the authors whose tokens were found there.
+    ``on_flush(tokens)`` is called with the tokens of a gist once it exists.
+    """
+
+    def __init__(
+        self,
+        create_gist: Callable[[str], Awaitable[str]],
+        notify: Callable[[int, list[int], str], Awaitable[None]],
+        *,
+        window: float = 5,
+        on_flush: Callable[[list[str]], Awaitable[None]] | None = None,
+    ) -> None:
+        self.create_gist = create_gist
+        self.notify = notify
+        self.window = window
+        self.on_flush = on_flush
+
+        self._findings: list[Finding] = []
+        self._task: asyncio.Task[None] | None = None
+        self.gists = 0
+
+    def __repr__(self) -> str:
+        return f"<TokenReporter pending={len(self._findings)} gists={self.gists}>"
+
+    def add(self, finding: Finding) -> None:
+        self._findings.append(finding)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._report_later())
+
+    async def _report_later(self) -> None:
+        # a failed gist keeps its findings, they are tried again after another window
+        while True:
+            await asyncio.sleep(self.window)
+            if await self.report():
+                return
+
+    async def report(self) -> bool:
+        """Report everything collected so far, right away.
+
+        Returns ``False`` if the gist could not be created. The findings are kept for the next
+        report then, and ``on_flush`` waits until they are reported.
+        """
+        findings, self._findings = self._findings, []
+        if not findings:
+            return True
+
+        tokens = list(dict.fromkeys(token for finding in findings for token in finding.tokens))
+        try:
+            url = await self.create_gist("\n".join(tokens))
+        except Exception:
+            log.exception("Failed to create a gist for %s tokens", len(tokens))
+            self._findings = findings + self._findings
+            return False
+        if self.on_flush is not None:
+            await self.on_flush(tokens)
+        self.gists += 1
+
+        authors: dict[int, list[int]] = {}
+        for finding in findings:
+            channel_authors = authors.setdefault(finding.channel_id, [])
+            if finding.author_id not in channel_authors:
+                channel_authors.append(finding.author_id)
+
+        await asyncio.gather(
+            *(self.notify(channel_id, author_ids, url) for channel_id, author_ids in authors.items()),
+            return_exceptions=True,
+        )
+        return True
+
+    async def close(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        await self.report()
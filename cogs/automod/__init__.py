@@ -6,6 +6,7 @@ from typing import TypedDict
 import discord
 from core import Cog, Context, Parrot
 from discord.ext import commands
+from utilities.message_pipeline import MessageContext
 
 from .parsers import Action, Condition, Trigger
 from .views import Automod
@@ -119,12 +120,17 @@ class AutomaticModeration(Cog):
         return discord.PartialEmoji(name="\N{SHIELD}")
 
     async def cog_load(self) -> None:
+        self.bot.message_pipeline.register("automod", self._automod_stage, order=10, budget=0.5, bots=True)
+
         if self._was_ready:
             return
 
         self._was_ready = True
         await self.bot.loop.create_task(self.__cache_build())
 
+    async def cog_unload(self) -> None:
+        self.bot.message_pipeline.unregister("automod")
+
     async def __cache_build(self):
         for guild in self.bot.guilds:
             await self.ensure_configuration_cache(guild.id)
@@ -178,17 +184,18 @@ class AutomaticModeration(Cog):
         if after.guild is None and after.author.id == self.bot.user.id:
             return
 
-        return await self.on_message(after)
+        await self.check_message(after)
 
-    @Cog.listener()
-    async def on_message(self, message: discord.Message) -> None:
+    async def check_message(self, message: discord.Message) -> bool:
+        """Run the automod rules of the guild on ``message``. Returns whether the message was deleted."""
         if message.guild is None or message.author.id == self.bot.user.id:
-            return
+            return False
 
         data = self.auto_mod.get(message.guild.id)
         if not data:
-            return
+            return False
 
+        deleted = False
         for _rule_name, rule_data in data.items():
             trigger: Trigger = rule_data["trigger"]
             condition: Condition = rule_data["condition"]
@@ -199,6 +206,13 @@ class AutomaticModeration(Cog):
                 action: Action = rule_data["action"]
 
                 await action.execute(message=message, member=message.author)
+                deleted = deleted or action.deletes_message
+
+        return deleted
+
+    async def _automod_stage(self, ctx: MessageContext) -> None:
+        if await self.check_message(ctx.message):
+            ctx.deleted = True
 
     @Cog.listener()
     async def on_member_join(self, member: discord.Member) -> None:
@@ -165,6 +165,10 @@ class Action:
     def __repr__(self) -> str:
         return f"<Action data={self.data}>"
 
+    @property
+    def deletes_message(self) -> bool:
+        return any(action["type"] in ("delete_message", "delete_multiple_messages") for action in self.data)
+
     async def execute(self, **kw) -> None:
         for action in self.data:
             func = getattr(self, action["type"], None)
@@ -11,6 +11,7 @@ from jinja2.sandbox import SandboxedEnvironment
 import discord
 from core import Cog, Context, Parrot
 from discord.ext import commands, tasks
+from utilities.message_pipeline import MessageContext
 
 from .jinja_help import TOPICS
 from .variables import Variables
@@ -52,11 +53,16 @@ class AutoResponders(Cog):
         )
 
     async def cog_load(self):
+        self.bot.message_pipeline.register("autoresponder", self._autoresponder_stage, order=50, budget=1, background=True)
         self.check_autoresponders.start()
+        self.bot.startup.defer("autoresponder", self.load_autoresponders)
+
+    async def load_autoresponders(self) -> None:
         async for guild_data in self.bot.guild_configurations.find({"autoresponder": {"$exists": True}}):
             self.cache[guild_data["_id"]] = guild_data["autoresponder"]
 
     async def cog_unload(self):
+        self.bot.message_pipeline.unregister("autoresponder")
         self.check_autoresponders.cancel()
 
     @commands.group(name="autoresponder", aliases=["ar"], invoke_without_command=True)
@@ -324,9 +330,9 @@ class AutoResponders(Cog):
         if ctx.guild.id not in self.cache:
             self.cache[ctx.guild.id] = self.bot.guild_configurations_cache[ctx.guild.id].get("autoresponder", {})
 
-    @Cog.listener()
-    async def on_message(self, message: discord.Message) -> None:
-        if message.guild is None or message.author.bot or not self.cache.get(message.guild.id):
+    async def _autoresponder_stage(self, ctx: MessageContext) -> None:
+        message = ctx.message
+        if not self.cache.get(message.guild.id):
             return
 
         assert isinstance(message.author, discord.Member)
@@ -341,7 +347,7 @@ class AutoResponders(Cog):
             if message.channel.id in data.get("ignore_channel", []):
                 continue
 
-            if any(role.id in data.get("ignore_role", []) for role in message.author.roles):
+            if not ctx.role_ids.isdisjoint(data.get("ignore_role", [])):
                 continue
 
             response = data["response"]
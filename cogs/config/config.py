@@ -699,7 +699,7 @@ class Configuration(Cog):
                 return m.author == ctx.author and m.channel == ctx.channel
 
             try:
-                msg: discord.Message = await self.bot.wait_for("message", check=check, timeout=60)
+                msg: discord.Message = await self.bot.wait_for("message", check=check, timeout=60, channel=ctx.channel, user=ctx.author)
                 return msg.content.lower()
             except asyncio.TimeoutError as e:
                 err = f"{ctx.author.mention} You took too long to respond!"
@@ -806,7 +806,7 @@ class Configuration(Cog):
                 return m.author == ctx.author and m.channel == ctx.channel
 
             try:
-                msg: discord.Message = await ctx.wait_for("message", check=check, timeout=60)
+                msg: discord.Message = await ctx.wait_for("message", check=check, timeout=60, channel=ctx.channel, user=ctx.author)
                 return msg.content.lower()
             except asyncio.TimeoutError as e:
                 err = f"{ctx.author.mention} You took too long to respond!"
@@ -1,12 +1,24 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import TYPE_CHECKING, Literal
 
 import discord
 from core import Cog, Context, Parrot
 from discord.ext import commands
 
+from .planner import (
+    ChannelState,
+    Plan,
+    PlanResult,
+    Snapshot,
+    apply_plan,
+    channel_states,
+    legacy_snapshot,
+    plan_level,
+    plan_restore,
+)
 from .settings import ACTION_SETTINGS, DEFCON_SETTINGS
 
 if TYPE_CHECKING:
@@ -91,103 +103,39 @@ class DefensiveCondition(Cog):
 
         return embed
 
-    async def defcon_set(self, ctx: Context, level: int) -> None:
-        # sourcery skip: use-named-expression
+    async def _snapshot(self, guild: discord.Guild, states: list[ChannelState]) -> Snapshot:
+        guild_config = await self.bot.guild_configurations.find_one({"_id": guild.id}) or {}
+        default_defcon = guild_config.get("default_defcon") or {}
+        if "snapshot" in default_defcon:
+            return default_defcon["snapshot"]
+        return legacy_snapshot(
+            states,
+            hidden=default_defcon.get("hidden_channels", []),
+            locked=default_defcon.get("locked_channels", []),
+        )
+
+    async def defcon_plan(self, guild: discord.Guild, level: int | None) -> Plan:
+        """What setting ``level`` (or resetting, if ``None``) would change, without changing it."""
+        states = channel_states(guild)
+        if level is None:
+            return plan_restore(states, await self._snapshot(guild, states))
+        return plan_level(states, DEFCON_SETTINGS[level]["SETTINGS"])
+
+    async def defcon_set(self, ctx: Context, level: int) -> PlanResult:
         """Set the level of defcon."""
-        channel_hidded = []
-        settings = DEFCON_SETTINGS[level]["SETTINGS"]
-        if settings.get("HIDE_CHANNELS"):
-            for channel in ctx.guild.channels:
-                if channel.permissions_for(ctx.guild.default_role).read_messages:
-                    try:
-                        overwrite = channel.overwrites_for(ctx.guild.default_role)
-                        overwrite.update(read_messages=False)
-                        await self.bot.wait_until_ready()
-                        await channel.set_permissions(
-                            ctx.guild.default_role,
-                            overwrite=overwrite,
-                            reason=f"Setting DEFON {level}. Invoked by {ctx.author}",
-                        )
-                        channel_hidded.append(channel.id)
-                    except discord.Forbidden:
-                        log.warning(
-                            "failed to hide channel %s in guild %s",
-                            channel.id,
-                            ctx.guild.id,
-                        )
-
-        if channel_hidded:
-            await self.bot.guild_configurations.update_one(
-                {"_id": ctx.guild.id},
-                {"$set": {"default_defcon.hidden_channels": channel_hidded}},
-                upsert=True,
-            )
+        states = channel_states(ctx.guild)
+        plan = plan_level(states, DEFCON_SETTINGS[level]["SETTINGS"])
 
-        channel_locked = []
-        if settings.get("LOCK_VOICE_CHANNELS"):
-            for channel in ctx.guild.voice_channels:
-                if channel.permissions_for(ctx.guild.default_role).connect:
-                    try:
-                        overwrite = channel.overwrites_for(ctx.guild.default_role)
-                        overwrite.update(connect=False)
-                        await self.bot.wait_until_ready()
-                        await channel.set_permissions(
-                            ctx.guild.default_role,
-                            overwrite=overwrite,
-                            reason=f"Setting DEFCON {level}. Invoked by {ctx.author}",
-                        )
-                        channel_locked.append(channel.id)
-                    except discord.Forbidden:
-                        log.warning(
-                            "failed to lock channel %s in guild %s",
-                            channel.id,
-                            ctx.guild.id,
-                        )
-
-        if settings.get("LOCK_TEXT_CHANNELS"):
-            for channel in ctx.guild.text_channels:
-                if channel.permissions_for(ctx.guild.default_role).send_messages:
-                    try:
-                        overwrite = channel.overwrites_for(ctx.guild.default_role)
-                        overwrite.update(send_messages=False)
-                        await self.bot.wait_until_ready()
-                        await channel.set_permissions(
-                            ctx.guild.default_role,
-                            overwrite=overwrite,
-                            reason=f"Setting DEFCON {level}. Invoked by {ctx.author}",
-                        )
-                        channel_locked.append(channel.id)
-                    except discord.Forbidden:
-                        log.warning(
-                            "failed to lock channel %s in guild %s",
-                            channel.id,
-                            ctx.guild.id,
-                        )
-
-        if channel_locked:
-            await self.bot.guild_configurations.update_one(
-                {"_id": ctx.guild.id},
-                {"$set": {"default_defcon.locked_channels": channel_locked}},
-                upsert=True,
-            )
+        # channels already changed by a previous level keep their original state
+        snapshot = {**plan.snapshot, **await self._snapshot(ctx.guild, states)}
+        await self.bot.guild_configurations.update_one(
+            {"_id": ctx.guild.id},
+            {"$set": {"default_defcon.snapshot": snapshot}},
+            upsert=True,
+        )
 
-        count = 0
-        if settings.get("SLOWMODE") and settings.get("SLOWMODE_TIME"):
-            for channel in ctx.guild.text_channels:
-                if channel.id not in channel_locked:
-                    continue
-                try:
-                    await channel.edit(
-                        slowmode_delay=DEFCON_SETTINGS[level]["SLOWMODE_TIME"],
-                        reason=f"Setting DEFCON {level}. Invoked by {ctx.author}",
-                    )
-                    count += 1
-                except discord.Forbidden:
-                    log.warning(
-                        "failed to set slowmode in channel %s in guild %s",
-                        channel.id,
-                        ctx.guild.id,
-                    )
+        await self.bot.wait_until_ready()
+        result = await apply_plan(ctx.guild, plan, reason=f"Setting DEFCON {level}. Invoked by {ctx.author}")
 
         cog: DefconListeners = self.bot.DefconListeners
         if cog:
@@ -197,112 +145,39 @@ class DefensiveCondition(Cog):
             )
             embed.description = (
                 f"**{ctx.author}** has set the defcon level to {level}.\n\n"
-                f"`Total Channels Locked  `: **{len(channel_locked)}**\n"
-                f"`Total Channels Hidden  `: **{len(channel_hidded)}**\n"
-                f"`Total Channels Affected`: **{len(channel_locked) + len(channel_hidded)}**\n"
-                f"`Channels With Slowmode `: **{count}**\n\n"
+                f"`Total Channels Locked  `: **{plan.counts['locked']}**\n"
+                f"`Total Channels Hidden  `: **{plan.counts['hidden']}**\n"
+                f"`Total Channels Affected`: **{result.edited}**\n"
+                f"`Channels With Slowmode `: **{plan.counts['slowmode']}**\n"
+                f"`Time Taken             `: **{result.elapsed:.2f}s**\n\n"
                 f"> **Use `defcon reset` to reset the defcon level.**"
             )
             await cog.defcon_broadcast(embed, guild=ctx.guild, level=level)
+        return result
 
-    async def defcon_reset(self, ctx: Context, level: int) -> None:
+    async def defcon_reset(self, ctx: Context, level: int) -> PlanResult | None:
         """Reset the level of defcon."""
         guild_config = await self.bot.guild_configurations.find_one({"_id": ctx.guild.id})
         if not guild_config or not guild_config.get("default_defcon"):
             await ctx.reply("Defcon is not set.")
-            return
+            return None
 
-        settings = DEFCON_SETTINGS[level]["SETTINGS"]
-        if settings.get("HIDE_CHANNELS"):
-            for channel_id in guild_config["default_defcon"].get("hidden_channels", []):
-                if channel := ctx.guild.get_channel(channel_id):
-                    try:
-                        overwrite = channel.overwrites_for(ctx.guild.default_role)
-                        overwrite.update(read_messages=None)
-                        await self.bot.wait_until_ready()
-                        await channel.set_permissions(
-                            ctx.guild.default_role,
-                            overwrite=overwrite,
-                            reason=f"Resetting DEFCON {level}. Invoked by {ctx.author}",
-                        )
-
-                    except discord.Forbidden:
-                        log.warning(
-                            "failed to reset channel %s in guild %s",
-                            channel.id,
-                            ctx.guild.id,
-                        )
-
-        count = 0
-        if settings.get("LOCK_VOICE_CHANNELS"):
-            for channel_id in guild_config["default_defcon"].get("locked_channels", []):
-                if channel := ctx.guild.get_channel(channel_id):
-                    try:
-                        overwrite = channel.overwrites_for(ctx.guild.default_role)
-                        overwrite.update(connect=None)
-                        await self.bot.wait_until_ready()
-                        await channel.set_permissions(
-                            ctx.guild.default_role,
-                            overwrite=overwrite,
-                            reason=f"Resetting DEFCON {level}. Invoked by {ctx.author}",
-                        )
-                        count += 1
-                    except discord.Forbidden:
-                        log.warning(
-                            "failed to reset channel %s in guild %s",
-                            channel.id,
-                            ctx.guild.id,
-                        )
-
-        if settings.get("LOCK_TEXT_CHANNELS"):
-            for channel_id in guild_config["default_defcon"].get("locked_channels", []):
-                if channel := ctx.guild.get_channel(channel_id):
-                    try:
-                        overwrite = channel.overwrites_for(ctx.guild.default_role)
-                        overwrite.update(send_messages=None)
-                        await self.bot.wait_until_ready()
-                        await channel.set_permissions(
-                            ctx.guild.default_role,
-                            overwrite=overwrite,
-                            reason=f"Resetting DEFCON {level}. Invoked by {ctx.author}",
-                        )
-                        count += 1
-                    except discord.Forbidden:
-                        log.warning(
-                            "failed to reset channel %s in guild %s",
-                            channel.id,
-                            ctx.guild.id,
-                        )
+        plan = await self.defcon_plan(ctx.guild, None)
+        await self.bot.wait_until_ready()
+        result = await apply_plan(ctx.guild, plan, reason=f"Resetting DEFCON {level}. Invoked by {ctx.author}")
 
         await self.bot.guild_configurations.update_one(
             {"_id": ctx.guild.id},
             {
-                "$set": {
-                    "default_defcon.locked_channels": [],
-                    "default_defcon.hidden_channels": [],
+                "$unset": {
+                    "default_defcon.snapshot": "",
+                    "default_defcon.locked_channels": "",
+                    "default_defcon.hidden_channels": "",
                 },
             },
             upsert=True,
         )
 
-        slow_mode_count = 0
-        if settings.get("SLOWMODE") and settings.get("SLOWMODE_TIME"):
-            for channel in ctx.guild.text_channels:
-                if channel.id in guild_config["default_defcon"]["locked_channels"]:
-                    continue
-                try:
-                    await channel.edit(
-                        slowmode_delay=0,
-                        reason=f"Resetting DEFCON {level}. Invoked by {ctx.author}",
-                    )
-                    slow_mode_count += 1
-                except discord.Forbidden:
-                    log.warning(
-                        "failed to reset slowmode in channel %s in guild %s",
-                        channel.id,
-                        ctx.guild.id,
-                    )
-
         if cog := self.bot.DefconListeners:
             embed = discord.Embed(title=f"DEFCON {level}", color=self.bot.color).set_footer(
                 text=f"Invoked by {ctx.author}",
@@ -310,11 +185,13 @@ class DefensiveCondition(Cog):
             )
             embed.description = (
                 f"**{ctx.author}** has reset the defcon level to {level}.\n\n"
-                f"`Total Channels Unlocked`: **{count}**\n"
-                f"`Channels With Slowmode `: **{slow_mode_count}**\n\n"
+                f"`Total Channels Unlocked`: **{plan.counts['restored']}**\n"
+                f"`Channels With Slowmode `: **{plan.counts['slowmode']}**\n"
+                f"`Time Taken             `: **{result.elapsed:.2f}s**\n\n"
                 f"> **Use `defcon set` to set the defcon level.**"
             )
             await cog.defcon_broadcast(embed, guild=ctx.guild, level=level)
+        return result
 
     @defcon.command(name="set")
     @commands.has_permissions(manage_guild=True)
@@ -331,14 +208,14 @@ class DefensiveCondition(Cog):
             return
 
         msg = await ctx.reply("Setting defcon...")
-        await self.defcon_set(ctx, level)
+        result = await self.defcon_set(ctx, level)
         await self.bot.guild_configurations.update_one(
             {"_id": ctx.guild.id},
             {"$set": {"default_defcon.level": level}},
             upsert=True,
         )
         if msg:
-            await msg.edit(content="Defcon set.", delete_after=5)
+            await msg.edit(content=f"Defcon set in {result.elapsed:.2f}s.", delete_after=5)
 
     @defcon.command(name="reset")
     @commands.has_permissions(manage_guild=True)
@@ -356,14 +233,42 @@ class DefensiveCondition(Cog):
             return
 
         msg = await ctx.reply("Resetting defcon...")
-        await self.defcon_reset(ctx, level)
+        result = await self.defcon_reset(ctx, level)
         await self.bot.guild_configurations.update_one(
             {"_id": ctx.guild.id},
             {"$unset": {"default_defcon": ""}},
             upsert=True,
         )
-        if msg:
-            await msg.edit(content="Defcon reset.", delete_after=5)
+        if msg and result:
+            await msg.edit(content=f"Defcon reset in {result.elapsed:.2f}s.", delete_after=5)
+
+    @defcon.command(name="plan", aliases=["dryrun", "dry-run"])
+    @commands.has_permissions(manage_guild=True)
+    async def _defcon_plan(self, ctx: Context, *, level: Literal[1, 2, 3, 4, 5] | None = None) -> None:
+        """Shows what setting a defcon level would change, without changing anything.
+
+        Without a level, shows what `defcon reset` would restore.
+        """
+        start = time.perf_counter()
+        plan = await self.defcon_plan(ctx.guild, level)
+        elapsed = time.perf_counter() - start
+
+        title = f"Defcon {level} plan" if level else "Defcon reset plan"
+        embed = discord.Embed(title=title, color=self.bot.color)
+        embed.description = "\n".join(
+            [
+                f"`Channels To Edit       `: **{len(plan.edits)}**",
+                f"`Channels Unchanged     `: **{plan.unchanged}**",
+                *(f"`{name.title():<23}`: **{count}**" for name, count in plan.counts.items()),
+                f"`Planned In             `: **{elapsed * 1000:.2f}ms**",
+            ],
+        )
+        if plan.edits:
+            channels = [f"<#{edit.channel_id}>" for edit in plan.edits[:20]]
+            if len(plan.edits) > 20:
+                channels.append(f"and {len(plan.edits) - 20} more")
+            embed.add_field(name="Channels", value=", ".join(channels), inline=False)
+        await ctx.reply(embed=embed)
 
     @defcon.command(name="settings")
     @commands.has_permissions(manage_guild=True)
@@ -0,0 +1,246 @@
+"""Plans and applies the channel changes of a DEFCON level.
+
+The planner reads the ``@everyone`` overwrite, effective permissions and slowmode of every channel
+once, and only edits the channels that are not already in the state the level asks for. Before a
+channel is touched, its previous state is recorded in a snapshot; resetting DEFCON puts every
+snapshotted channel back exactly as it was, including removing overwrites that did not exist.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import Counter
+from typing import Any, NamedTuple
+
+import discord
+
+log = logging.getLogger("cogs.defcon.planner")
+
+__all__ = (
+    "ChannelEdit",
+    "ChannelState",
+    "Plan",
+    "PlanResult",
+    "Snapshot",
+    "apply_plan",
+    "channel_states",
+    "legacy_snapshot",
+    "plan_level",
+    "plan_restore",
+)
+
+VIEW_CHANNEL = discord.Permissions(view_channel=True).value
+SEND_MESSAGES = discord.Permissions(send_messages=True).value
+CONNECT = discord.Permissions(connect=True).value
+
+# {str(channel_id): {"allow": int, "deny": int, "exists": bool, "slowmode": int | None}}
+Snapshot = dict[str, dict[str, Any]]
+
+
+class ChannelState(NamedTuple):
+    id: int
+    kind: str  # "text", "voice" or "other"
+    allow: int
+    deny: int
+    has_overwrite: bool
+    # effective permissions of @everyone in the channel
+    permissions: int
+    slowmode: int | None = None
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"allow": self.allow, "deny": self.deny, "exists": self.has_overwrite, "slowmode": self.slowmode}
+
+
+class ChannelEdit(NamedTuple):
+    channel_id: int
+    # new @everyone overwrite as (allow, deny), None to leave it
+    overwrite: tuple[int, int] | None = None
+    delete_overwrite: bool = False
+    slowmode: int | None = None
+
+
+class Plan(NamedTuple):
+    edits: list[ChannelEdit]
+    snapshot: Snapshot
+    counts: Counter[str]
+    unchanged: int
+
+
+class PlanResult(NamedTuple):
+    edited: int
+    failed: list[int]
+    elapsed: float
+
+
+def channel_states(guild: discord.Guild) -> list[ChannelState]:
+    everyone = guild.default_role
+    states = []
+    for channel in guild.channels:
+        allow, deny = channel.overwrites_for(everyone).pair()
+        if isinstance(channel, discord.TextChannel):
+            kind, slowmode = "text", channel.slowmode_delay
+        elif isinstance(channel, discord.VoiceChannel):
+            kind, slowmode = "voice", None
+        else:
+            kind, slowmode = "other", None
+        states.append(
+            ChannelState(
+                id=channel.id,
+                kind=kind,
+                allow=allow.value,
+                deny=deny.value,
+                has_overwrite=everyone in channel.overwrites,
+                permissions=channel.permissions_for(everyone).value,
+                slowmode=slowmode,
+            ),
+        )
+    return states
+
+
+def plan_level(states: list[ChannelState], settings: dict[str, Any]) -> Plan:
+    """The edits needed to bring ``states`` to a DEFCON level, and the snapshot to restore them."""
+    hide = settings.get("HIDE_CHANNELS", False)
+    lock_text = settings.get("LOCK_TEXT_CHANNELS", False)
+    lock_voice = settings.get("LOCK_VOICE_CHANNELS", False)
+    slowmode = settings.get("SLOWMODE_TIME", 0) if settings.get("SLOWMODE") else 0
+
+    edits: list[ChannelEdit] = []
+    snapshot: Snapshot = {}
+    counts: Counter[str] = Counter()
+    for state in states:
+        denied = 0
+        if hide and state.permissions & VIEW_CHANNEL:
+            denied |= VIEW_CHANNEL
+            counts["hidden"] += 1
+        if lock_text and state.kind == "text" and state.permissions & SEND_MESSAGES:
+            denied |= SEND_MESSAGES
+            counts["locked"] += 1
+        if lock_voice and state.kind == "voice" and state.permissions & CONNECT:
+            denied |= CONNECT
+            counts["locked"] += 1
+
+        new_slowmode = None
+        if slowmode and state.kind == "text" and (state.slowmode or 0) < slowmode:
+            new_slowmode = slowmode
+            counts["slowmode"] += 1
+
+        if not denied and new_slowmode is None:
+            continue
+
+        overwrite = (state.allow & ~denied, state.deny | denied) if denied else None
+        edits.append(ChannelEdit(state.id, overwrite=overwrite, slowmode=new_slowmode))
+        snapshot[str(state.id)] = state.snapshot()
+
+    return Plan(edits, snapshot, counts, len(states) - len(edits))
+
+
+def plan_restore(states: list[ChannelState], snapshot: Snapshot) -> Plan:
+    """The edits needed to put every channel in ``snapshot`` back to its recorded state."""
+    edits: list[ChannelEdit] = []
+    counts: Counter[str] = Counter()
+    for state in states:
+        previous = snapshot.get(str(state.id))
+        if previous is None:
+            continue
+
+        overwrite = None
+        delete_overwrite = False
+        if not previous["exists"]:
+            delete_overwrite = state.has_overwrite
+        elif (state.allow, state.deny) != (previous["allow"], previous["deny"]) or not state.has_overwrite:
+            overwrite = (previous["allow"], previous["deny"])
+
+        new_slowmode = None
+        if previous.get("slowmode") is not None and state.slowmode != previous["slowmode"]:
+            new_slowmode = previous["slowmode"]
+            counts["slowmode"] += 1
+
+        if overwrite is None and not delete_overwrite and new_slowmode is None:
+            continue
+        if overwrite is not None or delete_overwrite:
+            counts["restored"] += 1
+        edits.append(ChannelEdit(state.id, overwrite=overwrite, delete_overwrite=delete_overwrite, slowmode=new_slowmode))
+
+    return Plan(edits, {}, counts, len(states) - len(edits))
+
+
+def legacy_snapshot(states: list[ChannelState], *, hidden: list[int], locked: list[int]) -> Snapshot:
+    """A snapshot for DEFCON levels set before snapshots were stored, from the old channel id lists.
+
+    The old reset cleared the bits it had denied, so that is what this snapshot restores.
+    """
+    cleared: dict[int, int] = {}
+    for channel_id in hidden:
+        cleared[channel_id] = cleared.get(channel_id, 0) | VIEW_CHANNEL
+    for channel_id in locked:
+        cleared[channel_id] = cleared.get(channel_id, 0) | SEND_MESSAGES | CONNECT
+
+    snapshot: Snapshot = {}
+    for state in states:
+        if state.id in cleared:
+            snapshot[str(state.id)] = {
+                "allow": state.allow,
+                "deny": state.deny & ~cleared[state.id],
+                "exists": True,
+                "slowmode": None,
+            }
+    return snapshot
+
+
+async def _apply_edit(guild: discord.Guild, edit: ChannelEdit, *, reason: str) -> None:
+    channel = guild.get_channel(edit.channel_id)
+    if channel is None:
+        return
+
+    everyone = guild.default_role
+    overwrite = None
+    if edit.overwrite is not None:
+        allow, deny = edit.overwrite
+        overwrite = discord.PermissionOverwrite.from_pair(discord.Permissions(allow), discord.Permissions(deny))
+
+    changes_overwrite = overwrite is not None or edit.delete_overwrite
+    if edit.slowmode is None:
+        # one PUT on the @everyone overwrite, the other overwrites are not sent
+        await channel.set_permissions(everyone, overwrite=overwrite, reason=reason)
+    elif not changes_overwrite:
+        await channel.edit(slowmode_delay=edit.slowmode, reason=reason)
+    else:
+        overwrites = channel.overwrites
+        if overwrite is None:
+            overwrites.pop(everyone, None)
+        else:
+            overwrites[everyone] = overwrite
+        await channel.edit(slowmode_delay=edit.slowmode, overwrites=overwrites, reason=reason)
+
+
+async def apply_plan(guild: discord.Guild, plan: Plan, *, reason: str, concurrency: int = 8) -> PlanResult:
+    """Apply every edit of ``plan``, at most ``concurrency`` at a time.
+
+    Each channel is its own rate limit bucket, discord.py waits out a bucket or the global limit.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    failed: list[int] = []
+
+    async def apply(edit: ChannelEdit) -> None:
+        async with semaphore:
+            try:
+                await _apply_edit(guild, edit, reason=reason)
+            except discord.HTTPException as e:
+                log.warning("failed to edit channel %s in guild %s: %s", edit.channel_id, guild.id, e)
+                failed.append(edit.channel_id)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(apply(edit) for edit in plan.edits))
+    elapsed = time.perf_counter() - start
+
+    log.info(
+        "applied %s channel edits in guild %s in %.2fs (%s failed, %s unchanged)",
+        len(plan.edits),
+        guild.id,
+        elapsed,
+        len(failed),
+        plan.unchanged,
+    )
+    return PlanResult(len(plan.edits) - len(failed), failed, elapsed)
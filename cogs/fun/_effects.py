@@ -3,13 +3,17 @@ from __future__ import annotations
 import math
 import random
 from collections.abc import Callable
+from functools import cache
 from io import BytesIO
-from pathlib import Path
 from typing import Any
 
 from PIL import Image, ImageDraw, ImageOps
 
 import discord
+from utilities.assets import assets
+from utilities.lazy import lazy_import
+
+np = lazy_import("numpy")
 
 easter_like_colours: list[tuple[int, int, int]] = [
     (255, 247, 0),
@@ -28,6 +32,24 @@ easter_like_colours: list[tuple[int, int, int]] = [
 ]
 
 
+@cache
+def easter_table() -> np.ndarray:
+    """:meth:`PfpEffects.closest` of every colour posterized to 6 bits, as ``uint8`` RGB.
+
+    Row ``r >> 2 << 12 | g >> 2 << 6 | b >> 2`` is the colour ``(r, g, b)``, 768KB in all.
+    """
+    levels = np.arange(0, 256, 4, dtype=np.int32)
+    colours = np.stack(np.meshgrid(levels, levels, levels, indexing="ij"), axis=-1).reshape(-1, 3)
+    palette = np.array(easter_like_colours, dtype=np.int32)
+
+    distances = np.zeros((len(colours), len(palette)), dtype=np.int32)
+    for band in range(3):
+        distances += (colours[:, band, None] - palette[:, band]) ** 2
+    # argmin picks the first of equally close colours, as sorted() did
+    nearest = palette[distances.argmin(axis=1)]
+    return ((colours + nearest) // 2).astype(np.uint8)
+
+
 class PfpEffects:
     """Implements various image modifying effects, for the PfpModify cog.
     All of these functions are slow, and blocking, so they should be ran in executors.
@@ -91,7 +113,7 @@ class PfpEffects:
         """Applies the given pride effect to the given image."""
         image = PfpEffects.crop_avatar_circle(image)
 
-        ring = Image.open(Path(f"extra/pride/flags/{flag}.png")).resize((1024, 1024))
+        ring = assets.image(f"pride/flags/{flag}.png", size=(1024, 1024))
         ring = ring.convert("RGBA")
         ring = PfpEffects.crop_ring(ring, pixels)
 
@@ -134,146 +156,36 @@ class PfpEffects:
             )
             overlay_image = overlay_image.convert("RGBA")
         else:
-            overlay_image = Image.open(Path("extra/easter/chocolate_bunny.png"))
-
-        alpha = image.getchannel("A").getdata()
-        image = image.convert("RGB")
-        image = ImageOps.posterize(image, 6)
+            overlay_image = assets.image("easter/chocolate_bunny.png")
 
-        data = image.getdata()
-        data_set = set(data)
-        easterified_data_set = {x: PfpEffects.closest(x) for x in data_set}
+        pixels = np.asarray(image)
+        # ImageOps.posterize(image, 6) keeps the top 6 bits, which index the table
+        posterized = pixels[..., :3] >> 2
+        index = posterized[..., 0].astype(np.intp) << 12 | posterized[..., 1].astype(np.intp) << 6 | posterized[..., 2]
 
-        new_pixel_data = [
-            (*easterified_data_set[x], alpha[i]) if x in easterified_data_set else x for i, x in enumerate(data)
-        ]
-
-        im = Image.new("RGBA", image.size)
-        im.putdata(new_pixel_data)
+        im = Image.fromarray(np.dstack((easter_table()[index], pixels[..., 3])))
         im.alpha_composite(
             overlay_image,
             (im.width - overlay_image.width, (im.height - overlay_image.height) // 2),
         )
         return im
 
-    @staticmethod
-    def split_image(img: Image.Image, squares: int) -> list:
-        """Split an image into a selection of squares, specified by the squares argument.
-        Explanation:
-        1. It gets the width and the height of the Image passed to the function.
-        2. It gets the root of a number of squares (number of squares) passed, which is called xy. Reason: if let's say
-        25 squares (number of squares) were passed, that is the total squares (split pieces) that the image is supposed
-        to be split into. As it is known, a 2D shape has a height and a width, and in this case the program thinks of it
-        as rows and columns. Rows multiplied by columns is equal to the passed squares (number of squares). To get rows
-        and columns, since in this case, each square (split piece) is identical, rows are equal to columns and the
-        program treats the image as a square-shaped, it gets the root out of the squares (number of squares) passed.
-        3. Now width and height are both of the original Image, Discord PFP, so when it comes to forming the squares,
-        the program divides the original image's height and width by the xy. In a case of 25 squares (number of squares)
-        passed, xy would be 5, so if an image was 250x300, x_frac would be 50 and y_frac - 60. Note:
-        x_frac stands for a fracture of width. The reason it's called that is because it is shorter to use x for width
-        in mind and then it's just half of the word fracture, same applies to y_frac, just height instead of width.
-        x_frac and y_frac are width and height of a single square (split piece).
-        4. With left, top, right, bottom, = 0, 0, x_frac, y_frac, the program sets these variables to create the initial
-        square (split piece). Explanation: all of these 4 variables start at the top left corner of the Image, by adding
-        value to right and bottom, it's creating the initial square (split piece).
-        5. In the for loop, it keeps adding those squares (split pieces) in a row and once (index + 1) % xy == 0 is
-        True, it adds to top and bottom to lower them and reset right and left to recreate the initial space between
-        them, forming a square (split piece), it also adds the newly created square (split piece) into the new_imgs list
-        where it stores them. The program keeps repeating this process till all 25 squares get added to the list.
-        6. It returns new_imgs, a list of squares (split pieces).
-        """
-        width, heigth = img.size
-
-        xy = math.sqrt(squares)
-
-        x_frac = width // xy
-        y_frac = heigth // xy
-
-        (left, top, right, bottom) = (0, 0, x_frac, y_frac)
-
-        new_imgs = []
-
-        for index in range(squares):
-            new_img = img.crop((left, top, right, bottom))
-            new_imgs.append(new_img)
-
-            if (index + 1) % xy == 0:
-                top += y_frac
-                bottom += y_frac
-                left = 0
-                right = x_frac
-            else:
-                left += x_frac
-                right += x_frac
-
-        return new_imgs
-
-    @staticmethod
-    def join_images(images: list[Image.Image]) -> Image.Image:
-        """Stitches all the image squares into a new image.
-        Explanation:
-        1. Shuffles the passed images to randomize the pieces.
-        2. The program gets a single square (split piece) out of the list and defines single_width as the square's width
-        and single_height as the square's height.
-        3. It gets the root of type integer of the number of images (split pieces) in the list and calls it multiplier.
-        Program then proceeds to calculate total height and width of the new image that it's creating using the same
-        multiplier.
-        4. The program then defines new_image as the image that it's creating, using the previously obtained total_width
-        and total_height.
-        5. Now it defines width_multiplier as well as height with values of 0. These will be used to correctly position
-        squares (split pieces) onto the new_image canvas.
-        6. Similar to how in the split_image function, the program gets the root of number of images in the list.
-        In split_image function, it was the passed squares (number of squares) instead of a number of imgs in the
-        list that it got the square of here.
-        7. In the for loop, as it iterates, the program multiplies single_width by width_multiplier to correctly
-        position a square (split piece) width wise. It then proceeds to paste the newly positioned square (split piece)
-        onto the new_image. The program increases the width_multiplier by 1 every iteration so the image wouldn't get
-        pasted in the same spot and the positioning would move accordingly. It makes sure to increase the
-        width_multiplier before the check, which checks if the end of a row has been reached, -
-        (index + 1) % pieces == 0, so after it, if it was True, width_multiplier would have been reset to 0 (start of
-        the row). If the check returns True, the height gets increased by a single square's (split piece) height to
-        lower the positioning height wise and, as mentioned, the width_multiplier gets reset to 0 and width will
-        then be calculated from the start of the new row. The for loop finishes once all the squares (split pieces) were
-        positioned accordingly.
-        8. Finally, it returns the new_image, the randomized squares (split pieces) stitched back into the format of the
-        original image - user's PFP.
-        """
-        random.shuffle(images)
-        single_img = images[0]
-
-        single_wdith = single_img.size[0]
-        single_height = single_img.size[1]
-
-        multiplier = int(math.sqrt(len(images)))
-
-        total_width = multiplier * single_wdith
-        total_height = multiplier * single_height
-
-        new_image = Image.new("RGBA", (total_width, total_height), (250, 250, 250))
-
-        width_multiplier = 0
-        height = 0
-
-        squares = math.sqrt(len(images))
-
-        for index, image in enumerate(images):
-            width = single_wdith * width_multiplier
-
-            new_image.paste(image, (width, height))
-
-            width_multiplier += 1
-
-            if (index + 1) % squares == 0:
-                width_multiplier = 0
-                height += single_height
-
-        return new_image
-
     @staticmethod
     def mosaic_effect(image: Image.Image, squares: int) -> Image.Image:
         """Applies a mosaic effect to the given image.
         The "squares" argument specifies the number of squares to split
         the image into. This should be a square number.
+        The image is cut into that many tiles as one array (``pieces`` rows of ``pieces`` tiles,
+        the right and bottom pixels that do not fill a tile are dropped), shuffled and put back.
         """
-        img_squares = PfpEffects.split_image(image, squares)
-        return PfpEffects.join_images(img_squares)
+        pieces = math.isqrt(squares)
+        width, height = image.width // pieces, image.height // pieces
+        pixels = np.asarray(image)[: pieces * height, : pieces * width]
+
+        # (row, y, column, x, band) -> (tile, y, x, band)
+        tiles = pixels.reshape(pieces, height, pieces, width, -1).swapaxes(1, 2).reshape(pieces**2, height, width, -1)
+        order = list(range(pieces**2))
+        random.shuffle(order)
+
+        mosaic = tiles[order].reshape(pieces, pieces, height, width, -1).swapaxes(1, 2)
+        return Image.fromarray(mosaic.reshape(pieces * height, pieces * width, -1))
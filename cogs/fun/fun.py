@@ -40,6 +40,7 @@ from utilities import spookifications
 from utilities.constants import NEGATIVE_REPLIES, Colours, EmbeddedActivity
 from utilities.converters import from_bottom, to_bottom
 from utilities.img import imagine, timecard
+from utilities.lexicon import lexicon
 from utilities.paginator import PaginationView
 
 from ._effects import PfpEffects
@@ -95,7 +96,6 @@ with open(Path("extra/random_sentences.txt"), encoding="utf-8", errors="ignore")
 T = TypeVar("T")
 
 
-ALL_WORDS = Path("extra/hangman_words.txt").read_text().splitlines()
 GENDER_OPTIONS: dict[str, Any] = json.loads(Path(r"extra/gender_options.json").read_text("utf8"))
 
 
@@ -194,7 +194,7 @@ class Fun(Cog):
             return u.id == ctx.author.id and str(r.emoji) == "\N{HAMMER AND PICK}" and r.message.id == msg.id
 
         try:
-            await ctx.wait_for("reaction_add", timeout=30, check=check)
+            await ctx.wait_for("reaction_add", timeout=30, check=check, channel=ctx.channel, user=ctx.author)
             res = await ctx.prompt("Do you want to create a role of that color?")
             if res and colour_embed.title is not None:
                 await self._create_role_on_clr(ctx=ctx, rgb=rgb, color_name=colour_embed.title)
@@ -835,7 +835,7 @@ class Fun(Cog):
                 )
 
             try:
-                msg: discord.Message = await ctx.wait_for("message", check=check, timeout=10)
+                msg: discord.Message = await ctx.wait_for("message", check=check, timeout=10, channel=ctx.channel)
             except asyncio.TimeoutError:
                 # In case of TimeoutError and the game has been stopped, then do nothing.
                 if not self.game_status[ctx.channel.id]:
@@ -949,11 +949,11 @@ class Fun(Cog):
         - max_unique_letters: the maximum unique letters you want the word to have (i.e. 7).
         """
         # Filtering the list of all words depending on the configuration
-        filtered_words = [
-            word
-            for word in ALL_WORDS
-            if min_length < len(word) < max_length and min_unique_letters < len(set(word)) < max_unique_letters
-        ]
+        filtered_words = lexicon("hangman").view(
+            min_length=min_length + 1,
+            max_length=max_length - 1,
+            predicate=lambda word: min_unique_letters < len(set(word)) < max_unique_letters,
+        )
 
         if not filtered_words:
             filter_not_found_embed = discord.Embed(
@@ -989,7 +989,7 @@ class Fun(Cog):
             )
 
             try:
-                message: discord.Message = await ctx.wait_for("message", timeout=60.0, check=check)
+                message: discord.Message = await ctx.wait_for("message", timeout=60.0, check=check, channel=ctx.channel, user=ctx.author)
             except asyncio.TimeoutError:
                 timeout_embed = discord.Embed(
                     title=choice(NEGATIVE_REPLIES),
@@ -2340,7 +2340,7 @@ class Fun(Cog):
             return u.id == ctx.author.id and str(r.emoji) == "\N{WHITE HEAVY CHECK MARK}"
 
         try:
-            await ctx.wait_for("reaction_add", check=check1, timeout=60)
+            await ctx.wait_for("reaction_add", check=check1, timeout=60, user=ctx.author)
         except asyncio.TimeoutError:
             return await ctx.message.add_reaction("\N{ALARM CLOCK}")
 
@@ -2358,7 +2358,7 @@ class Fun(Cog):
         ini = time.perf_counter()
 
         try:
-            msg: discord.Message = await ctx.wait_for("message", check=check2, timeout=300)
+            msg: discord.Message = await ctx.wait_for("message", check=check2, timeout=300, channel=ctx.channel, user=ctx.author)
         except asyncio.TimeoutError:
             return await ctx.message.add_reaction("\N{ALARM CLOCK}")
         fin = time.perf_counter()
@@ -2390,7 +2390,7 @@ class Fun(Cog):
             return u.id == ctx.author.id and str(r.emoji) == "\N{WHITE HEAVY CHECK MARK}"
 
         try:
-            await ctx.wait_for("reaction_add", check=check_1, timeout=60)
+            await ctx.wait_for("reaction_add", check=check_1, timeout=60, user=ctx.author)
         except asyncio.TimeoutError:
             return await ctx.message.add_reaction("\N{ALARM CLOCK}")
 
@@ -2404,7 +2404,7 @@ class Fun(Cog):
             )
 
         start = time.perf_counter()
-        await ctx.wait_for("reaction_add", check=check_2)
+        await ctx.wait_for("reaction_add", check=check_2, channel=ctx.channel, user=ctx.author)
         end = time.perf_counter()
 
         await confirm.edit(content=f"{ctx.author.mention} reacted on {end-start:.2f}s")
@@ -2493,7 +2493,7 @@ class Fun(Cog):
             count += 1
 
             try:
-                msg = await self.bot.wait_for("message", check=check, timeout=30)
+                msg = await self.bot.wait_for("message", check=check, timeout=30, channel=ctx.channel, user=ctx.author)
             except asyncio.TimeoutError:
                 return await ctx.reply("You took too long to respond. Game Over")
 
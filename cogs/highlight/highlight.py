@@ -13,6 +13,7 @@ import discord
 from core import Cog, Context, Parrot, ParrotLinkView
 from discord.ext import commands, tasks
 from utilities.formats import plural
+from utilities.message_pipeline import MessageContext
 
 log = logging.getLogger("cogs.highlight.highlight")
 
@@ -94,11 +95,16 @@ class Highlight(Cog):
         }
 
     async def cog_unload(self):
+        self.bot.message_pipeline.unregister("highlight")
         log.info("Stopping bulk insert loop")
         self.bulk_insert_loop.stop()
         await self.bulk_insert()
 
     async def cog_load(self):
+        self.bot.message_pipeline.register("highlight", self.check_highlights, order=60, budget=0.05, bots=True, dms=True, self_messages=True)
+        self.bot.startup.defer("highlight", self.load_highlights)
+
+    async def load_highlights(self) -> None:
         log.info("Getting all the highlight settings")
         async for data in self.bot.user_collections_ind.find({"highlight_settings": {"$exists": True}}):
             self.cached_settings[data["_id"]] = data["highlight_settings"]
@@ -107,10 +113,12 @@ class Highlight(Cog):
         async for data in self.bot.user_collections_ind.find({"highlight_words": {"$exists": True}}):
             self.cached_words[data["_id"]] = data["highlight_words"]
 
-    @commands.Cog.listener("on_message")
-    async def check_highlights(self, message: discord.Message):
-        await self.bot.wait_until_ready()
-        if not message.guild or message.author.bot:
+    async def check_highlights(self, ctx: MessageContext):
+        message = ctx.message
+        # a message is also activity, see the listeners below
+        self.bot.dispatch("user_activity", message.channel, message.author)
+
+        if message.guild is None or ctx.is_bot:
             return
 
         notified_users = []
@@ -135,13 +143,8 @@ class Highlight(Cog):
                 notified_users.append(possible_word["user_id"])
                 self.bot.dispatch("highlight", message, possible_word, match[1])
 
-    # The following three listeners send a user activity to the on_highlight_trigger function
+    # The following listeners send a user activity to the on_highlight_trigger function
     # This way the user has time to indicate that they saw the message and we do not need to highlight them
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        await self.bot.wait_until_ready()
-        self.bot.dispatch("user_activity", message.channel, message.author)
-
     @commands.Cog.listener()
     async def on_typing(
         self,
@@ -171,6 +174,8 @@ class Highlight(Cog):
                 "user_activity",
                 check=lambda channel, user: message.channel == channel and user == member,
                 timeout=30,
+                channel=message.channel,
+                user=member,
             )
             return
         except asyncio.TimeoutError:
@@ -11,6 +11,7 @@ from tabulate import tabulate
 import discord
 from core import Cog, Context, MongoCollection as Collection, Parrot
 from discord.ext import commands
+from utilities.channel_index import Feature
 from utilities.converters import convert_bool
 from utilities.rankcard import rank_card
 from utilities.robopages import SimplePages
@@ -266,12 +267,7 @@ class Leveling(Cog):
         if any(message.author.get_role(r) for r in role):
             return
 
-        try:
-            ignore_channel: list = self.bot.guild_configurations_cache[message.guild.id]["leveling"]["ignore_channel"] or []
-        except KeyError:
-            ignore_channel = []
-
-        if message.channel.id in ignore_channel:
+        if self.bot.channel_index.has(message.channel.id, Feature.LEVELING_IGNORE):
             return
 
         await self._add_xp(member=message.author, xp=random.randint(10, 15), msg=message)
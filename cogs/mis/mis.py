@@ -15,7 +15,6 @@ from typing import TYPE_CHECKING, Annotated, Any, BinaryIO
 
 import arrow
 import qrcode
-import sympy
 import yarl
 from dateutil.zoneinfo import get_zonefile_instance
 from jishaku.paginators import PaginatorEmbedInterface
@@ -45,6 +44,7 @@ from discord.ext import commands
 from utilities.converters import convert_bool
 from utilities.imaging.graphing import boxplot, plotfn
 from utilities.imaging.image import do_command
+from utilities.lazy import lazy_import
 from utilities.paginator import PaginationView
 from utilities.regex import INVITE_RE, LINKS_RE
 from utilities.robopages import SimplePages
@@ -54,6 +54,8 @@ from utilities.youtube_search import YoutubeSearch
 from .__embed_view import EmbedBuilder, EmbedCancel, EmbedSend
 from .__flags import SearchFlag, TTFlag
 
+sympy = lazy_import("sympy")
+
 if TYPE_CHECKING:
     from .listeners import PingMessageListner, SnipeMessageListener
 
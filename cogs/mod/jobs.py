@@ -0,0 +1,497 @@
+"""Bulk moderation actions as persistent, resumable jobs.
+
+A job is one action (ban, kick, role grant, ...) applied to many targets. Targets are sent to
+Discord concurrently, a few requests at a time per route bucket, and a rate limit on a bucket pauses
+every job using it. Progress is checkpointed to the ``mod_jobs`` table so a job that was running
+when the bot stopped picks up where it left off, and is reported by editing a single message.
+
+The engine talks to Discord through the raw :class:`discord.http.HTTPClient` rather than models,
+so it only needs ids and works for members that are not cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import discord
+
+if TYPE_CHECKING:
+    from discord.http import HTTPClient
+
+    from utilities.sqlite import Database
+
+log = logging.getLogger("cogs.mod.jobs")
+
+__all__ = ("ACTIONS", "JobAction", "JobEngine", "ModJob", "RouteBucket")
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+CANCELLED = "cancelled"
+
+# discord.py gives up on a route after a few 429s, a job just waits and tries again
+MAX_RATE_LIMITS = 10
+
+Failures = dict[int, str]
+
+
+class ModJob:
+    __slots__ = (
+        "id",
+        "guild_id",
+        "channel_id",
+        "message_id",
+        "author_id",
+        "action",
+        "options",
+        "targets",
+        "done",
+        "failed",
+        "status",
+        "started_at",
+    )
+
+    def __init__(
+        self,
+        *,
+        job_id: int,
+        guild_id: int,
+        channel_id: int,
+        author_id: int,
+        action: str,
+        targets: list[int],
+        options: dict[str, Any] | None = None,
+        message_id: int | None = None,
+        done: set[int] | None = None,
+        failed: Failures | None = None,
+        status: str = PENDING,
+    ) -> None:
+        self.id = job_id
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.message_id = message_id
+        self.author_id = author_id
+        self.action = action
+        self.options = options or {}
+        self.targets = targets
+        self.done = done or set()
+        self.failed = failed or {}
+        self.status = status
+        self.started_at = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f"<ModJob id={self.id} action={self.action!r} status={self.status!r} progress={len(self.done)}/{len(self.targets)}>"
+
+    @classmethod
+    def from_row(cls, row: Any) -> ModJob:
+        (job_id, guild_id, channel_id, message_id, author_id, action, options, targets, done, failed, status) = row
+        return cls(
+            job_id=job_id,
+            guild_id=guild_id,
+            channel_id=channel_id,
+            message_id=message_id,
+            author_id=author_id,
+            action=action,
+            options=json.loads(options),
+            targets=json.loads(targets),
+            done=set(json.loads(done)),
+            failed={int(target): error for target, error in json.loads(failed).items()},
+            status=status,
+        )
+
+    @property
+    def remaining(self) -> list[int]:
+        return [target for target in self.targets if target not in self.done]
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, CANCELLED)
+
+    def summary(self) -> str:
+        action = ACTIONS[self.action]
+        total = len(self.targets)
+        processed = len(self.done)
+        succeeded = processed - len(self.failed)
+
+        if self.status == DONE:
+            head = f"Job #{self.id}: {action.verb} **{succeeded:,}/{total:,}**"
+        elif self.status == CANCELLED:
+            head = f"Job #{self.id} cancelled: {action.verb} **{succeeded:,}/{total:,}**"
+        else:
+            elapsed = time.monotonic() - self.started_at
+            rate = processed / elapsed if elapsed > 0 else 0
+            eta = f", about {int((total - processed) / rate)}s left" if rate and processed < total else ""
+            head = f"Job #{self.id}: {action.verb} **{succeeded:,}/{total:,}**{eta}"
+
+        lines = [head]
+        if self.failed:
+            lines.append(f"Failed for {len(self.failed):,}:")
+            lines.extend(f"- `{target}`: {error}" for target, error in list(self.failed.items())[:5])
+            if len(self.failed) > 5:
+                lines.append(f"- and {len(self.failed) - 5:,} more")
+        return "\n".join(lines)
+
+
+class JobAction(NamedTuple):
+    verb: str
+    # requests for the same route and major parameter share one Discord rate limit bucket
+    route: str
+    batch: int
+    concurrency: int
+    run: Callable[[HTTPClient, ModJob, list[int]], Awaitable[Failures]]
+
+    def bucket(self, job: ModJob) -> str:
+        major = job.options.get("target_channel_id", job.guild_id) if self.route.startswith("channel") else job.guild_id
+        return f"{self.route}:{major}"
+
+
+async def _ban(http: HTTPClient, job: ModJob, targets: list[int]) -> Failures:
+    (target,) = targets
+    await http.ban(target, job.guild_id, job.options.get("delete_message_seconds", 0), reason=job.options.get("reason"))
+    return {}
+
+
+async def _bulk_ban(http: HTTPClient, job: ModJob, targets: list[int]) -> Failures:
+    # the bulk endpoint needs Manage Server on top of Ban Members
+    response = await http.bulk_ban(
+        job.guild_id,
+        targets,
+        job.options.get("delete_message_seconds", 0),
+        reason=job.options.get("reason"),
+    )
+    return {int(target): "Could not ban" for target in response.get("failed_users", [])}
+
+
+async def _softban(http: HTTPClient, job: ModJob, targets: list[int]) -> Failures:
+    (target,) = targets
+    reason = job.options.get("reason")
+    await http.ban(target, job.guild_id, job.options.get("delete_message_seconds", 86400), reason=reason)
+    await http.unban(target, job.guild_id, reason=reason)
+    return {}
+
+
+async def _kick(http: HTTPClient, job: ModJob, targets: list[int]) -> Failures:
+    (target,) = targets
+    await http.kick(target, job.guild_id, reason=job.options.get("reason"))
+    return {}
+
+
+async def _add_role(http: HTTPClient, job: ModJob, targets: list[int]) -> Failures:
+    (target,) = targets
+    await http.add_role(job.guild_id, target, job.options["role_id"], reason=job.options.get("reason"))
+    return {}
+
+
+async def _remove_role(http: HTTPClient, job: ModJob, targets: list[int]) -> Failures:
+    (target,) = targets
+    await http.remove_role(job.guild_id, target, job.options["role_id"], reason=job.options.get("reason"))
+    return {}
+
+
+_BLOCKED = discord.Permissions(send_messages=True, view_channel=True).value
+
+
+async def _block(http: HTTPClient, job: ModJob, targets: list[int]) -> Failures:
+    # one overwrite per member instead of re-sending every overwrite of the channel
+    (target,) = targets
+    allow, deny = job.options.get("overwrites", {}).get(str(target), (0, 0))
+    await http.edit_channel_permissions(
+        job.options["target_channel_id"],
+        target,
+        str(allow & ~_BLOCKED),
+        str(deny | _BLOCKED),
+        1,
+        reason=job.options.get("reason"),
+    )
+    return {}
+
+
+async def _unblock(http: HTTPClient, job: ModJob, targets: list[int]) -> Failures:
+    (target,) = targets
+    allow, deny = job.options.get("overwrites", {}).get(str(target), (0, 0))
+    allow, deny = allow & ~_BLOCKED, deny & ~_BLOCKED
+    if allow or deny:
+        await http.edit_channel_permissions(
+            job.options["target_channel_id"],
+            target,
+            str(allow),
+            str(deny),
+            1,
+            reason=job.options.get("reason"),
+        )
+    else:
+        await http.delete_channel_permissions(job.options["target_channel_id"], target, reason=job.options.get("reason"))
+    return {}
+
+
+ACTIONS: dict[str, JobAction] = {
+    "ban": JobAction("banned", "guild:bans", 1, 4, _ban),
+    # bulk ban takes up to 200 users per request
+    "bulk_ban": JobAction("banned", "guild:bulk_bans", 200, 1, _bulk_ban),
+    "softban": JobAction("soft banned", "guild:bans", 1, 4, _softban),
+    "kick": JobAction("kicked", "guild:members", 1, 4, _kick),
+    "add_role": JobAction("gave the role to", "guild:member_roles", 1, 4, _add_role),
+    "remove_role": JobAction("removed the role from", "guild:member_roles", 1, 4, _remove_role),
+    "block": JobAction("blocked", "channel:permissions", 1, 4, _block),
+    "unblock": JobAction("unblocked", "channel:permissions", 1, 4, _unblock),
+}
+
+
+class RouteBucket:
+    """Limits in-flight requests on one route, and pauses all of them after a rate limit."""
+
+    def __init__(self, concurrency: int) -> None:
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.blocked_until = 0.0
+
+    def block(self, retry_after: float) -> None:
+        self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+
+    async def __aenter__(self) -> None:
+        await self.semaphore.acquire()
+        # another rate limit may push blocked_until back while sleeping, so it is checked again
+        while (delay := self.blocked_until - time.monotonic()) > 0:  # noqa: ASYNC110
+            await asyncio.sleep(delay)
+
+    async def __aexit__(self, *args: object) -> None:
+        self.semaphore.release()
+
+
+def _retry_after(error: Exception) -> float | None:
+    if isinstance(error, discord.RateLimited):
+        return error.retry_after
+    if isinstance(error, discord.HTTPException) and error.status == 429:
+        headers = getattr(error.response, "headers", None) or {}
+        return float(headers.get("Retry-After", 1))
+    return None
+
+
+class JobEngine:
+    """Runs :class:`ModJob` s against ``http`` and keeps them in the ``mod_jobs`` table.
+
+    ``report`` is called with the job at most every ``report_interval`` seconds while it runs,
+    and once when it finishes. Progress is written to the database at the same time.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        http: HTTPClient,
+        *,
+        report: Callable[[ModJob], Awaitable[None]] | None = None,
+        report_interval: float = 2.0,
+    ) -> None:
+        self.db = db
+        self.http = http
+        self.report = report
+        self.report_interval = report_interval
+
+        self._jobs: dict[int, ModJob] = {}
+        self._tasks: dict[int, asyncio.Task[None]] = {}
+        self._buckets: dict[str, RouteBucket] = {}
+        self._last_report: dict[int, float] = {}
+
+    def __repr__(self) -> str:
+        return f"<JobEngine running={len(self._tasks)} buckets={len(self._buckets)}>"
+
+    async def setup(self) -> None:
+        await self.db.execute(
+            """CREATE TABLE IF NOT EXISTS mod_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                channel_id INTEGER NOT NULL,
+                message_id INTEGER,
+                author_id INTEGER NOT NULL,
+                action TEXT NOT NULL,
+                options TEXT NOT NULL,
+                targets TEXT NOT NULL,
+                done TEXT NOT NULL DEFAULT '[]',
+                failed TEXT NOT NULL DEFAULT '{}',
+                status TEXT NOT NULL DEFAULT 'pending',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )""",
+        )
+        await self.db.execute("CREATE INDEX IF NOT EXISTS mod_jobs_status ON mod_jobs (status)")
+        await self.db.commit()
+
+    def get(self, job_id: int) -> ModJob | None:
+        return self._jobs.get(job_id)
+
+    def jobs(self, guild_id: int | None = None) -> list[ModJob]:
+        return [job for job in self._jobs.values() if guild_id is None or job.guild_id == guild_id]
+
+    async def submit(
+        self,
+        action: str,
+        targets: list[int],
+        *,
+        guild_id: int,
+        channel_id: int,
+        author_id: int,
+        message_id: int | None = None,
+        **options: Any,
+    ) -> ModJob:
+        """Store a new job and start running it."""
+        if action not in ACTIONS:
+            msg = f"Unknown job action {action!r}"
+            raise ValueError(msg)
+
+        targets = list(dict.fromkeys(targets))
+        async with self.db.transaction() as conn:
+            cursor = await conn.execute(
+                """INSERT INTO mod_jobs (guild_id, channel_id, message_id, author_id, action, options, targets)
+                VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (guild_id, channel_id, message_id, author_id, action, json.dumps(options), json.dumps(targets)),
+            )
+            job_id = cursor.lastrowid
+            assert job_id is not None
+
+        job = ModJob(
+            job_id=job_id,
+            guild_id=guild_id,
+            channel_id=channel_id,
+            message_id=message_id,
+            author_id=author_id,
+            action=action,
+            targets=targets,
+            options=options,
+        )
+        self._start(job)
+        return job
+
+    async def resume(self) -> list[ModJob]:
+        """Start every job that was pending or running when the bot stopped."""
+        rows = await self.db.fetchall(
+            """SELECT id, guild_id, channel_id, message_id, author_id, action, options, targets, done, failed, status
+            FROM mod_jobs WHERE status IN (?, ?) ORDER BY id""",
+            (PENDING, RUNNING),
+        )
+        jobs = [ModJob.from_row(row) for row in rows]
+        for job in jobs:
+            if job.id not in self._tasks and job.action in ACTIONS:
+                log.info("Resuming %r", job)
+                self._start(job)
+        return jobs
+
+    async def cancel(self, job_id: int) -> ModJob | None:
+        """Stop handing out targets of the job. Requests already sent are allowed to finish."""
+        job = self._jobs.get(job_id)
+        if job is None or job.finished:
+            return None
+
+        job.status = CANCELLED
+        if task := self._tasks.get(job_id):
+            await asyncio.shield(task)
+        else:
+            await self._checkpoint(job)
+        return job
+
+    async def wait(self, job_id: int) -> ModJob | None:
+        """Wait for a running job to finish and return it, ``None`` if it is not running."""
+        job = self._jobs.get(job_id)
+        if task := self._tasks.get(job_id):
+            await asyncio.shield(task)
+        return job
+
+    async def close(self) -> None:
+        """Stop running jobs without finishing them, they are resumed on the next start."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        for job in self._jobs.values():
+            if not job.finished:
+                await self._checkpoint(job)
+
+    def _start(self, job: ModJob) -> None:
+        self._jobs[job.id] = job
+        task = asyncio.create_task(self._run(job), name=f"mod-job-{job.id}")
+        self._tasks[job.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.id, None))
+
+    def _bucket(self, action: JobAction, job: ModJob) -> RouteBucket:
+        key = action.bucket(job)
+        if key not in self._buckets:
+            self._buckets[key] = RouteBucket(action.concurrency)
+        return self._buckets[key]
+
+    async def _run(self, job: ModJob) -> None:
+        action = ACTIONS[job.action]
+        bucket = self._bucket(action, job)
+
+        remaining = job.remaining
+        batches = asyncio.Queue[list[int]]()
+        for i in range(0, len(remaining), action.batch):
+            batches.put_nowait(remaining[i : i + action.batch])
+
+        job.status = RUNNING
+        job.started_at = time.monotonic()
+        await self._checkpoint(job)
+
+        async def worker() -> None:
+            while job.status == RUNNING and not batches.empty():
+                await self._send(job, action, bucket, batches.get_nowait())
+                await self._progress(job)
+
+        workers = max(1, min(action.concurrency, batches.qsize()))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+        if job.status == RUNNING:
+            job.status = DONE
+        await self._checkpoint(job)
+        await self._report(job)
+        # finished jobs stay in the mod_jobs table, not in memory
+        self._last_report.pop(job.id, None)
+        self._jobs.pop(job.id, None)
+        log.info("Finished %r", job)
+
+    async def _send(self, job: ModJob, action: JobAction, bucket: RouteBucket, targets: list[int]) -> None:
+        for _ in range(MAX_RATE_LIMITS):
+            async with bucket:
+                try:
+                    failures = await action.run(self.http, job, targets)
+                except Exception as e:
+                    retry_after = _retry_after(e)
+                    if retry_after is None:
+                        failures = dict.fromkeys(targets, str(e))
+                    else:
+                        log.debug("%r rate limited for %.2fs", job, retry_after)
+                        bucket.block(retry_after)
+                        continue
+
+            job.failed.update(failures)
+            job.done.update(targets)
+            return
+
+        job.failed.update(dict.fromkeys(targets, "Rate limited"))
+        job.done.update(targets)
+
+    async def _progress(self, job: ModJob) -> None:
+        now = time.monotonic()
+        if now - self._last_report.get(job.id, 0) < self.report_interval:
+            return
+        self._last_report[job.id] = now
+        await self._checkpoint(job)
+        await self._report(job)
+
+    async def _report(self, job: ModJob) -> None:
+        if self.report is None:
+            return
+        try:
+            await self.report(job)
+        except Exception:
+            log.exception("Failed to report progress of %r", job)
+
+    async def _checkpoint(self, job: ModJob) -> None:
+        await self.db.execute(
+            "UPDATE mod_jobs SET done = ?, failed = ?, status = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+            (json.dumps(sorted(job.done)), json.dumps(job.failed), job.status, job.id),
+        )
+        await self.db.commit()
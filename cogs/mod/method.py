@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import datetime
 import io
 from collections import Counter
@@ -12,6 +11,37 @@ from core import Context, Parrot
 from discord.ext import commands
 from utilities.time import FutureTime, ShortTime
 
+from .jobs import JobEngine, ModJob
+
+
+async def _submit_job(
+    ctx: Context,
+    destination: discord.abc.Messageable,
+    action: str,
+    targets: list[int],
+    *,
+    silent: bool = False,
+    **options: Any,
+) -> ModJob:
+    engine: JobEngine = ctx.bot.get_cog("Moderator").jobs  # type: ignore
+    message = None if silent else await destination.send(f"{ctx.author.mention} queued {len(targets):,} target(s)...")
+    return await engine.submit(
+        action,
+        targets,
+        guild_id=ctx.guild.id,
+        channel_id=message.channel.id if message else ctx.channel.id,
+        author_id=ctx.author.id,
+        message_id=message.id if message else None,
+        **options,
+    )
+
+
+def _ban_action(ctx: Context) -> str:
+    """``"bulk_ban"`` if both the bot and the moderator may use the bulk ban endpoint, else ``"ban"``."""
+    if ctx.guild.me.guild_permissions.manage_guild and ctx.author.guild_permissions.manage_guild:
+        return "bulk_ban"
+    return "ban"
+
 
 async def _add_roles_bot(
     *,
@@ -32,15 +62,18 @@ async def _add_roles_bot(
 
     if is_mod and (is_mod.id == role.id):
         return await destination.send(f"{ctx.author.mention} can not assign/remove/edit mod role")
-    for member in guild.members:
-        try:
-            if member.bot:
-                if operator.lower() in ["+", "add", "give"]:
-                    await member.add_roles(role, reason=reason)
-                elif operator.lower() in ["-", "remove", "take"]:
-                    await member.remove_roles(role, reason=reason)
-        except Exception as e:
-            await destination.send(f"Can not able to {command_name} **{member}**. Error raised: **{e}**")
+    adding = operator.lower() in ["+", "add", "give"]
+    targets = [member.id for member in guild.members if member.bot and (member.get_role(role.id) is None) is adding]
+    if not targets:
+        return await destination.send(f"{ctx.author.mention} nothing to do, no member left to {command_name}")
+    await _submit_job(
+        ctx,
+        destination,
+        "add_role" if adding else "remove_role",
+        targets,
+        role_id=role.id,
+        reason=reason,
+    )
 
 
 async def _add_roles_humans(
@@ -61,15 +94,18 @@ async def _add_roles_humans(
     is_mod = await ctx.modrole()
     if is_mod and (is_mod.id == role.id):
         return await destination.send(f"{ctx.author.mention} can not assign/remove/edit mod role")
-    for member in guild.members:
-        try:
-            if not member.bot:
-                if operator.lower() in ["+", "add", "give"]:
-                    await member.add_roles(role, reason=reason)
-                elif operator.lower() in ["-", "remove", "take"]:
-                    await member.remove_roles(role, reason=reason)
-        except Exception as e:
-            await destination.send(f"Can not able to {command_name} **{member}**. Error raised: **{e}**")
+    adding = operator.lower() in ["+", "add", "give"]
+    targets = [member.id for member in guild.members if not member.bot and (member.get_role(role.id) is None) is adding]
+    if not targets:
+        return await destination.send(f"{ctx.author.mention} nothing to do, no member left to {command_name}")
+    await _submit_job(
+        ctx,
+        destination,
+        "add_role" if adding else "remove_role",
+        targets,
+        role_id=role.id,
+        reason=reason,
+    )
 
 
 async def _add_roles(
@@ -316,19 +352,18 @@ async def _mass_ban(
             raise commands.BadArgument(
                 msg,
             )
-        try:
-            if member.id in (ctx.author.id, guild.me.id):
-                await destination.send(f"{ctx.author.mention} don't do that, Bot is only trying to help")
-                return
-            await guild.ban(
-                member,
-                reason=reason,
-                delete_message_days=days,
-            )
-        except Exception as e:
-            await destination.send(f"Can not able to {command_name} **{member}**. Error raised: **{e}**")
+        if member.id in (ctx.author.id, guild.me.id):
+            await destination.send(f"{ctx.author.mention} don't do that, Bot is only trying to help")
+            return
 
-    await destination.send(f"{ctx.author.mention} **{', '.join([str(member) for member in members])}** are banned!")
+    await _submit_job(
+        ctx,
+        destination,
+        _ban_action(ctx),
+        [member.id for member in members],
+        delete_message_seconds=(days or 0) * 86400,
+        reason=reason,
+    )
 
 
 async def _softban(
@@ -348,16 +383,11 @@ async def _softban(
             raise commands.BadArgument(
                 msg,
             )
-        try:
-            if member.id in (ctx.author.id, guild.me.id):
-                await destination.send(f"{ctx.author.mention} don't do that, Bot is only trying to help")
-                return
-            await member.ban(reason=reason)
-            await guild.unban(member, reason=reason)
+        if member.id in (ctx.author.id, guild.me.id):
+            await destination.send(f"{ctx.author.mention} don't do that, Bot is only trying to help")
+            return
 
-            await destination.send(f"{ctx.author.mention} **{member}** is soft banned!")
-        except Exception as e:
-            await destination.send(f"Can not able to {command_name} **{member}**. Error raised: **{e}**")
+    await _submit_job(ctx, destination, "softban", [member.id for member in members], reason=reason)
 
 
 async def _temp_ban(
@@ -375,33 +405,45 @@ async def _temp_ban(
 ):
     bot = bot or ctx.bot
     members = members if isinstance(members, list) else [members]
-    for member in members:
-        try:
-            if member.id in (ctx.author.id, guild.me.id) and not silent:
-                await destination.send(f"{ctx.author.mention} don't do that, Bot is only trying to help")
-                return
-            await guild.ban(discord.Object(id=member.id), reason=reason)
-            mod_action = {
-                "action": "UNBAN",
-                "member": member.id,
-                "reason": f"Action requested by: {ctx.author} ({ctx.author.id}) | Reason: Automatic tempban action",
-                "guild": guild.id,
-            }
+    if any(member.id in (ctx.author.id, guild.me.id) for member in members):
+        if not silent:
+            await destination.send(f"{ctx.author.mention} don't do that, Bot is only trying to help")
+        return
 
-            await ctx.bot.create_timer(
-                _event_name="mod_action",
-                expires_at=duration.dt.timestamp(),
-                created_at=discord.utils.utcnow().timestamp(),
-                message=ctx.message.id,
-                mod_action=mod_action,
-            )
-            await destination.send(
-                f"{ctx.author.mention} **{member}** will be unbanned {discord.utils.format_dt(duration.dt, 'R')}!",
-            )
+    dt = duration.dt if isinstance(duration, FutureTime) else duration
+    engine: JobEngine = bot.get_cog("Moderator").jobs  # type: ignore
+    job = await _submit_job(ctx, destination, _ban_action(ctx), [member.id for member in members], silent=silent, reason=reason)
+    # only the members the job banned get an unban timer
+    job = await engine.wait(job.id) or job
+    banned = [member for member in members if member.id in job.done and member.id not in job.failed]
+    failed = [member for member in members if member not in banned]
+
+    for member in banned:
+        mod_action = {
+            "action": "UNBAN",
+            "member": member.id,
+            "reason": f"Action requested by: {ctx.author} ({ctx.author.id}) | Reason: Automatic tempban action",
+            "guild": guild.id,
+        }
+
+        await bot.create_timer(
+            _event_name="mod_action",
+            expires_at=dt.timestamp(),
+            created_at=discord.utils.utcnow().timestamp(),
+            message=ctx.message.id,
+            mod_action=mod_action,
+        )
 
-        except Exception as e:
-            if not silent:
-                await destination.send(f"Can not able to {command_name} **{member}**. Error raised: **{e}**")
+    if silent:
+        return
+    if banned:
+        await destination.send(
+            f"{ctx.author.mention} **{', '.join(str(member) for member in banned)}** will be unbanned {discord.utils.format_dt(dt, 'R')}!",
+        )
+    if failed:
+        await destination.send(
+            f"{ctx.author.mention} could not ban **{', '.join(str(member) for member in failed)}**, no unban was scheduled for them.",
+        )
 
 
 async def _unban(
@@ -658,23 +700,25 @@ async def _mass_kick(
             raise commands.BadArgument(
                 msg,
             )
-        try:
-            if member.id in (ctx.author.id, guild.me.id):
-                await destination.send(f"{ctx.author.mention} don't do that, Bot is only trying to help")
-                return
-            await member.kick(reason=reason)
-        except Exception as e:
-            await destination.send(f"Can not able to {command_name} **{member}**. Error raised: **{e}**")
+        if member.id in (ctx.author.id, guild.me.id):
+            await destination.send(f"{ctx.author.mention} don't do that, Bot is only trying to help")
+            return
 
-        await asyncio.sleep(0.25)
-    await destination.send(
-        f"{ctx.author.mention} **{', '.join([str(member) for member in members])}** are kicked from the server!",
-    )
+    await _submit_job(ctx, destination, "kick", [member.id for member in members], reason=reason)
 
 
 # BLOCK
 
 
+def _overwrite_pairs(channel: discord.abc.GuildChannel, members: list[discord.Member]) -> dict[str, tuple[int, int]]:
+    pairs = {}
+    for member in members:
+        allow, deny = channel.overwrites_for(member).pair()
+        if allow.value or deny.value:
+            pairs[str(member.id)] = (allow.value, deny.value)
+    return pairs
+
+
 async def _block(
     *,
     guild: discord.Guild,
@@ -692,23 +736,20 @@ async def _block(
         if ctx.author.top_role.position < member.top_role.position and not silent:
             msg = f"{ctx.author.mention} can not {command_name} the {member}, as the their's role is above you"
             raise commands.BadArgument(msg)
-        try:
-            if member.id in (ctx.author.id, guild.me.id) and not silent:
-                await destination.send(f"{ctx.author.mention} don't do that, Bot is only trying to help")
-                return
-            overwrite = channel.overwrites
-            try:
-                overwrite[member].update(send_messages=False, view_channel=False)
-            except KeyError:
-                overwrite[member] = discord.PermissionOverwrite(send_messages=False, view_channel=False)
-            await channel.edit(overwrites=overwrite, reason=reason)
-            if not silent:
-                await destination.send(
-                    f"{ctx.author.mention} overwrite permission(s) for **{member}** has been created! **View Channel, and Send Messages** is denied!",
-                )
-        except Exception as e:
-            if not silent:
-                await destination.send(f"Can not able to {command_name} **{member}**. Error raised: **{e}**")
+        if member.id in (ctx.author.id, guild.me.id) and not silent:
+            await destination.send(f"{ctx.author.mention} don't do that, Bot is only trying to help")
+            return
+
+    await _submit_job(
+        ctx,
+        destination,
+        "block",
+        [member.id for member in members],
+        silent=silent,
+        target_channel_id=channel.id,
+        overwrites=_overwrite_pairs(channel, members),
+        reason=reason,
+    )
 
 
 async def _unblock(
@@ -723,20 +764,23 @@ async def _unblock(
     **kwargs: Any,
 ):
     members = members if isinstance(members, list) else [members]
-    for member in members:
-        try:
-            if channel.permissions_for(member).send_messages:
-                await destination.send(f"{ctx.author.mention} {member.name} is already unblocked. They can send message")
-            else:
-                overwrite = channel.overwrites
-                try:
-                    overwrite[member].update(send_messages=None, view_channel=None)
-                except KeyError:
-                    overwrite[member] = discord.PermissionOverwrite(send_messages=None, view_channel=None)
-                await channel.edit(overwrites=overwrite, reason=reason)
-            await destination.send(f"{ctx.author.mention} overwrite permission(s) for **{member}** has been deleted!")
-        except Exception as e:
-            await destination.send(f"Can not able to {command_name} **{member}**. Error raised: **{e}**")
+    blocked = [member for member in members if not channel.permissions_for(member).send_messages]
+    if unblocked := [member for member in members if member not in blocked]:
+        await destination.send(
+            f"{ctx.author.mention} {', '.join(member.name for member in unblocked)} is already unblocked. They can send message",
+        )
+    if not blocked:
+        return
+
+    await _submit_job(
+        ctx,
+        destination,
+        "unblock",
+        [member.id for member in blocked],
+        target_channel_id=channel.id,
+        overwrites=_overwrite_pairs(channel, blocked),
+        reason=reason,
+    )
 
 
 # LOCK
@@ -11,6 +11,7 @@ import arrow
 import discord
 from cogs.mod import method as mod_method
 from cogs.mod.embeds import MEMBER_EMBED, ROLE_EMBED, TEXT_CHANNEL_EMBED, VOICE_CHANNEL_EMBED
+from cogs.mod.jobs import JobEngine, ModJob
 from core import Cog, Context, Parrot
 from discord.ext import commands
 from utilities.checks import in_temp_channel, is_mod
@@ -31,6 +32,21 @@ class Moderator(Cog):
         self.bot = bot
         self.ON_TESTING = False
 
+        self.jobs = JobEngine(self.bot.sql, self.bot.http, report=self._report_job)
+
+    async def cog_load(self) -> None:
+        await self.jobs.setup()
+        await self.jobs.resume()
+
+    async def cog_unload(self) -> None:
+        await self.jobs.close()
+
+    async def _report_job(self, job: ModJob) -> None:
+        if job.message_id is None:
+            return
+        message = self.bot.get_partial_messageable(job.channel_id).get_partial_message(job.message_id)
+        await message.edit(content=job.summary())
+
     @property
     def display_emoji(self) -> discord.PartialEmoji:
         return discord.PartialEmoji(name="moderator", id=892424227007918121)
@@ -507,6 +523,40 @@ class Moderator(Cog):
             reason=reason,
         )
 
+    @commands.group(name="modjobs", aliases=["modjob"], invoke_without_command=True)
+    @commands.check_any(is_mod(), commands.has_permissions(manage_guild=True))
+    @Context.with_type
+    async def modjobs(self, ctx: Context):
+        """Shows the bulk moderation jobs (mass ban, mass kick, role all, ...) of the server.
+
+        Jobs keep running in the background and are resumed if the bot restarts.
+
+        **Examples:**
+        - `[p]modjobs`
+        - `[p]modjobs cancel 12`
+        """
+        jobs = [job for job in self.jobs.jobs(ctx.guild.id) if not job.finished]
+        if not jobs:
+            await ctx.reply("No moderation job is running.")
+            return
+        await ctx.reply("\n\n".join(job.summary() for job in jobs))
+
+    @modjobs.command(name="cancel", aliases=["stop"])
+    @commands.check_any(is_mod(), commands.has_permissions(manage_guild=True))
+    @Context.with_type
+    async def modjobs_cancel(self, ctx: Context, job_id: int):
+        """Cancels a bulk moderation job. Requests already sent to Discord are not undone.
+
+        **Examples:**
+        - `[p]modjobs cancel 12`
+        """
+        job = self.jobs.get(job_id)
+        if job is None or job.guild_id != ctx.guild.id or job.finished:
+            await ctx.reply(f"No running job with ID `{job_id}`.")
+            return
+        await self.jobs.cancel(job_id)
+        await ctx.reply(job.summary())
+
     @commands.command()
     @commands.check_any(is_mod(), commands.has_permissions(kick_members=True))
     @commands.bot_has_permissions(manage_channels=True, manage_permissions=True, manage_roles=True)
@@ -1474,7 +1524,7 @@ class Moderator(Cog):
 
             try:
                 await ctx.send(f"{ctx.author.mention} move the bot to other channel as to move other users")
-                _, _, a = await ctx.wait_for("voice_state_update", timeout=60, check=check)
+                _, _, a = await ctx.wait_for("voice_state_update", timeout=60, check=check, user=ctx.me)
             except asyncio.TimeoutError:
                 return await ctx.error(f"{ctx.author.mention} you ran out time")
 
@@ -1709,6 +1759,8 @@ class Moderator(Cog):
                 "message",
                 check=lambda m: m.author == ctx.author and m.channel == ctx.channel,
                 timeout=60,
+                channel=ctx.channel,
+                user=ctx.author,
             )
         except asyncio.TimeoutError as e:
             error_message = "You took too long to respond."
@@ -1725,6 +1777,8 @@ class Moderator(Cog):
                 "reaction_add",
                 check=lambda r, u: u == ctx.author and r.message.channel == ctx.channel,
                 timeout=60,
+                channel=ctx.channel,
+                user=ctx.author,
             )
         except asyncio.TimeoutError as e:
             msg = "You took too long to respond."
@@ -102,7 +102,7 @@ class NASA(Cog):
             "dim": 0.15,
         }
 
-        res = await self.bot.http_session.get(
+        res = await self.bot.http_cache.get(
             link,
             params={**self._api_params, **parameters},
             headers=self.bot.GLOBAL_HEADERS,
@@ -138,7 +138,7 @@ class NASA(Cog):
     async def apod_cache(self) -> discord.Embed:
         link = ENDPOINTS.APOD
 
-        r = await self.bot.http_session.get(link, params=self._api_params, headers=self.bot.GLOBAL_HEADERS)
+        r = await self.bot.http_cache.get(link, params=self._api_params, headers=self.bot.GLOBAL_HEADERS)
         if r.status == 200:
             res = await r.json()
         else:
@@ -209,7 +209,7 @@ class NASA(Cog):
         """Earth Polychromatic Imaging Camera. Date must be in "YYYY-MM-DD" format."""
         s_link = ENDPOINTS.EPIC
 
-        r = await self.bot.http_session.get(s_link, params={"date": date}, headers=self.bot.GLOBAL_HEADERS)
+        r = await self.bot.http_cache.get(s_link, params={"date": date}, headers=self.bot.GLOBAL_HEADERS)
         if r.status == 200:
             res = await r.json()
         else:
@@ -249,7 +249,7 @@ class NASA(Cog):
     ):
         """You can literally find any asteroid in the space by date. Date must be in "YYYY-MM-DD" format."""
 
-        r = await self.bot.http_session.get(
+        r = await self.bot.http_cache.get(
             ENDPOINTS.NEO_FIND,
             params={"start_date": start, "end_date": end, **self._api_params},
             headers=self.bot.GLOBAL_HEADERS,
@@ -308,7 +308,7 @@ class NASA(Cog):
     @Context.with_type
     async def findasteroididid(self, ctx: Context, asteroid_id: int):
         """Find any asteroid in the space by ID. "$help findaid" for syntax."""
-        r = await self.bot.http_session.get(
+        r = await self.bot.http_cache.get(
             ENDPOINTS.NEO_FIND_ID.format(asteroid_id),
             params=self._api_params,
             headers=self.bot.GLOBAL_HEADERS,
@@ -351,7 +351,7 @@ class NASA(Cog):
     async def mars(self, ctx: Context, date: Annotated[str, date_parser]):
         """Mars Rovers Pictures. Date must be in "YYYY-MM-DD" format."""
 
-        r = await self.bot.http_session.get(
+        r = await self.bot.http_cache.get(
             ENDPOINTS.MARS,
             params={**self._api_params, "earth_date": date},
             headers=self.bot.GLOBAL_HEADERS,
@@ -391,7 +391,7 @@ class NASA(Cog):
         """NASA Image and Video Library."""
         AGENT = self.random_agent(USER_AGENTS)
         limit = max(1, min(limit or 1, 10))
-        r = await self.bot.http_session.get(ENDPOINTS.NASA_SEARCH, headers={"User-Agent": AGENT}, params={"q": string})
+        r = await self.bot.http_cache.get(ENDPOINTS.NASA_SEARCH, headers={"User-Agent": AGENT}, params={"q": string})
         if r.status >= 300:
             return await ctx.reply(
                 f"{ctx.author.mention} could not find **{string}** in NASA Image and Video Library | Http status: {r.status}",
@@ -411,7 +411,7 @@ class NASA(Cog):
                     render = data["links"][0]["render"]
                 except KeyError:
                     continue
-                r = await self.bot.http_session.get(media_url, headers={"User-Agent": AGENT})
+                r = await self.bot.http_cache.get(media_url, headers={"User-Agent": AGENT})
                 media = await r.json() if r.status == 200 else None
                 img, vid, srt = [], [], []
                 if media:
@@ -467,7 +467,7 @@ class NASA(Cog):
     ):
         """Coronal Mass Ejection."""
         AGENT = self.random_agent(USER_AGENTS)
-        r = await self.bot.http_session.get(
+        r = await self.bot.http_cache.get(
             ENDPOINTS.DONKI.format("CME"),
             params={**self._api_params, "startDate": start, "endDate": end},
             headers={"User-Agent": AGENT},
@@ -518,7 +518,7 @@ class NASA(Cog):
     ):
         """Geomagnetic Storm."""
         AGENT = self.random_agent(USER_AGENTS)
-        r = await self.bot.http_session.get(
+        r = await self.bot.http_cache.get(
             ENDPOINTS.DONKI.format("GST"),
             params={**self._api_params, "startDate": start, "endDate": end},
             headers={"User-Agent": AGENT},
@@ -556,7 +556,7 @@ class NASA(Cog):
     ):
         """Interplanetary Shock."""
         AGENT = self.random_agent(USER_AGENTS)
-        r = await self.bot.http_session.get(
+        r = await self.bot.http_cache.get(
             ENDPOINTS.DONKI.format("IPS"),
             params={**self._api_params, "startDate": start, "endDate": end},
             headers={"User-Agent": AGENT},
@@ -602,7 +602,7 @@ class NASA(Cog):
     ):
         """Solar Flare."""
         AGENT = self.random_agent(USER_AGENTS)
-        r = await self.bot.http_session.get(
+        r = await self.bot.http_cache.get(
             ENDPOINTS.DONKI.format("FLR"),
             params={**self._api_params, "startDate": start, "endDate": end},
             headers={"User-Agent": AGENT},
@@ -656,7 +656,7 @@ class NASA(Cog):
     ):
         """Solar Energetic Particle."""
         AGENT = self.random_agent(USER_AGENTS)
-        r = await self.bot.http_session.get(
+        r = await self.bot.http_cache.get(
             ENDPOINTS.DONKI.format("SEP"),
             params={**self._api_params, "startDate": start, "endDate": end},
             headers={"User-Agent": AGENT},
@@ -699,7 +699,7 @@ Link: {link}
     ):
         """Magnetopause Crossing."""
         AGENT = self.random_agent(USER_AGENTS)
-        r = await self.bot.http_session.get(
+        r = await self.bot.http_cache.get(
             ENDPOINTS.DONKI.format("MPC"),
             params={**self._api_params, "startDate": start, "endDate": end},
             headers={"User-Agent": AGENT},
@@ -741,7 +741,7 @@ Link: {link}
     ):
         """Radiation Belt Enhancement."""
         AGENT = self.random_agent(USER_AGENTS)
-        r = await self.bot.http_session.get(
+        r = await self.bot.http_cache.get(
             ENDPOINTS.DONKI.format("RBE"),
             params={**self._api_params, "startDate": start, "endDate": end},
             headers={"User-Agent": AGENT},
@@ -783,7 +783,7 @@ Link: {link}
     ):
         """Hight Speed Stream."""
         AGENT = self.random_agent(USER_AGENTS)
-        r = await self.bot.http_session.get(
+        r = await self.bot.http_cache.get(
             ENDPOINTS.DONKI.format("HHS"),
             params={**self._api_params, "startDate": start, "endDate": end},
             headers={"User-Agent": AGENT},
@@ -5,11 +5,13 @@ import io
 from random import choice, random
 from typing import Literal
 
+import aiohttp
 import discord
 from core import Cog, Context, Parrot
 from discord.ext import commands, tasks
 from utilities.checks import is_adult
 from utilities.exceptions import ParrotCheckFailure
+from utilities.nsfw.sampler import LinkPrefetcher, LinkSampler
 from utilities.nsfw.sexdotcom import SexDotComGif, SexDotComPics
 from utilities.paginator import PaginationView as PV
 
@@ -29,11 +31,17 @@ class NSFW(Cog):
         self._sexdotcomgif = SexDotComGif(session=self.bot.http_session)
         self._sexdotcompics = SexDotComPics(session=self.bot.http_session)
 
+        self.links = LinkSampler(self.bot.sql, "nsfw_links")
+        self.grouped_links = LinkSampler(self.bot.sql, "nsfw_links_grouped", group_by="type")
+        self.gifs = LinkPrefetcher(self.links, self._fetch_sexdotcom)
+
     async def cog_load(self):
         self.command_loader()
+        self.bot.startup.defer("nsfw", self.refresh_links)
         self.sexdotcom_loop.start()
 
     async def cog_unload(self):
+        self.gifs.close()
         await self._sexdotcomgif.session.close()
         await self._sexdotcompics.session.close()
 
@@ -205,24 +213,44 @@ class NSFW(Cog):
     @commands.max_concurrency(1, commands.BucketType.user)
     @is_adult()
     @Context.with_type
-    async def _sex_gif(self, ctx: Context) -> None:
+    async def _sex_gif(self, ctx: Context, *, tag: str | None = None) -> None:
         """Mature Content. 18+ only Please."""
-        random_gif = """SELECT link FROM nsfw_links ORDER BY RANDOM() LIMIT 1"""
-        sql = self.bot.sql
-        link = await sql.execute(random_gif)
-        link = await link.fetchone()
+        if tag is None:
+            result = await self.gifs.get(channel_id=ctx.channel.id)
+        else:
+            tag = tag.lower()
+            if not self.grouped_links.count(tag):
+                await ctx.reply(f"No links for tag `{tag}`. Available tags: {', '.join(self.grouped_links.groups())}")
+                return
 
-        link = link[0]
-        headers = {"Referer": "https://www.sex.com/gifs"}
-        response = await self.bot.http_session.get(link, headers=headers)
-        if response.status != 200:
+            result = None
+            link = await self.grouped_links.sample(tag, channel_id=ctx.channel.id)
+            if link is not None and (data := await self._fetch_sexdotcom(link)) is not None:
+                result = link, data
+
+        if result is None:
             await ctx.reply("Something went wrong with the API")
             return
 
-        _bytes = await response.read()
+        _, _bytes = result
         file = discord.File(io.BytesIO(_bytes), "file.gif")
         await ctx.reply(file=file)
 
+    async def _fetch_sexdotcom(self, link: str) -> bytes | None:
+        headers = {"Referer": "https://www.sex.com/gifs"}
+        try:
+            response = await self.bot.http_session.get(link, headers=headers)
+            if response.status != 200:
+                return None
+            return await response.read()
+        except aiohttp.ClientError:
+            return None
+
+    async def refresh_links(self) -> None:
+        await self.links.refresh()
+        await self.grouped_links.refresh()
+        self.gifs.fill()
+
     async def _sexdotcom_write_to_db_gifs(self):
         links = await self._sexdotcomgif.get_all()
 
@@ -249,6 +277,7 @@ class NSFW(Cog):
             self._sexdotcom_write_to_db_pics(),
             return_exceptions=False,
         )
+        await self.refresh_links()
 
     @tasks.loop(minutes=30)
     async def sexdotcom_loop(self):
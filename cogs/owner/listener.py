@@ -55,7 +55,7 @@ class OwnerListener(Cog):
                 return m.author.id == message.author.id and m.channel.id == message.channel.id and m.content == AUTH
 
             try:
-                await self.bot.wait_for("message", check=check, timeout=15)
+                await self.bot.wait_for("message", check=check, timeout=15, channel=message.channel, user=message.author)
             except Exception:
                 await message.channel.send("Authentication failed. Command aborted")
                 await msg.delete()
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import hashlib
 import io
 import json
@@ -26,13 +25,12 @@ import discord
 from core import Cog, Context, Parrot
 from discord.ext import commands
 from utilities.converters import convert_bool
+from utilities.lazy import lazy_modules, profiler
 from utilities.paginator import PaginationView
 from utilities.time import ShortTime
 from utilities.wikihow import Parser as WikihowParser
 
-from . import fuzzy
 from .flags import BanFlag, SubscriptionFlag
-from .utils import SphinxObjectFileReader
 from .views import MongoCollectionView, MongoView, MongoViewSelect, NitroView
 
 
@@ -472,6 +470,70 @@ class Owner(Cog, command_attrs={"hidden": True}):
         embed.set_footer(text=f"{issues} warnings")
         await ctx.send(embed=embed)
 
+    @commands.command(name="httpstats", aliases=["http-stats"], hidden=True)
+    async def http_stats(self, ctx: Context):
+        """Outbound HTTP stats, per host."""
+        metrics = sorted(self.bot.http_client.metrics().items(), key=lambda item: item[1]["requests"], reverse=True)
+
+        builder = [f"{'Host':<28} {'Req':>6} {'Err':>5} {'429':>4} {'Avg':>7} {'Max':>7}"]
+        for host, data in metrics[:20]:
+            builder.append(
+                f"{host[:28]:<28} {data['requests']:>6} {data['errors']:>5} {data['rate_limited']:>4} "
+                f"{data['avg_latency']:>6.2f}s {data['max_latency']:>6.2f}s",
+            )
+
+        cache = self.bot.http_cache.metrics
+        builder.append(
+            f"\nCache: {cache['hit']} hits, {cache['db_hit']} from disk, {cache['miss']} misses, "
+            f"{cache['revalidated']} revalidated, {cache['coalesced']} coalesced",
+        )
+        await ctx.send("```\n" + "\n".join(builder) + "\n```")
+
+    @commands.command(name="pipelinestats", aliases=["pipeline-stats"], hidden=True)
+    async def pipeline_stats(self, ctx: Context):
+        """Timings of the message pipeline, per stage."""
+        builder = [f"{'Stage':<16} {'Calls':>7} {'Skip':>6} {'Err':>4} {'Slow':>5} {'Avg':>8} {'Max':>7}"]
+        for name, calls, skipped, errors, over_budget, average, maximum in self.bot.message_pipeline.report():
+            builder.append(
+                f"{name[:16]:<16} {calls:>7} {skipped:>6} {errors:>4} {over_budget:>5} "
+                f"{average * 1000:>6.1f}ms {maximum:>6.2f}s",
+            )
+        await ctx.send("```\n" + "\n".join(builder) + "\n```")
+
+    @commands.command(name="startupstats", aliases=["startup-stats"], hidden=True)
+    async def startup_stats(self, ctx: Context):
+        """Time to ready, and the slowest extensions to load."""
+        startup = self.bot.startup
+        builder = [", ".join(f"{name}: {elapsed:.2f}s" for name, elapsed in startup.milestones.items())]
+
+        builder.append(f"\n{'Extension':<30} {'Import':>7} {'Setup':>7} {'Total':>7}")
+        for timing in startup.slowest(15):
+            flag = " (lazy)" if timing.lazy else " (failed)" if timing.error else ""
+            builder.append(
+                f"{timing.name[:30]:<30} {timing.imported:>6.2f}s {timing.setup:>6.2f}s {timing.total:>6.2f}s{flag}",
+            )
+
+        if startup.warmups:
+            builder.append("\nWarm ups: " + ", ".join(f"{name} {elapsed:.2f}s" for name, elapsed in startup.warmups.items()))
+        await ctx.send("```\n" + "\n".join(builder) + "\n```")
+
+    @commands.command(name="importtime", aliases=["import-time"], hidden=True)
+    async def import_time(self, ctx: Context):
+        """What importing each package cost, and which lazy modules were imported yet."""
+        if not profiler.records:
+            return await ctx.send(f"{ctx.author.mention} import profiler was not installed")
+
+        builder = [f"{'Package':<24} {'Own':>8}"]
+        builder.extend(f"{package[:24]:<24} {elapsed:>7.3f}s" for package, elapsed in profiler.by_package(10))
+
+        builder.append(f"\n{'Module':<32} {'Own':>8} {'Total':>8}")
+        for record in profiler.top(15):
+            flag = " (lazy)" if record.lazy else ""
+            builder.append(f"{record.name[:32]:<32} {record.own:>7.3f}s {record.total:>7.3f}s{flag}")
+
+        builder.append("\nLazy: " + ", ".join(f"{name} {'loaded' if loaded else '-'}" for name, loaded in lazy_modules().items()))
+        await ctx.send("```\n" + "\n".join(builder) + "\n```")
+
     @commands.command()
     async def maintenance(
         self,
@@ -755,89 +817,11 @@ class DiscordPy(Cog, command_attrs={"hidden": True}):
     def display_emoji(self) -> discord.PartialEmoji:
         return discord.PartialEmoji(name="dpy", id=596577034537402378)
 
-    async def cog_load(self) -> None:
-        self.bot.loop.create_task(self.build_rtfm_lookup_table(self.page_types))
-
-    def parse_object_inv(self, stream, url):
-        # key: URL
-        # n.b.: key doesn't have `discord` or `discord.ext.commands` namespaces
-        result = {}
-
-        # first line is version info
-        inv_version = stream.readline().rstrip()
-        _ = stream.readline().rstrip()[11:]
-
-        if inv_version != "# Sphinx inventory version 2":
-            msg = "Invalid objects.inv file version."
-            raise RuntimeError(msg)
-
-        # next line is "# Project: <name>"
-        # then after that is "# Version: <version>"
-        projname = stream.readline().rstrip()[11:]
-
-        # next line says if it's a zlib header
-        line = stream.readline()
-        if "zlib" not in line:
-            msg = "Invalid objects.inv file, not z-lib compatible."
-            raise RuntimeError(msg)
-
-        # This code mostly comes from the Sphinx repository.
-        entry_regex = re.compile(r"(?x)(.+?)\s+(\S*:\S*)\s+(-?\d+)\s+(\S+)\s+(.*)")
-        for line in stream.read_compressed_lines():
-            match = entry_regex.match(line.rstrip())
-            if not match:
-                continue
-
-            name, directive, _, location, dispname = match.groups()
-            domain, _, subdirective = directive.partition(":")
-            if directive == "py:module" and name in result:
-                # From the Sphinx Repository:
-                # due to a bug in 1.1 and below,
-                # two inventory entries are created
-                # for Python modules, and the first
-                # one is correct
-                continue
-
-            # Most documentation pages have a label
-            if directive == "std:doc":
-                subdirective = "label"
-
-            if location.endswith("$"):
-                location = location[:-1] + name
-
-            key = name if dispname == "-" else dispname
-            prefix = f"{subdirective}:" if domain == "std" else ""
-
-            if projname == "discord.py":
-                key = key.replace("discord.ext.commands.", "").replace("discord.", "")
-
-            result[f"{prefix}{key}"] = os.path.join(url, location)
-
-        return result
-
-    async def build_rtfm_lookup_table(self, page_types):
-        cache = {}
-        for key, page in page_types.items():
-            cache[key] = {}
-            resp = await self.bot.http_session.get(f"{page}/objects.inv")
-            if resp.status != 200:
-                msg = "Cannot build rtfm lookup table, try again later."
-                raise RuntimeError(msg)
-
-            stream = SphinxObjectFileReader(await resp.read())
-            cache[key] = self.parse_object_inv(stream, page)
-
-        self._rtfm_cache = cache
-
     async def do_rtfm(self, ctx: Context, key: str, obj):
         if obj is None:
             await ctx.send(self.page_types[key])
             return
 
-        if not hasattr(self, "_rtfm_cache"):
-            await ctx.typing()
-            await self.build_rtfm_lookup_table(self.page_types)
-
         obj = re.sub(r"^(?:discord\.(?:ext\.)?)?(?:commands\.)?(.+)", r"\1", obj)
 
         if key.startswith("latest"):
@@ -850,10 +834,9 @@ class DiscordPy(Cog, command_attrs={"hidden": True}):
                     obj = f"abc.Messageable.{name}"
                     break
 
-        cache = list(self._rtfm_cache[key].items())
-
-        _matches = await asyncio.to_thread(fuzzy.finder, obj, cache, key=lambda t: t[0], lazy=False)
-        matches = list(_matches)[:8]
+        matches = self.bot.docs_index.search(key, obj, limit=8)
+        if matches is None:
+            return await ctx.send("Documentation index is still being built. Try again later.")
         if len(matches) == 0:
             return await ctx.send("Could not find anything. Sorry.")
 
@@ -878,7 +861,7 @@ class DiscordPy(Cog, command_attrs={"hidden": True}):
     async def rtfd(self, ctx: Context, *, obj: str | None = None):
         """Gives you a documentation link for a specified entity.
         Events, objects, and functions are all supported through
-        a cruddy fuzzy algorithm.
+        a fuzzy search over the documentation index.
         """
         if not ctx.invoked_subcommand:
             return await self.do_rtfm(ctx, "discord", obj)
@@ -26,25 +26,14 @@ async def python_doc(ctx: Context, text: str) -> discord.Message | None:
     """Filters python.org results based on your query."""
     text = text.strip("`")
 
-    url = "https://docs.python.org/3/genindex-all.html"
+    matches = ctx.bot.docs_index.search("python", text, limit=10)
+    if matches is None:
+        return await ctx.send("Python documentation index is still being built. Retry later.")
 
-    response = await ctx.bot.http_session.get(url)
-    if response.status != 200:
-        return await ctx.send(f"An error occurred (status code: {response.status}). Retry later.")
-
-    soup = BeautifulSoup(str(await response.text()), HTML_PARSER)
-
-    def soup_match(tag):
-        return all(string in tag.text for string in text.strip().split()) and tag.name == "li"
-
-    elements = await asyncio.to_thread(soup.find_all, soup_match, limit=10)
-    links = [tag.select_one("li > a") for tag in elements]
-    links = [link for link in links if link is not None]
-
-    if not links:
+    if not matches:
         return await ctx.send(f"{ctx.author.mention} no results")
 
-    content = [f"[{a.string}](https://docs.python.org/3/{a.get('href')})" for a in links]
+    content = [f"[{name}]({url})" for name, url in matches]
 
     emb = discord.Embed(title="Python 3 docs")
     emb.set_thumbnail(
@@ -94,8 +83,26 @@ async def _cppreference(language: str, ctx: Context, text: str) -> discord.Messa
     return await ctx.send(embed=emb)
 
 
+async def cpp_doc(ctx: Context, text: str) -> discord.Message | None:
+    """Search something in the cppreference index, falls back to the wiki search."""
+    text = text.strip("`")
+
+    matches = ctx.bot.docs_index.search("cpp", text, limit=10)
+    if matches is None:
+        return await _cppreference("C++", ctx, text)
+
+    if not matches:
+        return await ctx.send(f"{ctx.author.mention} no results")
+
+    content = [f"[{name}]({url})" for name, url in matches]
+    emb = discord.Embed(title="C++ docs")
+    emb.set_thumbnail(url="https://isocpp.org/files/img/cpp_logo.png")
+    emb.description = f"Results for `{text}` :\n" + "\n".join(content)
+
+    return await ctx.send(embed=emb)
+
+
 c_doc = partial(_cppreference, "C")
-cpp_doc = partial(_cppreference, "C++")
 
 
 async def haskell_doc(ctx: Context, text: str) -> discord.Message | None:
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import shlex
+import sys
+from typing import TypedDict
+
+from lru import LRU
+
+log = logging.getLogger("cogs.rtfm.lint_service")
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_lint_worker.py")
+STREAM_LIMIT = 2**24  # 16 MiB, pylint/bandit JSON for a big snippet is easily over the 64 KiB default
+
+__all__ = ("LintResult", "LintService", "LintWorker", "lint_service")
+
+# wait() of killed workers, referenced until they finish
+_reaping: set[asyncio.Task[int]] = set()
+
+
+class LintResult(TypedDict):
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+class LintWorker:
+    """A single long-lived ``_lint_worker.py`` process. Runs one job at a time."""
+
+    def __init__(self, tool: str) -> None:
+        self.tool = tool
+        self.process: asyncio.subprocess.Process | None = None
+        self.jobs: int = 0
+
+    def __repr__(self) -> str:
+        pid = self.process.pid if self.process else None
+        return f"<LintWorker tool={self.tool!r} pid={pid} jobs={self.jobs}>"
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    async def start(self) -> None:
+        self.process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            WORKER_SCRIPT,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=STREAM_LIMIT,
+        )
+        self.jobs = 0
+        log.debug("Started %s", self)
+
+    async def run(self, argv: list[str], source: str) -> LintResult:
+        if not self.alive:
+            await self.start()
+
+        assert self.process is not None and self.process.stdin is not None and self.process.stdout is not None
+
+        self.process.stdin.write(json.dumps({"argv": argv, "source": source}).encode() + b"\n")
+        await self.process.stdin.drain()
+
+        line = await self.process.stdout.readline()
+        if not line:
+            await self.process.wait()
+            msg = f"{self.tool} worker exited with code {self.process.returncode}"
+            raise RuntimeError(msg)
+
+        self.jobs += 1
+        return json.loads(line)
+
+    def kill(self) -> None:
+        if self.alive:
+            assert self.process is not None
+            self.process.kill()
+            # reap it in the background, or it stays a zombie with its pipes open
+            task = asyncio.create_task(self.process.wait())
+            _reaping.add(task)
+            task.add_done_callback(_reaping.discard)
+        self.process = None
+
+    async def close(self) -> None:
+        if not self.alive:
+            return
+
+        assert self.process is not None and self.process.stdin is not None
+        self.process.stdin.close()
+        try:
+            await asyncio.wait_for(self.process.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            self.kill()
+
+
+class LintService:
+    """Pool of warm linter workers.
+
+    Each tool gets ``workers_per_tool`` processes, which is also the number of jobs
+    of that tool that can run at once. Jobs are keyed by a hash of ``(argv, source)``,
+    finished results are kept in an LRU so linting the same snippet twice is instant.
+    """
+
+    def __init__(self, *, workers_per_tool: int = 2, timeout: float = 30, cache_size: int = 2**8) -> None:
+        self.workers_per_tool = workers_per_tool
+        self.timeout = timeout
+
+        self._pools: dict[str, asyncio.Queue[LintWorker]] = {}
+        self._workers: list[LintWorker] = []
+        self._cache: LRU = LRU(cache_size)
+        self._pending: dict[str, asyncio.Future[LintResult]] = {}
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __repr__(self) -> str:
+        return f"<LintService workers={len(self._workers)} cached={len(self._cache)} hits={self.hits} misses={self.misses}>"
+
+    def _pool(self, tool: str) -> asyncio.Queue[LintWorker]:
+        if tool not in self._pools:
+            pool: asyncio.Queue[LintWorker] = asyncio.Queue()
+            for _ in range(self.workers_per_tool):
+                worker = LintWorker(tool)
+                self._workers.append(worker)
+                pool.put_nowait(worker)
+            self._pools[tool] = pool
+        return self._pools[tool]
+
+    @staticmethod
+    def job_key(argv: list[str], source: str) -> str:
+        return hashlib.sha256(json.dumps([argv, source]).encode()).hexdigest()
+
+    async def warm(self, *tools: str) -> None:
+        """Start one worker per tool ahead of the first request."""
+        for tool in tools:
+            pool = self._pool(tool)
+            worker = pool.get_nowait()
+            try:
+                if not worker.alive:
+                    await worker.start()
+            finally:
+                pool.put_nowait(worker)
+
+    async def run(self, command: str | list[str], source: str) -> LintResult:
+        argv = shlex.split(command) if isinstance(command, str) else list(command)
+        key = self.job_key(argv, source)
+
+        if (cached := self._cache.get(key)) is not None:
+            self.hits += 1
+            return cached
+
+        # same snippet requested again while the first one is still running
+        if key in self._pending:
+            self.hits += 1
+            return await asyncio.shield(self._pending[key])
+
+        self.misses += 1
+        future: asyncio.Future[LintResult] = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            result = await self._run(argv, source)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark as retrieved, nobody else may be waiting
+            raise
+        else:
+            future.set_result(result)
+            if result["returncode"] >= 0:
+                self._cache[key] = result
+            return result
+        finally:
+            del self._pending[key]
+
+    async def _run(self, argv: list[str], source: str) -> LintResult:
+        pool = self._pool(argv[0])
+        worker = await pool.get()
+        try:
+            return await asyncio.wait_for(worker.run(argv, source), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            log.warning("Lint job timed out after %ss, restarting %s", self.timeout, worker)
+            worker.kill()
+            return {"returncode": -9, "stdout": "", "stderr": f"Timed out after {self.timeout} seconds."}
+        except (RuntimeError, OSError, ValueError):
+            log.warning("Lint worker failed, restarting %s", worker, exc_info=True)
+            worker.kill()
+            return {"returncode": -1, "stdout": "", "stderr": "Linter crashed while processing the code."}
+        except asyncio.CancelledError:
+            # the worker still owes us a response, it can not be reused
+            worker.kill()
+            raise
+        finally:
+            pool.put_nowait(worker)
+
+    async def close(self) -> None:
+        await asyncio.gather(*(worker.close() for worker in self._workers))
+        self._workers.clear()
+        self._pools.clear()
+
+
+lint_service = LintService()
@@ -0,0 +1,155 @@
+"""Long-lived linter worker.
+
+Started by :class:`cogs.rtfm._lint_service.LintService` as a plain script (so it never imports the bot).
+Reads one JSON job per line from stdin and writes one JSON result per line to stdout::
+
+    -> {"argv": ["flake8", "--format=json"], "source": "import os\\n"}
+    <- {"returncode": 1, "stdout": "...", "stderr": "..."}
+
+Python tools are imported once and run in-process, so every job after the first skips the
+interpreter and plugin start up. The snippet is written to a fixed file name inside a private
+directory (on ``/dev/shm`` when available), no shell is ever involved.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from collections.abc import Callable
+
+DISPLAY_NAME = "main.py"
+SUBPROCESS_TIMEOUT = 60
+
+
+class _Capture(io.TextIOWrapper):
+    """A text stream with a ``.buffer`` (flake8 writes bytes) that survives ``close()`` (bandit closes it)."""
+
+    def __init__(self, name: str) -> None:
+        buffer = io.BytesIO()
+        buffer.name = name  # bandit's formatters log the name of the file they write to
+        super().__init__(buffer, encoding="utf-8", errors="replace", write_through=True)
+
+    def close(self) -> None:
+        self.flush()
+
+    def getvalue(self) -> str:
+        self.flush()
+        return self.buffer.getvalue().decode("utf-8", errors="replace")
+
+
+def _run_flake8(argv: list[str], path: str) -> int:
+    from flake8.main.cli import main
+
+    return main([*argv, path])
+
+
+def _run_pylint(argv: list[str], path: str) -> int:
+    import astroid
+    from pylint.lint import Run
+
+    # astroid caches modules by name, and every job uses the same file name
+    astroid.MANAGER.clear_cache()
+    return Run([*argv, path], exit=False).linter.msg_status
+
+
+def _run_mypy(argv: list[str], path: str) -> int:
+    from mypy import api
+
+    # the cache lives next to the snippet, so typeshed is only analysed once per worker
+    stdout, stderr, returncode = api.run([*argv, "--cache-dir", os.path.join(os.path.dirname(path), ".mypy_cache"), path])
+    sys.stdout.write(stdout)
+    sys.stderr.write(stderr)
+    return returncode
+
+
+def _run_bandit(argv: list[str], path: str) -> int:
+    from bandit.cli.main import main
+
+    sys.argv = ["bandit", *argv, path]
+    main()
+    return 0
+
+
+def _run_executable(tool: str) -> Callable[[list[str], str], int]:
+    def runner(argv: list[str], path: str) -> int:
+        proc = subprocess.run(
+            [tool, *argv, path],
+            capture_output=True,
+            text=True,
+            timeout=SUBPROCESS_TIMEOUT,
+            cwd=os.path.dirname(path),
+            check=False,
+        )
+        sys.stdout.write(proc.stdout)
+        sys.stderr.write(proc.stderr)
+        return proc.returncode
+
+    return runner
+
+
+RUNNERS: dict[str, Callable[[list[str], str], int]] = {
+    "flake8": _run_flake8,
+    "pylint": _run_pylint,
+    "mypy": _run_mypy,
+    "bandit": _run_bandit,
+    "ruff": _run_executable("ruff"),
+    "pyright": _run_executable("pyright"),
+}
+
+
+def run_job(job: dict, path: str) -> dict:
+    tool, *argv = job["argv"]
+    runner = RUNNERS.get(tool)
+    if runner is None:
+        return {"returncode": -1, "stdout": "", "stderr": f"Unknown tool {tool!r}"}
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(job["source"])
+
+    stdout, stderr = _Capture("<stdout>"), _Capture("<stderr>")
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            returncode = runner(argv, path)
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else int(e.code is not None)
+        except subprocess.TimeoutExpired:
+            returncode = -9
+            print(f"{tool} timed out", file=sys.stderr)
+        except Exception as e:
+            returncode = -1
+            print(f"{type(e).__name__}: {e}", file=sys.stderr)
+
+    return {
+        "returncode": returncode,
+        "stdout": stdout.getvalue().replace(path, DISPLAY_NAME),
+        "stderr": stderr.getvalue().replace(path, DISPLAY_NAME),
+    }
+
+
+def main() -> None:
+    # Keep the real stdout for the protocol, anything a tool prints outside
+    # of the redirects must not corrupt it.
+    protocol = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+
+    root = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    with tempfile.TemporaryDirectory(prefix="lint_", dir=root) as directory:
+        os.chdir(directory)
+        path = os.path.join(directory, DISPLAY_NAME)
+
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            result = run_job(json.loads(line), path)
+            protocol.write(json.dumps(result) + "\n")
+            protocol.flush()
+
+
+if __name__ == "__main__":
+    main()
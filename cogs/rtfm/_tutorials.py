@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Iterable
+
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
+
+__all__ = ("Tutorial", "TutorialIndex")
+
+TUTORIALS_DIRECTORY = "extra/tutorials/python"
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+TITLE_RE = re.compile(r"^\*\*(.+?)\*\*")
+
+
+def _tokens(text: str) -> set[str]:
+    return set(TOKEN_RE.findall(text.lower()))
+
+
+class Tutorial:
+    __slots__ = ("name", "title", "content")
+
+    def __init__(self, name: str, content: str) -> None:
+        self.name = name
+        self.content = content
+
+        match = TITLE_RE.match(content.lstrip())
+        self.title: str = match[1] if match else name
+
+    def __repr__(self) -> str:
+        return f"<Tutorial name={self.name!r} title={self.title!r}>"
+
+
+class TutorialIndex:
+    """Search index over the markdown tutorials in ``extra/tutorials/python``.
+
+    Built once, then every query is an exact dict lookup, a token lookup in the
+    inverted index and one rapidfuzz pass over the pre-processed names. Cheap enough
+    to be called inline from both the prefix command and slash autocomplete.
+    """
+
+    __slots__ = ("tutorials", "_keys", "_names", "_titles", "_lookup", "_inverted")
+
+    def __init__(self, tutorials: Iterable[Tutorial]) -> None:
+        self.tutorials: dict[str, Tutorial] = {tutorial.name: tutorial for tutorial in tutorials}
+
+        names = self._keys = list(self.tutorials)
+        self._names: list[str] = [default_process(name.replace("-", " ")) for name in names]
+        self._titles: list[str] = [default_process(self.tutorials[name].title) for name in names]
+
+        self._lookup: dict[str, str] = {}
+        self._inverted: dict[str, set[int]] = {}
+        for index, (name, processed_name, processed_title) in enumerate(zip(names, self._names, self._titles, strict=True)):
+            self._lookup.setdefault(processed_name, name)
+            self._lookup.setdefault(processed_title, name)
+            for token in _tokens(name) | _tokens(self.tutorials[name].title):
+                self._inverted.setdefault(token, set()).add(index)
+
+    def __repr__(self) -> str:
+        return f"<TutorialIndex tutorials={len(self)}>"
+
+    def __len__(self) -> int:
+        return len(self.tutorials)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.tutorials
+
+    def __getitem__(self, name: str) -> Tutorial:
+        return self.tutorials[name]
+
+    def names(self) -> list[str]:
+        return list(self.tutorials)
+
+    @classmethod
+    def from_directory(cls, directory: str = TUTORIALS_DIRECTORY) -> TutorialIndex:
+        """Read every ``*.md`` file in ``directory``. Blocking, call it once at start up."""
+        tutorials: list[Tutorial] = []
+        for file in sorted(os.listdir(directory)):
+            if not file.endswith(".md"):
+                continue
+            with open(os.path.join(directory, file), encoding="utf-8") as f:
+                tutorials.append(Tutorial(file[:-3], f.read()))
+
+        return cls(tutorials)
+
+    def search(self, query: str, *, limit: int = 5, score_cutoff: float = 0) -> list[tuple[str, float]]:
+        """Return up to ``limit`` ``(name, score)`` pairs, best match first."""
+        processed = default_process(query.replace("-", " "))
+        if not processed:
+            return []
+
+        scores: dict[str, float] = {}
+
+        if (exact := self._lookup.get(processed)) is not None:
+            scores[exact] = 100
+
+        for _, score, index in process.extract(
+            processed,
+            self._names,
+            scorer=fuzz.WRatio,
+            processor=None,
+            limit=limit,
+            score_cutoff=score_cutoff,
+        ):
+            scores.setdefault(self._keys[index], score)
+
+        # titles are only scored for tutorials that share a word with the query
+        candidates: set[int] = set()
+        for token in _tokens(query):
+            candidates |= self._inverted.get(token, set())
+        for index in candidates:
+            name = self._keys[index]
+            score = max(fuzz.WRatio(processed, self._titles[index], processor=None), scores.get(name, 0))
+            if score >= score_cutoff:
+                scores[name] = score
+
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
@@ -2,15 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import io
-import os
 import pathlib
 import re
-import threading
 import time
-from collections.abc import Callable
-from typing import Any, TypeVar
+from typing import TypeVar
 
-import aiofiles
 import arrow
 import bandit
 import pkg_resources
@@ -36,6 +32,8 @@ from yapf.yapflib.yapf_api import FormatCode as yapf_format
 
 from ._bandit import BanditConverter, validate_flag as bandit_validate_flag
 from ._flake8 import Flake8Converter, validate_flag as flake8_validate_flag
+from ._lint_service import lint_service
+from ._lint_worker import DISPLAY_NAME
 from ._mypy import MypyConverter, validate_flag as mypy_validate_flag
 from ._pylint import PyLintConverter, validate_flag as pylint_validate_flag
 from ._pyright import PyrightConverter, validate_flag as pyright_validate_flag
@@ -222,35 +220,11 @@ class InformationDropdown(discord.ui.Select):
         await self.original_message.edit(embed=result_embed)
 
 
-async def code_to_file(code: str) -> str:
-    now = arrow.utcnow().timestamp()
-    filename = f"temp/runner_{int(now*1000)}.py"
-    async with aiofiles.open(filename, "w") as f:
-        await f.write(code)
-
-    return filename
-
-
-def background_task(func: Callable, *args: Any, **kwargs: Any) -> Callable[[], Any]:
-    """Decorator for running a function in the background."""
-
-    def wrapper() -> Any:
-        return func(*args, **kwargs)
-
-    return wrapper
-
-
-async def lint(cmd: str, filename: str) -> dict[str, str]:
-    proc = await asyncio.create_subprocess_shell(
-        f"{cmd} {filename}",
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
-
-    stdout, stderr = await proc.communicate()
+async def lint(cmd: str, source: str) -> dict[str, str]:
+    result = await lint_service.run(cmd, source)
 
     # some formatting
-    cmd = re.sub(" +", " ", cmd)  # remove extra spaces
+    cmd = re.sub(" +", " ", cmd).strip()  # remove extra spaces
 
     args = cmd.split(" ")
 
@@ -265,16 +239,14 @@ async def lint(cmd: str, filename: str) -> dict[str, str]:
             arg = f"{Fore.YELLOW}{arg}"
         rest.append(arg)
 
-    filename = f"{Fore.CYAN}{filename}"
+    filename = f"{Fore.CYAN}{DISPLAY_NAME}"
 
     complete_cmd_str = f"$ {command} {' '.join(rest)} {filename}"
-    payload = {"main": f"{complete_cmd_str}\n\n{Fore.CYAN}Return Code: {Fore.RED}{proc.returncode}"}
-    if stdout:
-        payload["stdout"] = stdout.decode()
-    if stderr:
-        payload["stderr"] = stderr.decode()
-
-    threading.Thread(target=background_task(os.remove, filename)).start()
+    payload = {"main": f"{complete_cmd_str}\n\n{Fore.CYAN}Return Code: {Fore.RED}{result['returncode']}"}
+    if result["stdout"]:
+        payload["stdout"] = result["stdout"]
+    if result["stderr"]:
+        payload["stderr"] = result["stderr"]
 
     return payload
 
@@ -333,8 +305,6 @@ class LintCode:
             await ctx.reply("Invalid language.")
             return
 
-        filename = await code_to_file(self.source)
-
         cmd_str = ""
         if self.linttype == "flake8":
             cmd_str = flake8_validate_flag(self.flag)
@@ -349,7 +319,7 @@ class LintCode:
         elif self.linttype == "ruff":
             cmd_str = ruff_validate_flag(self.flag)
 
-        data = await lint(cmd_str, filename) if cmd_str else {}
+        data = await lint(cmd_str, self.source) if cmd_str else {}
 
         if not data:
             await ctx.reply("No output.")
@@ -374,8 +344,8 @@ class LintCode:
             await interference.send_to(ctx)
 
     async def lint_with_pyright(self, ctx: Context) -> None:
-        filename = await code_to_file(self.source)
-        data = await lint("pyright --outputjson", filename)
+        filename = DISPLAY_NAME
+        data = await lint("pyright --outputjson", self.source)
 
         await ctx.reply(f"```ansi\n{data['main']}```")
 
@@ -418,8 +388,8 @@ class LintCode:
             await interface.send_to(ctx)
 
     async def lint_with_flake8(self, ctx: Context) -> None:
-        filename = await code_to_file(self.source)
-        data = await lint("flake8 --format=json", filename)
+        filename = DISPLAY_NAME
+        data = await lint("flake8 --format=json", self.source)
 
         await ctx.reply(f"```ansi\n{data['main']}```")
 
@@ -450,8 +420,8 @@ class LintCode:
             await interface.send_to(ctx)
 
     async def lint_with_ruff(self, ctx: Context) -> None:
-        filename = await code_to_file(self.source)
-        data = await lint("ruff --format=json", filename)
+        filename = DISPLAY_NAME
+        data = await lint("ruff --format=json", self.source)
 
         await ctx.reply(f"```ansi\n{data['main']}```")
 
@@ -500,8 +470,8 @@ class LintCode:
             await interface.send_to(ctx)
 
     async def lint_with_pylint(self, ctx: Context) -> None:
-        filename = await code_to_file(self.source)
-        data = await lint("pylint -f json", filename)
+        filename = DISPLAY_NAME
+        data = await lint("pylint -f json", self.source)
 
         await ctx.reply(f"```ansi\n{data['main']}```")
 
@@ -526,8 +496,8 @@ class LintCode:
                 )
 
     async def lint_with_bandit(self, ctx: Context) -> None:
-        filename = await code_to_file(self.source)
-        data = await lint("bandit -f json", filename)
+        filename = DISPLAY_NAME
+        data = await lint("bandit -f json", self.source)
 
         await ctx.reply(f"```ansi\n{data['main']}```")
 
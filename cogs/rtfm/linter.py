@@ -4,6 +4,7 @@ import discord
 from core import Cog, Context, Parrot
 from discord.ext import commands
 
+from ._lint_service import lint_service
 from ._utils import (
     BanditConverter,
     Flake8Converter,
@@ -21,6 +22,13 @@ class Linter(Cog):
     def __init__(self, bot: Parrot) -> None:
         self.bot = bot
 
+    async def cog_load(self) -> None:
+        # first flake8 run imports all of its plugins, do that before anyone asks
+        self.bot.loop.create_task(lint_service.warm("flake8"))
+
+    async def cog_unload(self) -> None:
+        await lint_service.close()
+
     @property
     def display_emoji(self) -> discord.PartialEmoji:
         return discord.PartialEmoji(name="\N{BROOM}")
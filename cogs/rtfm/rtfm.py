@@ -17,11 +17,9 @@ from urllib.parse import quote, quote_plus
 import aiohttp
 import arrow
 import rapidfuzz
-from aiofile import async_open
 from bs4 import BeautifulSoup
 from bs4.element import NavigableString
 from jishaku.paginators import PaginatorEmbedInterface
-from rapidfuzz.process import extractOne
 
 import discord
 from core import Cog, Context, Parrot
@@ -29,9 +27,11 @@ from discord import app_commands
 from discord.ext import commands, tasks
 from utilities import hastebin
 from utilities.converters import WrappedMessageConverter
+from utilities.http_cache import CachedResponse
 
 from . import _doc, _ref
 from ._kontests import AtCoder, CodeForces, CSAcademy, HackerEarth, HackerRank
+from ._tutorials import TutorialIndex
 from ._used import execute_run, get_raw, prepare_payload
 from ._utils import (
     ANSI_RE,
@@ -132,7 +132,7 @@ class RTFM(Cog):
             callback=self._bookmark_context_menu_callback,
         )
         self.bot.tree.add_command(self.__bookmark_context_menu_callback)
-        self._python_cached: dict[str, str] = {}
+        self.tutorials = TutorialIndex.from_directory()
         self._roadmap_cached: dict[str, str] = {}
         self.hastebin = hastebin.HTTPClient(session=self.bot.http_session)
 
@@ -305,61 +305,56 @@ class RTFM(Cog):
             description=ERROR_MESSAGE_CHEAT_SHEET,
         )
 
-    async def get_package(self, url: str):
-        return await self.session.get(url=url)
+    async def get_package(self, url: str) -> CachedResponse:
+        return await self.bot.http_cache.get(url)
 
-    async def build_python_cache(self):
-        if not hasattr(self, "_python_cached"):
-            self._python_cached = {}
-
-        for file in os.listdir("extra/tutorials/python"):
-            if file.endswith(".md"):
-                async with async_open(f"extra/tutorials/python/{file}") as f:
-                    self._python_cached[file.replace(".md", "")] = await f.read()
-
-    @commands.group(invoke_without_command=True)
+    @commands.hybrid_group(invoke_without_command=True, fallback="search")
+    @app_commands.describe(text="Name of the tutorial")
     @Context.with_type
     async def python(self, ctx: Context, *, text: str):
         """Search for a python tutorial."""
         if ctx.invoked_subcommand is not None:
             return
-        if not getattr(self, "_python_cached", None):
-            await self.build_python_cache()
 
         # get closest match
-        match = await asyncio.to_thread(extractOne, text, self._python_cached.keys())
-        if match[1] < 50:
+        results = self.tutorials.search(text, limit=1)
+        if not results or results[0][1] < 50:
             return await ctx.send(
                 embed=discord.Embed(
                     description="No such tutorial found in the search query.",
                     color=self.bot.color,
                 ),
             )
-        if 70 < match[1] < 90:
-            val = await ctx.prompt(f"{ctx.author.mention} Did you mean `{match[0]}`?")
-            if val:
-                data = self._python_cached[match[0]]
-            else:
+        match, score = results[0]
+        if 70 < score < 90:
+            val = await ctx.prompt(f"{ctx.author.mention} Did you mean `{match}`?")
+            if not val:
                 await ctx.send(
                     f"{ctx.author.mention} No tag found with your query, you can ask the developer to create one.\n"
                     f"Or consider contributing to the project by creating a tag yourself.\n"
                     f"See <{self.bot.github}> | `{ctx.prefix}python list` for a list of available tags.",
                 )
                 return
-        else:
-            data = self._python_cached[match[0]]
-        await ctx.send(embed=discord.Embed(description=data))
+        await ctx.send(embed=discord.Embed(description=self.tutorials[match].content))
+
+    @python.autocomplete("text")
+    async def python_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+        if not current:
+            return [app_commands.Choice(name=name, value=name) for name in self.tutorials.names()[:25]]
+
+        return [
+            app_commands.Choice(name=self.tutorials[name].title[:100], value=name)
+            for name, _ in self.tutorials.search(current, limit=25, score_cutoff=50)
+        ]
 
     @python.command(name="list")
     @Context.with_type
     async def python_list(self, ctx: Context):
-        if not getattr(self, "_python_cached", None):
-            await self.build_python_cache()
-
+        """List all the available python tutorials."""
         await ctx.send(
             embed=discord.Embed(
                 title="List of available tutorials",
-                description="`" + "`, `".join(self._python_cached.keys()) + "`",
+                description="`" + "`, `".join(self.tutorials.names()) + "`",
                 color=self.bot.color,
             ),
         )
@@ -372,7 +367,7 @@ class RTFM(Cog):
 
         try:
             res_json = await res_raw.json()
-        except aiohttp.ContentTypeError:
+        except (aiohttp.ContentTypeError, ValueError):
             return await ctx.send(
                 embed=discord.Embed(
                     description="No such package found in the search query.",
@@ -1166,7 +1161,7 @@ class RTFM(Cog):
         reaction_message = await self.send_reaction_embed(ctx.channel, target_message)
 
         try:
-            _, user = await self.bot.wait_for("reaction_add", timeout=TIMEOUT, check=event_check)
+            _, user = await self.bot.wait_for("reaction_add", timeout=TIMEOUT, check=event_check, channel=ctx.channel)
         except asyncio.TimeoutError:
             return await reaction_message.delete(delay=0)
 
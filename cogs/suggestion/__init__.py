@@ -9,8 +9,10 @@ from typing import Annotated, Any
 import discord
 from core import Cog, Context, Parrot
 from discord.ext import commands
+from utilities.channel_index import Feature
 from utilities.checks import is_mod
 from utilities.formats import TabularData
+from utilities.message_pipeline import MessageContext
 
 REACTION_EMOJI = ["\N{UPWARDS BLACK ARROW}", "\N{DOWNWARDS BLACK ARROW}"]
 
@@ -58,6 +60,13 @@ class Suggestions(Cog):
     def display_emoji(self) -> discord.PartialEmoji:
         return discord.PartialEmoji(name="\N{SPEECH BALLOON}")
 
+    async def cog_load(self) -> None:
+        # consumes the messages of the suggestion channel, before commands and autoresponders
+        self.bot.message_pipeline.register("suggestion", self._suggestion_stage, order=25, budget=2)
+
+    async def cog_unload(self) -> None:
+        self.bot.message_pipeline.unregister("suggestion")
+
     async def __fetch_suggestion_channel(self, guild: discord.Guild) -> discord.TextChannel | None:
         try:
             ch_id: int | None = self.bot.guild_configurations_cache[guild.id]["suggestion_channel"]
@@ -456,28 +465,20 @@ class Suggestions(Cog):
         if payload.message_id in self.message:
             del self.message[payload.message_id]
 
-    @Cog.listener()
-    async def on_message(self, message: discord.Message) -> None:
-        await self.bot.wait_until_ready()
-        if message.author.bot or message.guild is None:
-            return
-
-        ls = await self.bot.guild_configurations.find_one(
-            {"_id": message.guild.id, "suggestion_channel": message.channel.id},
-        )
-        if not ls:
-            return
-
-        if message.channel.id != ls["suggestion_channel"]:
+    async def _suggestion_stage(self, ctx: MessageContext) -> None:
+        if not ctx.features & Feature.SUGGESTION:
             return
 
+        message = ctx.message
         if await self.__parse_mod_action(message):
+            ctx.stop()
             return
 
         context: Context = await self.bot.get_context(message, cls=Context)
         if context.valid:
             return
 
+        ctx.stop()
         await self.suggest(context, suggestion=message.content)
 
     @Cog.listener()
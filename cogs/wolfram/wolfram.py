@@ -113,8 +113,8 @@ async def get_pod_pages(ctx: Context, bot: Parrot, query: str) -> list[tuple[str
         }
         request_url = QUERY.format(request="query")
 
-        async with bot.http_session.get(url=request_url, params=params) as response:
-            json = await response.json(content_type="text/plain")
+        response = await bot.http_cache.get(request_url, params=params)
+        json = await response.json(content_type="text/plain")
 
         result = json["queryresult"]
         _ = f"{request_url}?{urlencode(params)}"
@@ -177,9 +177,9 @@ class Wolfram(Cog):
 
         # Give feedback that the bot is working.
         async with ctx.typing():
-            async with self.bot.http_session.get(url=request_url, params=params) as response:
-                status = response.status
-                image_bytes = await response.read()
+            response = await self.bot.http_cache.get(request_url, params=params)
+            status = response.status
+            image_bytes = await response.read()
 
             f = discord.File(BytesIO(image_bytes), filename="image.png")
             image_url = "attachment://image.png"
@@ -252,9 +252,9 @@ class Wolfram(Cog):
 
         # Give feedback that the bot is working.
         async with ctx.typing():
-            async with self.bot.http_session.get(url=request_url, params=params) as response:
-                status = response.status
-                response_text = await response.text()
+            response = await self.bot.http_cache.get(request_url, params=params)
+            status = response.status
+            response_text = await response.text()
 
             if status == 501:
                 message = "Failed to get response."
@@ -248,6 +248,8 @@ class Context(commands.Context[commands.Bot], Generic[BotT]):
                     "message_delete",
                     check=lambda m: m.id == self.message.id,
                     timeout=30,
+                    channel=self.channel,
+                    user=self.author,
                 )
             except asyncio.TimeoutError:
                 return msg
@@ -343,6 +345,8 @@ class Context(commands.Context[commands.Bot], Generic[BotT]):
                 "raw_reaction_add",
                 check=check,
                 timeout=timeout,
+                channel=channel,
+                user=user,
             )
             return str(payload.emoji) == "\N{THUMBS UP SIGN}"
         except asyncio.TimeoutError:
@@ -388,6 +392,8 @@ class Context(commands.Context[commands.Bot], Generic[BotT]):
         check: Callable[..., bool] | None = None,
         suppress_error: bool = False,
         operator: Callable[[Iterable[object]], bool] = all,
+        channel: discord.abc.Snowflake | int | None = None,
+        user: discord.abc.Snowflake | int | None = None,
         **kwargs: Any,
     ) -> Any:
         if _event_name.lower().startswith("on_"):
@@ -398,6 +404,8 @@ class Context(commands.Context[commands.Bot], Generic[BotT]):
                 _event_name,
                 timeout=timeout,
                 check=self.outer_check(check, operator, **kwargs),
+                channel=channel,
+                user=user,
             )
         except asyncio.TimeoutError:
             if suppress_error:
@@ -469,7 +477,13 @@ class Context(commands.Context[commands.Bot], Generic[BotT]):
 
     async def wait_for_delete(self, message: discord.Message | None = None, *, timeout: float | None = None) -> Any:
         message = message or self.message
-        await self.wait_for("on_message_delete", message__id=message.id, timeout=timeout)
+        await self.wait_for(
+            "on_message_delete",
+            message__id=message.id,
+            timeout=timeout,
+            channel=message.channel,
+            user=message.author,
+        )
 
     async def retry(
         self,
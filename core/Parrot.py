@@ -14,8 +14,6 @@ from collections import Counter, defaultdict, deque
 from collections.abc import AsyncGenerator, Awaitable, Callable, Collection, Iterable, Mapping, Sequence
 from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast, overload
 
-import aiohttp
-import aiosqlite
 import jishaku  # noqa: F401  # pylint: disable=unused-import
 import pymongo
 from aiohttp import ClientSession
@@ -37,12 +35,15 @@ from time import perf_counter
 
 from discord.ext.commands.cooldowns import CooldownMapping
 
+from utilities.channel_index import PROJECTION, ChannelIndex
 from utilities.checks import can_run
 from utilities.config import (
     CASE_INSENSITIVE,
     CHANGE_LOG_CHANNEL_ID,
+    EXTENSION_CONCURRENCY,
     EXTENSIONS,
     GITHUB,
+    LAZY_EXTENSIONS,
     MASTER_OWNER,
     MINIMAL_BOOT,
     OWNER_IDS,
@@ -58,7 +59,15 @@ from utilities.config import (
     WEBHOOK_VOTE_LOGS,
 )
 from utilities.converters import Cache
+from utilities.docs_index import DocumentationIndexManager, default_sources
+from utilities.http_cache import HTTPCache
+from utilities.http_client import HTTPClient
+from utilities.lazy import profiler
+from utilities.message_pipeline import MessageContext, MessagePipeline
 from utilities.paste import Client
+from utilities.sqlite import Database
+from utilities.startup import Startup, loading_extension
+from utilities.wait_for import WaitRegistry
 
 from .__template import post as POST
 from .Cog import Cog
@@ -119,9 +128,9 @@ class Parrot(commands.AutoShardedBot):
     user: discord.ClientUser
     help_command: commands.HelpCommand | None
 
-    http_session: ClientSession
+    http_cache: HTTPCache
     mongo: AsyncMongoClient[dict]
-    sql: aiosqlite.Connection
+    sql: Database
 
     cogs: Mapping[str, Cog]
     extensions: Mapping[str, types.ModuleType]
@@ -166,6 +175,7 @@ class Parrot(commands.AutoShardedBot):
         )
         self._BotBase__cogs = commands.core._CaseInsensitiveDict()
         self._seen_messages: int = 0
+        self.startup: Startup = Startup(self, concurrency=EXTENSION_CONCURRENCY)
         self._change_log: list[discord.Message] = []
 
         self._error_log_token: str = WEBHOOK_ERROR_LOGS
@@ -195,11 +205,17 @@ class Parrot(commands.AutoShardedBot):
         self.identifies: dict[int, list[datetime.datetime]] = defaultdict(list)
         self._prev_events: deque[str] = deque(maxlen=10)
 
+        self.http_client: HTTPClient = HTTPClient()
         self.mystbin: Client = Client()
+        self.docs_index: DocumentationIndexManager = DocumentationIndexManager(default_sources())
 
         # caching variables
         self.guild_configurations_cache: Cache[int, PostType] = Cache[int, PostType](self)
+        self.channel_index: ChannelIndex = ChannelIndex()
+        self.message_pipeline: MessagePipeline = MessagePipeline(self)
+        self.message_pipeline.register("commands", self._commands_stage, order=40, budget=5, background=True)
         self.message_cache: dict[int, discord.Message] = {}
+        self.waits: WaitRegistry = WaitRegistry()
         self.banned_users: dict[int, dict[str, int | str | bool]] = {}
         self.afk_users: set[int] = set()
         self.channel_message_cache: Cache[int, deque[discord.Message]] = Cache(self, cache_size=2**10)
@@ -267,6 +283,10 @@ class Parrot(commands.AutoShardedBot):
     def __repr__(self) -> str:
         return f"<core.{self.user.name}>"
 
+    @property
+    def http_session(self) -> ClientSession:
+        return self.http_client.session
+
     @property
     def config(self) -> Cache[int, PostType]:
         return cast(Cache[int, PostType], self.guild_configurations_cache)
@@ -327,24 +347,43 @@ class Parrot(commands.AutoShardedBot):
     def get_cog(self, name: str) -> Cog | None:
         return super().get_cog(name)
 
+    async def add_cog(
+        self,
+        cog: commands.Cog,
+        /,
+        *,
+        override: bool = False,
+        guild: discord.abc.Snowflake | None = discord.utils.MISSING,
+        guilds: Sequence[discord.abc.Snowflake] = discord.utils.MISSING,
+    ) -> None:
+        start = perf_counter()
+        await super().add_cog(cog, override=override, guild=guild, guilds=guilds)
+        if (extension := loading_extension.get()) is not None:
+            self.startup.cog_added(extension, start, perf_counter() - start)
+
+    async def _load_extensions(self, extensions: list[str], *, lazy: bool = False) -> None:
+        for timing in await self.startup.load(extensions, lazy=lazy):
+            if timing.error is not None:
+                self._failed_to_load[timing.name] = timing.error
+                continue
+
+            self._successfully_loaded.append(timing.name)
+            if timing.name in UNLOAD_EXTENSIONS:
+                await self.unload_extension(timing.name)
+                log.warning("Unloaded extension %s", timing.name)
+
     async def setup_hook(self) -> None:
+        self.http_cache = HTTPCache(self.http_client, db=self.sql)
+        await self.http_cache.setup()
+
+        await self.channel_index.load(self.guild_configurations.find({}, PROJECTION))
+
         if MINIMAL_BOOT:
             await self.load_extension("jishaku")
             return
 
-        for ext in EXTENSIONS:
-            try:
-                await self.load_extension(ext)
-                self._successfully_loaded.append(ext)
-                log.info("Loaded extension %s", ext)
-            except (commands.ExtensionFailed, commands.ExtensionNotFound) as e:
-                self._failed_to_load[ext] = str(e)
-                traceback.print_exc()
-                log.error("Failed to load extension %s", ext)
-            else:
-                if ext in UNLOAD_EXTENSIONS:
-                    await self.unload_extension(ext)
-                    log.warning("Unloaded extension %s", ext)
+        await self._load_extensions([ext for ext in EXTENSIONS if ext not in LAZY_EXTENSIONS])
+        self.startup.mark("extensions")
 
         if self.HAS_TOP_GG:
             self.topgg = topgg.DBLClient(
@@ -367,6 +406,7 @@ class Parrot(commands.AutoShardedBot):
         self.update_banned_members.start()
         self.update_scam_link_db.start()
         self.update_user_cache.start()
+        self.update_docs_index.start()
 
     async def db_latency(self) -> float:
         ini = perf_counter()
@@ -428,9 +468,6 @@ class Parrot(commands.AutoShardedBot):
         if not payload:
             return
 
-        if self.http_session.closed:
-            log.warning("HTTP session is closed. Creating new session")
-            self.http_session = aiohttp.ClientSession(loop=self.loop)
         log.debug("Executing webhook from scratch (%s). Payload: %s", URL, payload)
         async with self.http_session.post(URL, json=payload, headers=self.GLOBAL_HEADERS) as resp:
             return await resp.json(content_type=None)
@@ -520,8 +557,7 @@ class Parrot(commands.AutoShardedBot):
 
     async def close(self) -> None:
         """To close the bot."""
-        if hasattr(self, "http_session"):
-            await self.http_session.close()
+        await self.http_client.close()
 
         if self.timer_task is not None and not self.timer_task.cancelled():
             self.timer_task.cancel()
@@ -532,6 +568,10 @@ class Parrot(commands.AutoShardedBot):
         if self.update_scam_link_db.is_running():
             self.update_scam_link_db.stop()
 
+        if self.update_docs_index.is_running():
+            self.update_docs_index.stop()
+
+        await self.message_pipeline.close()
         await self.sql.close()
 
         return await super().close()
@@ -543,9 +583,21 @@ class Parrot(commands.AutoShardedBot):
         if self._was_ready:
             return
         self._was_ready = True
+        self.startup.mark("ready")
 
         if MINIMAL_BOOT:
+            profiler.uninstall()
             return
+
+        # warm ups first, lazy extensions that defer theirs now get them run right away
+        await asyncio.gather(
+            self.startup.run_deferred(),
+            self._load_extensions([ext for ext in EXTENSIONS if ext in LAZY_EXTENSIONS], lazy=True),
+        )
+        self.startup.mark("warm")
+        # the start up imports are recorded, later ones should not go through a Python __import__
+        profiler.uninstall()
+
         ready_up_message = (
             f"[{self.user.name.title()}] Ready: {self.user} (ID: {self.user.id})\n"
             f"[{self.user.name.title()}] Using discord.py of version: {discord.__version__}"
@@ -702,12 +754,44 @@ class Parrot(commands.AutoShardedBot):
             if isinstance(condition, int):
                 condition -= 1
 
+    def dispatch(self, event_name: str, /, *args: Any, **kwargs: Any) -> None:
+        self.waits.dispatch(event_name, args)
+        super().dispatch(event_name, *args, **kwargs)
+
+    def wait_for(
+        self,
+        event: str,
+        /,
+        *,
+        check: Callable[..., bool] | None = None,
+        timeout: float | None = None,
+        channel: discord.abc.Snowflake | int | None = None,
+        user: discord.abc.Snowflake | int | None = None,
+    ) -> Awaitable[Any]:
+        """Same as :meth:`discord.Client.wait_for`.
+
+        Pass the ``channel`` and ``user`` the check accepts, if it only accepts one of each, and
+        the check is only run for the events of that channel and user.
+        """
+        return self.waits.wait_for(
+            event.lower(),
+            check=check,
+            timeout=timeout,
+            channel_id=getattr(channel, "id", channel),
+            user_id=getattr(user, "id", user),
+        )
+
     async def on_message(self, message: discord.Message) -> None:
-        # sourcery skip: use-contextlib-suppress
         self._seen_messages += 1
+        await self.message_pipeline.run(message)
 
-        if message.guild is None or message.author.bot:
-            return
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        self.message_pipeline.mark_deleted(payload.message_id)
+
+    async def _commands_stage(self, ctx: MessageContext) -> None:
+        # sourcery skip: use-contextlib-suppress
+        message = ctx.message
+        assert message.guild is not None
 
         try:
             self.guild_configurations_cache[message.guild.id]
@@ -874,6 +958,7 @@ class Parrot(commands.AutoShardedBot):
                 prefix = data.get("prefix", DEFAULT_PREFIX)
                 post = data
                 self.guild_configurations_cache[message.guild.id] = post
+                self.channel_index.update(message.guild.id, post)
             else:
                 FAKE_POST = POST.copy()
                 FAKE_POST["_id"] = message.guild.id
@@ -932,6 +1017,7 @@ class Parrot(commands.AutoShardedBot):
         log.debug("Updating server config cache for guild %s", guild_id)
         if data := await self.guild_configurations.find_one({"_id": guild_id}):
             self.guild_configurations_cache[guild_id] = data
+            self.channel_index.update(guild_id, data)
         else:
             log.debug("Guild %s not found in database, creating new one", guild_id)
             FAKE_POST = POST.copy()
@@ -1419,6 +1505,10 @@ class Parrot(commands.AutoShardedBot):
         async with self.lock:
             await insert_new(self.sql)
 
+    @tasks.loop(hours=6)
+    async def update_docs_index(self):
+        await self.docs_index.refresh(self.http_session)
+
     async def get_user_timezone(self, user_id: int) -> str:
         if tz := self.__user_timezone_cache.get(user_id):
             return tz
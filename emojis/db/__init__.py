@@ -11,7 +11,7 @@ __all__ = [
     "get_categories",
 ]
 
-from .db import Emoji
+from .index import Emoji
 from .utils import (
     get_categories,
     get_emoji_aliases,
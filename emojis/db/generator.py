@@ -8,6 +8,8 @@ from datetime import datetime
 import aiofiles
 import aiohttp
 
+from emojis.db.index import Emoji, EmojiIndex
+
 GEMOJI_RELEASE_URL = "https://api.github.com/repos/github/gemoji/releases"
 GEMOJI_JSON_DB_URL = "https://raw.githubusercontent.com/github/gemoji/{tag}/db/emoji.json"
 
@@ -61,11 +63,30 @@ async def generate(path: str, dbname: str):
 
         await file.write("]\n")
 
+    rows = [
+        Emoji(emoji["aliases"], emoji["emoji"], emoji["tags"], emoji["category"], emoji["unicode_version"])
+        for emoji in data
+        if "emoji" in emoji
+    ]
+    await write_index(os.path.dirname(path), EmojiIndex(rows))
+
+
+async def write_index(path: str, index: EmojiIndex | None = None, *, name: str = "db.json"):
+    """Compile the database into the compact index read lazily by :func:`emojis.db.index.get_index`."""
+    index = index or EmojiIndex.from_db()
+
+    async with aiofiles.open(os.path.join(path, name), "w", encoding="utf-8") as file:
+        await file.write(index.dumps())
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generates the Emoji database.")
     parser.add_argument("--dir", default=".", help="Database location")
     parser.add_argument("--dbname", default="db.py", help="Database location")
+    parser.add_argument("--index-only", action="store_true", help="Only rebuild db.json from the existing db.py")
     args = parser.parse_args()
 
-    asyncio.run(generate(args.dir, args.dbname))
+    if args.index_only:
+        asyncio.run(write_index(args.dir))
+    else:
+        asyncio.run(generate(args.dir, args.dbname))
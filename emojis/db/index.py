@@ -0,0 +1,126 @@
+"""Indexed form of the Emoji database.
+
+``db.json`` is written by ``generator.py`` next to ``db.py`` and holds the same rows in a compact
+form. It is only read the first time something needs it, and indexed once by code, alias, tag and
+category. Emoji are found in text with a codepoint trie (longest match wins) instead of a regex
+alternation over every Emoji.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+from collections.abc import Iterator
+from typing import NamedTuple
+
+__all__ = ("Emoji", "EmojiIndex", "get_index", "INDEX_PATH")
+
+INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "db.json")
+INDEX_VERSION = 1
+
+_END = ""  # trie key marking the end of an Emoji, never a real character
+
+
+class Emoji(NamedTuple):
+    aliases: list[str]
+    emoji: str
+    tags: list[str]
+    category: str
+    unicode_version: str
+
+
+class EmojiIndex:
+    __slots__ = ("emojis", "by_code", "by_alias", "by_tag", "by_category", "trie")
+
+    def __init__(self, emojis: list[Emoji]) -> None:
+        self.emojis = emojis
+
+        self.by_code: dict[str, Emoji] = {}
+        self.by_alias: dict[str, Emoji] = {}
+        self.by_tag: dict[str, list[Emoji]] = {}
+        self.by_category: dict[str, list[Emoji]] = {}
+        self.trie: dict[str, dict] = {}
+
+        for emoji in emojis:
+            self.by_code.setdefault(emoji.emoji, emoji)
+            for alias in emoji.aliases:
+                self.by_alias.setdefault(alias, emoji)
+            for tag in emoji.tags:
+                self.by_tag.setdefault(tag.lower(), []).append(emoji)
+            self.by_category.setdefault(emoji.category.lower(), []).append(emoji)
+
+            node = self.trie
+            for char in emoji.emoji:
+                node = node.setdefault(char, {})
+            node[_END] = emoji.emoji
+
+    def __repr__(self) -> str:
+        return f"<EmojiIndex emojis={len(self.emojis)} tags={len(self.by_tag)} categories={len(self.by_category)}>"
+
+    def __len__(self) -> int:
+        return len(self.emojis)
+
+    def aliases(self) -> dict[str, str]:
+        return {f":{alias}:": emoji.emoji for alias, emoji in self.by_alias.items()}
+
+    def finditer(self, text: str) -> Iterator[tuple[int, int]]:
+        """Yield ``(start, end)`` of every Emoji in ``text``, leftmost first, longest match at each position."""
+        if text.isascii():
+            return
+
+        trie = self.trie
+        length = len(text)
+        start = 0
+        while start < length:
+            node = trie.get(text[start])
+            if node is None:
+                start += 1
+                continue
+
+            end = start + 1 if _END in node else -1
+            position = start + 1
+            while position < length:
+                node = node.get(text[position])
+                if node is None:
+                    break
+                position += 1
+                if _END in node:
+                    end = position
+
+            if end == -1:
+                start += 1
+            else:
+                yield start, end
+                start = end
+
+    def find(self, text: str) -> Iterator[str]:
+        return (text[start:end] for start, end in self.finditer(text))
+
+    def dumps(self) -> str:
+        rows = [list(emoji) for emoji in self.emojis]
+        return json.dumps({"version": INDEX_VERSION, "emojis": rows}, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def loads(cls, data: str) -> EmojiIndex:
+        payload = json.loads(data)
+        if payload.get("version") != INDEX_VERSION:
+            msg = "Unsupported Emoji index version."
+            raise ValueError(msg)
+        return cls([Emoji(*row) for row in payload["emojis"]])
+
+    @classmethod
+    def from_db(cls) -> EmojiIndex:
+        from .db import EMOJI_DB
+
+        return cls([Emoji(*emoji) for emoji in EMOJI_DB])
+
+
+@functools.cache
+def get_index() -> EmojiIndex:
+    """The Emoji index, read from ``db.json`` on first use (or built from ``db.py`` if it is missing)."""
+    try:
+        with open(INDEX_PATH, encoding="utf-8") as f:
+            return EmojiIndex.loads(f.read())
+    except (OSError, ValueError):
+        return EmojiIndex.from_db()
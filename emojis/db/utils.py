@@ -1,20 +1,13 @@
 from __future__ import annotations
 
-from . import db
+from .index import get_index
 
 
 def get_emoji_aliases():
     """Returns all Emojis as a dict (key = alias, value = unicode).
     :rtype: dict.
     """
-    emoji_aliases = {}
-
-    for emoji in db.EMOJI_DB:
-        for alias in emoji.aliases:
-            a = f":{alias}:"
-            emoji_aliases[a] = emoji.emoji
-
-    return emoji_aliases
+    return get_index().aliases()
 
 
 def get_emoji_by_code(code):
@@ -22,10 +15,7 @@ def get_emoji_by_code(code):
     :param code: Emoji Unicode code.
     :rtype: emojis.db.Emoji.
     """
-    try:
-        return next(filter(lambda emoji: code == emoji.emoji, db.EMOJI_DB))
-    except StopIteration:
-        return None
+    return get_index().by_code.get(code)
 
 
 def get_emoji_by_alias(alias):
@@ -33,10 +23,7 @@ def get_emoji_by_alias(alias):
     :param alias: Emoji alias.
     :rtype: emojis.db.Emoji.
     """
-    try:
-        return next(filter(lambda emoji: alias in emoji.aliases, db.EMOJI_DB))
-    except StopIteration:
-        return None
+    return get_index().by_alias.get(alias)
 
 
 def get_emojis_by_tag(tag):
@@ -44,7 +31,7 @@ def get_emojis_by_tag(tag):
     :param tag: Tag name to filter (case-insensitive).
     :rtype: iter.
     """
-    return filter(lambda emoji: tag.lower() in emoji.tags, db.EMOJI_DB)
+    return iter(get_index().by_tag.get(tag.lower(), ()))
 
 
 def get_emojis_by_category(category):
@@ -52,18 +39,18 @@ def get_emojis_by_category(category):
     :param tag: Category name to filter (case-insensitive).
     :rtype: iter.
     """
-    return filter(lambda emoji: category.lower() == emoji.category.lower(), db.EMOJI_DB)
+    return iter(get_index().by_category.get(category.lower(), ()))
 
 
 def get_tags():
     """Returns all tags available.
     :rtype: set.
     """
-    return {tag for emoji in db.EMOJI_DB for tag in emoji.tags}
+    return set(get_index().by_tag)
 
 
 def get_categories():
     """Returns all categories available.
     :rtype: set.
     """
-    return {emoji.category for emoji in db.EMOJI_DB}
+    return {emoji.category for emoji in get_index().emojis}
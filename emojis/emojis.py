@@ -1,16 +1,4 @@
-import re
-
-from . import db
-
-ALIAS_TO_EMOJI = db.get_emoji_aliases()
-EMOJI_TO_ALIAS = {v: k for k, v in ALIAS_TO_EMOJI.items()}
-EMOJI_TO_ALIAS_SORTED = sorted(ALIAS_TO_EMOJI.values(), key=len, reverse=True)
-
-RE_TEXT_TO_EMOJI_GROUP = "({})".format("|".join([re.escape(emoji) for emoji in ALIAS_TO_EMOJI]))
-RE_TEXT_TO_EMOJI = re.compile(RE_TEXT_TO_EMOJI_GROUP)
-
-RE_EMOJI_TO_TEXT_GROUP = "({})".format("|".join([re.escape(emoji) for emoji in EMOJI_TO_ALIAS_SORTED]))
-RE_EMOJI_TO_TEXT = re.compile(RE_EMOJI_TO_TEXT_GROUP)
+from .db.index import get_index
 
 
 def encode(msg) -> str:
@@ -22,8 +10,26 @@ def encode(msg) -> str:
         >>> emojis.encode('This is a message with emojis :smile: :snake:')
         'This is a message with emojis 😄 🐍'.
     """
-    msg = RE_TEXT_TO_EMOJI.sub(lambda match: ALIAS_TO_EMOJI[match.group(0)], msg)
-    return msg
+    aliases = get_index().by_alias
+    parts = []
+    last = 0
+    start = msg.find(":")
+    while start != -1:
+        end = msg.find(":", start + 1)
+        if end == -1:
+            break
+        emoji = aliases.get(msg[start + 1 : end])
+        if emoji is None:
+            # the closing colon may open the next alias
+            start = end
+            continue
+        parts.append(msg[last:start])
+        parts.append(emoji.emoji)
+        last = end + 1
+        start = msg.find(":", last)
+
+    parts.append(msg[last:])
+    return "".join(parts)
 
 
 def decode(msg) -> str:
@@ -35,8 +41,16 @@ def decode(msg) -> str:
         >>> emojis.decode('This is a message with emojis 😄 🐍')
         'This is a message with emojis :smile: :snake:'.
     """
-    msg = RE_EMOJI_TO_TEXT.sub(lambda match: EMOJI_TO_ALIAS[match.group(0)], msg)
-    return msg
+    index = get_index()
+    parts = []
+    last = 0
+    for start, end in index.finditer(msg):
+        parts.append(msg[last:start])
+        parts.append(f":{index.by_code[msg[start:end]].aliases[-1]}:")
+        last = end
+
+    parts.append(msg[last:])
+    return "".join(parts)
 
 
 def get(msg) -> set:
@@ -44,7 +58,7 @@ def get(msg) -> set:
     :param msg: String to search for Emojis.
     :rtype: set.
     """
-    return {match.group() for match in RE_EMOJI_TO_TEXT.finditer(msg)}
+    return set(get_index().find(msg))
 
 
 def iter(msg):
@@ -52,7 +66,7 @@ def iter(msg):
     :param msg: String to search for Emojis.
     :rtype: iterator.
     """
-    return (match.group() for match in RE_EMOJI_TO_TEXT.finditer(msg))
+    return get_index().find(msg)
 
 
 def count(msg, unique=False):
@@ -62,5 +76,5 @@ def count(msg, unique=False):
     :rtype: int.
     """
     if unique:
-        return len({match.group() for match in RE_EMOJI_TO_TEXT.finditer(msg)})
-    return len([match.group() for match in RE_EMOJI_TO_TEXT.finditer(msg)])
+        return len(get(msg))
+    return sum(1 for _ in get_index().finditer(msg))
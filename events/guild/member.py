@@ -6,6 +6,7 @@ from pymongo import UpdateOne
 
 import discord
 from core import Cog, Parrot
+from utilities.channel_index import Feature
 
 from ._member import _MemberJoin as MemberJoin
 
@@ -85,40 +86,37 @@ class Member(Cog, command_attrs={"hidden": True}):
         channel: discord.VoiceChannel | discord.StageChannel,
         member: discord.Member,
     ):
-        try:
-            self.bot.guild_configurations_cache[member.guild.id]["hub"]
-        except KeyError:
+        if not self.bot.channel_index.has(channel.id, Feature.HUB):
             return
-        else:
-            perms = member.guild.me.guild_permissions
-            if not all([perms.manage_permissions, perms.manage_channels, perms.move_members]):
-                return
-            if channel.id == self.bot.guild_configurations_cache[member.guild.id]["hub"]:
-                if channel.category:
-                    hub_channel = await member.guild.create_voice_channel(
-                        f"[#{await self._get_index(member.guild)}] {member.name}",
-                        category=channel.category,
-                    )
-                    await self.bot.guild_configurations.update_one(
-                        {"_id": member.guild.id},
-                        {
-                            "$addToSet": {
-                                "hub_temp_channels": {
-                                    "channel_id": hub_channel.id,
-                                    "author": member.id,
-                                },
-                            },
+
+        perms = member.guild.me.guild_permissions
+        if not all([perms.manage_permissions, perms.manage_channels, perms.move_members]):
+            return
+        if channel.category:
+            hub_channel = await member.guild.create_voice_channel(
+                f"[#{await self._get_index(member.guild)}] {member.name}",
+                category=channel.category,
+            )
+            await self.bot.guild_configurations.update_one(
+                {"_id": member.guild.id},
+                {
+                    "$addToSet": {
+                        "hub_temp_channels": {
+                            "channel_id": hub_channel.id,
+                            "author": member.id,
                         },
-                    )
-                    await member.edit(
-                        voice_channel=hub_channel,
-                        reason=f"{member} ({member.id}) created their Hub",
-                    )
-                else:
-                    await self.__notify_member(
-                        f"{member.mention} falied to create Hub for you. As the base Category is unreachable by the bot",
-                        member=member,
-                    )
+                    },
+                },
+            )
+            await member.edit(
+                voice_channel=hub_channel,
+                reason=f"{member} ({member.id}) created their Hub",
+            )
+        else:
+            await self.__notify_member(
+                f"{member.mention} falied to create Hub for you. As the base Category is unreachable by the bot",
+                member=member,
+            )
 
     async def __on_voice_channel_remove(
         self,
@@ -266,7 +266,13 @@ class Cmd(Cog, command_attrs={"hidden": True}):
 
         try:
             if msg:
-                await ctx.wait_for("message_delete", timeout=10, check=lambda m: m.id == ctx.message.id)
+                await ctx.wait_for(
+                    "message_delete",
+                    timeout=10,
+                    check=lambda m: m.id == ctx.message.id,
+                    channel=ctx.channel,
+                    user=ctx.author,
+                )
                 await msg.delete(delay=0)
         except asyncio.TimeoutError:
             if DELETE_AFTER:
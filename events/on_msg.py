@@ -19,6 +19,8 @@ import discord
 import emojis
 from core import Cog
 from discord.ext import commands
+from utilities.channel_index import Feature
+from utilities.message_pipeline import MessageContext
 from utilities.regex import EQUATION_REGEX, LINKS_NO_PROTOCOLS
 
 if TYPE_CHECKING:
@@ -114,7 +116,6 @@ class OnMsg(Cog, command_attrs={"hidden": True}):
         ]
         self.message_append: list[discord.Message] = []
         self.__scam_link_cache: dict[str, bool] = {}
-        self.__global_chat_cache: dict[int, dict] = {}
 
     @overload
     async def _fetch_response(self, url: ..., response_format: ...) -> None:
@@ -129,12 +130,12 @@ class OnMsg(Cog, command_attrs={"hidden": True}):
         ...
 
     async def _fetch_response(self, url: str, response_format: str, **kwargs: Any) -> str | dict[str, Any] | None:
-        """Makes http requests using aiohttp."""
-        async with self.bot.http_session.get(url, raise_for_status=True, **kwargs) as response:
-            if response_format == "text":
-                return await response.text()
-            if response_format == "json":
-                return await response.json()
+        """Makes http requests using aiohttp, through the bot's HTTP cache."""
+        response = await self.bot.http_cache.get(url, raise_for_status=True, **kwargs)
+        if response_format == "text":
+            return await response.text()
+        if response_format == "json":
+            return await response.json()
         return None
 
     def _find_ref(self, path: str, refs: tuple) -> tuple:
@@ -303,20 +304,22 @@ class OnMsg(Cog, command_attrs={"hidden": True}):
         # Sorts the list of snippets by their match index and joins them into a single message
         return "\n".join(x[1] for x in sorted(all_snippets))
 
-    def _check_gitlink_req(self, message: discord.Message):
+    async def _check_gitlink_req(self, message: discord.Message):
         assert message.guild is not None
 
+        await self.bot.ensure_guild_cache(message.guild)
         return self.bot.guild_configurations_cache[message.guild.id]["opts"]["gitlink_enabled"]
 
-    def _check_equation_req(self, message: discord.Message):
+    async def _check_equation_req(self, message: discord.Message):
         assert message.guild is not None
 
+        await self.bot.ensure_guild_cache(message.guild)
         return self.bot.guild_configurations_cache[message.guild.id]["opts"]["equation_enabled"]
 
     async def query_ddg(self, query: str) -> str | None:
         link = f"https://api.duckduckgo.com/?q={query}&format=json&pretty=1"
         # saying `ok google`, and querying from ddg LOL.
-        res = await self.bot.http_session.get(link)
+        res = await self.bot.http_cache.get(link)
         data: dict = json.loads(await res.text())
         if data.get("Abstract"):
             return data.get("Abstract")
@@ -395,7 +398,7 @@ class OnMsg(Cog, command_attrs={"hidden": True}):
         if all(i not in message.content for i in OP):
             return
 
-        if not self._check_equation_req(message):
+        if not await self._check_equation_req(message):
             return
 
         def check(r: discord.Reaction, u: discord.User) -> bool:
@@ -405,7 +408,13 @@ class OnMsg(Cog, command_attrs={"hidden": True}):
             with suppress(discord.Forbidden, discord.NotFound):
                 await message.add_reaction("\N{SPIRAL NOTE PAD}")
                 try:
-                    r, _ = await self.bot.wait_for("reaction_add", check=check, timeout=30)
+                    r, _ = await self.bot.wait_for(
+                        "reaction_add",
+                        check=check,
+                        timeout=30,
+                        channel=message.channel,
+                        user=message.author,
+                    )
                 except asyncio.TimeoutError:
                     return
                 if r.emoji == "\N{SPIRAL NOTE PAD}":
@@ -423,43 +432,52 @@ class OnMsg(Cog, command_attrs={"hidden": True}):
                     if text != "???":
                         return await message.reply(text)
 
-    @Cog.listener()
-    async def on_message(self, message: discord.Message):
-        await self.bot.wait_until_ready()
+    async def cog_load(self) -> None:
+        pipeline = self.bot.message_pipeline
+        pipeline.register("afk", lambda ctx: self._on_message_passive(ctx.message), order=20, budget=1, bots=True)
+        pipeline.register("global_chat", self._global_chat_handler, order=30, budget=2)
+        pipeline.register(
+            "scam_detection",
+            lambda ctx: self._scam_detection(ctx.message),
+            order=50,
+            budget=5,
+            bots=True,
+            background=True,
+        )
+        pipeline.register("snippets", self._snippets_stage, order=60, budget=5, bots=True, background=True)
+        pipeline.register(
+            "quick_answer",
+            lambda ctx: self.quick_answer(ctx.message),
+            order=60,
+            budget=5,
+            bots=True,
+            background=True,
+        )
+        # waits up to 30 seconds for the reaction
+        pipeline.register("equation", lambda ctx: self.equation_solver(ctx.message), order=70, budget=35, background=True)
 
-        if message.guild is None:
+    async def cog_unload(self) -> None:
+        for stage in ("afk", "global_chat", "scam_detection", "snippets", "quick_answer", "equation"):
+            self.bot.message_pipeline.unregister(stage)
+
+    async def _snippets_stage(self, ctx: MessageContext) -> None:
+        message = ctx.message
+        if "https://" not in ctx.content:
             return
 
-        await self.bot.ensure_guild_cache(message.guild)
+        message_to_send = await self._parse_snippets(message.content)
+        if 0 < len(message_to_send) <= 2000 and await self._check_gitlink_req(message):
+            view = Delete(message.author)
+            view.message = await message.channel.send(message_to_send, view=view)
+            with suppress(discord.NotFound, discord.Forbidden):
+                await message.edit(suppress=True)
 
-        if message.guild.me.id == message.author.id:
+    async def _global_chat_handler(self, ctx: MessageContext) -> None:
+        if not ctx.features & Feature.GLOBAL_CHAT:
             return
 
-        async def __internal_snippets_parser():
-            message_to_send = await self._parse_snippets(message.content)
-            if 0 < len(message_to_send) <= 2000 and self._check_gitlink_req(message):
-                view = Delete(message.author)
-                view.message = await message.channel.send(message_to_send, view=view)
-                try:
-                    await message.edit(suppress=True)
-                except discord.NotFound:
-                    pass
-                except discord.Forbidden:
-                    pass
-            if message.author.bot:
-                return
-
-        AWAITABLES: list[Coroutine] = [
-            __internal_snippets_parser(),
-            self._scam_detection(message),
-            self.equation_solver(message),
-            self.quick_answer(message),
-            self._on_message_passive(message),
-            self._global_chat_handler(message),
-        ]
-        await asyncio.gather(*AWAITABLES, return_exceptions=False)
+        message = ctx.message
 
-    async def _global_chat_handler(self, message: discord.Message) -> None:
         if not message.content or message.author.bot:
             return
 
@@ -474,27 +492,9 @@ class OnMsg(Cog, command_attrs={"hidden": True}):
         if TYPE_CHECKING:
             assert message.guild is not None
 
-        if message.guild.id not in self.__global_chat_cache:
-            # LRU?
-            data = await self.bot.guild_configurations.find_one(
-                {
-                    "_id": message.guild.id,
-                    "global_chat.channel_id": message.channel.id,
-                    "global_chat.enable": True,
-                },
-            )
-            if data is None:
-                return
-            self.__global_chat_cache[message.guild.id] = data
-        else:
-            data = self.__global_chat_cache[message.guild.id]
-
-        data = data["global_chat"]
-        if message.channel.id != data.get("channel_id"):
-            return
-
-        if not data.get("enable"):
-            return
+        config = await ctx.config()
+        assert config is not None
+        data = config["global_chat"]
 
         bucket = self.cd_mapping.get_bucket(message)
         if bucket:
@@ -518,21 +518,21 @@ class OnMsg(Cog, command_attrs={"hidden": True}):
             return
 
         if LINKS_NO_PROTOCOLS.search(message.content):
-            await message.delete(delay=0)
+            await ctx.delete(delay=0)
             await message.channel.send(f"{message.author.mention} | URLs aren't allowed.", delete_after=5)
             return
 
         if len(message.content.split("\n")) > 4:
-            await message.delete(delay=0)
+            await ctx.delete(delay=0)
             await message.channel.send(
                 f"{message.author.mention} | Do not send message in 4-5 lines or above.",
                 delete_after=5,
             )
             return
 
-        to_send: bool = self.refrain_message(message.content.lower())
+        to_send: bool = self.refrain_message(ctx.lower)
         if not to_send:
-            await message.delete(delay=0)
+            await ctx.delete(delay=0)
             await message.channel.send(
                 f"{message.author.mention} | Sending Bad Word not allowed",
                 delete_after=5,
@@ -540,7 +540,7 @@ class OnMsg(Cog, command_attrs={"hidden": True}):
             return
 
         if self.get_emoji_count(message.content) > 10:
-            await message.delete(delay=0)
+            await ctx.delete(delay=0)
             await message.channel.send(
                 f"{message.author.mention} | Do not send message with more than 10 emoji.",
                 delete_after=5,
@@ -560,11 +560,10 @@ class OnMsg(Cog, command_attrs={"hidden": True}):
             except discord.NotFound:
                 pass
 
-        await message.delete(delay=2)
+        await ctx.delete(delay=2)
         __functions: list = []
-        async for webhook in self.bot.guild_configurations.find({"global_chat.enable": True}):
-            if hook := webhook["global_chat"]["webhook"]:
-                __functions.append(__internal_funtion(hook=hook, message=message))
+        for hook in self.bot.channel_index.global_chat_webhooks.values():
+            __functions.append(__internal_funtion(hook=hook, message=message))
 
         if __functions:
             await asyncio.gather(*__functions, return_exceptions=False)
@@ -602,8 +601,7 @@ class OnMsg(Cog, command_attrs={"hidden": True}):
         )
 
         for i in match_list:
-            cursor = await self.bot.sql.execute("""SELECT * FROM scam_links WHERE link = ?""", (i,))
-            if await cursor.fetchone():
+            if await self.bot.sql.fetchone("""SELECT 1 FROM scam_links WHERE link = ?""", (i,)):
                 if to_send:
                     await message.channel.send(
                         f"\N{WARNING SIGN} potential scam detected in {message.author}'s message. Match: `{i}`",
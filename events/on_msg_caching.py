@@ -3,6 +3,7 @@ from __future__ import annotations
 import discord
 from core import Cog, Context, Parrot
 from discord.ext import commands
+from utilities.message_pipeline import MessageContext
 
 
 class OnMsgCaching(Cog):
@@ -34,8 +35,14 @@ class OnMsgCaching(Cog):
             "type": str(message.type),
         }
 
-    @Cog.listener("on_message")
-    async def on_message_updater(self, message: discord.Message) -> None:
+    async def cog_load(self) -> None:
+        self.bot.message_pipeline.register("cache", self.on_message_updater, order=0, budget=0.01, bots=True, dms=True, self_messages=True)
+
+    async def cog_unload(self) -> None:
+        self.bot.message_pipeline.unregister("cache")
+
+    async def on_message_updater(self, ctx: MessageContext) -> None:
+        message = ctx.message
         if message.author.id in self.bot.message_cache:
             self.bot.message_cache[message.author.id] = message
 
@@ -8,6 +8,7 @@ import pymongo
 
 import discord
 from core import Cog
+from utilities.channel_index import Feature
 
 if TYPE_CHECKING:
     from core import Parrot
@@ -30,7 +31,7 @@ class OnReaction(Cog, command_attrs={"hidden": True}):
 
         CURRENT_TIME = time()
         DATETIME: datetime.datetime = discord.utils.snowflake_time(payload.message_id)
-        if payload.channel_id in self.bot.guild_configurations_cache[payload.guild_id]["starboard_config"]["ignore_channel"]:
+        if self.bot.channel_index.has(payload.channel_id, Feature.STARBOARD_IGNORE):
             log.debug("Channel ignored %s", payload.channel_id)
             return
 
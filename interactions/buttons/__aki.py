@@ -166,7 +166,13 @@ class Akinator:
                 return False
 
             try:
-                reaction, user = await ctx.bot.wait_for("reaction_add", timeout=timeout, check=check)
+                reaction, user = await ctx.bot.wait_for(
+                    "reaction_add",
+                    timeout=timeout,
+                    check=check,
+                    channel=ctx.channel,
+                    user=ctx.author,
+                )
             except asyncio.TimeoutError:
                 return
 
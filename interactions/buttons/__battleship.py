@@ -10,10 +10,11 @@ from collections.abc import Coroutine
 from io import BytesIO
 from typing import TYPE_CHECKING, Any, ClassVar, Final
 
-from PIL import Image, ImageDraw
+from PIL import ImageDraw
 
 import discord
 from core import Context, Parrot
+from utilities.assets import assets
 
 from .__wordle import WordInputButton
 from .utils import BaseView
@@ -165,26 +166,25 @@ class Board:
         RED = (255, 0, 0)
         GRAY = (128, 128, 128)
 
-        with Image.open("extra/battleship.png") as img:
-            _img = img.convert("RGBA")
-            cur = ImageDraw.Draw(_img, "RGBA")
-
-            for i, y in zip(range(1, 11), range(75, 530, 50), strict=False):
-                for j, x in zip(range(1, 11), range(75, 530, 50), strict=False):
-                    coord = (i, j)
-                    if coord in self.op_misses:
-                        self.draw_dot(cur, x, y, fill=GRAY)
-
-                    elif coord in self.op_hits:
-                        if not hide:
-                            ship = self.get_ship(coord)
-                            self.draw_sq(cur, x, y, coord=coord, ship=ship)
-                        self.draw_dot(cur, x, y, fill=RED)
-                    elif ship := self.get_ship(coord):
-                        if not hide:
-                            self.draw_sq(cur, x, y, coord=coord, ship=ship)
-            buffer = BytesIO()
-            _img.save(buffer, "PNG")
+        _img = assets.image("battleship.png", mode="RGBA")
+        cur = ImageDraw.Draw(_img, "RGBA")
+
+        for i, y in zip(range(1, 11), range(75, 530, 50), strict=False):
+            for j, x in zip(range(1, 11), range(75, 530, 50), strict=False):
+                coord = (i, j)
+                if coord in self.op_misses:
+                    self.draw_dot(cur, x, y, fill=GRAY)
+
+                elif coord in self.op_hits:
+                    if not hide:
+                        ship = self.get_ship(coord)
+                        self.draw_sq(cur, x, y, coord=coord, ship=ship)
+                    self.draw_dot(cur, x, y, fill=RED)
+                elif ship := self.get_ship(coord):
+                    if not hide:
+                        self.draw_sq(cur, x, y, coord=coord, ship=ship)
+        buffer = BytesIO()
+        _img.save(buffer, "PNG")
 
         buffer.seek(0)
         del _img
@@ -297,7 +297,7 @@ class BattleShip:
                 return False
 
             try:
-                message: discord.Message = await ctx.wait_for("message", check=check, timeout=self.timeout)
+                message: discord.Message = await ctx.wait_for("message", check=check, timeout=self.timeout, user=user)
             except asyncio.TimeoutError:
                 await user.send(f"The timeout of {self.timeout} seconds, has been reached. Aborting...")
                 return False
@@ -313,7 +313,7 @@ class BattleShip:
                 return False
 
             try:
-                message: discord.Message = await ctx.wait_for("message", check=check, timeout=self.timeout)
+                message: discord.Message = await ctx.wait_for("message", check=check, timeout=self.timeout, user=user)
             except asyncio.TimeoutError:
                 await user.send(f"The timeout of {self.timeout} seconds, has been reached. Aborting...")
                 return False
@@ -384,7 +384,7 @@ class BattleShip:
                 return False
 
             try:
-                message: discord.Message = await ctx.wait_for("message", check=check, timeout=self.timeout)
+                message: discord.Message = await ctx.wait_for("message", check=check, timeout=self.timeout, user=self.turn)
             except asyncio.TimeoutError:
                 await ctx.send(f"The timeout of {timeout} seconds, has been reached. Aborting...")
                 break
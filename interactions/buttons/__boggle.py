@@ -0,0 +1,72 @@
+"""Boggle boards solved once, when the board is dealt.
+
+Walking the board from every tile and pruning as soon as the letters so far do not start any word
+in the dictionary finds every word on a 6x6 board in a few milliseconds. The words that start with
+a prefix are one contiguous run of the sorted :class:`~utilities.lexicon.Lexicon`, and the run of a
+longer prefix is inside the run of a shorter one, so narrowing the run letter by letter walks it
+like a trie, without the memory of one. After that, checking a guess or scoring a list is a dict
+lookup, and the words nobody found come for free.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from functools import cache
+from typing import TYPE_CHECKING
+
+from .__constants import DIAGRAPHS, POINTS
+
+if TYPE_CHECKING:
+    from utilities.lexicon import Lexicon
+
+__all__ = ("neighbours", "solve")
+
+MIN_LENGTH = 3
+
+
+@cache
+def neighbours(size: int) -> tuple[tuple[int, ...], ...]:
+    """The adjacent tiles of every tile of a ``size`` x ``size`` board, tile ``col * size + row``."""
+    adjacent = []
+    for col in range(size):
+        for row in range(size):
+            adjacent.append(
+                tuple(
+                    x * size + y
+                    for x in range(max(col - 1, 0), min(col + 2, size))
+                    for y in range(max(row - 1, 0), min(row + 2, size))
+                    if (x, y) != (col, row)
+                ),
+            )
+    return tuple(adjacent)
+
+
+def solve(columns: Sequence[Sequence[str]], words: Lexicon) -> dict[str, int]:
+    """Every word of ``words`` on the board, with its points. No tile is used twice in a word."""
+    size = len(columns)
+    tiles = [DIAGRAPHS.get(letter, letter) for column in columns for letter in column]
+    adjacent = neighbours(size)
+    found: dict[str, int] = {}
+    # paths that spell the same prefix search the same run, boards repeat letters a lot
+    spans: dict[str, tuple[int, int]] = {}
+
+    def walk(tile: int, prefix: str, lo: int, hi: int, used: int) -> None:
+        prefix += tiles[tile]
+        span = spans.get(prefix)
+        if span is None:
+            span = spans[prefix] = words.span(prefix, lo, hi)
+        lo, hi = span
+        if lo == hi:
+            return
+
+        if len(prefix) >= MIN_LENGTH and words[lo] == prefix:
+            found[prefix] = POINTS[len(prefix)]
+
+        used |= 1 << tile
+        for other in adjacent[tile]:
+            if not used >> other & 1:
+                walk(other, prefix, lo, hi, used)
+
+    for tile in range(size * size):
+        walk(tile, "", 0, len(words), 0)
+    return found
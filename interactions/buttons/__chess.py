@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import io
 from typing import Any
 
 import chess
@@ -10,6 +11,8 @@ import discord
 from core import Context, Parrot
 from utilities.paginator import ParrotPaginator
 
+from .__chess_board import render
+
 
 class ChessView(discord.ui.View):
     def __init__(self, *, game: Chess, ctx: Context = None, timeout: float = 300.0, **kwargs: Any) -> None:
@@ -80,6 +83,7 @@ class Chess:
 
         self.game_stop = False
         self.game_message: discord.Message | None = None
+        self.view: ChessView | None = None
 
     def legal_moves(self) -> list[str]:
         return [self.board.san(move) for move in self.board.legal_moves]
@@ -93,7 +97,7 @@ class Chess:
             return (self.ctx.channel.id == m.channel.id) and (m.author == self.turn) and (m.content in LEGAL_MOVES)
 
         try:
-            msg = await self.bot.wait_for("message", check=check, timeout=self.timeout)
+            msg = await self.bot.wait_for("message", check=check, timeout=self.timeout, channel=self.ctx.channel)
             return msg
         except asyncio.TimeoutError:
             if not self.game_stop:
@@ -112,24 +116,38 @@ class Chess:
             self.alternate_turn = self.black
             return
 
-    async def place_move(self, user_move: str) -> None:
-        st = "white" if self.alternate_turn == self.white else "black"
-        move = self.board.push_san(user_move)
-        content = f"{self.white.mention} VS {self.black.mention}"
+    async def board_message(self, turn: discord.Member, move: chess.Move | None = None) -> dict[str, Any]:
+        """The message for the position after ``move``, the board is from the side of ``turn``, who moves next."""
+        white = turn == self.white
+        image = await asyncio.to_thread(render, self.board.board_fen(), move and move.uci(), white=white)
+
         embed = discord.Embed(
             timestamp=discord.utils.utcnow(),
         )
-        embed.set_image(
-            url=f"https://backscattering.de/web-boardimage/board.png?fen={self.board.board_fen()}&lastMove={move.uci()}&coordinates=true&orientation={st}",
-        )
+        embed.set_image(url="attachment://board.png")
         embed.description = f"""```
 On Check?      : {self.board.is_check()}
 Can Claim Draw?: {self.board.can_claim_threefold_repetition()}
 ```
 """
-        embed.set_footer(text=f"Turn: {self.alternate_turn} | Having 5m to make move")
-        await self.game_message.delete()
-        self.game_message = await self.ctx.send(content=content, embed=embed, view=ChessView(game=self, ctx=self.ctx))
+        embed.set_footer(text=f"Turn: {turn} | Having 5m to make move")
+
+        if self.view is not None:
+            self.view.stop()
+        self.view = ChessView(game=self, ctx=self.ctx)
+        return {
+            "content": f"{self.white.mention} VS {self.black.mention}",
+            "embed": embed,
+            "view": self.view,
+            "file": discord.File(io.BytesIO(image), filename="board.png"),
+        }
+
+    async def place_move(self, user_move: str) -> None:
+        move = self.board.push_san(user_move)
+        kwargs = await self.board_message(self.alternate_turn, move)
+        # the new board replaces the old attachment, the message stays where it is
+        kwargs["attachments"] = [kwargs.pop("file")]
+        self.game_message = await self.game_message.edit(**kwargs)
         await self.game_over()
 
     async def game_over(
@@ -166,20 +184,7 @@ Can Claim Draw?: {self.board.can_claim_threefold_repetition()}
         return self.game_stop
 
     async def start(self):
-        content = f"{self.white.mention} VS {self.black.mention}"
-        embed = discord.Embed(
-            timestamp=discord.utils.utcnow(),
-        )
-        embed.set_image(
-            url=f"https://backscattering.de/web-boardimage/board.png?fen={self.board.board_fen()}&coordinates=true",
-        )
-        embed.description = f"""```
-On Check?      : {self.board.is_check()}
-Can Claim Draw?: {self.board.can_claim_threefold_repetition()}
-```
-"""
-        embed.set_footer(text=f"Turn: {self.turn} | Having 5m to make move")
-        self.game_message = await self.ctx.send(content=content, embed=embed, view=ChessView(game=self, ctx=self.ctx))
+        self.game_message = await self.ctx.send(**await self.board_message(self.turn))
         while not self.game_stop:
             msg = await self.wait_for_move()
             if msg is None:
@@ -0,0 +1,113 @@
+"""Chess boards drawn here, instead of linked from an image service.
+
+The twelve piece sprites are rasterized from python-chess' SVGs once per square size, and a
+board is the cached empty board for its orientation, the squares of the last move, and the
+sprites pasted on top. Rendered boards are kept in an LRU by position, last move and
+orientation: both players and the "show board" buttons look at the same few positions.
+"""
+
+from __future__ import annotations
+
+from functools import cache, lru_cache
+from io import BytesIO
+
+import chess
+import chess.svg
+from PIL import Image, ImageDraw, ImageFont
+
+from utilities.imaging.image import svg_to_png
+
+__all__ = ("SQUARE", "render", "square_origin")
+
+SQUARE = 64
+
+LIGHT = (240, 217, 181)
+DARK = (181, 136, 99)
+LIGHT_MOVE = (205, 210, 106)
+DARK_MOVE = (170, 162, 58)
+
+FONT = "extra/roboto-bold.ttf"
+
+
+def square_origin(square: chess.Square, *, white: bool = True, size: int = SQUARE) -> tuple[int, int]:
+    """Top left corner of ``square``, seen from white's side if ``white`` else black's."""
+    file, rank = chess.square_file(square), chess.square_rank(square)
+    if white:
+        return file * size, (7 - rank) * size
+    return (7 - file) * size, rank * size
+
+
+def _colour(square: chess.Square, *, moved: bool = False) -> tuple[int, int, int]:
+    light = (chess.square_file(square) + chess.square_rank(square)) % 2
+    if moved:
+        return LIGHT_MOVE if light else DARK_MOVE
+    return LIGHT if light else DARK
+
+
+@cache
+def sprites(size: int = SQUARE) -> dict[str, Image.Image]:
+    """The piece images by symbol (``"K"``, ``"q"``, ...), ``size`` pixels square."""
+    images = {}
+    for symbol in "PNBRQKpnbrqk":
+        svg = chess.svg.piece(chess.Piece.from_symbol(symbol), size=size)
+        png = svg_to_png(svg.encode(), width=size, height=size)
+        images[symbol] = Image.open(BytesIO(png)).convert("RGBA")
+    return images
+
+
+@cache
+def empty_board(*, white: bool = True, size: int = SQUARE) -> Image.Image:
+    """The squares with file and rank letters along the edges, do not draw on it, copy it."""
+    image = Image.new("RGB", (8 * size, 8 * size))
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.truetype(FONT, size // 5)
+    padding = size // 16
+
+    for square in chess.SQUARES:
+        x, y = square_origin(square, white=white, size=size)
+        draw.rectangle((x, y, x + size - 1, y + size - 1), fill=_colour(square))
+
+    for index in range(8):
+        # label on the opposite colour of the square it is on
+        file = index if white else 7 - index
+        square = chess.square(file, 0 if white else 7)
+        x, y = square_origin(square, white=white, size=size)
+        draw.text(
+            (x + size - padding, y + size - padding),
+            chess.FILE_NAMES[file],
+            font=font,
+            fill=_colour(square ^ 1),
+            anchor="rd",
+        )
+
+        rank = 7 - index if white else index
+        square = chess.square(0 if white else 7, rank)
+        x, y = square_origin(square, white=white, size=size)
+        draw.text((x + padding, y + padding), chess.RANK_NAMES[rank], font=font, fill=_colour(square ^ 8), anchor="lt")
+    return image
+
+
+@lru_cache(maxsize=256)
+def render(board_fen: str, last_move: str | None = None, *, white: bool = True, size: int = SQUARE) -> bytes:
+    """PNG of the position ``board_fen`` (see :meth:`chess.Board.board_fen`).
+
+    ``last_move`` is the UCI of the move that led to it, its squares are highlighted.
+    Renders in a few milliseconds once the sprites exist, run it in a thread all the same.
+    """
+    image = empty_board(white=white, size=size).copy()
+    draw = ImageDraw.Draw(image)
+
+    if last_move:
+        move = chess.Move.from_uci(last_move)
+        for square in (move.from_square, move.to_square):
+            x, y = square_origin(square, white=white, size=size)
+            draw.rectangle((x, y, x + size - 1, y + size - 1), fill=_colour(square, moved=True))
+
+    pieces = sprites(size)
+    for square, piece in chess.BaseBoard(board_fen).piece_map().items():
+        sprite = pieces[piece.symbol()]
+        image.paste(sprite, square_origin(square, white=white, size=size), sprite)
+
+    buffer = BytesIO()
+    image.save(buffer, "png")
+    return buffer.getvalue()
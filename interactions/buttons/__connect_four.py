@@ -0,0 +1,247 @@
+"""Connect Four on bitboards, and the computer player.
+
+Each player's counters are one int. Column ``c`` is bits ``c * (height + 1)`` up to
+``c * (height + 1) + height - 1`` from the bottom, with one empty bit above every column so
+that shifting never carries a line from the top of a column into the next one. Four in a row
+is then four shifts and four ANDs, whatever the size of the board.
+
+:class:`Search` is a negamax with alpha-beta pruning and a transposition table, deepened one
+ply at a time until its time is up. It is plain Python and CPU bound, run it in a thread.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import NamedTuple
+
+__all__ = ("DIFFICULTIES", "Bitboard", "Difficulty", "Search")
+
+
+class Bitboard:
+    def __init__(self, width: int = 7, height: int = 6) -> None:
+        self.width = width
+        self.height = height
+        # counters of player 1 and player 2
+        self.stones = [0, 0]
+        self.mask = 0
+        self.moves = 0
+
+        self.bottom, self.top, self.column_mask = masks(width, height)
+
+    def __repr__(self) -> str:
+        return f"<Bitboard {self.width}x{self.height} moves={self.moves}>"
+
+    def copy(self) -> Bitboard:
+        board = Bitboard.__new__(Bitboard)
+        board.__dict__.update(self.__dict__)
+        board.stones = self.stones.copy()
+        return board
+
+    @property
+    def turn(self) -> int:
+        """0 if it is player 1's turn, 1 for player 2."""
+        return self.moves & 1
+
+    @property
+    def full(self) -> bool:
+        return self.moves == self.width * self.height
+
+    def can_play(self, column: int) -> bool:
+        return 0 <= column < self.width and not self.mask & self.top[column]
+
+    def playable(self) -> list[int]:
+        return [column for column in range(self.width) if not self.mask & self.top[column]]
+
+    def move(self, column: int) -> int:
+        """The bit the next counter dropped in ``column`` lands on."""
+        return (self.mask + self.bottom[column]) & self.column_mask[column]
+
+    def play(self, column: int) -> int:
+        """Drop a counter of the player whose turn it is. Returns its row, counted from the top."""
+        move = self.move(column)
+        self.stones[self.turn] |= move
+        self.mask |= move
+        self.moves += 1
+        return self.height - move.bit_length() + column * (self.height + 1)
+
+    def has_won(self, player: int) -> bool:
+        return aligned(self.stones[player], self.height)
+
+    def cell(self, row: int, column: int) -> int:
+        """0 if empty, else the player (1 or 2) whose counter is there. ``row`` counts from the top."""
+        bit = 1 << (column * (self.height + 1) + self.height - 1 - row)
+        if self.stones[0] & bit:
+            return 1
+        return 2 if self.stones[1] & bit else 0
+
+    def rows(self) -> list[list[int]]:
+        return [[self.cell(row, column) for column in range(self.width)] for row in range(self.height)]
+
+
+def masks(width: int, height: int) -> tuple[list[int], list[int], list[int]]:
+    """The bottom cell, the top cell and all cells of every column."""
+    bottom = [1 << (column * (height + 1)) for column in range(width)]
+    top = [1 << (column * (height + 1) + height - 1) for column in range(width)]
+    column_mask = [((1 << height) - 1) << (column * (height + 1)) for column in range(width)]
+    return bottom, top, column_mask
+
+
+def aligned(stones: int, height: int) -> bool:
+    """Whether ``stones`` has four in a row: vertical, horizontal and both diagonals."""
+    for shift in (1, height + 1, height, height + 2):
+        pairs = stones & (stones >> shift)
+        if pairs & (pairs >> (2 * shift)):
+            return True
+    return False
+
+
+def windows(width: int, height: int) -> list[int]:
+    """Every line of four cells of the board, as a mask."""
+    lines = []
+    for column in range(width):
+        for row in range(height):
+            for dx, dy in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                end_column, end_row = column + 3 * dx, row + 3 * dy
+                if 0 <= end_column < width and 0 <= end_row < height:
+                    lines.append(sum(1 << ((column + i * dx) * (height + 1) + row + i * dy) for i in range(4)))
+    return lines
+
+
+class Difficulty(NamedTuple):
+    depth: int
+    # seconds
+    time_limit: float
+    # chance of a random move instead of the best one
+    blunder: float = 0.0
+
+
+DIFFICULTIES: dict[str, Difficulty] = {
+    "easy": Difficulty(depth=2, time_limit=0.2, blunder=0.3),
+    "medium": Difficulty(depth=6, time_limit=0.5, blunder=0.05),
+    "hard": Difficulty(depth=64, time_limit=1.5),
+}
+
+WIN = 1_000_000
+# a line with 1, 2 or 3 of one player's counters and none of the other's
+LINE_SCORES = (0, 1, 4, 16, 0)
+
+EXACT, LOWER, UPPER = range(3)
+
+
+class OutOfTime(Exception):
+    pass
+
+
+class Search:
+    """The computer player's search, keeps its transposition table between moves of a game."""
+
+    def __init__(self, width: int, height: int, difficulty: Difficulty = DIFFICULTIES["medium"]) -> None:
+        self.difficulty = difficulty
+        self.width = width
+        self.height = height
+        self.cells = width * height
+        # center columns first, they are in the most lines
+        self.order = sorted(range(width), key=lambda column: abs(width // 2 - column))
+        self.windows = windows(width, height)
+        self.bottom, self.top, self.column_mask = masks(width, height)
+        self.table: dict[int, tuple[int, int, int]] = {}
+
+        self.nodes = 0
+        self.depth_reached = 0
+        self._deadline = 0.0
+
+    def __repr__(self) -> str:
+        return f"<Search {self.difficulty} nodes={self.nodes} table={len(self.table)}>"
+
+    def best_move(self, board: Bitboard) -> int | None:
+        """The column to play for the player whose turn it is, ``None`` if the board is full."""
+        playable = board.playable()
+        if not playable:
+            return None
+        if random.random() < self.difficulty.blunder:
+            return random.choice(playable)
+
+        if len(self.table) > 1_000_000:
+            self.table.clear()
+        self._deadline = time.perf_counter() + self.difficulty.time_limit
+        self.nodes = 0
+
+        current, mask = board.stones[board.turn], board.mask
+        best = next(column for column in self.order if column in playable)
+        for depth in range(1, min(self.difficulty.depth, self.cells - board.moves) + 1):
+            try:
+                best, score = self._root(current, mask, board.moves, depth)
+            except OutOfTime:
+                break
+            self.depth_reached = depth
+            if abs(score) >= WIN - self.cells:
+                # a forced win or loss, searching deeper will not change it
+                break
+        return best
+
+    def _root(self, current: int, mask: int, moves: int, depth: int) -> tuple[int, int]:
+        alpha, best = -WIN - 1, -1
+        for column in self.order:
+            if mask & self.top[column]:
+                continue
+            move = (mask + self.bottom[column]) & self.column_mask[column]
+            if aligned(current | move, self.height):
+                return column, WIN - moves
+            score = -self._negamax(current ^ mask, mask | move, moves + 1, depth - 1, -WIN - 1, -alpha)
+            if score > alpha:
+                alpha, best = score, column
+        return best, alpha
+
+    def _negamax(self, current: int, mask: int, moves: int, depth: int, alpha: int, beta: int) -> int:
+        self.nodes += 1
+        if not self.nodes & 1023 and time.perf_counter() > self._deadline:
+            raise OutOfTime
+
+        if moves == self.cells:
+            return 0
+
+        playable = [(mask + self.bottom[column]) & self.column_mask[column] for column in self.order if not mask & self.top[column]]
+        for move in playable:
+            if aligned(current | move, self.height):
+                return WIN - moves
+
+        if depth == 0:
+            return self._evaluate(current, mask ^ current)
+
+        key = current + mask
+        entry = self.table.get(key)
+        if entry is not None and entry[0] >= depth:
+            _, flag, value = entry
+            if flag == EXACT:
+                return value
+            if flag == LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value
+
+        original_alpha = alpha
+        best = -WIN - 1
+        for move in playable:
+            score = -self._negamax(current ^ mask, mask | move, moves + 1, depth - 1, -beta, -alpha)
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        flag = UPPER if best <= original_alpha else LOWER if best >= beta else EXACT
+        self.table[key] = (depth, flag, best)
+        return best
+
+    def _evaluate(self, current: int, opponent: int) -> int:
+        score = 0
+        for line in self.windows:
+            if not line & opponent:
+                score += LINE_SCORES[(line & current).bit_count()]
+            elif not line & current:
+                score -= LINE_SCORES[(line & opponent).bit_count()]
+        return score
@@ -7,7 +7,7 @@ import re
 from collections import defaultdict
 from collections.abc import Iterable, Iterator, Sequence
 from functools import cached_property, wraps
-from typing import TYPE_CHECKING, Literal, NamedTuple, TypedDict, overload
+from typing import TYPE_CHECKING, Literal, TypedDict, overload
 
 from discord.utils import MISSING
 
@@ -15,16 +15,17 @@ import discord
 import emojis
 from core import Context, Parrot
 from discord.ext import boardgames, commands, old_menus as menus
+from utilities.lexicon import lexicon
 
+from .__boggle import solve
+from .__connect_four import DIFFICULTIES, Bitboard, Search
 from .__constants import (
     BIG,
     CROSS_EMOJI,
-    DIAGRAPHS,
     DIE,
     LETTERS_EMOJI,
     NUMBERS,
     ORIGINAL,
-    POINTS,
     SMALL,
     STATES,
     SUPER_BIG,
@@ -32,14 +33,6 @@ from .__constants import (
     Coordinate,
 )
 
-with open("extra/boggle.txt", encoding="utf-8", errors="ignore") as f:
-    DICTIONARY = set(f.read().splitlines())
-
-
-class Position(NamedTuple):
-    col: int
-    row: int
-
 
 def ordinal(number: int, /) -> str:
     return f'{number}{"tsnrhtdd"[(number // 10 % 10 != 1) * (number % 10 < 4) * number % 10 :: 4]}'
@@ -66,54 +59,16 @@ class BoardBoogle:
 
         self.columns = board
 
-    def board_contains(self, word: str, pos: Position = None, passed: list[Position] = None) -> bool:
-        if passed is None:
-            passed = []
-        # Empty words
-        if not word:
-            return True
-
-        # When starting out
-        if pos is None:
-            # Check all positions
-            for col in range(self.size):
-                for row in range(self.size):
-                    if self.board_contains(word, Position(col, row)):
-                        return True
-
-        elif pos not in passed:
-            # Check if letter matches current start of word
-            letter = self.columns[pos.col][pos.row]
-            if letter.isdigit():
-                letter = DIAGRAPHS[letter]
-
-            if word[: len(letter)] == letter:
-                # Check adjacent for next letter
-                for x, y in itertools.product(range(-1, 2), range(-1, 2)):
-                    # don't check yourself
-                    if x == 0 and y == 0:
-                        continue
-
-                    new_pos = Position(pos.col + x, pos.row + y)
-
-                    # don't check out of bounds
-                    if new_pos.col < 0 or new_pos.col >= self.size or new_pos.row < 0 or new_pos.row >= self.size:
-                        continue
-
-                    if self.board_contains(word[len(letter) :], new_pos, [*passed, pos]):
-                        return True
-
-        # Otherwise cannot find word
-        return False
+    @cached_property
+    def legal_words(self) -> dict[str, int]:
+        """Every word on the board, with its points."""
+        return solve(self.columns, lexicon("boggle"))
 
     def is_legal(self, word: str) -> bool:
-        if len(word) < 3:
-            return False
-        word = word.upper()
-        return False if word not in DICTIONARY else self.board_contains(word)
+        return word.upper() in self.legal_words
 
     def points(self, word: str) -> int:
-        return POINTS[len(word)] if self.is_legal(word) else 0
+        return self.legal_words.get(word.upper(), 0)
 
     def total_points(self, words: Iterable[str]) -> int:
         return sum(self.points(word) for word in words)
@@ -146,8 +101,9 @@ class GameBoogle(menus.Menu):
         return await channel.send(content="Boggle game started, you have 3 minutes!", embed=self.state)
 
     async def start(self, *args, **kwargs):
+        # solve the board before it is shown, so no guess waits on it
+        await asyncio.to_thread(lambda: self.board.legal_words)
         await super().start(*args, **kwargs)
-        # await self.bot.loop.run_in_executor(None, lambda: self.board.legal_words)
 
     async def finalize(self, timed_out):
         self.bot.dispatch("boggle_game_complete", self.message.channel)
@@ -158,6 +114,16 @@ class GameBoogle(menus.Menu):
     def check_word(self, word: str) -> bool:
         return self.board.is_legal(word)
 
+    def missed_words(self, found: set[str], count: int = 15) -> str | None:
+        """The best words on the board(s) nobody found, ``None`` if there are none."""
+        legal = {word: points for board in getattr(self, "boards", [self.board]) for word, points in board.legal_words.items()}
+        missed = sorted(legal.keys() - found, key=lambda word: (-legal[word], word))
+        if not missed:
+            return None
+
+        text = ", ".join(missed[:count])
+        return f"{text} and {len(missed) - count} more" if len(missed) > count else text
+
     async def check_message(self, message: discord.Message):
         raise NotImplementedError
 
@@ -183,6 +149,7 @@ class ShuffflingGame(GameBoogle):
 
             # Shuffle board
             self.shuffle()
+            await asyncio.to_thread(lambda: self.board.legal_words)
             self.boards.append(self.board)
 
             # Note Board Updated
@@ -237,6 +204,8 @@ class DiscordGame(GameBoogle):
                 inline=False,
             )
 
+        if missed := self.missed_words(self.all_words):
+            embed.add_field(name="Words you missed", value=missed, inline=False)
         return embed
 
     def setup(self):
@@ -300,6 +269,8 @@ class ClassicGame(GameBoogle):
                 inline=False,
             )
 
+        if missed := self.missed_words(self.used_words):
+            embed.add_field(name="Words you missed", value=missed, inline=False)
         return embed
 
     def filter_lists(self):
@@ -492,16 +463,17 @@ class GameC4:
         player2: discord.Member | discord.User | None,
         tokens: list,
         size: int = 7,
+        difficulty: str = "medium",
     ):
         self.bot = bot
         self.channel = channel
+        self.board = Bitboard(size, size)
+        self.grid_size = size
+
         self.player1 = player1
-        self.player2 = player2 or AI_C4(self.bot, game=self)
+        self.player2 = player2 or AI_C4(self.bot, game=self, difficulty=difficulty)
         self.tokens = tokens
 
-        self.grid = self.generate_board(size)
-        self.grid_size = size
-
         self.unicode_numbers = [emojis.encode(i) for i in NUMBERS[: self.grid_size]]
 
         self.message: discord.Message | None = None
@@ -509,10 +481,10 @@ class GameC4:
         self.player_active: AI_C4 | discord.Member | discord.User | None = None
         self.player_inactive: AI_C4 | discord.Member | discord.User | None = None
 
-    @staticmethod
-    def generate_board(size: int) -> list[list[int]]:
-        """Generate the connect 4 board."""
-        return [[0 for _ in range(size)] for _ in range(size)]
+    @property
+    def grid(self) -> list[list[int]]:
+        """The board, top row first: 0 for an empty cell, else the player number."""
+        return self.board.rows()
 
     async def print_grid(self) -> None:
         """Formats and outputs the Connect Four grid to the channel."""
@@ -555,7 +527,7 @@ class GameC4:
             await self.print_grid()
 
             if isinstance(self.player_active, AI_C4):
-                coords = self.player_active.play()
+                coords = await self.player_active.play()
                 if not coords:
                     await self.game_over(
                         "draw",
@@ -576,6 +548,14 @@ class GameC4:
                 )
                 return
 
+            if self.board.full:
+                await self.game_over(
+                    "draw",
+                    (self.bot.user if isinstance(self.player_active, AI_C4) else self.player_active),
+                    (self.bot.user if isinstance(self.player_inactive, AI_C4) else self.player_inactive),
+                )
+                return
+
             self.player_active, self.player_inactive = (
                 self.player_inactive,
                 self.player_active,
@@ -594,10 +574,9 @@ class GameC4:
         message = await self.channel.send(
             f"{self.player_active.mention}, it's your turn! React with the column you want to place your token in.",
         )
-        player_num = 1 if self.player_active == self.player1 else 2
         while True:
             try:
-                reaction, user = await self.bot.wait_for("reaction_add", check=self.predicate, timeout=30.0)
+                reaction, user = await self.bot.wait_for("reaction_add", check=self.predicate, timeout=30.0, channel=self.channel)
             except asyncio.TimeoutError:
                 await self.channel.send(f"{self.player_active.mention}, you took too long. Game over!")
                 return None
@@ -613,36 +592,13 @@ class GameC4:
                     pass
 
                 column_num = self.unicode_numbers.index(str(reaction.emoji))
-                column = [row[column_num] for row in self.grid]
-
-                for row_num, square in reversed(list(enumerate(column))):
-                    if not square:
-                        self.grid[row_num][column_num] = player_num
-                        return row_num, column_num
+                if self.board.can_play(column_num):
+                    return self.board.play(column_num), column_num
                 message = await self.channel.send(f"Column {column_num + 1} is full. Try again")
 
     def check_win(self, coords: Coordinate, player_num: int) -> bool:
-        """Check that placing a counter here would cause the player to win."""
-        vertical = [(-1, 0), (1, 0)]
-        horizontal = [(0, 1), (0, -1)]
-        forward_diag = [(-1, 1), (1, -1)]
-        backward_diag = [(-1, -1), (1, 1)]
-        axes = [vertical, horizontal, forward_diag, backward_diag]
-
-        for axis in axes:
-            counters_in_a_row = 1  # The initial counter that is compared to
-            for row_incr, column_incr in axis:
-                row, column = coords
-                row += row_incr
-                column += column_incr
-
-                while 0 <= row < self.grid_size and 0 <= column < self.grid_size and self.grid[row][column] == player_num:
-                    counters_in_a_row += 1
-                    row += row_incr
-                    column += column_incr
-            if counters_in_a_row >= 4:
-                return True
-        return False
+        """Check whether the counter just placed at ``coords`` made the player win."""
+        return self.board.has_won(player_num - 1)
 
 
 class AI_C4:
@@ -651,75 +607,22 @@ class AI_C4:
     if TYPE_CHECKING:
         from .__constants import Coordinate
 
-    def __init__(self, bot: Parrot, game: GameC4):
+    def __init__(self, bot: Parrot, game: GameC4, difficulty: str = "medium"):
         self.game = game
         self.mention = bot.user.mention
+        self.search = Search(game.board.width, game.board.height, DIFFICULTIES[difficulty])
 
-    def get_possible_places(self) -> list[Coordinate]:
-        """Gets all the coordinates where the AI_C4 could possibly place a counter."""
-        possible_coords = []
-        for column_num in range(self.game.grid_size):
-            column = [row[column_num] for row in self.game.grid]
-            for row_num, square in reversed(list(enumerate(column))):
-                if not square:
-                    possible_coords.append((row_num, column_num))
-                    break
-        return possible_coords
-
-    def check_ai_win(self, coord_list: list[Coordinate]) -> Coordinate | None:
-        """
-        Check AI_C4 win.
-        Check if placing a counter in any possible coordinate would cause the AI_C4 to win
-        with 10% chance of not winning and returning None
-        """
-        if random.randint(1, 10) == 1:
-            return None
-        return next(
-            (coords for coords in coord_list if self.game.check_win(coords, 2)),
-            None,
-        )
-
-    def check_player_win(self, coord_list: list[Coordinate]) -> Coordinate | None:
-        """
-        Check Player win.
-        Check if placing a counter in possible coordinates would stop the player
-        from winning with 25% of not blocking them  and returning None.
-        """
-        if random.randint(1, 4) == 1:
-            return None
-        return next(
-            (coords for coords in coord_list if self.game.check_win(coords, 1)),
-            None,
-        )
-
-    @staticmethod
-    def random_coords(coord_list: list[Coordinate]) -> Coordinate:
-        """Picks a random coordinate from the possible ones."""
-        return random.choice(coord_list)
-
-    def play(self) -> Coordinate | bool:
+    async def play(self) -> Coordinate | bool:
         """
         Plays for the AI_C4.
-        Gets all possible coords, and determins the move:
-        1. coords where it can win.
-        2. coords where the player can win.
-        3. Random coord
-        The first possible value is choosen.
+        Searches the game for the best column, in a thread so the bot keeps answering meanwhile,
+        and drops a counter in it. False if the board is full.
         """
-        possible_coords = self.get_possible_places()
-
-        if not possible_coords:
+        column = await asyncio.to_thread(self.search.best_move, self.game.board.copy())
+        if column is None:
             return False
 
-        coords = (
-            self.check_ai_win(possible_coords)
-            or self.check_player_win(possible_coords)
-            or self.random_coords(possible_coords)
-        )
-
-        row, column = coords
-        self.game.grid[row][column] = 2
-        return coords
+        return self.game.board.play(column), column
 
 
 class Board:
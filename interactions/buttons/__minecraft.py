@@ -4,13 +4,20 @@ import asyncio
 import re
 from io import BytesIO
 
-import numpy as np
 from PIL import Image
 
 import discord
 from core import Context
+from utilities.assets import assets
+from utilities.lazy import lazy_import
 
-from .__constants import code_dict, codes, selector_back, selector_front
+from .__constants import code_dict, codes
+
+np = lazy_import("numpy")
+
+
+def texture(name: str) -> Image.Image:
+    return assets.image(f"minecraft/{name}.png", mode="RGBA")
 
 
 def isometric_func(shape, selector_pos=None):
@@ -32,13 +39,16 @@ def isometric_func(shape, selector_pos=None):
 
             selected = False
             if [lvl, i, j] == selector_pos:
+                selector_back = texture("selector_back")
                 canvas.paste(selector_back, (fx, fy), selector_back)
                 selected = True
 
-            if img := code_dict.get(val):
+            if name := code_dict.get(val):
+                img = texture(name)
                 canvas.paste(img, (fx, fy), img)
 
             if selected:
+                selector_front = texture("selector_front")
                 canvas.paste(selector_front, (fx, fy), selector_front)
 
             j += 1
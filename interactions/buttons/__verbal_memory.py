@@ -2,10 +2,9 @@ from __future__ import annotations
 
 import random
 
-from english_words import get_english_words_set
-
 import discord
 from core import Context, Parrot
+from utilities.lexicon import lexicon
 
 from .utils import BaseView
 
@@ -75,21 +74,10 @@ class VerbalMemory:
         self.lives: int = 0
         self.embed: discord.Embed | None = None
 
-        english_words = list(
-            get_english_words_set(
-                ["web2"],
-                alpha=True,
-                lower=True,
-            ),
-        )
-
         if sample_size:
-            self.word_set = word_set or random.choices(
-                english_words,
-                k=sample_size,
-            )
+            self.word_set = word_set or random.choices(lexicon("english"), k=sample_size)
         else:
-            self.word_set = word_set or english_words
+            self.word_set = word_set or list(lexicon("english"))
 
         assert self.word_set
 
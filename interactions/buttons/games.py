@@ -24,6 +24,7 @@ from core import Cog, Context, Parrot
 from discord.ext import boardgames, commands
 from utilities.constants import Colours
 from utilities.converters import convert_bool
+from utilities.lexicon import lexicon
 from utilities.uno.game import UNO
 
 from .__2048 import Twenty48, Twenty48_Button
@@ -101,6 +102,14 @@ class Games(Cog):
         self.current_games: dict[int, DuckGame] = {}
         self.uno_games: dict[int, UNO] = {}
 
+    async def cog_load(self):
+        self.bot.startup.defer("lexicons", self.load_lexicons)
+
+    @staticmethod
+    async def load_lexicons() -> None:
+        # compiles the word lists the first time, memory-maps them after that
+        await asyncio.to_thread(lambda: [lexicon(name) for name in ("boggle", "english", "wordle")])
+
     @staticmethod
     def _load_templates() -> list[MadlibsTemplate]:
         madlibs_stories = Path("extra/madlibs_templates.json")
@@ -265,13 +274,14 @@ class Games(Cog):
         board_size: int,
         emoji1: Any,
         emoji2: Any,
+        difficulty: str = "medium",
     ) -> None:
         """Helper for playing a game of connect four."""
         self.tokens = [":white_circle:", emoji1, emoji2]
         game = None  # if game fails to intialize in try...except
 
         try:
-            game = GameC4(self.bot, ctx.channel, ctx.author, user, self.tokens, size=board_size)
+            game = GameC4(self.bot, ctx.channel, ctx.author, user, self.tokens, size=board_size, difficulty=difficulty)
             self.games_c4.append(game)
             await game.start_game()
             self.games_c4.remove(game)
@@ -358,8 +368,9 @@ class Games(Cog):
         board_size: int = 7,
         emoji1: EMOJI_CHECK = "\N{LARGE BLUE CIRCLE}",
         emoji2: EMOJI_CHECK = "\N{LARGE RED CIRCLE}",
+        difficulty: Literal["easy", "medium", "hard"] = "medium",
     ) -> None:
-        """Play Connect Four against a computer player."""
+        """Play Connect Four against a computer player, `easy`, `medium` or `hard`."""
         check, emoji = self.check_emojis(emoji1, emoji2)
         if not check:
             raise commands.EmojiNotFound(emoji)
@@ -368,7 +379,7 @@ class Games(Cog):
         if not check_author_result:
             return
 
-        await self._play_game(ctx, None, board_size, emoji1, emoji2)
+        await self._play_game(ctx, None, board_size, emoji1, emoji2, difficulty)
 
     @commands.command(aliases=["akinator"])
     @commands.bot_has_permissions(embed_links=True, add_reactions=True)
@@ -762,7 +773,7 @@ class Games(Cog):
             await original_message.edit(embed=madlibs_embed)
 
             try:
-                message = await self.bot.wait_for("message", check=author_check, timeout=60)
+                message = await self.bot.wait_for("message", check=author_check, timeout=60, channel=ctx.channel, user=ctx.author)
             except TimeoutError:
                 timeout_embed = discord.Embed(
                     description="Uh oh! You took too long to respond!",
@@ -176,7 +176,7 @@ class LinePaginator(Paginator):
 
         while True:
             try:
-                reaction, user = await ctx.wait_for("reaction_add", timeout=timeout, check=event_check)
+                reaction, user = await ctx.wait_for("reaction_add", timeout=timeout, check=event_check, channel=message.channel)
             except asyncio.TimeoutError:
                 break  # We're done, no reactions for the last 5 minutes
 
@@ -271,7 +271,7 @@ async def disambiguate(
         if embed is None:
             embed = discord.Embed()
 
-        coro1 = ctx.wait_for("message", check=check, timeout=timeout)
+        coro1 = ctx.wait_for("message", check=check, timeout=timeout, channel=ctx.channel, user=ctx.author)
         coro2 = LinePaginator.paginate(
             choices,
             ctx,
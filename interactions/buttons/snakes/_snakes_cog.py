@@ -428,7 +428,7 @@ class Snakes(Cog):
 
         # Validate the answer
         try:
-            reaction, _ = await ctx.wait_for("reaction_add", timeout=45.0, check=predicate)
+            reaction, _ = await ctx.wait_for("reaction_add", timeout=45.0, check=predicate, channel=ctx.channel, user=ctx.author)
         except asyncio.TimeoutError:
             await ctx.send(f"You took too long. The correct answer was **{options[answer]}**.")
             await message.clear_reactions()
@@ -515,7 +515,7 @@ class Snakes(Cog):
         # Begin main game loop
         while not win and antidote_tries < 10:
             try:
-                reaction, user = await ctx.wait_for("reaction_add", timeout=300, check=predicate)
+                reaction, user = await ctx.wait_for("reaction_add", timeout=300, check=predicate, channel=ctx.channel, user=ctx.author)
             except asyncio.TimeoutError:
                 break  # We're done, no reactions for the last 5 minutes
 
@@ -608,16 +608,20 @@ class Snakes(Cog):
             # Build and send the snek
             text = random.choice(self.snake_idioms)["idiom"]
             factory = PerlinNoiseFactory(dimension=1, octaves=2)
-            image_frame = create_snek_frame(
-                factory,
-                snake_width=width,
-                snake_length=length,
-                snake_color=snek_color,
-                text=text,
-                text_color=text_color,
-                bg_color=bg_color,
-            )
-            png_bytes = frame_to_png_bytes(image_frame)
+
+            def render() -> BytesIO:
+                image_frame = create_snek_frame(
+                    factory,
+                    snake_width=width,
+                    snake_length=length,
+                    snake_color=snek_color,
+                    text=text,
+                    text_color=text_color,
+                    bg_color=bg_color,
+                )
+                return frame_to_png_bytes(image_frame)
+
+            png_bytes = await asyncio.to_thread(render)
             file = File(png_bytes, filename="snek.png")
             await ctx.send(file=file)
 
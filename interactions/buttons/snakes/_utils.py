@@ -1,10 +1,13 @@
+from __future__ import annotations
+
 import asyncio
 import io
 import json
 import logging
 import math
 import random
-from itertools import product
+from functools import cache
+from itertools import pairwise, product
 from pathlib import Path
 
 from PIL import Image
@@ -13,6 +16,9 @@ from PIL.ImageDraw import ImageDraw
 from core import Cog, Context
 from discord import File, Member, Reaction, User
 from discord.ext import commands
+from utilities.lazy import lazy_import
+
+np = lazy_import("numpy")
 
 SNAKE_RESOURCES = Path("extra/snakes").absolute()
 
@@ -128,19 +134,22 @@ def lerp(t: float, a: float, b: float) -> float:
 
 
 class PerlinNoiseFactory:
-    """Callable that produces Perlin noise for an arbitrary point in an arbitrary number of dimensions.
-    The underlying grid is aligned with the integers.
-    There is no limit to the coordinates used; new gradients are generated on the fly as necessary.
-    Taken from: https://gist.github.com/eevee/26f547457522755cb1fb8739d0ea89a1
+    """Callable that produces Perlin noise for arrays of points in an arbitrary number of dimensions.
+    The underlying grid is aligned with the integers, and repeats every ``PERIOD`` units.
+    Based on: https://gist.github.com/eevee/26f547457522755cb1fb8739d0ea89a1
     Licensed under ISC.
     """
 
+    PERIOD = 256
+
     def __init__(
         self,
         dimension: int,
         octaves: int = 1,
         tile: tuple[int, ...] = (),
         unbias: bool = False,
+        *,
+        seed: int | None = None,
     ) -> None:
         """Create a new Perlin noise factory in the given number of dimensions.
         dimension should be an integer and at least 1.
@@ -151,96 +160,101 @@ class PerlinNoiseFactory:
         This will produce noise that tiles every 3 units vertically, but never tiles horizontally.
         If ``unbias`` is True, the smoothstep function will be applied to the output before returning
         it, to counteract some of Perlin noise's significant bias towards the center of its output range.
+        ``seed`` makes the gradients reproducible, by default they come from the ``random`` module.
         """
         self.dimension = dimension
         self.octaves = octaves
-        self.tile = tile + (0,) * dimension
+        self.tile = np.array((tile + (0,) * dimension)[:dimension], dtype=np.int64)
         self.unbias = unbias
 
         # For n dimensions, the range of Perlin noise is ±sqrt(n)/2; multiply
         # by this to scale to ±1
         self.scale_factor = 2 * dimension**-0.5
 
-        self.gradient = {}
+        rng = np.random.default_rng(random.getrandbits(64) if seed is None else seed)
+        # Lattice points hash to one of PERIOD gradients through a permutation, like Perlin's
+        # reference implementation, instead of generating and storing one per point visited
+        self.permutation = rng.permutation(self.PERIOD)
+        self.gradient = self._generate_gradients(rng)
+
+        # the corners of a grid cell, as offsets from its lowest corner
+        self.corners = np.array(list(product((0, 1), repeat=dimension)), dtype=np.int64)
 
-    def _generate_gradient(self) -> tuple[float, ...]:
-        """Generate a random unit vector at each grid point.
+    def _generate_gradients(self, rng: np.random.Generator) -> np.ndarray:
+        """Generate ``PERIOD`` random unit vectors, shape ``(PERIOD, dimension)``.
         This is the "gradient" vector, in that the grid tile slopes towards it.
         """
         # 1 dimension is special, since the only unit vector is trivial;
         # instead, use a slope between -1 and 1
         if self.dimension == 1:
-            return (random.uniform(-1, 1),)
-
-        # Generate a random point on the surface of the unit n-hypersphere;
-        # this is the same as a random unit vector in n dimensions.  Thanks
-        # to: http://mathworld.wolfram.com/SpherePointPicking.html
-        # Pick n normal random variables with stddev 1
-        random_point = [random.gauss(0, 1) for _ in range(self.dimension)]
-        # Then scale the result to a unit vector
-        scale = sum(n * n for n in random_point) ** -0.5
-        return tuple(coord * scale for coord in random_point)
-
-    def get_plain_noise(self, *point) -> float:
-        """Get plain noise for a single point, without taking into account either octaves or tiling."""
-        if len(point) != self.dimension:
+            return rng.uniform(-1, 1, (self.PERIOD, 1))
+
+        # A random point on the surface of the unit n-hypersphere is the same as a random unit
+        # vector in n dimensions: n normal random variables, scaled to length 1.  Thanks to:
+        # http://mathworld.wolfram.com/SpherePointPicking.html
+        points = rng.normal(0, 1, (self.PERIOD, self.dimension))
+        return points / np.linalg.norm(points, axis=1, keepdims=True)
+
+    def _points(self, point: tuple) -> np.ndarray:
+        """``point`` as an array of shape ``(n, dimension)``, from coordinates or arrays of coordinates."""
+        if len(point) == 1 and np.ndim(point[0]) == 2:
+            points = np.asarray(point[0], dtype=np.float64)
+        elif len(point) == self.dimension:
+            points = np.stack(np.broadcast_arrays(*(np.asarray(p, dtype=np.float64).ravel() for p in point)), axis=-1)
+        else:
             msg = f"Expected {self.dimension} values, got {len(point)}"
             raise ValueError(msg)
 
-        # Build a list of the (min, max) bounds in each dimension
-        grid_coords = []
-        for coord in point:
-            min_coord = math.floor(coord)
-            max_coord = min_coord + 1
-            grid_coords.append((min_coord, max_coord))
-
-        # Compute the dot product of each gradient vector and the point's
-        # distance from the corresponding grid point.  This gives you each
-        # gradient's "influence" on the chosen point.
-        dots = []
-        for grid_point in product(*grid_coords):
-            if grid_point not in self.gradient:
-                self.gradient[grid_point] = self._generate_gradient()
-            gradient = self.gradient[grid_point]
-
-            dot = sum(gradient[i] * (point[i] - grid_point[i]) for i in range(self.dimension))
-            dots.append(dot)
-
-        # Interpolate all those dot products together.  The interpolation is
-        # done with smoothstep to smooth out the slope as you pass from one
-        # grid cell into the next.
-        # Due to the way product() works, dot products are ordered such that
-        # the last dimension alternates: (..., min), (..., max), etc.  So we
-        # can interpolate adjacent pairs to "collapse" that last dimension.  Then
-        # the results will alternate in their second-to-last dimension, and so
-        # forth, until we only have a single value left.
-        dim = self.dimension
-        while len(dots) > 1:
-            dim -= 1
-            s = smoothstep(point[dim] - grid_coords[dim][0])
-
-            next_dots = []
-            while dots:
-                next_dots.append(lerp(s, dots.pop(0), dots.pop(0)))
-
-            dots = next_dots
-
-        return dots[0] * self.scale_factor
-
-    def __call__(self, *point) -> float:
-        """Get the value of this Perlin noise function at the given point.
-        The number of values given should match the number of dimensions.
+        if points.shape[-1] != self.dimension:
+            msg = f"Expected {self.dimension} values, got {points.shape[-1]}"
+            raise ValueError(msg)
+        return points
+
+    def _plain_noise(self, points: np.ndarray, period: np.ndarray) -> np.ndarray:
+        # the lowest corner of the grid cell of each point, and where the point is inside it
+        low = np.floor(points)
+        offset = points - low
+        low = low.astype(np.int64)
+
+        # Compute the dot product of each gradient vector and the point's distance from the
+        # corresponding grid point, for every corner: shape (n, 2 ** dimension)
+        dots = np.empty((len(points), len(self.corners)))
+        for index, corner in enumerate(self.corners):
+            lattice = low + corner
+            # corners on the far edge of a tile are the ones on the near edge
+            lattice = np.where(period > 0, lattice % np.maximum(period, 1), lattice)
+            hashed = np.zeros(len(points), dtype=np.int64)
+            for axis in range(self.dimension):
+                hashed = self.permutation[(hashed + lattice[:, axis]) % self.PERIOD]
+            dots[:, index] = np.einsum("ij,ij->i", self.gradient[hashed], offset - corner)
+
+        # Interpolate the dot products, collapsing the last dimension first: the corners are in
+        # product() order, so the last dimension alternates between adjacent columns
+        for axis in reversed(range(self.dimension)):
+            s = smoothstep(offset[:, axis])[:, None]
+            dots = lerp(s, dots[:, 0::2], dots[:, 1::2])
+
+        return dots[:, 0] * self.scale_factor
+
+    def get_plain_noise(self, *point) -> float | np.ndarray:
+        """Get plain noise, without taking into account either octaves or tiling.
+        Takes one coordinate per dimension, each a number or an array, or one array of points of
+        shape ``(n, dimension)``. Returns a float for a single point, else an array of ``n`` values.
+        """
+        points = self._points(point)
+        noise = self._plain_noise(points, np.zeros(self.dimension, dtype=np.int64))
+        return float(noise[0]) if all(np.ndim(p) == 0 for p in point) else noise
+
+    def __call__(self, *point) -> float | np.ndarray:
+        """Get the value of this Perlin noise function at the given points.
+        Takes the same points as :meth:`get_plain_noise`.
         """
-        ret = 0
+        points = self._points(point)
+        ret = np.zeros(len(points))
         for o in range(self.octaves):
             o2 = 1 << o
-            new_point = []
-            for i, coord in enumerate(point):
-                coord *= o2
-                if self.tile[i]:
-                    coord %= self.tile[i] * o2
-                new_point.append(coord)
-            ret += self.get_plain_noise(*new_point) / o2
+            period = self.tile * o2
+            ret += self._plain_noise(points * o2, period) / o2
 
         # Need to scale n back down since adding all those extra octaves has
         # probably expanded it beyond ±1
@@ -261,7 +275,7 @@ class PerlinNoiseFactory:
                 r = smoothstep(r)
             ret = r * 2 - 1
 
-        return ret
+        return float(ret[0]) if all(np.ndim(p) == 0 for p in point) else ret
 
 
 def create_snek_frame(
@@ -281,59 +295,29 @@ def create_snek_frame(
     """Creates a single random snek frame using Perlin noise.
     `perlin_lookup_vertical_shift` represents the Perlin noise shift in the Y-dimension for this frame.
     If `text` is given, display the given text with the snek.
+    CPU bound, run it in a thread.
     """
     start_x = random.randint(image_margins[X], image_dimensions[X] - image_margins[X])
     start_y = random.randint(image_margins[Y], image_dimensions[Y] - image_margins[Y])
-    points: list[tuple[float, float]] = [(start_x, start_y)]
 
-    for index in range(snake_length):
-        angle = (
-            perlin_factory.get_plain_noise(((1 / (snake_length + 1)) * (index + 1)) + perlin_lookup_vertical_shift)
-            * ANGLE_RANGE
-        )
-        current_point = points[index]
-        segment_length = random.randint(segment_length_range[0], segment_length_range[1])
-        points.append(
-            (
-                current_point[X] + segment_length * math.cos(angle),
-                current_point[Y] + segment_length * math.sin(angle),
-            ),
-        )
-
-    # normalize bounds
-    min_dimensions: list[float] = [start_x, start_y]
-    max_dimensions: list[float] = [start_x, start_y]
-    for point in points:
-        min_dimensions[X] = min(point[X], min_dimensions[X])
-        min_dimensions[Y] = min(point[Y], min_dimensions[Y])
-        max_dimensions[X] = max(point[X], max_dimensions[X])
-        max_dimensions[Y] = max(point[Y], max_dimensions[Y])
+    # the angle of every segment from one noise lookup, and the points as a running sum of segments
+    lookups = np.arange(1, snake_length + 1) / (snake_length + 1) + perlin_lookup_vertical_shift
+    angles = perlin_factory.get_plain_noise(lookups[:, None]) * ANGLE_RANGE
+    segment_lengths = np.array(
+        [random.randint(segment_length_range[0], segment_length_range[1]) for _ in range(snake_length)],
+    )
+    steps = np.stack((segment_lengths * np.cos(angles), segment_lengths * np.sin(angles)), axis=-1)
+    points = np.vstack(((start_x, start_y), (start_x, start_y) + np.cumsum(steps, axis=0)))
 
     # shift towards middle
-    dimension_range = (
-        max_dimensions[X] - min_dimensions[X],
-        max_dimensions[Y] - min_dimensions[Y],
-    )
-    shift = (
-        image_dimensions[X] / 2 - (dimension_range[X] / 2 + min_dimensions[X]),
-        image_dimensions[Y] / 2 - (dimension_range[Y] / 2 + min_dimensions[Y]),
-    )
+    min_dimensions, max_dimensions = points.min(axis=0), points.max(axis=0)
+    shift = np.array(image_dimensions) / 2 - ((max_dimensions - min_dimensions) / 2 + min_dimensions)
+    points += shift
 
     image = Image.new(mode="RGB", size=image_dimensions, color=bg_color)
     draw = ImageDraw(image)
-    for index in range(1, len(points)):
-        point = points[index]
-        previous = points[index - 1]
-        draw.line(
-            (
-                shift[X] + previous[X],
-                shift[Y] + previous[Y],
-                shift[X] + point[X],
-                shift[Y] + point[Y],
-            ),
-            width=snake_width,
-            fill=snake_color,
-        )
+    for previous, point in pairwise(points.tolist()):
+        draw.line((*previous, *point), width=snake_width, fill=snake_color)
     if text is not None:
         draw.multiline_text(text_position, text, fill=text_color)
     return image
@@ -347,6 +331,84 @@ def frame_to_png_bytes(image: Image.Image) -> io.BytesIO:
     return stream
 
 
+@cache
+def base_board() -> Image.Image:
+    """The empty Snakes and Ladders board, decoded once. Shared, copy it before drawing on it."""
+    with Image.open(SNAKE_RESOURCES / "snakes_and_ladders" / "board.jpg") as image:
+        return image.convert("RGB")
+
+
+class SnakesAndLaddersBoard:
+    """The board of one game, with the players' avatars on it.
+    Avatars are decoded and resized once, when a player joins. Every round only the avatars
+    that moved are drawn again: their old squares are copied back from the empty board first.
+    """
+
+    def __init__(self) -> None:
+        self.image = base_board().copy()
+        self.avatars: dict[int, Image.Image] = {}
+        # where each avatar is drawn, top left corner
+        self.drawn: dict[int, tuple[int, int]] = {}
+
+    def add_avatar(self, user_id: int, data: bytes) -> None:
+        """Decode and resize an avatar. CPU bound, run it in a thread."""
+        with Image.open(io.BytesIO(data)) as image:
+            self.avatars[user_id] = image.resize((BOARD_PLAYER_SIZE, BOARD_PLAYER_SIZE))
+
+    def remove_avatar(self, user_id: int) -> None:
+        self.avatars.pop(user_id, None)
+
+    @staticmethod
+    def coordinate_from_index(index: int) -> tuple[int, int]:
+        """Convert the tile number to the x/y coordinates for graphical purposes."""
+        y_level = 9 - math.floor((index - 1) / 10)
+        is_reversed = math.floor((index - 1) / 10) % 2 != 0
+        x_level = (index - 1) % 10
+        if is_reversed:
+            x_level = 9 - x_level
+        return x_level, y_level
+
+    @classmethod
+    def avatar_origin(cls, tile: int, slot: int) -> tuple[int, int]:
+        """Top left corner of the ``slot``-th avatar on ``tile``. Slots fill a tile from its bottom left."""
+        player_row_size = math.ceil(MAX_PLAYERS / 2)
+        tile_coordinates = cls.coordinate_from_index(tile)
+        x_offset = BOARD_MARGIN[0] + tile_coordinates[0] * BOARD_TILE_SIZE
+        y_offset = BOARD_MARGIN[1] + ((10 * BOARD_TILE_SIZE) - (9 - tile_coordinates[1]) * BOARD_TILE_SIZE - BOARD_PLAYER_SIZE)
+        x_offset += BOARD_PLAYER_SIZE * (slot % player_row_size)
+        y_offset -= BOARD_PLAYER_SIZE * math.floor(slot / player_row_size)
+        return x_offset, y_offset
+
+    def update(self, tiles: dict[int, int]) -> int:
+        """Move the avatars to ``tiles``, user id to tile in the order of the players.
+        Players not in ``tiles`` are taken off the board. Returns how many avatars were drawn.
+        """
+        wanted = {user_id: self.avatar_origin(tile, slot) for slot, (user_id, tile) in enumerate(tiles.items())}
+        moved = [user_id for user_id, origin in wanted.items() if self.drawn.get(user_id) != origin]
+
+        # erase everything that moves or leaves before drawing, one avatar may take another's place
+        for user_id in [*moved, *(user_id for user_id in self.drawn if user_id not in wanted)]:
+            origin = self.drawn.pop(user_id, None)
+            if origin is not None:
+                box = (*origin, origin[0] + BOARD_PLAYER_SIZE, origin[1] + BOARD_PLAYER_SIZE)
+                self.image.paste(base_board().crop(box), box)
+
+        for user_id in moved:
+            self.image.paste(self.avatars[user_id], box=wanted[user_id])
+            self.drawn[user_id] = wanted[user_id]
+        return len(moved)
+
+    def render(self, tiles: dict[int, int]) -> io.BytesIO:
+        """:meth:`update`, then the board as a JPEG, a fraction of the time PNG takes to encode.
+        CPU bound, run it in a thread.
+        """
+        self.update(tiles)
+        stream = io.BytesIO()
+        self.image.save(stream, format="JPEG", quality=85)
+        stream.seek(0)
+        return stream
+
+
 log = logging.getLogger(__name__)
 START_EMOJI = "\u2611"  # :ballot_box_with_check: - Start the game
 CANCEL_EMOJI = "\u274C"  # :x: - Cancel or leave the game
@@ -369,7 +431,7 @@ class SnakeAndLaddersGame:
         self.players = []
         self.player_tiles = {}
         self.round_has_rolled = {}
-        self.avatar_images = {}
+        self.board_image = SnakesAndLaddersBoard()
         self.board = None
         self.positions = None
         self.rolls = []
@@ -411,7 +473,12 @@ class SnakeAndLaddersGame:
 
         while not self.started:
             try:
-                reaction, user = await self.ctx.wait_for("reaction_add", timeout=300, check=startup_event_check)
+                reaction, user = await self.ctx.wait_for(
+                    "reaction_add",
+                    timeout=300,
+                    check=startup_event_check,
+                    channel=self.channel,
+                )
                 if reaction.emoji == JOIN_EMOJI:
                     await self.player_join(user)
                 elif reaction.emoji == CANCEL_EMOJI:
@@ -438,8 +505,7 @@ class SnakeAndLaddersGame:
         self.player_tiles[user.id] = 1
 
         avatar_bytes = await user.display_avatar.replace(size=PLAYER_ICON_IMAGE_SIZE).read()
-        im = Image.open(io.BytesIO(avatar_bytes)).resize((BOARD_PLAYER_SIZE, BOARD_PLAYER_SIZE))
-        self.avatar_images[user.id] = im
+        await asyncio.to_thread(self.board_image.add_avatar, user.id, avatar_bytes)
 
     async def player_join(self, user: User | Member) -> None:
         """Handle players joining the game.
@@ -475,6 +541,7 @@ class SnakeAndLaddersGame:
             if user == p:
                 self.players.remove(p)
                 self.player_tiles.pop(p.id, None)
+                self.board_image.remove_avatar(p.id)
                 self.round_has_rolled.pop(p.id, None)
                 await self.channel.send(
                     f"**Snakes and Ladders**: {user.mention} has left the game.",
@@ -535,21 +602,8 @@ class SnakeAndLaddersGame:
         self.state = "roll"
         for user in self.players:
             self.round_has_rolled[user.id] = False
-        board_img = Image.open(SNAKE_RESOURCES / "snakes_and_ladders" / "board.jpg")
-        player_row_size = math.ceil(MAX_PLAYERS / 2)
-
-        for i, player in enumerate(self.players):
-            tile = self.player_tiles[player.id]
-            tile_coordinates = self._board_coordinate_from_index(tile)
-            x_offset = BOARD_MARGIN[0] + tile_coordinates[0] * BOARD_TILE_SIZE
-            y_offset = BOARD_MARGIN[1] + (
-                (10 * BOARD_TILE_SIZE) - (9 - tile_coordinates[1]) * BOARD_TILE_SIZE - BOARD_PLAYER_SIZE
-            )
-            x_offset += BOARD_PLAYER_SIZE * (i % player_row_size)
-            y_offset -= BOARD_PLAYER_SIZE * math.floor(i / player_row_size)
-            board_img.paste(self.avatar_images[player.id], box=(x_offset, y_offset))
-
-        board_file = File(frame_to_png_bytes(board_img), filename="Board.jpg")
+        tiles = {player.id: self.player_tiles[player.id] for player in self.players}
+        board_file = File(await asyncio.to_thread(self.board_image.render, tiles), filename="Board.jpg")
         player_list = "\n".join(f"{user.mention}: Tile {str(self.player_tiles[user.id])}" for user in self.players)
 
         # Store and send new messages
@@ -582,7 +636,7 @@ class SnakeAndLaddersGame:
         is_surrendered = False
         while True:
             try:
-                reaction, user = await self.ctx.wait_for("reaction_add", timeout=300, check=game_event_check)
+                reaction, user = await self.ctx.wait_for("reaction_add", timeout=300, check=game_event_check, channel=self.channel)
 
                 if reaction.emoji == ROLL_EMOJI:
                     await self.player_roll(user)
@@ -669,15 +723,6 @@ class SnakeAndLaddersGame:
         """Clean up the finished game object."""
         del self.snakes.active_sal[self.channel]
 
-    def _board_coordinate_from_index(self, index: int) -> tuple[int, int]:
-        """Convert the tile number to the x/y coordinates for graphical purposes."""
-        y_level = 9 - math.floor((index - 1) / 10)
-        is_reversed = math.floor((index - 1) / 10) % 2 != 0
-        x_level = (index - 1) % 10
-        if is_reversed:
-            x_level = 9 - x_level
-        return x_level, y_level
-
     @staticmethod
     def _is_moderator(user: Member) -> bool:
         """Return True if the user is a Moderator."""
@@ -74,7 +74,7 @@ async def wait_for_delete(
 
     resolved_bot: discord.Client = bot or ctx.bot
     try:
-        await resolved_bot.wait_for("reaction_add", timeout=timeout, check=check)
+        await resolved_bot.wait_for("reaction_add", timeout=timeout, check=check, channel=message.channel)
     except asyncio.TimeoutError:
         return False
     else:
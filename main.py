@@ -1,16 +1,19 @@
 from __future__ import annotations
 
-import asyncio
-import contextlib
-import os
-import socket
+from utilities.lazy import profiler
 
-from aiohttp import AsyncResolver, ClientSession, TCPConnector
-from motor.motor_asyncio import AsyncIOMotorClient
+# before anything else is imported, so the ``importtime`` command sees every import
+profiler.install()
 
-from core import Parrot
-from updater import init
-from utilities.config import DATABASE_KEY, DATABASE_URI, TOKEN, VERSION
+import asyncio  # noqa: E402
+import contextlib  # noqa: E402
+import os  # noqa: E402
+
+from motor.motor_asyncio import AsyncIOMotorClient  # noqa: E402
+
+from core import Parrot  # noqa: E402
+from updater import init  # noqa: E402
+from utilities.config import DATABASE_KEY, DATABASE_URI, TOKEN, VERSION  # noqa: E402
 
 bot: Parrot = Parrot()
 
@@ -24,21 +27,19 @@ else:
 
 
 async def main() -> None:
-    async with ClientSession(connector=TCPConnector(resolver=AsyncResolver(), family=socket.AF_INET)) as http_session:
-        async with bot:
-            bot.http_session = http_session
-            bot.sql = await init()
+    async with bot:
+        bot.sql = await init()
 
-            if not hasattr(bot, "__version__"):
-                bot.__version__ = VERSION
+        if not hasattr(bot, "__version__"):
+            bot.__version__ = VERSION
 
-            bot.mongo = AsyncIOMotorClient(DATABASE_URI.format(DATABASE_KEY))
+        bot.mongo = AsyncIOMotorClient(DATABASE_URI.format(DATABASE_KEY))
 
-            await bot.init_db()
+        await bot.init_db()
 
-            start_what = [bot.start(TOKEN)]
+        start_what = [bot.start(TOKEN)]
 
-            await asyncio.gather(*start_what)
+        await asyncio.gather(*start_what)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,29 @@
 # sourcery skip: dont-import-test-modules
+from .test_assets import *
+from .test_boggle import *
+from .test_channel_index import *
+from .test_chess_board import *
+from .test_connect_four import *
+from .test_defcon_planner import *
+from .test_docs_index import *
+from .test_effects import *
+from .test_emojis import *
+from .test_http_cache import *
+from .test_http_client import *
+from .test_lazy import *
+from .test_lexicon import *
+from .test_lint_service import *
+from .test_message_pipeline import *
+from .test_mod_jobs import *
+from .test_nsfw_sampler import *
+from .test_perlin import *
+from .test_snakes_board import *
+from .test_sqlite import *
+from .test_startup import *
 from .test_time import *
+from .test_tokens import *
+from .test_tutorials import *
+from .test_wait_for import *
 from .test_wikihow import *
+from .test_wordle import *
 from .test_youtube_search import *
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from unittest import TestCase
+
+from PIL import Image, ImageDraw
+
+from utilities.assets import AssetRegistry
+
+
+class TestAssetRegistry(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        for name, colour in (("red", (255, 0, 0)), ("blue", (0, 0, 255))):
+            Image.new("RGB", (16, 16), colour).save(os.path.join(self.directory.name, f"{name}.png"))
+
+    def test_shared_and_read_only(self):
+        assets = AssetRegistry(self.directory.name)
+        first = assets.image("red.png", mode="RGBA")
+        self.assertEqual(first.mode, "RGBA")
+        self.assertEqual(assets.stats.misses, 1)
+
+        second = assets.image("red.png", mode="RGBA")
+        self.assertEqual(assets.stats.hits, 1)
+        self.assertEqual(second.tobytes(), first.tobytes())
+
+        # drawing on one view leaves the cache and the other views alone
+        ImageDraw.Draw(first).rectangle((0, 0, 7, 7), fill=(0, 255, 0, 255))
+        second.putalpha(0)
+        third = assets.image("red.png", mode="RGBA")
+        self.assertEqual(first.getpixel((0, 0)), (0, 255, 0, 255))
+        self.assertEqual(second.getpixel((0, 0)), (255, 0, 0, 0))
+        self.assertEqual(third.getpixel((0, 0)), (255, 0, 0, 255))
+
+    def test_size_and_mode_are_separate_entries(self):
+        assets = AssetRegistry(self.directory.name)
+        self.assertEqual(assets.image("red.png", size=(4, 4)).size, (4, 4))
+        self.assertEqual(assets.image("red.png").size, (16, 16))
+        self.assertEqual(assets.stats.images, 2)
+
+    def test_eviction(self):
+        # room for one 16x16 RGB image and a half
+        assets = AssetRegistry(self.directory.name, max_bytes=16 * 16 * 3 * 3 // 2)
+        assets.image("red.png")
+        assets.image("blue.png")
+        stats = assets.stats
+        self.assertEqual((stats.images, stats.evictions, stats.nbytes), (1, 1, 16 * 16 * 3))
+        self.assertEqual(assets.largest(), [("blue.png", 16 * 16 * 3)])
+
+        assets.image("red.png")
+        self.assertEqual(assets.stats.misses, 3)
+
+    def test_missing(self):
+        with self.assertRaises(FileNotFoundError):
+            AssetRegistry(self.directory.name).image("green.png")
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
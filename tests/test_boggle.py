@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+from interactions.buttons.__boggle import neighbours, solve
+from utilities.lexicon import Lexicon
+
+WORDS = Lexicon(["CAT", "CATS", "ACT", "TACT", "SCAT", "QUIT", "QUITS", "DOG", "TA", "CATCAT"])
+
+
+class TestBoggle(TestCase):
+    def test_word_list(self):
+        self.assertIn("CATS", WORDS)
+        self.assertNotIn("CA", WORDS)
+        start, end = WORDS.span("CAT")
+        self.assertEqual(WORDS[start:end], ["CAT", "CATCAT", "CATS"])
+        self.assertEqual(WORDS.span("X")[0], WORDS.span("X")[1])
+
+    def test_neighbours(self):
+        adjacent = neighbours(4)
+        self.assertEqual(sorted(adjacent[0]), [1, 4, 5])
+        self.assertEqual(len(adjacent[5]), 8)
+
+    def test_solve(self):
+        # columns, the board reads
+        # C A
+        # T S
+        board = [["C", "T"], ["A", "S"]]
+        self.assertEqual(solve(board, WORDS), {"CAT": 1, "CATS": 1, "ACT": 1, "SCAT": 1})
+
+    def test_tiles_once_and_digraphs(self):
+        # "5" is the QU tile, points go by the letters of the word; TACT would need the T twice
+        board = [["5", "T"], ["I", "S"]]
+        self.assertEqual(solve(board, WORDS), {"QUIT": 1, "QUITS": 2})
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from utilities.channel_index import ChannelIndex, Feature, features_from_config
+
+CONFIG = {
+    "_id": 1,
+    "suggestion_channel": 10,
+    "hub": 11,
+    "global_chat": {"enable": True, "channel_id": 12, "webhook": "https://example.com/hook"},
+    "telephone": {"enable": False, "channel_id": 13},
+    "ticket_config": {"ticket_channel_ids": [14, 15]},
+    "starboard_config": {"channel": 16, "ignore_channel": [10, 17]},
+    "leveling": {"ignore_channel": [17]},
+}
+
+
+class TestFeaturesFromConfig(TestCase):
+    def test_features(self):
+        channels = features_from_config(CONFIG)
+
+        self.assertEqual(channels[10], Feature.SUGGESTION | Feature.STARBOARD_IGNORE)
+        self.assertEqual(channels[11], Feature.HUB)
+        self.assertEqual(channels[12], Feature.GLOBAL_CHAT)
+        self.assertEqual(channels[14], Feature.TICKET)
+        self.assertEqual(channels[17], Feature.STARBOARD_IGNORE | Feature.LEVELING_IGNORE)
+        # disabled
+        self.assertNotIn(13, channels)
+
+    def test_missing_fields(self):
+        self.assertEqual(features_from_config({"_id": 1, "suggestion_channel": None, "leveling": None}), {})
+
+
+class TestChannelIndex(IsolatedAsyncioTestCase):
+    def test_update_replaces_guild(self):
+        index = ChannelIndex()
+        index.update(1, CONFIG)
+
+        self.assertTrue(index.has(10, Feature.SUGGESTION))
+        self.assertEqual(index.global_chat_webhooks, {1: "https://example.com/hook"})
+
+        index.update(1, {"_id": 1, "suggestion_channel": 20, "global_chat": {"enable": False}})
+
+        self.assertFalse(index.has(10, Feature.SUGGESTION))
+        self.assertTrue(index.has(20, Feature.SUGGESTION))
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.global_chat_webhooks, {})
+
+    async def test_load(self):
+        async def configs():
+            yield CONFIG
+            yield {"_id": 2, "hub": 30, "global_chat": {"enable": True, "channel_id": 31, "webhook": "w"}}
+
+        index = ChannelIndex()
+        await index.load(configs())
+
+        self.assertTrue(index.loaded)
+        self.assertEqual(sorted(index.channels(Feature.GLOBAL_CHAT)), [12, 31])
+        self.assertEqual(sorted(index.channels(Feature.HUB)), [11, 30])
+        self.assertNotIn(99, index)
+
+        index.remove(1)
+        self.assertEqual(list(index.global_chat_webhooks), [2])
+        self.assertEqual(index.features(10), Feature.NONE)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
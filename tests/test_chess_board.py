@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from io import BytesIO
+from unittest import TestCase, skipUnless
+
+import chess
+from PIL import Image
+
+from interactions.buttons.__chess_board import DARK, LIGHT, SQUARE, empty_board, render, square_origin
+
+try:
+    import wand.image  # noqa: F401
+except ImportError:
+    HAS_WAND = False
+else:
+    HAS_WAND = True
+
+
+class TestChessBoard(TestCase):
+    def test_square_origin(self):
+        self.assertEqual(square_origin(chess.A1), (0, 7 * SQUARE))
+        self.assertEqual(square_origin(chess.H8), (7 * SQUARE, 0))
+        self.assertEqual(square_origin(chess.A1, white=False), (7 * SQUARE, 0))
+        self.assertEqual(square_origin(chess.E2, white=False, size=10), (30, 10))
+
+    def test_empty_board(self):
+        for white in (True, False):
+            board = empty_board(white=white)
+            # a1 is dark and h1 light, from either side; the middle of the square is clear of labels
+            x, y = square_origin(chess.A1, white=white)
+            self.assertEqual(board.getpixel((x + SQUARE // 2, y + SQUARE // 2)), DARK)
+            x, y = square_origin(chess.H1, white=white)
+            self.assertEqual(board.getpixel((x + SQUARE // 2, y + SQUARE // 2)), LIGHT)
+
+    @skipUnless(HAS_WAND, "sprites are rasterized with Wand")
+    def test_render(self):
+        board = chess.Board()
+        move = board.push_san("e4")
+        png = render(board.board_fen(), move.uci(), white=False)
+        self.assertEqual(Image.open(BytesIO(png)).size, (8 * SQUARE, 8 * SQUARE))
+        self.assertIs(render(board.board_fen(), move.uci(), white=False), png)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
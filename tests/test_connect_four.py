@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+from interactions.buttons.__connect_four import DIFFICULTIES, Bitboard, Search
+
+
+def play(board: Bitboard, *columns: int) -> Bitboard:
+    for column in columns:
+        board.play(column)
+    return board
+
+
+class TestBitboard(TestCase):
+    def test_lines(self):
+        # vertical, horizontal and both diagonals for player 1, player 2 plays elsewhere
+        self.assertTrue(play(Bitboard(7, 6), 0, 1, 0, 1, 0, 1, 0).has_won(0))
+        self.assertTrue(play(Bitboard(7, 6), 0, 0, 1, 1, 2, 2, 3).has_won(0))
+        self.assertTrue(play(Bitboard(7, 6), 0, 1, 1, 2, 2, 3, 2, 3, 3, 6, 3).has_won(0))
+        self.assertTrue(play(Bitboard(7, 6), 3, 2, 2, 1, 1, 0, 1, 0, 0, 6, 0).has_won(0))
+        # three, and four split over the top of one column and the bottom of the next
+        self.assertFalse(play(Bitboard(7, 6), 0, 1, 0, 1, 0).has_won(0))
+        board = play(Bitboard(5, 4), 0, 4, 0, 4, 0, 4, 1)
+        self.assertFalse(board.has_won(0))
+        self.assertFalse(board.has_won(1))
+
+    def test_play(self):
+        board = Bitboard(5, 5)
+        self.assertEqual(board.play(2), 4)
+        self.assertEqual(board.play(2), 3)
+        self.assertEqual(board.rows()[4], [0, 0, 1, 0, 0])
+        self.assertEqual(board.cell(3, 2), 2)
+
+        for _ in range(3):
+            board.play(2)
+        self.assertFalse(board.can_play(2))
+        self.assertNotIn(2, board.playable())
+        self.assertFalse(play(Bitboard(5, 5), *[column for column in range(5) for _ in range(5)]).can_play(0))
+
+
+class TestSearch(TestCase):
+    def test_takes_and_blocks_wins(self):
+        search = Search(7, 6, DIFFICULTIES["hard"]._replace(time_limit=0.2))
+        # player 1 has three in column 3, player 2 has to block
+        board = play(Bitboard(7, 6), 3, 0, 3, 0, 3)
+        self.assertEqual(search.best_move(board), 3)
+
+        # player 2 did not, player 1 wins
+        board.play(6)
+        self.assertEqual(search.best_move(board), 3)
+
+    def test_full_board(self):
+        board = play(Bitboard(4, 1), 0, 1, 2, 3)
+        self.assertIsNone(Search(4, 1).best_move(board))
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
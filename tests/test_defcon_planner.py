@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+from cogs.defcon.planner import (
+    CONNECT,
+    SEND_MESSAGES,
+    VIEW_CHANNEL,
+    ChannelState,
+    legacy_snapshot,
+    plan_level,
+    plan_restore,
+)
+from cogs.defcon.settings import DEFCON_SETTINGS
+
+EVERYONE = VIEW_CHANNEL | SEND_MESSAGES | CONNECT
+ATTACH_FILES = 1 << 15
+
+
+def apply(states: list[ChannelState], plan) -> list[ChannelState]:
+    """What the channels look like after Discord applied ``plan``."""
+    edits = {edit.channel_id: edit for edit in plan.edits}
+    result = []
+    for original in states:
+        edit = edits.get(original.id)
+        if edit is None:
+            result.append(original)
+            continue
+        state = original
+        if edit.delete_overwrite:
+            state = state._replace(allow=0, deny=0, has_overwrite=False)
+        elif edit.overwrite is not None:
+            allow, deny = edit.overwrite
+            state = state._replace(allow=allow, deny=deny, has_overwrite=True)
+        if edit.slowmode is not None:
+            state = state._replace(slowmode=edit.slowmode)
+        result.append(state._replace(permissions=(EVERYONE | state.allow) & ~state.deny))
+    return result
+
+
+class TestDefconPlanner(TestCase):
+    def setUp(self) -> None:
+        self.states = [
+            ChannelState(1, "text", 0, 0, False, EVERYONE, 0),
+            # already read only
+            ChannelState(2, "text", 0, SEND_MESSAGES, True, EVERYONE & ~SEND_MESSAGES, 0),
+            ChannelState(3, "text", ATTACH_FILES, 0, True, EVERYONE | ATTACH_FILES, 30),
+            ChannelState(4, "voice", 0, 0, False, EVERYONE),
+            ChannelState(5, "other", 0, 0, False, EVERYONE),
+        ]
+
+    def test_minimal_edits(self):
+        plan = plan_level(self.states, DEFCON_SETTINGS[2]["SETTINGS"])
+
+        self.assertEqual([edit.channel_id for edit in plan.edits], [1, 3, 4])
+        self.assertEqual(plan.unchanged, 2)
+        self.assertEqual(plan.counts["locked"], 3)
+        # other allowed permissions of the overwrite are kept
+        self.assertEqual(plan.edits[1].overwrite, (ATTACH_FILES, SEND_MESSAGES))
+        self.assertEqual(set(plan.snapshot), {"1", "3", "4"})
+
+        # nothing left to do once the level is applied
+        self.assertEqual(plan_level(apply(self.states, plan), DEFCON_SETTINGS[2]["SETTINGS"]).edits, [])
+
+    def test_slowmode(self):
+        plan = plan_level(self.states, DEFCON_SETTINGS[3]["SETTINGS"])
+        slowmodes = {edit.channel_id: edit.slowmode for edit in plan.edits if edit.slowmode}
+
+        # a channel with a longer slowmode is left alone
+        self.assertEqual(slowmodes, {1: 10, 2: 10})
+
+    def test_restore(self):
+        for level in DEFCON_SETTINGS:
+            plan = plan_level(self.states, DEFCON_SETTINGS[level]["SETTINGS"])
+            locked = apply(self.states, plan)
+
+            restored = apply(locked, plan_restore(locked, plan.snapshot))
+            self.assertEqual(restored, self.states, f"DEFCON {level}")
+
+    def test_restore_after_raising_level(self):
+        first = plan_level(self.states, DEFCON_SETTINGS[2]["SETTINGS"])
+        locked = apply(self.states, first)
+        second = plan_level(locked, DEFCON_SETTINGS[1]["SETTINGS"])
+        hidden = apply(locked, second)
+
+        # the first snapshot of a channel wins
+        snapshot = {**second.snapshot, **first.snapshot}
+        self.assertEqual(apply(hidden, plan_restore(hidden, snapshot)), self.states)
+
+    def test_legacy_snapshot(self):
+        locked = apply(self.states, plan_level(self.states, DEFCON_SETTINGS[2]["SETTINGS"]))
+        snapshot = legacy_snapshot(locked, hidden=[], locked=[1, 3, 4])
+        restored = {state.id: state for state in apply(locked, plan_restore(locked, snapshot))}
+
+        self.assertTrue(restored[1].permissions & SEND_MESSAGES)
+        self.assertTrue(restored[4].permissions & CONNECT)
+        self.assertEqual(restored[3].allow, ATTACH_FILES)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
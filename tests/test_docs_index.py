@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from unittest import TestCase
+
+from utilities.docs_index import DocumentationIndex, DocumentationIndexManager, DocumentationSource, parse_object_inv
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "objects.inv")
+BASE_URL = "https://docs.python.org/3"
+
+
+class TestDocumentationIndex(TestCase):
+    def setUp(self) -> None:
+        with open(FIXTURE, "rb") as f:
+            self.buffer = f.read()
+
+        self.entries = parse_object_inv(self.buffer)
+        self.index = DocumentationIndex("python", BASE_URL, self.entries)
+
+    def test_parse_object_inv(self):
+        self.assertEqual(self.entries["asyncio.gather"], "library/asyncio-task.html#asyncio.gather")
+        self.assertEqual(self.entries["asyncio"], "library/asyncio.html#module-asyncio")
+        self.assertEqual(self.entries["label:Classes"], "tutorial/classes.html#tut-classes")
+
+    def test_search(self):
+        name, url = self.index.search("asyncio.gather")[0]
+        self.assertEqual(name, "asyncio.gather")
+        self.assertEqual(url, f"{BASE_URL}/library/asyncio-task.html#asyncio.gather")
+
+        names = [name for name, _ in self.index.search("defaultdict", limit=3)]
+        self.assertEqual(names[0], "collections.defaultdict")
+
+        self.assertEqual(self.index.search("   "), [])
+        self.assertLessEqual(len(self.index.search("asyncio", limit=2)), 2)
+
+    def test_dumps_loads(self):
+        loaded = DocumentationIndex.loads("python", self.index.dumps())
+
+        self.assertEqual(loaded.base_url, BASE_URL)
+        self.assertEqual(loaded.keys, self.index.keys)
+        self.assertEqual(loaded.locations, self.index.locations)
+
+    def test_manager_load(self):
+        source = DocumentationSource("python", BASE_URL, f"{BASE_URL}/objects.inv")
+
+        with tempfile.TemporaryDirectory() as directory:
+            manager = DocumentationIndexManager([source], directory=directory)
+            self.assertIsNone(manager.search("python", "zip"))
+
+            manager._build_and_save(source, self.buffer)
+            self.assertEqual(manager.load(), 1)
+
+        self.assertIn("python", manager)
+        self.assertEqual(manager.search("python", "zip", limit=1), [("zip", f"{BASE_URL}/library/functions.html#zip")])
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import random
+from unittest import TestCase
+
+from PIL import Image
+
+from cogs.fun._effects import PfpEffects, easter_table
+
+
+class TestEffects(TestCase):
+    def test_easter_table(self):
+        table = easter_table()
+        self.assertEqual(table.shape, (64**3, 3))
+        rng = random.Random(0)
+        for _ in range(500):
+            colour = tuple(rng.randrange(0, 256, 4) for _ in range(3))
+            r, g, b = (value >> 2 for value in colour)
+            self.assertEqual(tuple(table[r << 12 | g << 6 | b].tolist()), PfpEffects.closest(colour))
+
+    def test_easterify(self):
+        image = Image.new("RGBA", (128, 128), (101, 202, 33, 200))
+        overlay = Image.new("RGBA", (8, 16), (0, 0, 0, 0))
+        result = PfpEffects.easterify_effect(image, overlay)
+        self.assertEqual(result.mode, "RGBA")
+        self.assertEqual(result.getpixel((0, 0)), (*PfpEffects.closest((100, 200, 32)), 200))
+
+    def test_mosaic(self):
+        # one colour per tile, the last pixel row and column do not fill a tile
+        image = Image.new("RGBA", (31, 31))
+        for tile in range(9):
+            row, column = divmod(tile, 3)
+            image.paste((tile, 0, 0, 255), (column * 10, row * 10, column * 10 + 10, row * 10 + 10))
+
+        random.seed(1)
+        order = list(range(9))
+        random.shuffle(order)
+
+        random.seed(1)
+        mosaic = PfpEffects.mosaic_effect(image, 9)
+        self.assertEqual(mosaic.size, (30, 30))
+        self.assertEqual([mosaic.getpixel((column * 10 + 5, row * 10 + 5))[0] for row in range(3) for column in range(3)], order)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
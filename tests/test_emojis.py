@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+import emojis
+from emojis.db import get_emoji_by_alias, get_emoji_by_code, get_emojis_by_category, get_emojis_by_tag
+from emojis.db.index import EmojiIndex, get_index
+
+MESSAGE = "gg 😀😀 nice one 👍🏽 lets go 🇮🇳 🏴󠁧󠁢󠁥󠁮󠁧󠁿 👨‍👩‍👧‍👦 #️⃣ done"
+
+
+class TestEmojis(TestCase):
+    def test_count(self):
+        self.assertEqual(emojis.count("just some text"), 0)
+        self.assertEqual(emojis.count("ünïcödé — text"), 0)
+        self.assertEqual(emojis.count(MESSAGE), 7)
+        self.assertEqual(emojis.count(MESSAGE, unique=True), 6)
+
+    def test_longest_match(self):
+        # a family is one Emoji, not four people, and a subdivision flag is not a black flag
+        found = list(emojis.iter(MESSAGE))
+        self.assertIn("👨‍👩‍👧‍👦", found)
+        self.assertIn("🏴󠁧󠁢󠁥󠁮󠁧󠁿", found)
+        self.assertNotIn("👨", found)
+        self.assertNotIn("🏴", found)
+
+    def test_encode_decode(self):
+        self.assertEqual(emojis.encode("This is a message with emojis :smile: :snake:"), "This is a message with emojis 😄 🐍")
+        self.assertEqual(emojis.encode("a:b:smile: :+1: ::snake:: :nope:"), "a🅱️smile: 👍 :🐍: :nope:")
+        self.assertEqual(
+            emojis.decode(MESSAGE),
+            "gg :grinning::grinning: nice one :thumbsup:🏽 lets go :india: :england: :family_man_woman_girl_boy: :hash: done",
+        )
+
+    def test_lookups(self):
+        self.assertEqual(get_emoji_by_code("🐍").aliases, ["snake"])
+        self.assertEqual(get_emoji_by_alias("snake").emoji, "🐍")
+        self.assertIsNone(get_emoji_by_alias("not_an_emoji"))
+        self.assertIn("😄", {emoji.emoji for emoji in get_emojis_by_tag("HAPPY")})
+        self.assertTrue(all(emoji.category == "Flags" for emoji in get_emojis_by_category("flags")))
+
+    def test_index_matches_db(self):
+        self.assertEqual(get_index().emojis, EmojiIndex.from_db().emojis)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
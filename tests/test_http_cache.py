@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+from collections import Counter
+from unittest import IsolatedAsyncioTestCase
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from utilities.http_cache import HTTPCache
+from utilities.sqlite import Database
+
+
+class TestHTTPCache(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.hits: Counter[str] = Counter()
+
+        async def max_age(request: web.Request) -> web.Response:
+            self.hits[request.path] += 1
+            return web.json_response({"hits": self.hits[request.path]}, headers={"Cache-Control": "max-age=60"})
+
+        async def etag(request: web.Request) -> web.Response:
+            self.hits[request.path] += 1
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304, headers={"ETag": '"v1"'})
+            return web.Response(text="body", headers={"Cache-Control": "no-cache", "ETag": '"v1"'})
+
+        async def no_store(request: web.Request) -> web.Response:
+            self.hits[request.path] += 1
+            return web.Response(text="secret", headers={"Cache-Control": "no-store"})
+
+        async def plain(request: web.Request) -> web.Response:
+            self.hits[request.path] += 1
+            return web.Response(text="plain")
+
+        async def slow(request: web.Request) -> web.Response:
+            self.hits[request.path] += 1
+            await asyncio.sleep(0.1)
+            return web.Response(text="slow", headers={"Cache-Control": "max-age=60"})
+
+        app = web.Application()
+        app.router.add_get("/max-age", max_age)
+        app.router.add_get("/etag", etag)
+        app.router.add_get("/no-store", no_store)
+        app.router.add_get("/plain", plain)
+        app.router.add_get("/slow", slow)
+
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.session = aiohttp.ClientSession()
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = await Database(os.path.join(self.directory.name, "cached.sqlite"), readers=1).connect()
+
+        self.cache = HTTPCache(self.session, db=self.db, host_ttl={})
+        await self.cache.setup()
+
+    async def asyncTearDown(self) -> None:
+        await self.session.close()
+        await self.server.close()
+        await self.db.close()
+        self.directory.cleanup()
+
+    def url(self, path: str) -> str:
+        return str(self.server.make_url(path))
+
+    async def test_max_age(self):
+        first = await self.cache.get(self.url("/max-age"))
+        second = await self.cache.get(self.url("/max-age"))
+
+        self.assertEqual(await first.json(), {"hits": 1})
+        self.assertEqual(await second.json(), {"hits": 1})
+        self.assertTrue(second.from_cache)
+        self.assertEqual(self.hits["/max-age"], 1)
+        self.assertEqual(self.cache.metrics["hit"], 1)
+
+        await self.cache.get(self.url("/max-age"), params={"q": "other"})
+        self.assertEqual(self.hits["/max-age"], 2)
+
+    async def test_etag_revalidation(self):
+        first = await self.cache.get(self.url("/etag"))
+        second = await self.cache.get(self.url("/etag"))
+
+        self.assertEqual(await second.text(), "body")
+        self.assertEqual(second.status, 200)
+        self.assertEqual(self.hits["/etag"], 2)
+        self.assertEqual(self.cache.metrics["revalidated"], 1)
+        self.assertEqual(first.etag, second.etag)
+
+    async def test_not_stored(self):
+        await self.cache.get(self.url("/no-store"))
+        await self.cache.get(self.url("/no-store"))
+        await self.cache.get(self.url("/plain"))
+        await self.cache.get(self.url("/plain"))
+
+        self.assertEqual(self.hits["/no-store"], 2)
+        self.assertEqual(self.hits["/plain"], 2)
+        self.assertEqual(self.cache.metrics["store"], 0)
+
+    async def test_ttl_overrides(self):
+        await self.cache.get(self.url("/plain"), ttl=60)
+        await self.cache.get(self.url("/plain"), ttl=60)
+        self.assertEqual(self.hits["/plain"], 1)
+
+        self.cache.host_ttl[self.server.host] = 60
+        await self.cache.get(self.url("/plain?a=1"))
+        await self.cache.get(self.url("/plain?a=1"))
+        self.assertEqual(self.hits["/plain"], 2)
+
+    async def test_coalescing(self):
+        responses = await asyncio.gather(*(self.cache.get(self.url("/slow")) for _ in range(5)))
+
+        self.assertEqual(self.hits["/slow"], 1)
+        self.assertEqual(self.cache.metrics["coalesced"], 4)
+        self.assertTrue(all(r.body == b"slow" for r in responses))
+
+    async def test_sqlite_tier(self):
+        await self.cache.get(self.url("/max-age"))
+
+        # a fresh cache on the same database, e.g. after a restart
+        cache = HTTPCache(self.session, db=self.db, host_ttl={})
+        response = await cache.get(self.url("/max-age"))
+
+        self.assertEqual(await response.json(), {"hits": 1})
+        self.assertEqual(self.hits["/max-age"], 1)
+        self.assertEqual(cache.metrics["db_hit"], 1)
+
+    async def test_raise_for_status(self):
+        with self.assertRaises(aiohttp.ClientResponseError):
+            await self.cache.get(self.url("/missing"), raise_for_status=True)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from unittest import IsolatedAsyncioTestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from utilities.http_client import HostPolicy, HTTPClient, TokenBucket
+
+
+class TestHTTPClient(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.hits: Counter[str] = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        async def limited(request: web.Request) -> web.Response:
+            self.hits[request.path] += 1
+            if self.hits[request.path] == 1:
+                return web.Response(status=429, headers={"Retry-After": "0.1"})
+            return web.Response(text="ok")
+
+        async def slow(request: web.Request) -> web.Response:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.05)
+            self.in_flight -= 1
+            return web.Response(text="slow")
+
+        app = web.Application()
+        app.router.add_get("/limited", limited)
+        app.router.add_get("/slow", slow)
+
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+        policy = HostPolicy(concurrency=2, rate=1000, burst=1000)
+        self.client = HTTPClient(policies={self.server.host: policy})
+
+    async def asyncTearDown(self) -> None:
+        await self.client.close()
+        await self.server.close()
+
+    def url(self, path: str) -> str:
+        return str(self.server.make_url(path))
+
+    async def test_retry_after(self):
+        async with self.client.get(self.url("/limited")) as resp:
+            self.assertEqual(resp.status, 200)
+            self.assertEqual(await resp.text(), "ok")
+
+        metrics = self.client.metrics()[self.server.host]
+        self.assertEqual(self.hits["/limited"], 2)
+        self.assertEqual(metrics["requests"], 2)
+        self.assertEqual(metrics["rate_limited"], 1)
+        self.assertEqual(metrics["statuses"], {429: 1, 200: 1})
+
+    async def test_concurrency_cap(self):
+        async def fetch() -> str:
+            async with self.client.get(self.url("/slow")) as resp:
+                return await resp.text()
+
+        results = await asyncio.gather(*(fetch() for _ in range(6)))
+
+        self.assertEqual(results, ["slow"] * 6)
+        self.assertLessEqual(self.max_in_flight, 2)
+        self.assertEqual(self.client.metrics()[self.server.host]["in_flight"], 0)
+
+    async def test_session_recreated(self):
+        session = self.client.session
+        await session.close()
+        self.assertIsNot(self.client.session, session)
+        self.assertFalse(self.client.session.closed)
+
+    async def test_token_bucket(self):
+        bucket = TokenBucket(rate=20, capacity=2)
+
+        start = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+
+        # two from the burst, then two more at 20/s
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
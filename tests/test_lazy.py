@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from unittest import TestCase
+
+from utilities.lazy import ImportProfiler, is_loaded, lazy_import, profiler
+
+# the modules below import these lazily, nothing should load them while the bot starts
+HEAVY = ("matplotlib", "sympy", "pandas", "cv2", "numpy", "wand")
+
+BASELINE = """
+import json, sys
+import psutil
+import core, cogs.mis.mis, interactions.buttons.__minecraft, utilities.imaging.graphing, utilities.imaging.image, utilities.ttg
+print(json.dumps({"rss": psutil.Process().memory_info().rss, "modules": [name for name in %r if name in sys.modules]}))
+"""
+
+# eagerly importing the heavy modules took it to ~220MB, ~85MB without them
+MAX_RSS = 150 * 2**20
+
+
+class TestLazy(TestCase):
+    def test_lazy_import(self):
+        sys.modules.pop("colorsys", None)
+        colorsys = lazy_import("colorsys")
+
+        self.assertNotIn("colorsys", sys.modules)
+        self.assertIs(is_loaded("colorsys"), False)
+        self.assertEqual(colorsys.rgb_to_hsv(1, 0, 0), (0, 1, 1))
+        self.assertIn("colorsys", sys.modules)
+        self.assertIs(is_loaded("colorsys"), True)
+        self.assertTrue(profiler.records["colorsys"].lazy)
+        self.assertIsNone(is_loaded("not a lazy module"))
+
+    def test_profiler(self):
+        sys.modules.pop("colorsys", None)
+        sys.modules.pop("wave", None)
+        import_profiler = ImportProfiler()
+        import_profiler.install()
+        try:
+            import colorsys  # noqa: F401
+            import wave  # noqa: F401
+        finally:
+            import_profiler.uninstall()
+
+        self.assertFalse(import_profiler.installed)
+        self.assertIn("colorsys", import_profiler.records)
+        record = import_profiler.records["wave"]
+        self.assertLessEqual(record.own, record.total)
+        self.assertIn("wave", [name for name, _ in import_profiler.by_package()])
+
+    def test_baseline(self):
+        process = subprocess.run(
+            [sys.executable, "-c", BASELINE % (HEAVY,)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        result = json.loads(process.stdout.splitlines()[-1])
+
+        self.assertEqual(result["modules"], [])
+        self.assertLess(result["rss"], MAX_RSS)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import os
+import random
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from utilities import lexicon as lexicon_module
+from utilities.lexicon import Lexicon, Source, compile_words, lexicon
+
+WORDS = ["apple", "apply", "ape", "banana", "band", "bandana", "cat", "naïve", "apple"]
+
+
+class TestLexicon(TestCase):
+    def setUp(self):
+        self.words = Lexicon(WORDS)
+
+    def test_sorted_and_deduplicated(self):
+        self.assertEqual(list(self.words), sorted(set(WORDS)))
+        self.assertEqual(self.words[-1], "naïve")
+        self.assertEqual(self.words[1:3], ["apple", "apply"])
+        self.assertRaises(IndexError, self.words.__getitem__, len(self.words))
+
+    def test_membership(self):
+        for word in WORDS:
+            self.assertIn(word, self.words)
+            self.assertEqual(self.words[self.words.index(word)], word)
+        for word in ("", "ap", "applez", "naive", "dog"):
+            self.assertNotIn(word, self.words)
+        self.assertNotIn(1, self.words)
+        self.assertEqual(self.words.find("dog"), -1)
+
+    def test_prefix(self):
+        self.assertEqual(list(self.words.with_prefix("ban")), ["banana", "band", "bandana"])
+        self.assertEqual(list(self.words.with_prefix("appl")), ["apple", "apply"])
+        start, end = self.words.span("x")
+        self.assertEqual(start, end)
+
+    def test_views(self):
+        view = self.words.view(min_length=4, max_length=5)
+        self.assertEqual(sorted(view), ["apple", "apply", "band", "naïve"])
+        self.assertIn("band", view)
+        self.assertNotIn("cat", view)
+        self.assertNotIn("bandana", view)
+
+        doubled = self.words.view(predicate=lambda word: len(set(word)) < len(word))
+        self.assertEqual(sorted(doubled), ["apple", "apply", "banana", "bandana"])
+        self.assertNotIn("cat", doubled)
+        self.assertIn(random.choice(doubled), doubled)
+
+        self.assertEqual(len(self.words.view(min_length=10)), 0)
+        self.assertIn(self.words.random(min_length=6), {"banana", "bandana"})
+        self.assertRaises(IndexError, self.words.random, min_length=10)
+
+    def test_compiled_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "words.lex")
+            with open(path, "wb") as f:
+                f.write(compile_words(WORDS, stamp="test 1"))
+            words = Lexicon.open(path)
+            self.assertEqual(words.stamp, "test 1")
+            self.assertEqual(list(words), list(self.words))
+            self.assertIn("naïve", words)
+        self.assertRaises(ValueError, Lexicon.from_buffer, b"not a lexicon")
+
+    def test_service(self):
+        loads = []
+
+        def load():
+            loads.append(1)
+            return WORDS
+
+        sources = {"test": Source(load, lambda: "v1")}
+        with (
+            tempfile.TemporaryDirectory() as directory,
+            patch.multiple(
+                lexicon_module,
+                SOURCES=sources,
+                LEXICON_DIRECTORY=directory,
+                _lexicons={},
+            ),
+        ):
+            self.assertIs(lexicon("test"), lexicon("test"))
+            self.assertEqual(len(loads), 1)
+
+            # a new process memory-maps the compiled file
+            lexicon_module._lexicons.clear()
+            self.assertIn("band", lexicon("test"))
+            self.assertEqual(len(loads), 1)
+
+            # until the source changes
+            lexicon_module._lexicons.clear()
+            sources["test"] = Source(load, lambda: "v2")
+            self.assertEqual(lexicon("test").stamp, "v2")
+            self.assertEqual(len(loads), 2)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
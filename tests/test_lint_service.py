@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from cogs.rtfm._lint_service import LintService
+
+# answers with its pid and job count, sleeps or dies when the source says so
+FAKE_WORKER = """
+import json, os, sys, time
+
+jobs = 0
+for line in sys.stdin:
+    job = json.loads(line)
+    if job["source"] == "exit":
+        sys.exit(1)
+    if job["source"] == "sleep":
+        time.sleep(60)
+    jobs += 1
+    print(json.dumps({"returncode": 0, "stdout": f"{os.getpid()} {jobs}", "stderr": ""}), flush=True)
+"""
+
+
+class TestLintService(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        script = os.path.join(self.directory.name, "worker.py")
+        with open(script, "w", encoding="utf-8") as f:
+            f.write(FAKE_WORKER)
+
+        patcher = patch("cogs.rtfm._lint_service.WORKER_SCRIPT", script)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.directory.cleanup)
+        self.service = LintService(workers_per_tool=1, timeout=2)
+
+    async def asyncTearDown(self) -> None:
+        await self.service.close()
+
+    async def test_cache(self):
+        first = await self.service.run("flake8 --format=json", "import os\n")
+        second = await self.service.run(["flake8", "--format=json"], "import os\n")
+        self.assertIs(second, first)
+        self.assertEqual((self.service.hits, self.service.misses), (1, 1))
+
+        other = await self.service.run("flake8", "import sys\n")
+        self.assertTrue(other["stdout"].endswith(" 2"))
+
+    async def test_concurrent_requests_share_a_run(self):
+        first, second = await asyncio.gather(
+            self.service.run("flake8", "import os\n"),
+            self.service.run("flake8", "import os\n"),
+        )
+        self.assertEqual(first, second)
+        self.assertTrue(first["stdout"].endswith(" 1"))
+        self.assertEqual((self.service.hits, self.service.misses), (1, 1))
+
+    async def test_timeout_restarts_worker(self):
+        self.service.timeout = 0.5
+        before = await self.service.run("flake8", "warm up")
+        (worker,) = self.service._workers
+        process = worker.process
+
+        with self.assertLogs("cogs.rtfm.lint_service", "WARNING"):
+            result = await self.service.run("flake8", "sleep")
+        self.assertEqual(result["returncode"], -9)
+        # the killed worker is reaped, not left behind
+        await asyncio.wait_for(process.wait(), timeout=2)
+        self.assertIsNotNone(process.returncode)
+
+        after = await self.service.run("flake8", "import os\n")
+        self.assertEqual(after["returncode"], 0)
+        self.assertNotEqual(after["stdout"].split()[0], before["stdout"].split()[0])
+        # timeouts are not cached
+        self.assertIsNone(self.service._cache.get(LintService.job_key(["flake8"], "sleep")))
+
+    async def test_dead_worker(self):
+        with self.assertLogs("cogs.rtfm.lint_service", "WARNING"):
+            result = await self.service.run("flake8", "exit")
+        self.assertEqual(result["returncode"], -1)
+
+        result = await self.service.run("flake8", "import os\n")
+        self.assertEqual(result["returncode"], 0)
+        self.assertTrue(result["stdout"].endswith(" 1"))
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
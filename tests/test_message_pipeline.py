@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest import IsolatedAsyncioTestCase
+
+from utilities.channel_index import ChannelIndex, Feature
+from utilities.message_pipeline import MessageContext, MessagePipeline
+
+
+class FakeBot:
+    def __init__(self) -> None:
+        self.user = SimpleNamespace(id=1)
+        self.channel_index = ChannelIndex()
+
+    def is_ready(self) -> bool:
+        return True
+
+    async def wait_until_ready(self) -> None:
+        pass
+
+
+def make_message(*, message_id: int = 100, author_id: int = 2, bot: bool = False, guild: bool = True, content: str = "hi"):
+    async def delete(*, delay: float | None = None) -> None:
+        pass
+
+    return SimpleNamespace(
+        id=message_id,
+        guild=SimpleNamespace(id=10) if guild else None,
+        channel=SimpleNamespace(id=20),
+        author=SimpleNamespace(id=author_id, bot=bot, _roles=[5, 6]),
+        webhook_id=None,
+        content=content,
+        delete=delete,
+    )
+
+
+class TestMessagePipeline(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.bot = FakeBot()
+        self.pipeline = MessagePipeline(self.bot)
+        self.calls: list[str] = []
+
+    def stage(self, name: str, *, delete: bool = False, sleep: float = 0):
+        async def callback(ctx: MessageContext) -> None:
+            self.calls.append(name)
+            if sleep:
+                await asyncio.sleep(sleep)
+            if delete:
+                await ctx.delete()
+
+        return callback
+
+    async def test_order_and_filters(self):
+        self.pipeline.register("late", self.stage("late"), order=50)
+        self.pipeline.register("early", self.stage("early"), order=0, bots=True)
+        self.pipeline.register("dm", self.stage("dm"), order=10, dms=True)
+
+        await self.pipeline.run(make_message())
+        self.assertEqual(self.calls, ["early", "dm", "late"])
+
+        self.calls.clear()
+        await self.pipeline.run(make_message(bot=True))
+        self.assertEqual(self.calls, ["early"])
+
+        self.calls.clear()
+        await self.pipeline.run(make_message(guild=False))
+        self.assertEqual(self.calls, ["dm"])
+
+        self.calls.clear()
+        await self.pipeline.run(make_message(author_id=1))
+        self.assertEqual(self.calls, [])
+
+    async def test_self_messages(self):
+        self.pipeline.register("cache", self.stage("cache"), order=0, bots=True, self_messages=True)
+        self.pipeline.register("automod", self.stage("automod"), order=10, bots=True)
+
+        await self.pipeline.run(make_message(author_id=1, bot=True))
+        self.assertEqual(self.calls, ["cache"])
+
+    async def test_delete_skips_later_stages(self):
+        self.pipeline.register("automod", self.stage("automod", delete=True), order=10)
+        self.pipeline.register("autoresponder", self.stage("autoresponder"), order=50)
+
+        ctx = await self.pipeline.run(make_message())
+
+        self.assertTrue(ctx.deleted)
+        self.assertEqual(self.calls, ["automod"])
+        self.assertEqual(self.pipeline.stats["autoresponder"].skipped, 1)
+
+    async def test_budget_and_errors(self):
+        async def broken(ctx: MessageContext) -> None:
+            raise RuntimeError
+
+        self.pipeline.register("slow", self.stage("slow", sleep=0.02), order=0, budget=0.01)
+        self.pipeline.register("broken", broken, order=10)
+        self.pipeline.register("after", self.stage("after"), order=20)
+
+        with self.assertLogs("utilities.message_pipeline", level="WARNING"):
+            ctx = await self.pipeline.run(make_message())
+
+        self.assertEqual(self.calls, ["slow", "after"])
+        self.assertGreaterEqual(ctx.timings["slow"], 0.02)
+        self.assertEqual(self.pipeline.stats["slow"].over_budget, 1)
+        self.assertEqual(self.pipeline.stats["broken"].errors, 1)
+
+    async def test_background_and_context(self):
+        self.bot.channel_index.update(10, {"suggestion_channel": 20})
+        seen: list[MessageContext] = []
+
+        async def inspect(ctx: MessageContext) -> None:
+            seen.append(ctx)
+
+        self.pipeline.register("slow", self.stage("slow", sleep=0.05), order=0, background=True, budget=1)
+        self.pipeline.register("inspect", inspect, order=10)
+
+        await self.pipeline.run(make_message(content="See https://example.com, Thanks"))
+        # the background stage did not hold up the next one
+        self.assertEqual(self.calls, [])
+        self.assertEqual(len(seen), 1)
+        await asyncio.sleep(0)
+        self.assertEqual(self.calls, ["slow"])
+
+        ctx = seen[0]
+        self.assertEqual(ctx.links, ("https://example.com",))
+        self.assertEqual(ctx.words, ("see", "https://example.com", "thanks"))
+        self.assertEqual(ctx.role_ids, frozenset({5, 6}))
+        self.assertTrue(ctx.features & Feature.SUGGESTION)
+
+        await self.pipeline.close()
+        self.assertEqual(self.pipeline.stats["slow"].calls, 1)
+
+    async def test_unregister(self):
+        self.pipeline.register("stage", self.stage("stage"), order=0)
+        self.pipeline.unregister("stage")
+
+        await self.pipeline.run(make_message())
+        self.assertEqual(self.calls, [])
+        self.assertEqual(self.pipeline.stages, [])
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
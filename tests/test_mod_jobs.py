@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+from types import SimpleNamespace
+from unittest import IsolatedAsyncioTestCase
+
+import discord
+
+from cogs.mod.jobs import CANCELLED, DONE, JobEngine, ModJob
+from utilities.sqlite import Database
+
+GUILD_ID = 1
+
+
+class FakeHTTP:
+    """Stands in for discord.http.HTTPClient, with a per-route limit on requests in flight."""
+
+    def __init__(self, *, limit: int = 4, delay: float = 0.001, missing: set[int] | None = None) -> None:
+        self.limit = limit
+        self.delay = delay
+        self.missing = missing or set()
+        self.calls: list[tuple[str, tuple]] = []
+        self.in_flight = 0
+        self.peak = 0
+        self.rate_limited = 0
+
+    async def _request(self, route: str, *args: object, target: int | None = None) -> None:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            if self.in_flight > self.limit:
+                self.rate_limited += 1
+                raise discord.RateLimited(0.01)
+            await asyncio.sleep(self.delay)
+            if target in self.missing:
+                raise discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown Member")
+            self.calls.append((route, args))
+        finally:
+            self.in_flight -= 1
+
+    async def bulk_ban(self, guild_id, user_ids, delete_message_seconds, reason=None):
+        await self._request("bulk_ban", guild_id, tuple(user_ids))
+        return {
+            "banned_users": [str(user) for user in user_ids if user not in self.missing],
+            "failed_users": [str(user) for user in user_ids if user in self.missing],
+        }
+
+    async def ban(self, user_id, guild_id, delete_message_seconds=86400, reason=None):
+        await self._request("ban", user_id, target=user_id)
+
+    async def kick(self, user_id, guild_id, reason=None):
+        await self._request("kick", user_id, target=user_id)
+
+    async def add_role(self, guild_id, user_id, role_id, *, reason=None):
+        await self._request("add_role", user_id, role_id, target=user_id)
+
+    async def edit_channel_permissions(self, channel_id, target, allow, deny, kind, *, reason=None):
+        await self._request("edit_channel_permissions", target, allow, deny, target=target)
+
+    async def delete_channel_permissions(self, channel_id, target, *, reason=None):
+        await self._request("delete_channel_permissions", target, target=target)
+
+
+class TestJobEngine(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = await Database(os.path.join(self.directory.name, "test.sqlite"), readers=1).connect()
+        self.reports: list[str] = []
+
+    async def asyncTearDown(self) -> None:
+        await self.db.close()
+        self.directory.cleanup()
+
+    async def engine(self, http: FakeHTTP) -> JobEngine:
+        async def report(job: ModJob) -> None:
+            self.reports.append(job.status)
+
+        engine = JobEngine(self.db, http, report=report, report_interval=0)  # type: ignore
+        await engine.setup()
+        return engine
+
+    async def submit(self, engine: JobEngine, action: str, targets: list[int], **options) -> ModJob:
+        return await engine.submit(action, targets, guild_id=GUILD_ID, channel_id=2, author_id=3, message_id=4, **options)
+
+    async def test_bulk_ban(self):
+        http = FakeHTTP(missing={7})
+        engine = await self.engine(http)
+
+        job = await self.submit(engine, "bulk_ban", list(range(450)), reason="raid")
+        await engine.wait(job.id)
+
+        self.assertEqual(job.status, DONE)
+        self.assertEqual(len(http.calls), 3)
+        self.assertEqual(set(job.failed), {7})
+        self.assertEqual(self.reports[-1], DONE)
+        self.assertEqual(await self.db.fetchval("SELECT status FROM mod_jobs WHERE id = ?", (job.id,)), DONE)
+        # only the table keeps finished jobs
+        self.assertIsNone(engine.get(job.id))
+        self.assertEqual(engine.jobs(), [])
+
+    async def test_ban(self):
+        # without Manage Server bans go one user per request
+        http = FakeHTTP(missing={7})
+        engine = await self.engine(http)
+
+        job = await self.submit(engine, "ban", list(range(20)), reason="raid")
+        await engine.wait(job.id)
+
+        self.assertEqual(job.status, DONE)
+        self.assertEqual({route for route, _ in http.calls}, {"ban"})
+        self.assertEqual(len(http.calls), 19)
+        self.assertEqual(list(job.failed), [7])
+
+    async def test_concurrency_and_rate_limits(self):
+        http = FakeHTTP(limit=2, missing={5})
+        engine = await self.engine(http)
+
+        job = await self.submit(engine, "kick", list(range(40)))
+        await engine.wait(job.id)
+
+        # four workers against a route that allows two, the rest are retried after the rate limit
+        self.assertGreater(http.rate_limited, 0)
+        self.assertEqual(job.status, DONE)
+        self.assertEqual(len(http.calls), 39)
+        self.assertEqual(list(job.failed), [5])
+        self.assertIn("Unknown Member", job.failed[5])
+
+    async def test_block_keeps_other_overwrites(self):
+        http = FakeHTTP()
+        engine = await self.engine(http)
+
+        read_history = discord.Permissions(read_message_history=True).value
+        overwrites = {"10": (read_history, 0)}
+        job = await self.submit(engine, "unblock", [10, 11], target_channel_id=20, overwrites=overwrites)
+        await engine.wait(job.id)
+
+        self.assertIn(("edit_channel_permissions", (10, str(read_history), "0")), http.calls)
+        self.assertIn(("delete_channel_permissions", (11,)), http.calls)
+
+    async def test_cancel(self):
+        http = FakeHTTP(delay=0.01)
+        engine = await self.engine(http)
+
+        job = await self.submit(engine, "add_role", list(range(200)), role_id=99)
+        await asyncio.sleep(0.05)
+        await engine.cancel(job.id)
+
+        self.assertEqual(job.status, CANCELLED)
+        self.assertLess(len(job.done), 200)
+        self.assertEqual(self.reports[-1], CANCELLED)
+        self.assertEqual(await self.db.fetchval("SELECT status FROM mod_jobs WHERE id = ?", (job.id,)), CANCELLED)
+
+    async def test_resume(self):
+        http = FakeHTTP(delay=0.01)
+        engine = await self.engine(http)
+        job = await self.submit(engine, "kick", list(range(100)))
+        await asyncio.sleep(0.05)
+
+        # the bot stops mid job
+        await engine.close()
+        self.assertLess(len(job.done), 100)
+
+        engine = await self.engine(http)
+        (resumed,) = await engine.resume()
+        await engine.wait(resumed.id)
+
+        self.assertEqual(resumed.status, DONE)
+        self.assertEqual(len(resumed.done), 100)
+        self.assertEqual({args[0] for _, args in http.calls}, set(range(100)))
+        self.assertLessEqual(len(http.calls), 100 + 4)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
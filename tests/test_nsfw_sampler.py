@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+from unittest import IsolatedAsyncioTestCase
+
+from utilities.nsfw.sampler import LinkPrefetcher, LinkSampler
+from utilities.sqlite import Database
+
+
+class TestLinkSampler(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = await Database(os.path.join(self.directory.name, "test.sqlite"), readers=1).connect()
+        await self.db.executescript(
+            """
+            CREATE TABLE nsfw_links (id INTEGER PRIMARY KEY AUTOINCREMENT, link TEXT NOT NULL, UNIQUE(link));
+            CREATE TABLE nsfw_links_grouped (id INTEGER PRIMARY KEY AUTOINCREMENT, link TEXT NOT NULL UNIQUE, type TEXT);
+            """,
+        )
+        await self.insert("nsfw_links", [(f"https://example.com/{i}.gif",) for i in range(100)])
+
+    async def asyncTearDown(self) -> None:
+        await self.db.close()
+        self.directory.cleanup()
+
+    async def insert(self, table: str, rows: list[tuple]) -> None:
+        columns = "(link)" if len(rows[0]) == 1 else "(link, type)"
+        values = "(?)" if len(rows[0]) == 1 else "(?, ?)"
+        async with self.db.transaction() as conn:
+            await conn.executemany(f"INSERT INTO {table} {columns} VALUES {values} ON CONFLICT DO NOTHING", rows)
+
+    async def test_refresh(self):
+        sampler = LinkSampler(self.db, "nsfw_links")
+        self.assertEqual(await sampler.refresh(), 100)
+        self.assertEqual(await sampler.refresh(), 0)
+
+        await self.insert("nsfw_links", [("https://example.com/0.gif",), ("https://example.com/new.gif",)])
+        self.assertEqual(await sampler.refresh(), 1)
+        self.assertEqual(len(sampler), 101)
+
+        link = await sampler.sample()
+        self.assertTrue(link.startswith("https://example.com/"))
+
+    async def test_concurrent_refresh(self):
+        sampler = LinkSampler(self.db, "nsfw_links")
+        self.assertEqual(sorted(await asyncio.gather(sampler.refresh(), sampler.refresh())), [0, 100])
+        self.assertEqual(len(sampler), 100)
+
+        await self.insert("nsfw_links", [(f"https://example.com/new/{i}.gif",) for i in range(10)])
+        await asyncio.gather(*(sampler.refresh() for _ in range(4)))
+        self.assertEqual(sampler.count(), 110)
+
+    async def test_groups(self):
+        await self.insert("nsfw_links_grouped", [(f"a{i}", "Amateur") for i in range(5)] + [("b", "blonde")])
+        sampler = LinkSampler(self.db, "nsfw_links_grouped", group_by="type")
+        await sampler.refresh()
+
+        self.assertEqual(sampler.groups(), ["amateur", "blonde"])
+        self.assertEqual(sampler.count("amateur"), 5)
+        self.assertEqual(await sampler.sample("blonde"), "b")
+        self.assertIsNone(await sampler.sample("missing"))
+
+    async def test_no_repeat_window(self):
+        sampler = LinkSampler(self.db, "nsfw_links", window=50, attempts=64)
+        await sampler.refresh()
+
+        picks = [sampler.pick(channel_id=1) for _ in range(50)]
+        self.assertEqual(len(set(picks)), 50)
+
+        # other channels have their own window
+        self.assertFalse(sampler.recently_sent(2, picks[0]))
+
+    async def test_prefetch(self):
+        fetched: list[str] = []
+
+        async def fetch(link: str) -> bytes:
+            fetched.append(link)
+            return link.encode()
+
+        sampler = LinkSampler(self.db, "nsfw_links")
+        await sampler.refresh()
+        prefetcher = LinkPrefetcher(sampler, fetch, size=3)
+
+        prefetcher.fill()
+        await prefetcher.wait()
+        self.assertEqual(len(prefetcher), 3)
+
+        link, data = await prefetcher.get(channel_id=1)
+        self.assertEqual(data, link.encode())
+        self.assertEqual(prefetcher.metrics["hit"], 1)
+
+        await prefetcher.wait()
+        self.assertEqual(len(prefetcher), 3)
+        self.assertEqual(len(fetched), 4)
+        prefetcher.close()
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+import numpy as np
+from PIL import Image
+
+from interactions.buttons.snakes._utils import PerlinNoiseFactory, create_snek_frame
+
+
+class TestPerlinNoise(TestCase):
+    def test_points_and_arrays(self):
+        noise = PerlinNoiseFactory(2, octaves=3, seed=1)
+        points = np.random.default_rng(0).uniform(-10, 10, (50, 2))
+        values = noise(points)
+
+        self.assertEqual(values.shape, (50,))
+        self.assertAlmostEqual(noise(*points[7]), values[7])
+        np.testing.assert_allclose(noise(points[:, 0], points[:, 1]), values)
+        self.assertTrue(np.all(np.abs(values) <= 1))
+        self.assertRaises(ValueError, noise, 1.0, 2.0, 3.0)
+
+    def test_plain_noise(self):
+        noise = PerlinNoiseFactory(3, seed=2)
+        # zero on the lattice, continuous between
+        self.assertAlmostEqual(noise.get_plain_noise(3, -4, 5), 0)
+        self.assertAlmostEqual(noise.get_plain_noise(0.5, 0.5, 0.5), noise.get_plain_noise(0.5, 0.5, 0.5 + 1e-9), places=6)
+        self.assertNotEqual(noise.get_plain_noise(0.5, 0.5, 0.5), 0)
+
+    def test_tile(self):
+        noise = PerlinNoiseFactory(2, octaves=2, tile=(0, 3), seed=3)
+        xs = np.linspace(0, 5, 40)
+        np.testing.assert_allclose(noise(xs, 1.25), noise(xs, 4.25))
+        self.assertFalse(np.allclose(noise(xs, 1.25), noise(xs + 3, 1.25)))
+
+    def test_unbias(self):
+        points = np.linspace(0, 100, 5000)[:, None]
+        plain = PerlinNoiseFactory(1, octaves=2, seed=4)(points)
+        unbiased = PerlinNoiseFactory(1, octaves=2, unbias=True, seed=4)(points)
+        self.assertGreater(np.std(unbiased), np.std(plain))
+
+    def test_snek_frame(self):
+        frame = create_snek_frame(PerlinNoiseFactory(1, octaves=2, seed=5), image_dimensions=(160, 120), text=None)
+        self.assertIsInstance(frame, Image.Image)
+        self.assertEqual(frame.size, (160, 120))
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import io
+from unittest import TestCase
+
+from PIL import Image
+
+from interactions.buttons.snakes._utils import BOARD_PLAYER_SIZE, SnakesAndLaddersBoard, base_board
+
+
+def avatar(colour: tuple[int, int, int]) -> bytes:
+    stream = io.BytesIO()
+    Image.new("RGB", (32, 32), colour).save(stream, "png")
+    return stream.getvalue()
+
+
+class TestSnakesAndLaddersBoard(TestCase):
+    def setUp(self):
+        self.board = SnakesAndLaddersBoard()
+        self.board.add_avatar(1, avatar((255, 0, 0)))
+        self.board.add_avatar(2, avatar((0, 0, 255)))
+
+    def pixel(self, origin: tuple[int, int]) -> tuple[int, int, int]:
+        return self.board.image.getpixel((origin[0] + BOARD_PLAYER_SIZE // 2, origin[1] + BOARD_PLAYER_SIZE // 2))
+
+    def test_only_moved_avatars_are_drawn(self):
+        self.assertEqual(self.board.update({1: 1, 2: 1}), 2)
+        self.assertEqual(self.board.update({1: 1, 2: 1}), 0)
+        self.assertEqual(self.board.update({1: 5, 2: 1}), 1)
+
+        self.assertEqual(self.pixel(SnakesAndLaddersBoard.avatar_origin(5, 0)), (255, 0, 0))
+        self.assertEqual(self.pixel(SnakesAndLaddersBoard.avatar_origin(1, 1)), (0, 0, 255))
+        # the square player 1 left is the empty board again
+        origin = SnakesAndLaddersBoard.avatar_origin(1, 0)
+        self.assertEqual(self.pixel(origin), base_board().getpixel((origin[0] + 10, origin[1] + 10)))
+
+    def test_leaving_player(self):
+        self.board.update({1: 1, 2: 1})
+        self.board.remove_avatar(1)
+        # player 2 takes the first slot of the tile, the second one is cleared
+        self.assertEqual(self.board.update({2: 1}), 1)
+        self.assertEqual(self.pixel(SnakesAndLaddersBoard.avatar_origin(1, 0)), (0, 0, 255))
+        origin = SnakesAndLaddersBoard.avatar_origin(1, 1)
+        self.assertEqual(self.pixel(origin), base_board().getpixel((origin[0] + 10, origin[1] + 10)))
+
+    def test_render(self):
+        with Image.open(self.board.render({1: 100, 2: 42})) as image:
+            self.assertEqual(image.format, "JPEG")
+            self.assertEqual(image.size, base_board().size)
+
+    def test_coordinates(self):
+        self.assertEqual(SnakesAndLaddersBoard.coordinate_from_index(1), (0, 9))
+        self.assertEqual(SnakesAndLaddersBoard.coordinate_from_index(11), (9, 8))
+        self.assertEqual(SnakesAndLaddersBoard.coordinate_from_index(100), (0, 0))
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import os
+import sqlite3
+import tempfile
+from unittest import IsolatedAsyncioTestCase
+
+from utilities.sqlite import Database
+
+
+class TestDatabase(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = await Database(os.path.join(self.directory.name, "test.sqlite"), readers=2).connect()
+        await self.db.executescript(
+            """
+            CREATE TABLE links (id INTEGER PRIMARY KEY, link TEXT UNIQUE);
+            CREATE TABLE logs (id INTEGER PRIMARY KEY, message TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+            """,
+        )
+        await self.db.commit()
+
+    async def asyncTearDown(self) -> None:
+        await self.db.close()
+        self.directory.cleanup()
+
+    async def test_wal(self):
+        self.assertEqual(await self.db.fetchval("PRAGMA journal_mode"), "wal")
+
+    async def test_read_write_split(self):
+        await self.db.executemany("INSERT INTO links (link) VALUES (?)", [(f"link{i}",) for i in range(100)])
+
+        # not committed yet, readers only see committed data
+        self.assertEqual(await self.db.fetchval("SELECT COUNT(*) FROM links"), 0)
+        await self.db.commit()
+        self.assertEqual(await self.db.fetchval("SELECT COUNT(*) FROM links"), 100)
+
+        with self.assertRaises(sqlite3.OperationalError):
+            await self.db.fetchall("INSERT INTO links (link) VALUES ('nope')")
+
+    async def test_reads_during_write_transaction(self):
+        await self.db.execute("INSERT INTO links (link) VALUES ('scam.example')")
+        await self.db.commit()
+
+        async with self.db.transaction() as conn:
+            await conn.executemany("INSERT INTO links (link) VALUES (?)", [(f"bulk{i}",) for i in range(1000)])
+            row = await asyncio.wait_for(self.db.fetchone("SELECT 1 FROM links WHERE link = ?", ("scam.example",)), 1)
+            self.assertIsNotNone(row)
+
+        self.assertEqual(await self.db.fetchval("SELECT COUNT(*) FROM links"), 1001)
+
+    async def test_transaction_rollback(self):
+        with self.assertRaises(RuntimeError):
+            async with self.db.transaction() as conn:
+                await conn.execute("INSERT INTO links (link) VALUES ('rolled back')")
+                raise RuntimeError
+
+        self.assertEqual(await self.db.fetchval("SELECT COUNT(*) FROM links"), 0)
+
+    async def test_prune(self):
+        old = (datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=30)).strftime("%Y-%m-%d %H:%M:%S")
+        await self.db.executemany("INSERT INTO logs (message, created_at) VALUES (?, ?)", [("old", old)] * 5)
+        await self.db.executemany("INSERT INTO logs (message) VALUES (?)", [("new",)] * 5)
+        await self.db.commit()
+
+        deleted = await self.db.prune("logs", older_than=datetime.timedelta(days=7), max_rows=3)
+
+        self.assertEqual(deleted, 7)
+        self.assertEqual(await self.db.fetchall("SELECT message FROM logs"), [("new",)] * 3)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest import IsolatedAsyncioTestCase
+
+from discord.ext import commands
+
+from utilities.startup import Startup, loading_extension
+
+
+class FakeBot:
+    """``load_extension`` "imports" for 10ms, then spends 50ms in ``cog_load``."""
+
+    def __init__(self) -> None:
+        self.startup = Startup(self, concurrency=4)
+        self.loaded: list[str] = []
+
+    async def load_extension(self, name: str) -> None:
+        if name == "missing":
+            raise commands.ExtensionNotFound(name)
+
+        time.sleep(0.01)  # noqa: ASYNC251  # a blocking import
+        start = time.perf_counter()
+        await asyncio.sleep(0.05)
+        self.startup.cog_added(loading_extension.get(), start, time.perf_counter() - start)
+        self.loaded.append(name)
+
+
+class TestStartup(IsolatedAsyncioTestCase):
+    async def test_concurrent_load(self):
+        bot = FakeBot()
+        names = [f"cogs.ext{i}" for i in range(4)]
+
+        start = time.perf_counter()
+        timings = await bot.startup.load([*names, "missing"])
+        elapsed = time.perf_counter() - start
+
+        # the cog_loads overlap, only the imports add up
+        self.assertLess(elapsed, 0.15)
+        self.assertEqual(sorted(bot.loaded), names)
+        self.assertEqual([timing.name for timing in timings], [*names, "missing"])
+        self.assertIsNotNone(bot.startup.timings["missing"].error)
+
+        timing = bot.startup.timings["cogs.ext0"]
+        self.assertGreaterEqual(timing.imported, 0.01)
+        self.assertGreaterEqual(timing.setup, 0.05)
+        self.assertIsNone(timing.error)
+        self.assertEqual(loading_extension.get(), None)
+
+    async def test_defer(self):
+        startup = Startup(FakeBot())
+        calls: list[str] = []
+
+        async def warm(name: str) -> None:
+            calls.append(name)
+
+        async def broken() -> None:
+            raise RuntimeError
+
+        startup.defer("first", lambda: warm("first"))
+        startup.defer("broken", broken)
+        self.assertEqual(calls, [])
+
+        with self.assertLogs("utilities.startup", level="ERROR"):
+            await startup.run_deferred()
+        self.assertEqual(calls, ["first"])
+        self.assertEqual(set(startup.warmups), {"first", "broken"})
+
+        # after READY, warm ups run right away
+        startup.defer("late", lambda: warm("late"))
+        await asyncio.sleep(0)
+        self.assertEqual(calls, ["first", "late"])
+
+        startup.mark("ready")
+        self.assertIn("ready", startup.milestones)
+
+    async def test_reached(self):
+        startup = Startup(FakeBot())
+        warm = asyncio.create_task(startup.reached("warm").wait())
+        await asyncio.sleep(0)
+        self.assertFalse(warm.done())
+
+        startup.mark("warm")
+        await asyncio.wait_for(warm, timeout=1)
+        startup.mark("ready")
+        self.assertTrue(startup.reached("ready").is_set())
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import base64
+import os
+import tempfile
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from cogs.api.tokens import BloomFilter, Finding, SeenTokens, TokenReporter, find_tokens
+from utilities.sqlite import Database
+
+
+def make_token(user_id: int, suffix: str = "a") -> str:
+    return f"{base64.b64encode(str(user_id).encode()).decode().rstrip('=')}.GhIjKl.{suffix * 27}"
+
+
+TOKEN = make_token(123456789012345678)
+OTHER = make_token(876543210987654321, "b")
+
+
+class TestFindTokens(TestCase):
+    def test_find(self):
+        self.assertEqual(find_tokens(f"here {TOKEN} and {OTHER} and {TOKEN} again"), [TOKEN, OTHER])
+
+    def test_reject(self):
+        self.assertEqual(find_tokens("short message. with. dots"), [])
+        self.assertEqual(find_tokens("a" * 100), [])
+        # not a base64 user id
+        self.assertEqual(find_tokens(f"X{TOKEN[1:]}"), [])
+
+    def test_bloom(self):
+        bloom = BloomFilter(1000)
+        words = [f"token-{i}" for i in range(1000)]
+        for word in words:
+            bloom.add(word)
+
+        self.assertTrue(all(word in bloom for word in words))
+        false_positives = sum(f"other-{i}" in bloom for i in range(1000))
+        self.assertLess(false_positives, 10)
+
+
+class TestSeenTokens(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = await Database(os.path.join(self.directory.name, "cached.sqlite"), readers=1).connect()
+        await self.db.executescript(
+            "CREATE TABLE discord_tokens (id INTEGER PRIMARY KEY AUTOINCREMENT, token TEXT NOT NULL, UNIQUE(token));",
+        )
+
+    async def asyncTearDown(self) -> None:
+        await self.db.close()
+        self.directory.cleanup()
+
+    async def test_unseen(self):
+        seen = SeenTokens(self.db)
+
+        self.assertEqual(await seen.unseen([TOKEN, OTHER]), [TOKEN, OTHER])
+        self.assertEqual(await seen.unseen([TOKEN]), [])
+        # nothing was in the Bloom filter, the database was never asked
+        self.assertEqual(seen.database_lookups, 0)
+
+        await seen.flush()
+        rows = await self.db.fetchall("SELECT token FROM discord_tokens ORDER BY id")
+        self.assertEqual(rows, [(TOKEN,), (OTHER,)])
+
+        # after a restart
+        restarted = SeenTokens(self.db)
+        self.assertEqual(await restarted.load(), 2)
+        self.assertEqual(await restarted.unseen([OTHER, make_token(111111111111111111)]), [make_token(111111111111111111)])
+        self.assertEqual(restarted.database_lookups, 1)
+
+    async def test_flush_reported(self):
+        seen = SeenTokens(self.db)
+        tokens = [make_token(100000000000000000 + i) for i in range(150)]
+        self.assertEqual(len(await seen.unseen(tokens)), 150)
+        # nothing is written before it was reported, however many are pending
+        self.assertEqual(await self.db.fetchval("SELECT COUNT(*) FROM discord_tokens"), 0)
+
+        await seen.flush(tokens[:100])
+        self.assertEqual(await self.db.fetchval("SELECT COUNT(*) FROM discord_tokens"), 100)
+        self.assertEqual(await seen.unseen(tokens), [])
+
+        await seen.flush()
+        self.assertEqual(await self.db.fetchval("SELECT COUNT(*) FROM discord_tokens"), 150)
+
+    async def test_reporter_batches(self):
+        gists: list[str] = []
+        notified: list[tuple[int, list[int], str]] = []
+
+        async def create_gist(content: str) -> str:
+            gists.append(content)
+            return f"https://gist.github.com/{len(gists)}"
+
+        async def notify(channel_id: int, author_ids: list[int], url: str) -> None:
+            notified.append((channel_id, author_ids, url))
+
+        seen = SeenTokens(self.db)
+        reporter = TokenReporter(create_gist, notify, window=60, on_flush=seen.flush)
+        for channel_id in range(5):
+            reporter.add(Finding(await seen.unseen([TOKEN, OTHER]) or [TOKEN], channel_id, 1))
+        reporter.add(Finding([OTHER], 0, 2))
+        await reporter.close()
+
+        self.assertEqual(gists, [f"{TOKEN}\n{OTHER}"])
+        self.assertEqual(len(notified), 5)
+        self.assertIn((0, [1, 2], "https://gist.github.com/1"), notified)
+        self.assertEqual(await self.db.fetchval("SELECT COUNT(*) FROM discord_tokens"), 2)
+
+    async def test_reporter_failed_gist(self):
+        gists: list[str] = []
+        notified: list[tuple[int, list[int], str]] = []
+
+        async def create_gist(content: str) -> str:
+            if not gists:
+                gists.append("")
+                msg = "GitHub is down"
+                raise RuntimeError(msg)
+            gists.append(content)
+            return "https://gist.github.com/1"
+
+        async def notify(channel_id: int, author_ids: list[int], url: str) -> None:
+            notified.append((channel_id, author_ids, url))
+
+        seen = SeenTokens(self.db)
+        reporter = TokenReporter(create_gist, notify, window=60, on_flush=seen.flush)
+        reporter.add(Finding(await seen.unseen([TOKEN]), 0, 1))
+
+        with self.assertLogs("cogs.api.tokens", "ERROR"):
+            self.assertFalse(await reporter.report())
+        # nothing was reported, so nothing is stored as seen and the finding is kept
+        self.assertEqual(await self.db.fetchval("SELECT COUNT(*) FROM discord_tokens"), 0)
+        self.assertEqual(notified, [])
+
+        await reporter.close()
+        self.assertEqual(gists[-1], TOKEN)
+        self.assertEqual(notified, [(0, [1], "https://gist.github.com/1")])
+        self.assertEqual(await self.db.fetchval("SELECT COUNT(*) FROM discord_tokens"), 1)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
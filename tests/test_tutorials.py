@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+from cogs.rtfm._tutorials import Tutorial, TutorialIndex
+
+TUTORIALS = [
+    Tutorial("async-await", "**Asynchronous programming**\nawait it."),
+    Tutorial("blocking", "**Why does my bot freeze?**\ntime.sleep blocks the loop."),
+    Tutorial("classmethod", "**Alternative constructors**\n@classmethod"),
+    Tutorial("class", "A class without a bold title."),
+    Tutorial("comparison", "**Comparing values**\n== and is."),
+]
+
+
+class TestTutorialIndex(TestCase):
+    def setUp(self) -> None:
+        self.index = TutorialIndex(TUTORIALS)
+
+    def test_titles(self):
+        self.assertEqual(self.index["blocking"].title, "Why does my bot freeze?")
+        self.assertEqual(self.index["class"].title, "class")
+        self.assertEqual(len(self.index), 5)
+        self.assertIn("comparison", self.index)
+
+    def test_exact(self):
+        self.assertEqual(self.index.search("async await", limit=1), [("async-await", 100)])
+        self.assertEqual(self.index.search("Async-Await")[0], ("async-await", 100))
+        self.assertEqual(self.index.search("why does my bot freeze")[0], ("blocking", 100))
+
+    def test_token(self):
+        # nothing like the name, one word of the title
+        name, score = self.index.search("bot freezes", limit=1)[0]
+        self.assertEqual(name, "blocking")
+        self.assertGreater(score, 50)
+
+    def test_fuzzy(self):
+        self.assertEqual(self.index.search("comparisn", limit=1)[0][0], "comparison")
+        self.assertEqual(self.index.search("clasmethod", limit=1)[0][0], "classmethod")
+
+    def test_limit_and_cutoff(self):
+        self.assertEqual(len(self.index.search("class", limit=2)), 2)
+        self.assertLessEqual(len(self.index.search("a", limit=3)), 3)
+
+        results = self.index.search("class", limit=5, score_cutoff=80)
+        self.assertTrue(results)
+        self.assertTrue(all(score >= 80 for _, score in results))
+        self.assertEqual(self.index.search("zzzzqqqq", score_cutoff=90), [])
+
+    def test_empty_query(self):
+        # autocomplete lists names() for an empty query and never searches it
+        self.assertEqual(self.index.search(""), [])
+        self.assertEqual(self.index.search("  -- "), [])
+        self.assertEqual(self.index.names(), [tutorial.name for tutorial in TUTORIALS])
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest import IsolatedAsyncioTestCase
+
+from utilities.wait_for import WaitRegistry
+
+
+def message(channel_id: int, author_id: int, content: str = "") -> SimpleNamespace:
+    return SimpleNamespace(channel=SimpleNamespace(id=channel_id), author=SimpleNamespace(id=author_id), content=content)
+
+
+class TestWaitRegistry(IsolatedAsyncioTestCase):
+    async def test_buckets(self):
+        registry = WaitRegistry()
+        waits = [
+            asyncio.ensure_future(
+                registry.wait_for("message", check=lambda m: m.content == "go", channel_id=i, user_id=i, timeout=5),
+            )
+            for i in range(1000)
+        ]
+        anywhere = asyncio.ensure_future(registry.wait_for("message", check=lambda m: m.content == "go", timeout=5))
+        await asyncio.sleep(0)
+        self.assertEqual(registry.pending("message"), 1001)
+
+        registry.dispatch("message", (message(5000, 5000, "go"),))
+        # only the unscoped wait was checked
+        self.assertEqual(registry.checks, 1)
+        self.assertEqual((await anywhere).channel.id, 5000)
+
+        registry.dispatch("message", (message(7, 7, "nope"),))
+        registry.dispatch("message", (message(7, 8, "go"),))
+        self.assertFalse(waits[7].done())
+
+        registry.dispatch("message", (message(7, 7, "go"),))
+        self.assertEqual((await waits[7]).author.id, 7)
+        self.assertEqual(registry.checks, 3)
+
+        for wait in waits:
+            wait.cancel()
+        await asyncio.gather(*waits, return_exceptions=True)
+        self.assertEqual(len(registry), 0)
+
+    async def test_results(self):
+        registry = WaitRegistry()
+        reaction = SimpleNamespace(message=SimpleNamespace(channel=SimpleNamespace(id=1)))
+        user = SimpleNamespace(id=2)
+
+        wait = asyncio.ensure_future(registry.wait_for("reaction_add", channel_id=1, user_id=2))
+        # unknown events ignore the scope
+        custom = asyncio.ensure_future(registry.wait_for("game_complete", channel_id=1))
+        broken = asyncio.ensure_future(registry.wait_for("game_complete", check=lambda _: 1 / 0))
+        await asyncio.sleep(0)
+
+        registry.dispatch("reaction_add", (reaction, user))
+        registry.dispatch("game_complete", ("channel",))
+        self.assertEqual(await wait, (reaction, user))
+        self.assertEqual(await custom, "channel")
+        with self.assertRaises(ZeroDivisionError):
+            await broken
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await registry.wait_for("message", channel_id=1, timeout=0.01)
+        self.assertEqual(len(registry), 0)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
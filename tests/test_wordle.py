@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+from PIL import Image, ImageChops
+
+from interactions.buttons.__wordle import GREEN, SQ, Wordle, tile, tile_origin
+
+
+class TestWordleRenderer(TestCase):
+    def game(self, *guesses: str) -> Wordle:
+        game = Wordle()
+        game.word = "crane"
+        for guess in guesses:
+            game.parse_guess(guess)
+        return game
+
+    def test_incremental_matches_full_render(self):
+        game = self.game()
+        for guess in ("slate", "pious", "crane"):
+            game.render_image()
+            game.parse_guess(guess)
+        incremental = Image.open(game.render_image()).convert("RGB")
+        full = Image.open(self.game("slate", "pious", "crane").render_image()).convert("RGB")
+        self.assertIsNone(ImageChops.difference(incremental, full).getbbox())
+
+    def test_tiles(self):
+        self.assertIs(tile("a", GREEN, 55), tile("a", GREEN, 55))
+        image = Image.open(self.game("crane").render_image()).convert("RGB")
+        x, y = tile_origin(0, 4)
+        self.assertEqual(image.getpixel((x + 5, y + 5)), GREEN)
+        x, y = tile_origin(1, 0)
+        self.assertEqual(image.getpixel((x + SQ // 2, y + SQ // 2)), (255, 255, 255))
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
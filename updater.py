@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import datetime
 import logging
 
 import aiofiles
 import aiohttp
-import aiosqlite
 import yarl
 
+from utilities.config import SQLITE_CONFIG
+from utilities.sqlite import Database
+
 log = logging.getLogger("updater")
 
 API = yarl.URL("https://api.github.com/")
@@ -23,8 +26,13 @@ with open("_meta.txt") as f:
     is_first_run = f.read().strip().lower() == "true"
 
 
-async def init():
-    db = await aiosqlite.connect("cached.sqlite", iter_chunk_size=2**8, cached_statements=2**10)
+async def init() -> Database:
+    db = await Database(
+        "cached.sqlite",
+        readers=SQLITE_CONFIG.get("readers", 4),
+        pragmas=SQLITE_CONFIG.get("pragmas"),
+        slow_query=SQLITE_CONFIG.get("slow_query_ms", 100) / 1000,
+    ).connect()
 
     query = """
         BEGIN;
@@ -34,7 +42,7 @@ async def init():
         CREATE TABLE IF NOT EXISTS nsfw_links_grouped (id INTEGER PRIMARY KEY AUTOINCREMENT, link TEXT NOT NULL UNIQUE, type TEXT);
 
         CREATE TABLE IF NOT EXISTS logs (id INTEGER PRIMARY KEY AUTOINCREMENT, level INT NOT NULL, message TEXT NOT NULL, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, extra TEXT, UNIQUE(message, created_at));
-        DELETE FROM logs;
+        CREATE INDEX IF NOT EXISTS logs_created_at ON logs (created_at);
 
         COMMIT;
     """
@@ -42,10 +50,22 @@ async def init():
     await db.executescript(query)
     await db.commit()
 
+    await apply_retention(db)
+
     return db
 
 
-async def insert_all_scams(db: aiosqlite.Connection):
+async def apply_retention(db: Database) -> None:
+    """Drop old rows from the ``logs`` table, keeping at most ``log_retention_days`` and ``log_max_rows``."""
+    await db.prune(
+        "logs",
+        column="created_at",
+        older_than=datetime.timedelta(days=SQLITE_CONFIG.get("log_retention_days", 7)),
+        max_rows=SQLITE_CONFIG.get("log_max_rows", 100_000),
+    )
+
+
+async def insert_all_scams(db: Database):
     async with aiofiles.open("_meta.txt", "w") as f:
         await f.write("false")
 
@@ -66,14 +86,12 @@ async def insert_all_scams(db: aiosqlite.Connection):
 
     query = """INSERT INTO scam_links (link) VALUES (?) ON CONFLICT DO NOTHING"""
 
-    for link in data:
-        await db.execute(query, (link,))
-        log.info("inserted link: %s", link)
-
-    await db.commit()
+    async with db.transaction() as conn:
+        await conn.executemany(query, [(link,) for link in data])
+    log.info("inserted %s links", len(data))
 
 
-async def insert_new(db: aiosqlite.Connection):
+async def insert_new(db: Database):
     if is_first_run:
         log.info("First Run... Inserting all scams...")
         await insert_all_scams(db)
@@ -96,17 +114,16 @@ async def insert_new(db: aiosqlite.Connection):
     insert_query = """INSERT INTO scam_links (link) VALUES (?) ON CONFLICT DO NOTHING"""
     delete_query = """DELETE FROM scam_links WHERE link = ?"""
 
-    for commit in data:
-        message = commit["commit"]["message"]
-        if message.startswith("+ "):
-            link = message[2:]
-            cur = await db.execute(insert_query, (link,))
-            if cur.rowcount:
-                log.info("inserted link: %s", link)
-        elif message.startswith("- "):
-            link = message[2:]
-            cur = await db.execute(delete_query, (link,))
-            if cur.rowcount:
-                log.info("deleted link: %s", link)
-
-    await db.commit()
+    async with db.transaction() as conn:
+        for commit in data:
+            message = commit["commit"]["message"]
+            if message.startswith("+ "):
+                link = message[2:]
+                cur = await conn.execute(insert_query, (link,))
+                if cur.rowcount:
+                    log.info("inserted link: %s", link)
+            elif message.startswith("- "):
+                link = message[2:]
+                cur = await conn.execute(delete_query, (link,))
+                if cur.rowcount:
+                    log.info("deleted link: %s", link)
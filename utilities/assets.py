@@ -0,0 +1,143 @@
+"""Images and fonts from ``extra/``, decoded on first use and shared.
+
+``assets.image("pride/flags/gay.png", mode="RGBA", size=(1024, 1024))`` decodes, converts and
+resizes the file once. Every call after that is a dict lookup returning a read-only view of
+the cached image: it shares the pixels, and the first call that draws on it (``paste``,
+``putalpha``, ``alpha_composite``...) gives that view a private copy first. The cache never
+changes under its users.
+
+Images are evicted least recently used first once they hold more than ``max_bytes``.
+Fonts are small and few; they stay.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+from PIL import Image, ImageFont
+
+__all__ = ("AssetRegistry", "AssetStats", "assets")
+
+ASSET_DIRECTORY = "extra"
+
+
+class AssetStats(NamedTuple):
+    images: int
+    fonts: int
+    # pixel memory of the cached images
+    nbytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+def image_nbytes(image: Image.Image) -> int:
+    # 32 bit modes ("I", "F") and 16 bit ones are rare here, bands is close enough for the rest
+    return image.width * image.height * len(image.getbands())
+
+
+class AssetRegistry:
+    def __init__(self, root: str = ASSET_DIRECTORY, *, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+
+        self._images: OrderedDict[tuple[str, str | None, tuple[int, int] | None], Image.Image] = OrderedDict()
+        self._fonts: dict[tuple[str, int], ImageFont.FreeTypeFont] = {}
+        self._lock = threading.Lock()
+
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self) -> str:
+        return f"<AssetRegistry images={len(self._images)} fonts={len(self._fonts)} nbytes={self.nbytes}>"
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.root, name)
+
+    def image(self, name: str, *, mode: str | None = None, size: tuple[int, int] | None = None) -> Image.Image:
+        """``extra/<name>``, converted to ``mode`` and resized to ``size`` if given, as a read-only view.
+
+        Safe to call from threads. Raises what :func:`PIL.Image.open` raises for a missing file.
+        """
+        key = (name, mode, size)
+        with self._lock:
+            cached = self._images.get(key)
+            if cached is not None:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return self._view(cached)
+
+        # decode outside the lock, two threads may decode the same file once, both are correct
+        with Image.open(self.path(name)) as file:
+            image = file.convert(mode) if mode is not None else file.copy()
+        if size is not None and image.size != size:
+            image = image.resize(size)
+
+        with self._lock:
+            self.misses += 1
+            if key not in self._images:
+                self._images[key] = image
+                self.nbytes += image_nbytes(image)
+                self._evict()
+            return self._view(self._images[key])
+
+    @staticmethod
+    def _view(image: Image.Image) -> Image.Image:
+        view = image._new(image.im)
+        # Pillow copies the pixels of a read-only image before drawing on it
+        view.readonly = 1
+        return view
+
+    def _evict(self) -> None:
+        # the newest image stays even if it alone is over the limit
+        while self.nbytes > self.max_bytes and len(self._images) > 1:
+            _, image = self._images.popitem(last=False)
+            self.nbytes -= image_nbytes(image)
+            self.evictions += 1
+
+    def font(self, name: str, size: int) -> ImageFont.FreeTypeFont:
+        """``extra/<name>`` at ``size`` points. Fonts are not drawn on, the same one is shared."""
+        key = (name, size)
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is not None:
+                self.hits += 1
+                return font
+
+        font = ImageFont.truetype(self.path(name), size)
+        with self._lock:
+            self.misses += 1
+            return self._fonts.setdefault(key, font)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._images.clear()
+            self._fonts.clear()
+            self.nbytes = 0
+
+    @property
+    def stats(self) -> AssetStats:
+        return AssetStats(
+            images=len(self._images),
+            fonts=len(self._fonts),
+            nbytes=self.nbytes,
+            max_bytes=self.max_bytes,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
+
+    def largest(self, count: int = 10) -> list[tuple[str, int]]:
+        """The ``count`` cached images taking the most memory, by name."""
+        with self._lock:
+            sizes = [(name, image_nbytes(image)) for (name, _, _), image in self._images.items()]
+        return sorted(sizes, key=lambda item: item[1], reverse=True)[:count]
+
+
+assets = AssetRegistry()
@@ -0,0 +1,133 @@
+"""Which channels are special to which feature, without asking Mongo on every message.
+
+The index is built once from every guild configuration and rebuilt for a guild whenever its
+configuration is re-read, which every config command already does after it writes. Message
+listeners check it synchronously and return right away for ordinary channels.
+"""
+
+from __future__ import annotations
+
+import enum
+import logging
+from collections.abc import AsyncIterable, Iterator, Mapping
+from typing import Any
+
+log = logging.getLogger("utilities.channel_index")
+
+__all__ = ("ChannelIndex", "Feature", "PROJECTION", "features_from_config")
+
+
+class Feature(enum.Flag):
+    NONE = 0
+    SUGGESTION = enum.auto()
+    GLOBAL_CHAT = enum.auto()
+    HUB = enum.auto()
+    TICKET = enum.auto()
+    STARBOARD = enum.auto()
+    STARBOARD_IGNORE = enum.auto()
+    LEVELING_IGNORE = enum.auto()
+    TELEPHONE = enum.auto()
+
+
+# only the fields the index reads, for the initial load
+PROJECTION = {
+    "suggestion_channel": 1,
+    "global_chat": 1,
+    "hub": 1,
+    "ticket_config.ticket_channel_ids": 1,
+    "starboard_config.channel": 1,
+    "starboard_config.ignore_channel": 1,
+    "leveling.ignore_channel": 1,
+    "telephone.enable": 1,
+    "telephone.channel_id": 1,
+}
+
+
+def _get(config: Mapping[str, Any], path: str) -> Any:
+    value: Any = config
+    for key in path.split("."):
+        if not isinstance(value, Mapping):
+            return None
+        value = value.get(key)
+    return value
+
+
+def features_from_config(config: Mapping[str, Any]) -> dict[int, Feature]:
+    """The features of every channel mentioned in a guild configuration."""
+    channels: dict[int, Feature] = {}
+
+    def add(channel_id: Any, feature: Feature) -> None:
+        if isinstance(channel_id, int) and channel_id:
+            channels[channel_id] = channels.get(channel_id, Feature.NONE) | feature
+
+    add(config.get("suggestion_channel"), Feature.SUGGESTION)
+    add(config.get("hub"), Feature.HUB)
+    add(_get(config, "starboard_config.channel"), Feature.STARBOARD)
+    if _get(config, "global_chat.enable"):
+        add(_get(config, "global_chat.channel_id"), Feature.GLOBAL_CHAT)
+    if _get(config, "telephone.enable"):
+        add(_get(config, "telephone.channel_id"), Feature.TELEPHONE)
+
+    for channel_id in _get(config, "ticket_config.ticket_channel_ids") or []:
+        add(channel_id, Feature.TICKET)
+    for channel_id in _get(config, "starboard_config.ignore_channel") or []:
+        add(channel_id, Feature.STARBOARD_IGNORE)
+    for channel_id in _get(config, "leveling.ignore_channel") or []:
+        add(channel_id, Feature.LEVELING_IGNORE)
+
+    return channels
+
+
+class ChannelIndex:
+    """``channel_id -> Feature`` for every guild, and the global chat webhooks."""
+
+    def __init__(self) -> None:
+        self._channels: dict[int, Feature] = {}
+        self._guild_channels: dict[int, list[int]] = {}
+        self.global_chat_webhooks: dict[int, str] = {}
+        self.loaded = False
+
+    def __repr__(self) -> str:
+        return f"<ChannelIndex guilds={len(self._guild_channels)} channels={len(self._channels)}>"
+
+    def __len__(self) -> int:
+        return len(self._channels)
+
+    def __contains__(self, channel_id: int) -> bool:
+        return channel_id in self._channels
+
+    def features(self, channel_id: int) -> Feature:
+        return self._channels.get(channel_id, Feature.NONE)
+
+    def has(self, channel_id: int, feature: Feature) -> bool:
+        return bool(self._channels.get(channel_id, Feature.NONE) & feature)
+
+    def channels(self, feature: Feature) -> Iterator[int]:
+        return (channel_id for channel_id, features in self._channels.items() if features & feature)
+
+    def update(self, guild_id: int, config: Mapping[str, Any]) -> None:
+        """Replace everything known about ``guild_id`` with what ``config`` says."""
+        self.remove(guild_id)
+
+        channels = features_from_config(config)
+        self._channels.update(channels)
+        if channels:
+            self._guild_channels[guild_id] = list(channels)
+
+        if _get(config, "global_chat.enable") and (webhook := _get(config, "global_chat.webhook")):
+            self.global_chat_webhooks[guild_id] = webhook
+
+    def remove(self, guild_id: int) -> None:
+        for channel_id in self._guild_channels.pop(guild_id, []):
+            self._channels.pop(channel_id, None)
+        self.global_chat_webhooks.pop(guild_id, None)
+
+    async def load(self, configs: AsyncIterable[Mapping[str, Any]]) -> None:
+        """Build the index from every guild configuration, e.g. ``collection.find({}, PROJECTION)``."""
+        guilds = 0
+        async for config in configs:
+            self.update(config["_id"], config)
+            guilds += 1
+
+        self.loaded = True
+        log.info("Indexed %s special channels across %s guilds", len(self._channels), guilds)
@@ -56,7 +56,10 @@ SUPER_USER: int = parse_env_var("OWNER_ID")
 MASTER_OWNER: int = SUPER_USER
 EXTENSIONS: list[str] = data["all_extensions"]
 UNLOAD_EXTENSIONS: list[str] = data.get("unload_extensions", [])
+LAZY_EXTENSIONS: list[str] = data.get("lazy_extensions", [])
+EXTENSION_CONCURRENCY: int = data.get("extension_concurrency", 8)
 DEV_LOGO: str = data["dev_logo"]
+SQLITE_CONFIG: dict[str, Any] = data.get("sqlite") or {}
 TOKEN: str = parse_env_var("TOKEN")
 DATABASE_KEY: str = parse_env_var("DATABASE_KEY")
 OPEN_ROBOT_API: str = parse_env_var("OPEN_ROBOT_API")
@@ -84,3 +87,4 @@ MINIMAL_BOOT: bool = parse_env_var("MINIMAL_BOOT", False)
 
 if MINIMAL_BOOT:
     EXTENSIONS = ["jishaku"]
+    LAZY_EXTENSIONS = []
@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import logging
+import os
+import re
+import time
+import zlib
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, NamedTuple
+from xml.etree import ElementTree
+
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
+log = logging.getLogger("utilities.docs_index")
+
+__all__ = (
+    "DocumentationIndex",
+    "DocumentationIndexManager",
+    "DocumentationSource",
+    "SphinxObjectFileReader",
+    "default_sources",
+    "parse_doxygen_tag",
+    "parse_object_inv",
+)
+
+INDEX_DIRECTORY = "temp/docs"
+INDEX_HEADER = b"# Parrot documentation index version 1\n"
+INDEX_MAX_AGE = 60 * 60 * 24  # 1 day
+
+CPPREFERENCE_TAG_URL = "https://upload.cppreference.com/mwiki/images/f/f8/cppreference-doxygen-web.tag.xml"
+CPPREFERENCE_BASE_URL = "https://en.cppreference.com/w"
+
+# This code mostly comes from the Sphinx repository.
+ENTRY_REGEX = re.compile(r"(?x)(.+?)\s+(\S*:\S*)\s+(-?\d+)\s+(\S+)\s+(.*)")
+
+
+class SphinxObjectFileReader:
+    # Inspired by Sphinx's InventoryFileReader
+    BUFSIZE = 16 * 1024
+
+    def __init__(self, buffer: bytes) -> None:
+        self.stream = io.BytesIO(buffer)
+
+    def readline(self) -> str:
+        return self.stream.readline().decode("utf-8")
+
+    def skipline(self) -> None:
+        self.stream.readline()
+
+    def read_compressed_chunks(self) -> Iterator[bytes]:
+        decompressor = zlib.decompressobj()
+        while True:
+            chunk = self.stream.read(self.BUFSIZE)
+            if len(chunk) == 0:
+                break
+            yield decompressor.decompress(chunk)
+        yield decompressor.flush()
+
+    def read_compressed_lines(self) -> Iterator[str]:
+        buf = b""
+        for chunk in self.read_compressed_chunks():
+            buf += chunk
+            pos = buf.find(b"\n")
+            while pos != -1:
+                yield buf[:pos].decode("utf-8")
+                buf = buf[pos + 1 :]
+                pos = buf.find(b"\n")
+
+
+def parse_object_inv(buffer: bytes, *, strip_prefixes: Iterable[str] = ()) -> dict[str, str]:
+    """Parse a Sphinx ``objects.inv`` into a mapping of ``name -> relative location``."""
+    stream = SphinxObjectFileReader(buffer)
+    result: dict[str, str] = {}
+
+    # first line is version info
+    inv_version = stream.readline().rstrip()
+    if inv_version != "# Sphinx inventory version 2":
+        msg = "Invalid objects.inv file version."
+        raise RuntimeError(msg)
+
+    # next line is "# Project: <name>"
+    # then after that is "# Version: <version>"
+    stream.skipline()
+    stream.skipline()
+
+    # next line says if it's a zlib header
+    line = stream.readline()
+    if "zlib" not in line:
+        msg = "Invalid objects.inv file, not z-lib compatible."
+        raise RuntimeError(msg)
+
+    strip_prefixes = tuple(strip_prefixes)
+    for line in stream.read_compressed_lines():
+        match = ENTRY_REGEX.match(line.rstrip())
+        if not match:
+            continue
+
+        name, directive, _, location, dispname = match.groups()
+        domain, _, subdirective = directive.partition(":")
+        if directive == "py:module" and name in result:
+            # From the Sphinx Repository:
+            # due to a bug in 1.1 and below,
+            # two inventory entries are created
+            # for Python modules, and the first
+            # one is correct
+            continue
+
+        # Most documentation pages have a label
+        if directive == "std:doc":
+            subdirective = "label"
+
+        if location.endswith("$"):
+            location = location[:-1] + name
+
+        key = name if dispname == "-" else dispname
+        prefix = f"{subdirective}:" if domain == "std" else ""
+
+        for strip in strip_prefixes:
+            key = key.replace(strip, "")
+
+        result.setdefault(f"{prefix}{key}", location)
+
+    return result
+
+
+def parse_doxygen_tag(buffer: bytes) -> dict[str, str]:
+    """Parse a Doxygen tag file (as published by cppreference) into ``name -> relative location``."""
+    result: dict[str, str] = {}
+
+    root = ElementTree.fromstring(buffer)
+    for compound in root.iter("compound"):
+        name = compound.findtext("name")
+        filename = compound.findtext("filename")
+        if not name or not filename:
+            continue
+
+        result.setdefault(name, filename)
+
+        for member in compound.iter("member"):
+            member_name = member.findtext("name")
+            anchorfile = member.findtext("anchorfile")
+            if not member_name or not anchorfile:
+                continue
+
+            anchor = member.findtext("anchor")
+            location = f"{anchorfile}#{anchor}" if anchor else anchorfile
+            key = member_name if compound.get("kind") == "file" else f"{name}::{member_name}"
+            result.setdefault(key, location)
+
+    return result
+
+
+class DocumentationSource(NamedTuple):
+    name: str
+    base_url: str
+    index_url: str
+    kind: str = "sphinx"
+    strip_prefixes: tuple[str, ...] = ()
+
+    def parse(self, buffer: bytes) -> dict[str, str]:
+        if self.kind == "doxygen":
+            return parse_doxygen_tag(buffer)
+        return parse_object_inv(buffer, strip_prefixes=self.strip_prefixes)
+
+
+def default_sources(path: str = "extra/docs_links.json") -> list[DocumentationSource]:
+    """Sources from ``extra/docs_links.json`` (all Sphinx) plus the cppreference tag file."""
+    with open(path, encoding="utf-8", errors="ignore") as f:
+        links: dict[str, str] = json.load(f)
+
+    sources = [
+        DocumentationSource(
+            name,
+            url.rstrip("/"),
+            f"{url.rstrip('/')}/objects.inv",
+            strip_prefixes=("discord.ext.commands.", "discord.") if name == "discord" else (),
+        )
+        for name, url in links.items()
+    ]
+    sources.append(DocumentationSource("cpp", CPPREFERENCE_BASE_URL, CPPREFERENCE_TAG_URL, kind="doxygen"))
+    return sources
+
+
+class DocumentationIndex:
+    """An in-memory index for a single documentation source.
+
+    Keys and locations are kept in parallel lists, and the keys are pre-processed once
+    so that a query is a dict lookup for exact hits and a single rapidfuzz pass otherwise.
+    """
+
+    __slots__ = ("name", "base_url", "keys", "locations", "_processed", "_lookup")
+
+    def __init__(self, name: str, base_url: str, entries: dict[str, str]) -> None:
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.keys: list[str] = list(entries)
+        self.locations: list[str] = list(entries.values())
+
+        self._processed: list[str] = [default_process(key) for key in self.keys]
+        self._lookup: dict[str, int] = {}
+        for index, key in enumerate(self._processed):
+            self._lookup.setdefault(key, index)
+
+    def __repr__(self) -> str:
+        return f"<DocumentationIndex name={self.name!r} entries={len(self)}>"
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def url(self, index: int) -> str:
+        return f"{self.base_url}/{self.locations[index]}"
+
+    def search(self, query: str, *, limit: int = 8, score_cutoff: float = 60) -> list[tuple[str, str]]:
+        """Return up to ``limit`` ``(name, url)`` pairs, best match first."""
+        processed = default_process(query)
+        if not processed:
+            return []
+
+        results: list[tuple[str, str]] = []
+        exact = self._lookup.get(processed)
+        if exact is not None:
+            results.append((self.keys[exact], self.url(exact)))
+
+        for _, _, index in process.extract(
+            processed,
+            self._processed,
+            scorer=fuzz.WRatio,
+            processor=None,
+            limit=limit,
+            score_cutoff=score_cutoff,
+        ):
+            if index != exact:
+                results.append((self.keys[index], self.url(index)))
+
+        return results[:limit]
+
+    def dumps(self) -> bytes:
+        body = "".join(f"{key}\t{location}\n" for key, location in zip(self.keys, self.locations, strict=True))
+        return INDEX_HEADER + f"# Base: {self.base_url}\n".encode() + zlib.compress(body.encode("utf-8"), 9)
+
+    @classmethod
+    def loads(cls, name: str, data: bytes) -> DocumentationIndex:
+        stream = io.BytesIO(data)
+        if stream.readline() != INDEX_HEADER:
+            msg = "Invalid documentation index file."
+            raise RuntimeError(msg)
+
+        base_url = stream.readline().decode("utf-8").rstrip("\n").removeprefix("# Base: ")
+        body = zlib.decompress(stream.read()).decode("utf-8")
+
+        entries: dict[str, str] = {}
+        for line in body.splitlines():
+            key, _, location = line.partition("\t")
+            entries[key] = location
+
+        return cls(name, base_url, entries)
+
+
+class DocumentationIndexManager:
+    """Owns the documentation indexes, their on-disk copies and their refresh."""
+
+    def __init__(
+        self,
+        sources: Iterable[DocumentationSource],
+        *,
+        directory: str = INDEX_DIRECTORY,
+        max_age: float = INDEX_MAX_AGE,
+    ) -> None:
+        self.sources: dict[str, DocumentationSource] = {source.name: source for source in sources}
+        self.directory = directory
+        self.max_age = max_age
+
+        self._indexes: dict[str, DocumentationIndex] = {}
+        self._lock = asyncio.Lock()
+
+    def __repr__(self) -> str:
+        return f"<DocumentationIndexManager loaded={len(self._indexes)}/{len(self.sources)}>"
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._indexes
+
+    def get(self, name: str) -> DocumentationIndex | None:
+        return self._indexes.get(name)
+
+    def search(self, name: str, query: str, **kwargs) -> list[tuple[str, str]] | None:
+        """Search the index ``name``. Returns ``None`` if that index is not loaded (yet)."""
+        index = self._indexes.get(name)
+        if index is None:
+            return None
+        return index.search(query, **kwargs)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.idx")
+
+    def _is_stale(self, name: str) -> bool:
+        try:
+            return time.time() - os.path.getmtime(self._path(name)) > self.max_age
+        except OSError:
+            return True
+
+    def load(self) -> int:
+        """Load every index present on disk. Blocking, call it from a thread."""
+        loaded = 0
+        for name in self.sources:
+            try:
+                with open(self._path(name), "rb") as f:
+                    self._indexes[name] = DocumentationIndex.loads(name, f.read())
+            except FileNotFoundError:
+                continue
+            except (OSError, RuntimeError, zlib.error):
+                log.warning("Discarding unreadable documentation index %s", name, exc_info=True)
+                continue
+            loaded += 1
+
+        log.info("Loaded %s documentation indexes from %s", loaded, self.directory)
+        return loaded
+
+    def _build_and_save(self, source: DocumentationSource, buffer: bytes) -> DocumentationIndex:
+        index = DocumentationIndex(source.name, source.base_url, source.parse(buffer))
+
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = f"{self._path(source.name)}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(index.dumps())
+        os.replace(tmp, self._path(source.name))
+        return index
+
+    async def refresh(self, session: ClientSession, *, force: bool = False) -> list[str]:
+        """Download and re-index every stale (or missing) source. Returns the names that were rebuilt."""
+        refreshed: list[str] = []
+        async with self._lock:
+            if not self._indexes:
+                await asyncio.to_thread(self.load)
+
+            for name, source in self.sources.items():
+                if not force and name in self._indexes and not self._is_stale(name):
+                    continue
+
+                try:
+                    async with session.get(source.index_url) as resp:
+                        if resp.status != 200:
+                            log.warning("Failed to fetch documentation index %s (status %s)", name, resp.status)
+                            continue
+                        buffer = await resp.read()
+
+                    self._indexes[name] = await asyncio.to_thread(self._build_and_save, source, buffer)
+                except Exception:
+                    log.warning("Failed to build documentation index %s", name, exc_info=True)
+                    continue
+
+                refreshed.append(name)
+                log.info("Built documentation index %s (%s entries)", name, len(self._indexes[name]))
+
+        return refreshed
@@ -0,0 +1,401 @@
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import hashlib
+import json
+import logging
+import time
+from collections import Counter
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+import yarl
+from lru import LRU
+from multidict import CIMultiDict, CIMultiDictProxy
+
+if TYPE_CHECKING:
+    from .http_client import HTTPClient
+    from .sqlite import Database
+
+log = logging.getLogger("utilities.http_cache")
+
+__all__ = ("CachedResponse", "HTTPCache", "DEFAULT_HOST_TTL")
+
+# Freshness lifetimes (seconds) for APIs that send no usable Cache-Control of their own.
+DEFAULT_HOST_TTL: dict[str, float] = {
+    "pypi.org": 60 * 60,
+    "registry.npmjs.org": 60 * 60,
+    "crates.io": 60 * 60,
+    "api.duckduckgo.com": 60 * 10,
+    "api.nasa.gov": 60 * 30,
+    "images-api.nasa.gov": 60 * 60,
+    "api.wolframalpha.com": 60 * 60,
+    "gitlab.com": 60 * 5,
+    "bitbucket.org": 60 * 5,
+    "raw.githubusercontent.com": 60 * 5,
+    "gist.githubusercontent.com": 60 * 5,
+}
+
+# RFC 9111 4.2.2, responses that may be stored without explicit freshness information
+CACHEABLE_STATUSES = frozenset({200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501})
+
+# request headers that change the response, the rest (User-Agent, ...) is not part of the key
+VARY_HEADERS = ("Accept", "Accept-Language", "Authorization")
+
+MAX_BODY_SIZE = 2**20  # 1 MiB
+PRUNE_EVERY = 2**6  # SQLite writes
+
+
+def _parse_cache_control(value: str | None) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    if not value:
+        return directives
+
+    for part in value.split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') or None
+    return directives
+
+
+def _parse_http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class CachedResponse:
+    """A fully read response. Quacks like the parts of :class:`aiohttp.ClientResponse` the cogs use."""
+
+    __slots__ = ("url", "method", "status", "headers", "body", "stored_at", "expires_at", "from_cache")
+
+    def __init__(
+        self,
+        url: str,
+        status: int,
+        headers: Mapping[str, str] | list[tuple[str, str]],
+        body: bytes,
+        *,
+        method: str = "GET",
+        stored_at: float | None = None,
+        expires_at: float = 0,
+    ) -> None:
+        self.url = yarl.URL(url)
+        self.method = method
+        self.status = status
+        self.headers: CIMultiDictProxy[str] = CIMultiDictProxy(CIMultiDict(headers))
+        self.body = body
+        self.stored_at = time.time() if stored_at is None else stored_at
+        self.expires_at = expires_at
+        self.from_cache = False
+
+    def __repr__(self) -> str:
+        return f"<CachedResponse url={str(self.url)!r} status={self.status} from_cache={self.from_cache}>"
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("ETag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("Last-Modified")
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get("Content-Type", "application/octet-stream").partition(";")[0].strip().lower()
+
+    @property
+    def charset(self) -> str:
+        _, _, params = self.headers.get("Content-Type", "").partition(";")
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "charset" and value:
+                return value.strip('"')
+        return "utf-8"
+
+    @property
+    def request_info(self) -> aiohttp.RequestInfo:
+        return aiohttp.RequestInfo(self.url, self.method, CIMultiDictProxy(CIMultiDict()), self.url)
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise aiohttp.ClientResponseError(
+                self.request_info,
+                (),
+                status=self.status,
+                message=f"HTTP {self.status}",
+                headers=self.headers,
+            )
+
+    async def read(self) -> bytes:
+        return self.body
+
+    async def text(self, encoding: str | None = None, errors: str = "strict") -> str:
+        return self.body.decode(encoding or self.charset, errors=errors)
+
+    async def json(self, *, content_type: str | None = "application/json", loads: Any = json.loads) -> Any:
+        if content_type and content_type not in self.content_type:
+            raise aiohttp.ContentTypeError(
+                self.request_info,
+                (),
+                status=self.status,
+                message=f"Attempt to decode JSON with unexpected mimetype: {self.content_type}",
+                headers=self.headers,
+            )
+        return loads(self.body.decode(self.charset))
+
+
+class HTTPCache:
+    """HTTP caching layer over the shared :class:`aiohttp.ClientSession`.
+
+    Only ``GET`` is cached. Freshness comes from ``Cache-Control: max-age``/``Expires``
+    unless a TTL is given per call or per host; stale entries with an ``ETag`` or
+    ``Last-Modified`` are revalidated with a conditional request. Entries live in an
+    in-memory LRU and, when a database is given, in the ``http_cache`` table of
+    ``cached.sqlite`` so they survive restarts. Identical requests made while one is
+    already in flight share its response.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession | HTTPClient,
+        *,
+        db: Database | None = None,
+        host_ttl: Mapping[str, float] | None = None,
+        memory_size: int = 2**9,
+        max_db_entries: int = 2**12,
+        max_body_size: int = MAX_BODY_SIZE,
+    ) -> None:
+        self.session = session
+        self.db = db
+        self.host_ttl: dict[str, float] = dict(DEFAULT_HOST_TTL if host_ttl is None else host_ttl)
+        self.max_db_entries = max_db_entries
+        self.max_body_size = max_body_size
+
+        self._memory: LRU = LRU(memory_size)
+        self._pending: dict[str, asyncio.Future[CachedResponse]] = {}
+        self._writes = 0
+
+        self.metrics: Counter[str] = Counter()
+
+    def __repr__(self) -> str:
+        return f"<HTTPCache entries={len(self._memory)} metrics={dict(self.metrics)}>"
+
+    async def setup(self) -> None:
+        if self.db is None:
+            return
+
+        await self.db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS http_cache (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                stored_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS http_cache_stored_at ON http_cache (stored_at);
+            """,
+        )
+        await self.db.commit()
+
+    @staticmethod
+    def cache_key(url: yarl.URL, headers: Mapping[str, str] | None = None) -> str:
+        vary = CIMultiDict(headers or {})
+        parts = [str(url), *(f"{name}:{vary.get(name, '')}" for name in VARY_HEADERS)]
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    def freshness(self, response: CachedResponse, *, ttl: float | None = None) -> float | None:
+        """Seconds ``response`` stays fresh for, or ``None`` if it must not be stored."""
+        cache_control = _parse_cache_control(response.headers.get("Cache-Control"))
+        if "no-store" in cache_control or len(response.body) > self.max_body_size:
+            return None
+        if response.status not in CACHEABLE_STATUSES:
+            return None
+
+        if ttl is not None:
+            return ttl
+
+        host = response.url.host or ""
+        if host in self.host_ttl and "no-cache" not in cache_control:
+            return self.host_ttl[host]
+
+        if "no-cache" in cache_control:
+            lifetime = 0.0
+        elif (max_age := cache_control.get("max-age")) is not None:
+            try:
+                lifetime = float(max_age) - float(response.headers.get("Age", 0))
+            except ValueError:
+                lifetime = 0.0
+        elif (expires := _parse_http_date(response.headers.get("Expires"))) is not None:
+            date = _parse_http_date(response.headers.get("Date")) or time.time()
+            lifetime = expires - date
+        else:
+            lifetime = 0.0
+
+        if lifetime <= 0 and not (response.etag or response.last_modified):
+            # nothing to revalidate with, storing it would be pointless
+            return None
+        return max(lifetime, 0.0)
+
+    async def get(
+        self,
+        url: str | yarl.URL,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        ttl: float | None = None,
+        raise_for_status: bool = False,
+        **kwargs: Any,
+    ) -> CachedResponse:
+        """``GET`` ``url``, served from the cache when possible.
+
+        ``ttl`` overrides the freshness lifetime of the response. Extra keyword
+        arguments are passed to :meth:`aiohttp.ClientSession.get`.
+        """
+        url = yarl.URL(url)
+        if params:
+            url = url.update_query({k: str(v) for k, v in params.items()})
+
+        key = self.cache_key(url, headers)
+        entry = await self._lookup(key)
+
+        if entry is not None and entry.fresh:
+            self.metrics["hit"] += 1
+            response = entry
+        elif key in self._pending:
+            self.metrics["coalesced"] += 1
+            response = await asyncio.shield(self._pending[key])
+        else:
+            future: asyncio.Future[CachedResponse] = asyncio.get_running_loop().create_future()
+            self._pending[key] = future
+            try:
+                response = await self._fetch(key, url, headers, entry, ttl=ttl, **kwargs)
+            except BaseException as e:
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+                    future.exception()  # mark as retrieved, nobody else may be waiting
+                raise
+            else:
+                future.set_result(response)
+            finally:
+                del self._pending[key]
+
+        if raise_for_status:
+            response.raise_for_status()
+        return response
+
+    async def _fetch(
+        self,
+        key: str,
+        url: yarl.URL,
+        headers: Mapping[str, str] | None,
+        entry: CachedResponse | None,
+        *,
+        ttl: float | None,
+        **kwargs: Any,
+    ) -> CachedResponse:
+        request_headers = CIMultiDict(headers or {})
+        if entry is not None:
+            if entry.etag:
+                request_headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request_headers["If-Modified-Since"] = entry.last_modified
+
+        async with self.session.get(url, headers=request_headers, **kwargs) as resp:
+            if resp.status == 304 and entry is not None:
+                self.metrics["revalidated"] += 1
+                merged = CIMultiDict(entry.headers)
+                for name in ("Cache-Control", "Expires", "Date", "ETag", "Last-Modified", "Age"):
+                    if name in resp.headers:
+                        merged[name] = resp.headers[name]
+                response = CachedResponse(str(entry.url), entry.status, merged, entry.body)
+            else:
+                self.metrics["miss"] += 1
+                response = CachedResponse(str(resp.url), resp.status, list(resp.headers.items()), await resp.read())
+
+        lifetime = self.freshness(response, ttl=ttl)
+        if lifetime is not None:
+            response.expires_at = response.stored_at + lifetime
+            await self._store(key, response)
+
+        return response
+
+    async def _lookup(self, key: str) -> CachedResponse | None:
+        entry: CachedResponse | None = self._memory.get(key)
+        if entry is not None or self.db is None:
+            if entry is not None:
+                entry.from_cache = True
+            return entry
+
+        row = await self.db.fetchone(
+            "SELECT url, status, headers, body, stored_at, expires_at FROM http_cache WHERE key = ?",
+            (key,),
+        )
+        if row is None:
+            return None
+
+        url, status, headers, body, stored_at, expires_at = row
+        entry = CachedResponse(url, status, json.loads(headers), body, stored_at=stored_at, expires_at=expires_at)
+        entry.from_cache = True
+
+        self.metrics["db_hit"] += 1
+        self._memory[key] = entry
+        return entry
+
+    async def _store(self, key: str, response: CachedResponse) -> None:
+        self.metrics["store"] += 1
+        self._memory[key] = response
+        if self.db is None:
+            return
+
+        await self.db.execute(
+            "INSERT OR REPLACE INTO http_cache (key, url, status, headers, body, stored_at, expires_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                str(response.url),
+                response.status,
+                json.dumps(list(response.headers.items())),
+                response.body,
+                response.stored_at,
+                response.expires_at,
+            ),
+        )
+        self._writes += 1
+        if self._writes % PRUNE_EVERY == 0:
+            await self.prune()
+        await self.db.commit()
+
+    async def prune(self) -> None:
+        """Keep only the ``max_db_entries`` most recently stored rows."""
+        if self.db is None:
+            return
+
+        await self.db.execute(
+            "DELETE FROM http_cache WHERE key NOT IN (SELECT key FROM http_cache ORDER BY stored_at DESC LIMIT ?)",
+            (self.max_db_entries,),
+        )
+
+    async def invalidate(self, url: str | yarl.URL, *, headers: Mapping[str, str] | None = None) -> None:
+        key = self.cache_key(yarl.URL(url), headers)
+        self._memory.pop(key, None)
+        if self.db is not None:
+            await self.db.execute("DELETE FROM http_cache WHERE key = ?", (key,))
+            await self.db.commit()
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import logging
+import socket
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any, NamedTuple
+
+from aiohttp import AsyncResolver, ClientRequest, ClientResponse, ClientSession, ClientTimeout, TCPConnector
+
+log = logging.getLogger("utilities.http_client")
+
+__all__ = ("HTTPClient", "HostGovernor", "HostMetrics", "HostPolicy", "TokenBucket")
+
+Handler = Callable[[ClientRequest], Awaitable[ClientResponse]]
+
+# Seconds to wait for the response headers, by class of host. The body is read
+# afterwards by the caller and is bounded by the session wide total timeout.
+TIMEOUTS: dict[str, float] = {
+    "api": 15,
+    "media": 30,
+    "webhook": 10,
+    "default": 20,
+}
+
+SESSION_TIMEOUT = ClientTimeout(total=120, sock_connect=10)
+
+
+class HostPolicy(NamedTuple):
+    concurrency: int = 8
+    rate: float = 10  # requests per second
+    burst: int = 10
+    timeout_class: str = "default"
+
+
+DEFAULT_POLICIES: dict[str, HostPolicy] = {
+    "discord.com": HostPolicy(concurrency=4, rate=5, burst=5, timeout_class="webhook"),
+    "discordapp.com": HostPolicy(concurrency=4, rate=5, burst=5, timeout_class="webhook"),
+    "cdn.discordapp.com": HostPolicy(concurrency=8, rate=20, burst=20, timeout_class="media"),
+    "media.discordapp.net": HostPolicy(concurrency=8, rate=20, burst=20, timeout_class="media"),
+    "api.github.com": HostPolicy(concurrency=4, rate=2, burst=10, timeout_class="api"),
+    "api.nasa.gov": HostPolicy(concurrency=4, rate=2, burst=5, timeout_class="api"),
+    "api.wolframalpha.com": HostPolicy(concurrency=2, rate=1, burst=3, timeout_class="api"),
+    "api.duckduckgo.com": HostPolicy(concurrency=4, rate=2, burst=5, timeout_class="api"),
+    "pypi.org": HostPolicy(concurrency=4, rate=5, burst=10, timeout_class="api"),
+    "registry.npmjs.org": HostPolicy(concurrency=4, rate=5, burst=10, timeout_class="api"),
+    "crates.io": HostPolicy(concurrency=2, rate=1, burst=5, timeout_class="api"),
+    "some-random-api.com": HostPolicy(concurrency=4, rate=2, burst=5, timeout_class="media"),
+}
+
+
+class TokenBucket:
+    """Allows ``rate`` acquisitions per second on average, and bursts of up to ``capacity``."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated_at")
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f"<TokenBucket rate={self.rate} capacity={self.capacity} tokens={self.tokens:.2f}>"
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def delay(self) -> float:
+        """Seconds until a token is available, ``0`` if one can be taken right now."""
+        self._refill()
+        return 0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    async def acquire(self) -> None:
+        # other acquirers may take the token first, so the delay is computed again after sleeping
+        while (delay := self.delay()) > 0:  # noqa: ASYNC110
+            await asyncio.sleep(delay)
+        self.tokens -= 1
+
+
+class HostMetrics:
+    __slots__ = ("requests", "errors", "rate_limited", "statuses", "total_latency", "max_latency", "in_flight")
+
+    def __init__(self) -> None:
+        self.requests: int = 0
+        self.errors: int = 0
+        self.rate_limited: int = 0
+        self.statuses: Counter[int] = Counter()
+        self.total_latency: float = 0
+        self.max_latency: float = 0
+        self.in_flight: int = 0
+
+    def __repr__(self) -> str:
+        return f"<HostMetrics requests={self.requests} errors={self.errors} avg_latency={self.avg_latency:.3f}>"
+
+    @property
+    def avg_latency(self) -> float:
+        return self.total_latency / self.requests if self.requests else 0
+
+    def record(self, latency: float, *, status: int | None = None) -> None:
+        self.requests += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        if status is None:
+            self.errors += 1
+        else:
+            self.statuses[status] += 1
+            if status >= 500:
+                self.errors += 1
+            if status == 429:
+                self.rate_limited += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "rate_limited": self.rate_limited,
+            "in_flight": self.in_flight,
+            "avg_latency": round(self.avg_latency, 4),
+            "max_latency": round(self.max_latency, 4),
+            "statuses": dict(self.statuses),
+        }
+
+
+class HostGovernor:
+    """Concurrency cap, token bucket and 429 back-off for a single host."""
+
+    __slots__ = ("host", "policy", "semaphore", "bucket", "blocked_until", "metrics")
+
+    def __init__(self, host: str, policy: HostPolicy) -> None:
+        self.host = host
+        self.policy = policy
+        self.semaphore = asyncio.Semaphore(policy.concurrency)
+        self.bucket = TokenBucket(policy.rate, policy.burst)
+        self.blocked_until: float = 0
+        self.metrics = HostMetrics()
+
+    def __repr__(self) -> str:
+        return f"<HostGovernor host={self.host!r} policy={self.policy}>"
+
+    @property
+    def timeout(self) -> float:
+        return TIMEOUTS.get(self.policy.timeout_class, TIMEOUTS["default"])
+
+    def block(self, seconds: float) -> None:
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    async def __aenter__(self) -> HostGovernor:
+        await self.semaphore.acquire()
+        try:
+            # a 429 may push blocked_until back while sleeping, so it is checked again
+            while (delay := self.blocked_until - time.monotonic()) > 0:  # noqa: ASYNC110
+                await asyncio.sleep(delay)
+            await self.bucket.acquire()
+        except BaseException:
+            self.semaphore.release()
+            raise
+        self.metrics.in_flight += 1
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.metrics.in_flight -= 1
+        self.semaphore.release()
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> float | None:
+    """Seconds to wait from ``Retry-After`` (seconds or HTTP date) or ``X-RateLimit-Reset-After``."""
+    value = headers.get("Retry-After") or headers.get("X-RateLimit-Reset-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        return max(email.utils.parsedate_to_datetime(value).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+class HTTPClient:
+    """Owns the bot's :class:`aiohttp.ClientSession`.
+
+    Every request made through the session passes a client middleware that applies the
+    host's :class:`HostPolicy` (concurrency cap, token bucket and header timeout),
+    retries ``429`` responses after ``Retry-After`` and records per-host latency and
+    error metrics. The session is created lazily, and again if something closed it.
+    """
+
+    def __init__(
+        self,
+        *,
+        policies: Mapping[str, HostPolicy] | None = None,
+        default_policy: HostPolicy | None = None,
+        max_retries: int = 3,
+        max_retry_after: float = 60,
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 16,
+        dns_cache_ttl: int = 300,
+    ) -> None:
+        self.policies: dict[str, HostPolicy] = dict(DEFAULT_POLICIES if policies is None else policies)
+        self.default_policy = default_policy or HostPolicy()
+        self.max_retries = max_retries
+        self.max_retry_after = max_retry_after
+
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+
+        self._session: ClientSession | None = None
+        self._governors: dict[str, HostGovernor] = {}
+
+    def __repr__(self) -> str:
+        return f"<HTTPClient hosts={len(self._governors)} open={self._session is not None and not self._session.closed}>"
+
+    def _create_session(self) -> ClientSession:
+        connector = TCPConnector(
+            resolver=AsyncResolver(),
+            family=socket.AF_INET,
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True,
+            keepalive_timeout=30,
+        )
+        return ClientSession(connector=connector, timeout=SESSION_TIMEOUT, middlewares=(self._middleware,))
+
+    @property
+    def session(self) -> ClientSession:
+        if self._session is None or self._session.closed:
+            if self._session is not None:
+                log.warning("HTTP session is closed. Creating new session")
+            self._session = self._create_session()
+        return self._session
+
+    def governor(self, host: str) -> HostGovernor:
+        if host not in self._governors:
+            self._governors[host] = HostGovernor(host, self.policies.get(host, self.default_policy))
+        return self._governors[host]
+
+    async def _middleware(self, request: ClientRequest, handler: Handler) -> ClientResponse:
+        governor = self.governor(request.url.host or "")
+
+        attempt = 0
+        while True:
+            async with governor:
+                start = time.perf_counter()
+                try:
+                    response = await asyncio.wait_for(handler(request), timeout=governor.timeout)
+                except BaseException:
+                    governor.metrics.record(time.perf_counter() - start)
+                    raise
+                governor.metrics.record(time.perf_counter() - start, status=response.status)
+
+            if response.status != 429 or attempt >= self.max_retries:
+                return response
+
+            retry_after = parse_retry_after(response.headers)
+            if retry_after is None:
+                retry_after = 2**attempt
+            if retry_after > self.max_retry_after:
+                return response
+
+            log.warning("Rate limited by %s, retrying in %.2fs (attempt %s)", governor.host, retry_after, attempt + 1)
+            governor.block(retry_after)
+            response.release()
+            attempt += 1
+
+    def get(self, url: Any, **kwargs: Any) -> Any:
+        return self.session.get(url, **kwargs)
+
+    def post(self, url: Any, **kwargs: Any) -> Any:
+        return self.session.post(url, **kwargs)
+
+    def request(self, method: str, url: Any, **kwargs: Any) -> Any:
+        return self.session.request(method, url, **kwargs)
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        return {host: governor.metrics.to_dict() for host, governor in self._governors.items()}
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
@@ -1,28 +1,45 @@
 from __future__ import annotations
 
 import re
+from functools import cache
 from io import BytesIO
 from statistics import StatisticsError, mean, mode, quantiles
 from typing import TYPE_CHECKING
 
-import matplotlib
-import numpy as np
-from matplotlib import pyplot as plt
-from matplotlib.font_manager import FontProperties
-from sympy import lambdify, symbols, sympify
-
 import discord
 from core import Context
+from utilities.lazy import lazy, lazy_import
 
 if TYPE_CHECKING:
     from matplotlib.axes import Axes
     from matplotlib.figure import Figure
+    from matplotlib.font_manager import FontProperties
 
-matplotlib.use("agg")
-plt.style.use(("bmh", "ggplot"))
 __all__: tuple[str, ...] = ("boxplot", "plotfn")
 
-CODEFONT: FontProperties = FontProperties(fname="extra/Monaco-Linux.ttf")
+
+def _pyplot():
+    import matplotlib
+
+    matplotlib.use("agg")
+    from matplotlib import pyplot
+
+    pyplot.style.use(("bmh", "ggplot"))
+    return pyplot
+
+
+# matplotlib, numpy and sympy take over a second to import, and only these commands need them
+plt = lazy("matplotlib.pyplot", _pyplot)
+np = lazy_import("numpy")
+sympy = lazy_import("sympy")
+
+
+@cache
+def codefont() -> FontProperties:
+    # not a lazy proxy, matplotlib checks ``isinstance(..., FontProperties)``
+    from matplotlib.font_manager import FontProperties
+
+    return FontProperties(fname="extra/Monaco-Linux.ttf")
 
 
 def boxplot(_: Context, data: list[float], *, fill_boxes: bool = True) -> discord.File:
@@ -51,23 +68,24 @@ def boxplot(_: Context, data: list[float], *, fill_boxes: bool = True) -> discor
         median.set(color="#b54d6a", linewidth=2)
 
     x = ax.get_xticks()[1]
+    font = codefont()
 
     _min, _max = min(data), max(data)
-    ax.text(x, 1.4, f"Min: {_min}", fontproperties=CODEFONT)
-    ax.text(x, 1.34, f"Max: {_max}", fontproperties=CODEFONT)
-    ax.text(x, 1.28, f"Range: {_max - _min}", fontproperties=CODEFONT)
-    ax.text(x, 1.22, f"Mean: {mean(data)}", fontproperties=CODEFONT)
-    ax.text(x, 1.16, f"Mode: {mode(data)}", fontproperties=CODEFONT)
+    ax.text(x, 1.4, f"Min: {_min}", fontproperties=font)
+    ax.text(x, 1.34, f"Max: {_max}", fontproperties=font)
+    ax.text(x, 1.28, f"Range: {_max - _min}", fontproperties=font)
+    ax.text(x, 1.22, f"Mean: {mean(data)}", fontproperties=font)
+    ax.text(x, 1.16, f"Mode: {mode(data)}", fontproperties=font)
 
     try:
         q1, q2, q3 = quantiles(data, n=4)
     except StatisticsError:
         q1 = q2 = q3 = data[0]
 
-    ax.text(x, 0.8, f"Q1: {q1}", fontproperties=CODEFONT)
-    ax.text(x, 0.74, f"Q2: {q2}", fontproperties=CODEFONT)
-    ax.text(x, 0.68, f"Q3: {q3}", fontproperties=CODEFONT)
-    ax.text(x, 0.62, f"IQR: {q3 - q1}", fontproperties=CODEFONT)
+    ax.text(x, 0.8, f"Q1: {q1}", fontproperties=font)
+    ax.text(x, 0.74, f"Q2: {q2}", fontproperties=font)
+    ax.text(x, 0.68, f"Q3: {q3}", fontproperties=font)
+    ax.text(x, 0.62, f"IQR: {q3 - q1}", fontproperties=font)
 
     buffer = BytesIO()
     plt.savefig(buffer)
@@ -89,10 +107,10 @@ def _clean_implicit_mul(equation: str) -> str:
 
 
 def plotfn(_, equation: str, *, xrange: tuple[int, int] = (-20, 20)) -> discord.File:
-    x = symbols("x")
+    x = sympy.symbols("x")
     equation = _clean_implicit_mul(equation)
-    expr = sympify(equation)  # Convert equation string to a Sympy expression
-    func = lambdify(x, expr)  # Create a function from the Sympy expression
+    expr = sympy.sympify(equation)  # Convert equation string to a Sympy expression
+    func = sympy.lambdify(x, expr)  # Create a function from the Sympy expression
 
     x_vals = np.linspace(*xrange, 500)
     y_vals = func(x_vals)  # Evaluate the function for the x-values
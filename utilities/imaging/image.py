@@ -8,20 +8,25 @@ from itertools import cycle
 from math import ceil
 from typing import TYPE_CHECKING, Any, Concatenate, Final, ParamSpec, TypeAlias, TypeVar
 
-import cv2
-import numpy as np
 from PIL import Image, ImageChops, ImageDraw, ImageOps, ImageSequence
-from wand.drawing import Drawing
-from wand.image import Image as WandImage
-from wand.sequence import Sequence
 
 import discord
 from discord.ext import commands
 
 from ..converters import ImageConverter
 from ..exceptions import TooManyFrames
+from ..lazy import lazy_import
+
+# imported when an image command first runs, not when the bot starts
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
+wand_drawing = lazy_import("wand.drawing")
+wand_images = lazy_import("wand.image")
+wand_sequence = lazy_import("wand.sequence")
 
 if TYPE_CHECKING:
+    from wand.image import Image as WandImage
+
     from core import Context
 
     IT = TypeVar("IT")
@@ -80,7 +85,7 @@ def svg_to_png(
     width: int = 500,
     height: int = 500,
 ) -> bytes:
-    with WandImage(
+    with wand_images.Image(
         blob=svg_bytes,
         format="svg",
         width=width,
@@ -100,7 +105,7 @@ async def run_threaded(func: Callable[[BytesIO], R | R_], argument: BytesIO, *,
 def check_frame_amount(img: Image.Image | WandImage, max_frames: int = MAX_FRAMES) -> None:
     if isinstance(img, Image.Image):
         n_frames = getattr(img, "n_frames", 1)
-    elif isinstance(img, WandImage):
+    elif isinstance(img, wand_images.Image):
         n_frames = len(img.sequence)
     else:
         n_frames = len(img)
@@ -113,7 +118,7 @@ def process_gif(
     img: WandImage | Image.Image,
     iterable: Iterable[IT],
 ) -> Iterable[tuple[WandImage | Image.Image, IT]]:
-    if isinstance(img, WandImage):
+    if isinstance(img, wand_images.Image):
         seq = img.sequence
     else:
         seq = ImageSequence.Iterator(img)
@@ -131,9 +136,9 @@ def get_closest_color(px: tuple[int, ...], sample: list | np.ndarray, *, reverse
 
 
 def wand_circle_mask(width: int, height: int) -> WandImage:
-    mask = WandImage(width=width, height=height, background="transparent", colorspace="gray")
+    mask = wand_images.Image(width=width, height=height, background="transparent", colorspace="gray")
     mask.antialias = True
-    with Drawing() as draw:
+    with wand_drawing.Drawing() as draw:
         draw.stroke_color = "black"
         draw.stroke_width = 1
         draw.fill_color = "white"
@@ -178,7 +183,7 @@ def _get_prop_size(
     width: int | None = None,
     height: int | None = None,
 ) -> tuple[int, int]:
-    if isinstance(image, Image.Image | WandImage):
+    if isinstance(image, Image.Image | wand_images.Image):
         w, h = image.size
     else:
         h, w, *_ = image.shape
@@ -251,7 +256,7 @@ def resize_cv_prop(
     width: int | None = None,
     height: int | None = None,
     *,
-    resampling: int = cv2.INTER_LANCZOS4,
+    resampling: int = 4,  # cv2.INTER_LANCZOS4, without importing cv2 for the default
 ) -> np.ndarray:
     if not (width and height):
         width, height = _get_prop_size(image, width, height)
@@ -265,12 +270,12 @@ def wand_save_list(
 ) -> WandImage:
     is_pil = isinstance(frames, ImageSequence.Iterator) or isinstance(frames[0], Image.Image)
 
-    base = WandImage()
+    base = wand_images.Image()
 
     for i, frame in enumerate(frames):
         if is_pil:
             frame = np.asarray(frame.convert("RGBA"))
-            frame = WandImage.from_array(frame)
+            frame = wand_images.Image.from_array(frame)
 
         frame.dispose = "background"
 
@@ -401,10 +406,10 @@ def wand_image(
             def inner(image: BytesIO) -> R_:
                 durations = None
                 if not pass_buf:
-                    image: WandImage = WandImage(file=image)
+                    image: WandImage = wand_images.Image(file=image)
                     image.background_color = "none"
 
-                    durations = [frame.delay for frame in Sequence(image)]
+                    durations = [frame.delay for frame in wand_sequence.Sequence(image)]
 
                     if width or height:
                         image = resize_wand_prop(image, width, height)
@@ -416,7 +421,7 @@ def wand_image(
                 else:
                     result = func(ctx, image, *args, **kwargs)
 
-                if auto_save and isinstance(result, WandImage | list):
+                if auto_save and isinstance(result, wand_images.Image | list):
                     result = save_wand_image(result, duration=durations or duration, file=to_file)
                 return result
 
@@ -435,7 +440,7 @@ def _convert_to_arr(
     if image.mode != img_mode.upper():
         if isinstance(image, Image.Image):
             image = image.convert(img_mode.upper())
-        elif isinstance(image, WandImage):
+        elif isinstance(image, wand_images.Image):
             image.transform_colorspace(img_mode.lower())
 
     arr = np.asarray(image)
@@ -450,8 +455,8 @@ def _convert_from_arr(
     if isinstance(arr, np.ndarray):
         arr = cv2.cvtColor(arr, arr_mode)
 
-        if isinstance(og_image, WandImage):
-            arr: WandImage = WandImage.from_array(arr)
+        if isinstance(og_image, wand_images.Image):
+            arr: WandImage = wand_images.Image.from_array(arr)
             if arr.format == "MIFF":
                 arr.format = "png"
         elif isinstance(og_image, Image.Image):
@@ -461,7 +466,7 @@ def _convert_from_arr(
 
 def to_array(
     img_mode: str = "RGB",
-    arr_mode: int = cv2.COLOR_RGB2BGR,
+    arr_mode: int = 4,  # cv2.COLOR_RGB2BGR
 ) -> Callable[[WandFunction | PillowFunction], WandFunction | PillowFunction]:
     def decorator(func: WandFunction | PillowFunction) -> WandFunction | PillowFunction:
         def inner(ctx: C, image: I | I_ | list[I | I_], *args: P.args, **kwargs: P.kwargs) -> R | R_:
@@ -0,0 +1,164 @@
+"""Lazily imported modules, and what the imports of the process cost.
+
+``np = lazy_import("numpy")`` is a proxy that imports numpy the first time an attribute of it
+is used. Proxy modules only, never classes: ``isinstance(x, proxy)`` is always ``False`` for a
+proxied class, so reach the class through its module (``wand_image.Image``).
+
+:data:`profiler` times every ``import`` statement that loads something new while it is
+installed (main.py installs it before importing anything else, ``Parrot.on_ready`` removes it
+once the bot is warm), and every lazy import when it happens. The ``importtime`` owner command shows the result.
+"""
+
+from __future__ import annotations
+
+import builtins
+import importlib
+import importlib.util
+import sys
+import threading
+import time
+from collections.abc import Callable
+from types import ModuleType
+from typing import Any, NamedTuple, cast
+
+import lazy_object_proxy
+
+__all__ = ("ImportProfiler", "ImportRecord", "is_loaded", "lazy", "lazy_import", "lazy_modules", "profiler")
+
+
+class ImportRecord(NamedTuple):
+    name: str
+    # including the imports it caused
+    total: float
+    # without them
+    own: float
+    lazy: bool = False
+
+
+class ImportProfiler:
+    def __init__(self) -> None:
+        self.records: dict[str, ImportRecord] = {}
+        self._original: Callable[..., ModuleType] | None = None
+        self._local = threading.local()
+
+    def __repr__(self) -> str:
+        return f"<ImportProfiler installed={self.installed} records={len(self.records)}>"
+
+    @property
+    def installed(self) -> bool:
+        return self._original is not None
+
+    def install(self) -> None:
+        if self._original is None:
+            self._original = builtins.__import__
+            builtins.__import__ = self._import
+
+    def uninstall(self) -> None:
+        if self._original is not None:
+            builtins.__import__ = self._original
+            self._original = None
+
+    def record(self, name: str, total: float, own: float, *, lazy: bool = False) -> None:
+        previous = self.records.get(name)
+        if previous is not None:
+            total, own = total + previous.total, own + previous.own
+        self.records[name] = ImportRecord(name, total, own, lazy or (previous is not None and previous.lazy))
+
+    def _stack(self) -> list[float]:
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def measure(self, name: str, load: Callable[[], Any], *, lazy: bool = False) -> Any:
+        """Call ``load`` and record its time under ``name``, apart from the imports it caused."""
+        stack = self._stack()
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return load()
+        finally:
+            total = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += total
+            self.record(name, total, total - children, lazy=lazy)
+
+    def _import(
+        self,
+        name: str,
+        globals: dict[str, Any] | None = None,  # noqa: A002
+        locals: dict[str, Any] | None = None,  # noqa: A002
+        fromlist: tuple[str, ...] | list[str] = (),
+        level: int = 0,
+    ) -> ModuleType:
+        original = self._original
+        assert original is not None
+        if not level and not fromlist and name in sys.modules:
+            # already imported, the common case once the bot is running
+            return original(name, globals, locals, fromlist, level)
+
+        before = len(sys.modules)
+        stack = self._stack()
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            total = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += total
+            if len(sys.modules) > before:
+                if level and globals is not None:
+                    name = importlib.util.resolve_name("." * level + name, globals.get("__package__"))
+                self.record(name, total, total - children)
+
+    def top(self, count: int = 20) -> list[ImportRecord]:
+        """The most expensive imports by their own time."""
+        return sorted(self.records.values(), key=lambda record: record.own, reverse=True)[:count]
+
+    def by_package(self, count: int = 20) -> list[tuple[str, float]]:
+        """The own time of every import, summed per top level package."""
+        packages: dict[str, float] = {}
+        for record in self.records.values():
+            package = record.name.partition(".")[0]
+            packages[package] = packages.get(package, 0) + record.own
+        return sorted(packages.items(), key=lambda item: item[1], reverse=True)[:count]
+
+
+profiler = ImportProfiler()
+
+_lazy: dict[str, Any] = {}
+
+
+def lazy(name: str, factory: Callable[[], Any]) -> Any:
+    """A proxy for what ``factory`` returns, created the first time it is used.
+
+    The time ``factory`` took is recorded under ``name``.
+    """
+
+    def load() -> Any:
+        return profiler.measure(name, factory, lazy=True)
+
+    proxy = lazy_object_proxy.Proxy(load)
+    _lazy[name] = proxy
+    return proxy
+
+
+def lazy_import(name: str) -> ModuleType:
+    """The module ``name``, imported the first time one of its attributes is used."""
+    if name in _lazy:
+        return cast(ModuleType, _lazy[name])
+    return cast(ModuleType, lazy(name, lambda: importlib.import_module(name)))
+
+
+def is_loaded(name: str) -> bool | None:
+    """Whether the lazy module ``name`` was imported yet, ``None`` if there is no such lazy module."""
+    proxy = _lazy.get(name)
+    return None if proxy is None else proxy.__resolved__
+
+
+def lazy_modules() -> dict[str, bool]:
+    return {name: proxy.__resolved__ for name, proxy in _lazy.items()}
@@ -0,0 +1,365 @@
+"""Word lists, loaded once per process and shared by every word game.
+
+A :class:`Lexicon` is one sorted blob of UTF-8 words and a few ``uint32`` arrays over it:
+where each word starts, the words ordered by length, and an open addressing hash table.
+That is O(1) membership, prefix ranges by binary search, random words of a given length
+without scanning, in less than half the memory of a list of ``str``.
+
+The same layout is the file format. :func:`lexicon` compiles a word list to
+``temp/lexicon/<name>.lex`` the first time and memory-maps it afterwards: loading is
+instant, and the pages are shared with every other process of the bot. Views
+(:meth:`Lexicon.view`) filter a lexicon for one game without copying a word.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import mmap
+import os
+import random
+import struct
+import threading
+import zlib
+from array import array
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import NamedTuple, overload
+
+log = logging.getLogger("utilities.lexicon")
+
+__all__ = ("SOURCES", "Lexicon", "LexiconView", "Source", "lexicon")
+
+LEXICON_DIRECTORY = "temp/lexicon"
+LEXICON_HEADER = b"# Parrot lexicon version 1\n"
+# count, length buckets, table size, blob size
+LEXICON_SIZES = struct.Struct("<4I")
+
+
+class Lexicon(Sequence[str]):
+    """A sorted, deduplicated word list, in one buffer.
+
+    ``Lexicon(words)`` builds one in memory, :meth:`from_buffer` reads the serialized form
+    (``bytes``, or an ``mmap`` to share it). Words sort by code point.
+    """
+
+    def __init__(self, words: Iterable[str] = (), *, stamp: str = "") -> None:
+        self._read(compile_words(words, stamp=stamp))
+
+    @classmethod
+    def from_buffer(cls, buffer: bytes | mmap.mmap) -> Lexicon:
+        self = cls.__new__(cls)
+        self._read(buffer)
+        return self
+
+    @classmethod
+    def open(cls, path: str) -> Lexicon:
+        """Memory-map a compiled lexicon, see :func:`compile_words`."""
+        with open(path, "rb") as f:
+            return cls.from_buffer(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def _read(self, data: bytes | mmap.mmap) -> None:
+        buffer = memoryview(data)
+        if buffer[: len(LEXICON_HEADER)] != LEXICON_HEADER:
+            msg = "Not a lexicon"
+            raise ValueError(msg)
+        end = bytes(buffer[len(LEXICON_HEADER) : len(LEXICON_HEADER) + 256]).index(b"\n") + len(LEXICON_HEADER)
+        self.stamp = bytes(buffer[len(LEXICON_HEADER) : end]).decode()
+
+        position = _align(end + 1)
+        count, buckets, table_size, blob_size = LEXICON_SIZES.unpack_from(buffer, position)
+        position += LEXICON_SIZES.size
+
+        def take(size: int) -> memoryview:
+            nonlocal position
+            part = buffer[position : position + 4 * size].cast("I")
+            position += 4 * size
+            return part
+
+        self.size = count
+        # word i is blob[offsets[i]:offsets[i + 1]]
+        self.offsets = take(count + 1)
+        # word indices by length, the words of length n are by_length[length_starts[n]:length_starts[n + 1]]
+        self.by_length = take(count)
+        self.length_starts = take(buckets)
+        # index + 1 of the word hashing there, 0 if empty
+        self.table = take(table_size)
+        self.mask = table_size - 1
+        self.blob = buffer[position : position + blob_size]
+        # words are sliced out of bytes and mmap as bytes directly, the fastest way there is
+        self._data = data
+        self._start = position
+        if len(self.blob) != blob_size:
+            msg = "Truncated lexicon"
+            raise ValueError(msg)
+
+    def __repr__(self) -> str:
+        return f"<Lexicon words={self.size} bytes={self.nbytes}>"
+
+    @property
+    def nbytes(self) -> int:
+        return sum(part.nbytes for part in (self.offsets, self.by_length, self.length_starts, self.table, self.blob))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def key(self, index: int) -> bytes:
+        """Word ``index``, encoded."""
+        return self._data[self._start + self.offsets[index] : self._start + self.offsets[index + 1]]
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.size))]
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            msg = "Lexicon index out of range"
+            raise IndexError(msg)
+        return self.key(index).decode()
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self.size):
+            yield self[index]
+
+    def index(self, word: str, start: int = 0, stop: int | None = None) -> int:
+        index = self.find(word)
+        if not start <= index < (self.size if stop is None else stop):
+            msg = f"{word!r} is not in the lexicon"
+            raise ValueError(msg)
+        return index
+
+    def find(self, word: str) -> int:
+        """Index of ``word``, ``-1`` if it is not in the lexicon."""
+        key = word.encode()
+        slot = zlib.crc32(key) & self.mask
+        while entry := self.table[slot]:
+            if self.key(entry - 1) == key:
+                return entry - 1
+            slot = (slot + 1) & self.mask
+        return -1
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self.find(word) >= 0
+
+    def span(self, prefix: str, lo: int = 0, hi: int | None = None) -> tuple[int, int]:
+        """The ``[start, end)`` run of the words starting with ``prefix``, searched within ``lo:hi``."""
+        key = prefix.encode()
+        start = self._bisect(key, lo, self.size if hi is None else hi)
+        # no UTF-8 sequence has a 0xff byte, every word with the prefix sorts before this
+        return start, self._bisect(key + b"\xff", start, self.size if hi is None else hi)
+
+    def _bisect(self, key: bytes, lo: int, hi: int) -> int:
+        while lo < hi:
+            middle = (lo + hi) // 2
+            if self.key(middle) < key:
+                lo = middle + 1
+            else:
+                hi = middle
+        return lo
+
+    def with_prefix(self, prefix: str) -> LexiconView:
+        return LexiconView(self, range(*self.span(prefix)), prefix=prefix)
+
+    def length_range(self, min_length: int = 0, max_length: int | None = None) -> range:
+        """Positions in ``by_length`` of the words of ``min_length`` to ``max_length`` characters."""
+        buckets = len(self.length_starts) - 1
+        low = min(max(min_length, 0), buckets)
+        high = buckets if max_length is None else min(max(max_length + 1, low), buckets)
+        return range(self.length_starts[low], self.length_starts[high])
+
+    def view(
+        self,
+        *,
+        min_length: int = 0,
+        max_length: int | None = None,
+        predicate: Callable[[str], bool] | None = None,
+    ) -> LexiconView:
+        """The words of ``min_length`` to ``max_length`` characters for which ``predicate`` is true.
+
+        Without a predicate the view is a slice of the length index and costs nothing, with
+        one it holds 4 bytes per matching word.
+        """
+        positions = self.length_range(min_length, max_length)
+        indices: Sequence[int] = self.by_length[positions.start : positions.stop]
+        if predicate is not None:
+            indices = array("I", (index for index in indices if predicate(self[index])))
+        return LexiconView(self, indices, min_length=min_length, max_length=max_length, predicate=predicate)
+
+    def random(self, *, min_length: int = 0, max_length: int | None = None) -> str:
+        positions = self.length_range(min_length, max_length)
+        if not positions:
+            msg = f"No words of {min_length} to {max_length} characters"
+            raise IndexError(msg)
+        return self[self.by_length[random.choice(positions)]]
+
+
+class LexiconView(Sequence[str]):
+    """Some words of a :class:`Lexicon`, by index. Membership checks the filter, not a list."""
+
+    def __init__(
+        self,
+        lexicon: Lexicon,
+        indices: Sequence[int],
+        *,
+        prefix: str = "",
+        min_length: int = 0,
+        max_length: int | None = None,
+        predicate: Callable[[str], bool] | None = None,
+    ) -> None:
+        self.lexicon = lexicon
+        self.indices = indices
+        self.prefix = prefix
+        self.min_length = min_length
+        self.max_length = max_length
+        self.predicate = predicate
+
+    def __repr__(self) -> str:
+        return f"<LexiconView words={len(self)} of {self.lexicon!r}>"
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self.lexicon[i] for i in self.indices[index]]
+        return self.lexicon[self.indices[index]]
+
+    def __iter__(self) -> Iterator[str]:
+        for index in self.indices:
+            yield self.lexicon[index]
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str) or not word.startswith(self.prefix) or len(word) < self.min_length:
+            return False
+        if self.max_length is not None and len(word) > self.max_length:
+            return False
+        return (self.predicate is None or self.predicate(word)) and word in self.lexicon
+
+
+def _align(position: int) -> int:
+    return (position + 3) & ~3
+
+
+def compile_words(words: Iterable[str], *, stamp: str = "") -> bytes:
+    """The serialized :class:`Lexicon` of ``words``, empty strings and duplicates dropped.
+
+    The header, the stamp (what the words were compiled from) on one line, then ``uint32``
+    arrays of the machine's byte order and the blob, all 4 byte aligned.
+    """
+    encoded = sorted({word.encode() for word in words if word})
+    count = len(encoded)
+
+    offsets = array("I", itertools.accumulate(map(len, encoded), initial=0))
+    lengths = [len(word.decode()) for word in encoded]
+    by_length = array("I", sorted(range(count), key=lengths.__getitem__))
+    counts = Counter(lengths)
+    length_starts = array("I", itertools.accumulate((counts[length] for length in range(max(counts, default=0) + 1)), initial=0))
+
+    # at most half full, so a missing word is found missing after a probe or two
+    table_size = 1 << max(3, (2 * count).bit_length())
+    table = array("I", bytes(4 * table_size))
+    for index, word in enumerate(encoded):
+        slot = zlib.crc32(word) & (table_size - 1)
+        while table[slot]:
+            slot = (slot + 1) & (table_size - 1)
+        table[slot] = index + 1
+
+    header = LEXICON_HEADER + stamp.encode() + b"\n"
+    header += bytes(_align(len(header)) - len(header))
+    blob = b"".join(encoded)
+    sizes = LEXICON_SIZES.pack(count, len(length_starts), table_size, len(blob))
+    return b"".join(
+        (header, sizes, offsets.tobytes(), by_length.tobytes(), length_starts.tobytes(), table.tobytes(), blob),
+    )
+
+
+class Source(NamedTuple):
+    # the words
+    load: Callable[[], Iterable[str]]
+    # changes when the words do, a compiled lexicon with another stamp is compiled again
+    stamp: Callable[[], str]
+
+
+def text_file(path: str, *, transform: Callable[[str], str] = str.strip) -> Source:
+    """A word per line of ``path``."""
+
+    def load() -> list[str]:
+        with open(path, encoding="utf-8", errors="ignore") as f:
+            return [transform(line) for line in f]
+
+    def stamp() -> str:
+        status = os.stat(path)
+        return f"{path} {status.st_size} {status.st_mtime_ns}"
+
+    return Source(load, stamp)
+
+
+def _english_words() -> Iterable[str]:
+    from english_words import get_english_words_set
+
+    return get_english_words_set(["web2"], alpha=True, lower=True)
+
+
+def _english_words_stamp() -> str:
+    from importlib.metadata import version
+
+    return f"english-words {version('english-words')} web2"
+
+
+SOURCES: dict[str, Source] = {
+    "boggle": text_file("extra/boggle.txt"),
+    "english": Source(_english_words, _english_words_stamp),
+    "hangman": text_file("extra/hangman_words.txt"),
+    "wordle": text_file("extra/5_words.txt"),
+}
+
+_lexicons: dict[str, Lexicon] = {}
+_lock = threading.Lock()
+
+
+def lexicon(name: str) -> Lexicon:
+    """The word list ``name`` of :data:`SOURCES`, loaded on first use. Safe to call from threads."""
+    if (loaded := _lexicons.get(name)) is not None:
+        return loaded
+
+    with _lock:
+        if (loaded := _lexicons.get(name)) is not None:
+            return loaded
+        _lexicons[name] = loaded = _load(name, SOURCES[name])
+        return loaded
+
+
+def _load(name: str, source: Source) -> Lexicon:
+    stamp = source.stamp()
+    path = os.path.join(LEXICON_DIRECTORY, f"{name}.lex")
+    try:
+        compiled = Lexicon.open(path)
+    except (OSError, ValueError):
+        pass
+    else:
+        if compiled.stamp == stamp:
+            return compiled
+
+    data = compile_words(source.load(), stamp=stamp)
+    try:
+        os.makedirs(LEXICON_DIRECTORY, exist_ok=True)
+        temporary = f"{path}.{os.getpid()}"
+        with open(temporary, "wb") as f:
+            f.write(data)
+        os.replace(temporary, path)
+        return Lexicon.open(path)
+    except OSError as e:
+        log.warning("Could not cache the %s lexicon, keeping it in memory: %s", name, e)
+        return Lexicon.from_buffer(data)
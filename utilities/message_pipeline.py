@@ -0,0 +1,269 @@
+"""One ``on_message`` for the whole bot.
+
+Every guild message is parsed once into a :class:`MessageContext` (author flags, role ids, the
+guild configuration, lowercased words and links, the channel's features) and then handed to the
+registered stages in order. Cheap stages that can reject or delete a message go first; once a
+stage deletes the message or calls :meth:`MessageContext.stop`, the remaining stages are skipped.
+
+Stages that wait on the network or on the user are registered with ``background=True``. They are
+started in order like every other stage but do not hold up the ones after them.
+
+Every stage is timed. A stage that takes longer than its budget is logged and counted, the
+numbers are shown by the ``pipelinestats`` owner command.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import discord
+from utilities.channel_index import Feature
+from utilities.regex import LINKS_RE
+
+if TYPE_CHECKING:
+    from core import Parrot
+    from core.types import PostType
+
+log = logging.getLogger("utilities.message_pipeline")
+
+__all__ = ("MessageContext", "MessagePipeline", "Stage", "StageStats")
+
+StageCallback = Callable[["MessageContext"], Awaitable[Any]]
+
+
+class MessageContext:
+    """Everything the stages need to know about a message, computed at most once."""
+
+    def __init__(self, bot: Parrot, message: discord.Message) -> None:
+        self.bot = bot
+        self.message = message
+        self.guild = message.guild
+        self.channel = message.channel
+        self.author = message.author
+
+        self.is_bot: bool = message.author.bot
+        self.is_webhook: bool = message.webhook_id is not None
+        self.is_self: bool = bot.user is not None and message.author.id == bot.user.id
+
+        self.deleted = False
+        self.stopped = False
+        self.timings: dict[str, float] = {}
+
+        self._config: PostType | None = None
+
+    def __repr__(self) -> str:
+        return f"<MessageContext message={self.message.id} deleted={self.deleted} stopped={self.stopped}>"
+
+    @property
+    def done(self) -> bool:
+        return self.deleted or self.stopped
+
+    def stop(self) -> None:
+        """Skip the remaining stages, e.g. because the message was consumed."""
+        self.stopped = True
+
+    async def delete(self, *, delay: float | None = None) -> None:
+        """Delete the message and skip the remaining stages."""
+        self.deleted = True
+        await self.message.delete(delay=delay)
+
+    @cached_property
+    def content(self) -> str:
+        return self.message.content
+
+    @cached_property
+    def lower(self) -> str:
+        return self.content.lower()
+
+    @cached_property
+    def words(self) -> tuple[str, ...]:
+        return tuple(self.lower.replace(",", "").split())
+
+    @cached_property
+    def links(self) -> tuple[str, ...]:
+        return tuple(match.group(0) for match in LINKS_RE.finditer(self.content))
+
+    @cached_property
+    def role_ids(self) -> frozenset[int]:
+        return frozenset(getattr(self.author, "_roles", ()))
+
+    @cached_property
+    def features(self) -> Feature:
+        return self.bot.channel_index.features(self.channel.id)
+
+    async def config(self) -> PostType | None:
+        """The guild configuration, read from Mongo only if it is not cached already."""
+        if self._config is None and self.guild is not None:
+            await self.bot.ensure_guild_cache(self.guild)
+            self._config = self.bot.guild_configurations_cache.get(self.guild.id)
+        return self._config
+
+
+class Stage(NamedTuple):
+    name: str
+    callback: StageCallback
+    order: int
+    # seconds, anything slower is logged
+    budget: float
+    bots: bool = False
+    dms: bool = False
+    background: bool = False
+    # the bot's own messages, which are also bot messages: needs ``bots`` as well
+    self_messages: bool = False
+
+    def accepts(self, ctx: MessageContext) -> bool:
+        if ctx.is_self and not self.self_messages:
+            return False
+        if ctx.is_bot and not self.bots:
+            return False
+        return ctx.guild is not None or self.dms
+
+
+class StageStats:
+    __slots__ = ("calls", "errors", "max", "over_budget", "skipped", "total")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.skipped = 0
+        self.errors = 0
+        self.over_budget = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @property
+    def average(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+    def record(self, elapsed: float, *, budget: float) -> None:
+        self.calls += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        if elapsed > budget:
+            self.over_budget += 1
+
+
+class MessagePipeline:
+    """The registered stages, and the loop that runs them for every message."""
+
+    def __init__(self, bot: Parrot, *, default_budget: float = 0.25) -> None:
+        self.bot = bot
+        self.default_budget = default_budget
+
+        self._stages: dict[str, Stage] = {}
+        self._ordered: list[Stage] = []
+        self._running: dict[int, MessageContext] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.stats: dict[str, StageStats] = {}
+
+    def __repr__(self) -> str:
+        return f"<MessagePipeline stages={[stage.name for stage in self._ordered]}>"
+
+    @property
+    def stages(self) -> list[Stage]:
+        return list(self._ordered)
+
+    def register(
+        self,
+        name: str,
+        callback: StageCallback,
+        *,
+        order: int,
+        budget: float | None = None,
+        bots: bool = False,
+        dms: bool = False,
+        background: bool = False,
+        self_messages: bool = False,
+    ) -> None:
+        """Add a stage, replacing any stage of the same name (e.g. when a cog is reloaded)."""
+        self._stages[name] = Stage(
+            name,
+            callback,
+            order,
+            self.default_budget if budget is None else budget,
+            bots=bots,
+            dms=dms,
+            background=background,
+            self_messages=self_messages,
+        )
+        self._ordered = sorted(self._stages.values(), key=lambda stage: stage.order)
+        self.stats.setdefault(name, StageStats())
+
+    def unregister(self, name: str) -> None:
+        if self._stages.pop(name, None) is not None:
+            self._ordered = sorted(self._stages.values(), key=lambda stage: stage.order)
+
+    def mark_deleted(self, message_id: int) -> None:
+        """Skip the remaining stages of a message that was deleted while it was being processed."""
+        if ctx := self._running.get(message_id):
+            ctx.deleted = True
+
+    async def _run_stage(self, stage: Stage, ctx: MessageContext) -> None:
+        start = time.perf_counter()
+        try:
+            await stage.callback(ctx)
+        except Exception:
+            self.stats[stage.name].errors += 1
+            log.exception("Stage %s failed on message %s", stage.name, ctx.message.id)
+        finally:
+            elapsed = time.perf_counter() - start
+            ctx.timings[stage.name] = elapsed
+            self.stats[stage.name].record(elapsed, budget=stage.budget)
+            if elapsed > stage.budget:
+                log.warning(
+                    "Stage %s took %.3fs on message %s (budget %.3fs)",
+                    stage.name,
+                    elapsed,
+                    ctx.message.id,
+                    stage.budget,
+                )
+
+    async def run(self, message: discord.Message) -> MessageContext:
+        ctx = MessageContext(self.bot, message)
+        if not self.bot.is_ready():
+            await self.bot.wait_until_ready()
+
+        self._running[message.id] = ctx
+        try:
+            for stage in self._ordered:
+                if ctx.done:
+                    self.stats[stage.name].skipped += 1
+                    continue
+                if not stage.accepts(ctx):
+                    continue
+
+                if stage.background:
+                    task = asyncio.create_task(self._run_stage(stage, ctx), name=f"pipeline-{stage.name}-{message.id}")
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                else:
+                    await self._run_stage(stage, ctx)
+        finally:
+            self._running.pop(message.id, None)
+
+        return ctx
+
+    def report(self) -> list[tuple[str, int, int, int, int, float, float]]:
+        """``(name, calls, skipped, errors, over budget, average, max)`` of every registered stage."""
+        return [
+            (
+                stage.name,
+                (stats := self.stats[stage.name]).calls,
+                stats.skipped,
+                stats.errors,
+                stats.over_budget,
+                stats.average,
+                stats.max,
+            )
+            for stage in self._ordered
+        ]
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from array import array
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+from lru import LRU
+
+if TYPE_CHECKING:
+    from utilities.sqlite import Database
+
+log = logging.getLogger("utilities.nsfw.sampler")
+
+__all__ = ("LinkSampler", "LinkPrefetcher", "RecentWindow")
+
+
+class RecentWindow:
+    """The last ``size`` row ids sent to a channel, with O(1) membership."""
+
+    __slots__ = ("_order", "_seen")
+
+    def __init__(self, size: int) -> None:
+        self._order: deque[int] = deque(maxlen=size)
+        self._seen: set[int] = set()
+
+    def __contains__(self, row_id: int) -> bool:
+        return row_id in self._seen
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def add(self, row_id: int) -> None:
+        if row_id in self._seen or not self._order.maxlen:
+            return
+        if len(self._order) == self._order.maxlen:
+            self._seen.discard(self._order[0])
+        self._order.append(row_id)
+        self._seen.add(row_id)
+
+
+class LinkSampler:
+    """Random rows of a link table without ``ORDER BY RANDOM()``.
+
+    The row ids of ``table`` are kept in memory (one array per ``group_by`` value, if given),
+    so picking a row is an index into an array followed by a primary key lookup. Call
+    :meth:`refresh` after inserting rows; only ids newer than the last refresh are read.
+
+    Each channel gets a :class:`RecentWindow` so the same link is not sent there again
+    within the last ``window`` picks, as long as the pool is large enough to avoid it.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        table: str,
+        *,
+        group_by: str | None = None,
+        window: int = 50,
+        attempts: int = 8,
+        channels: int = 2**10,
+    ) -> None:
+        self.db = db
+        self.table = table
+        self.group_by = group_by
+        self.window = window
+        self.attempts = attempts
+
+        self._ids: dict[str | None, array[int]] = {}
+        self._last_id = 0
+        # concurrent refreshes would read the same _last_id and append the new ids twice
+        self._refresh_lock = asyncio.Lock()
+        self._recent: LRU = LRU(channels)
+        self._random = random.Random()
+
+    def __repr__(self) -> str:
+        return f"<LinkSampler table={self.table!r} rows={len(self)} groups={len(self._ids)}>"
+
+    def __len__(self) -> int:
+        return sum(len(ids) for ids in self._ids.values())
+
+    def groups(self) -> list[str]:
+        return sorted(group for group in self._ids if group is not None)
+
+    def count(self, group: str | None = None) -> int:
+        return len(self._ids.get(group, ()))
+
+    async def refresh(self, *, full: bool = False) -> int:
+        """Load row ids added since the last refresh. Returns the number of new rows."""
+        async with self._refresh_lock:
+            if full:
+                self._ids.clear()
+                self._last_id = 0
+
+            column = self.group_by or "NULL"
+            rows = await self.db.fetchall(
+                f"SELECT id, {column} FROM {self.table} WHERE id > ? ORDER BY id",
+                (self._last_id,),
+            )
+            for row_id, group in rows:
+                key = group.lower() if isinstance(group, str) else None
+                if key not in self._ids:
+                    self._ids[key] = array("q")
+                self._ids[key].append(row_id)
+
+            if rows:
+                self._last_id = rows[-1][0]
+                log.debug("Loaded %s new rows from %s (%s total)", len(rows), self.table, len(self))
+            return len(rows)
+
+    def recently_sent(self, channel_id: int | None, row_id: int) -> bool:
+        if channel_id is None:
+            return False
+        window: RecentWindow | None = self._recent.get(channel_id)
+        return window is not None and row_id in window
+
+    def mark_sent(self, channel_id: int | None, row_id: int) -> None:
+        if channel_id is None:
+            return
+        window: RecentWindow | None = self._recent.get(channel_id)
+        if window is None:
+            window = self._recent[channel_id] = RecentWindow(self.window)
+        window.add(row_id)
+
+    def pick(self, group: str | None = None, *, channel_id: int | None = None) -> int | None:
+        """A random row id of ``group``, avoiding the ones recently sent to ``channel_id``.
+
+        If every attempt lands in the channel's window (the pool is barely larger than the
+        window), the last pick is used anyway.
+        """
+        ids = self._ids.get(group)
+        if not ids:
+            return None
+
+        row_id = ids[self._random.randrange(len(ids))]
+        for _ in range(self.attempts - 1):
+            if not self.recently_sent(channel_id, row_id):
+                break
+            row_id = ids[self._random.randrange(len(ids))]
+
+        self.mark_sent(channel_id, row_id)
+        return row_id
+
+    async def link(self, row_id: int) -> str | None:
+        return await self.db.fetchval(f"SELECT link FROM {self.table} WHERE id = ?", (row_id,))
+
+    async def sample(self, group: str | None = None, *, channel_id: int | None = None) -> str | None:
+        row_id = self.pick(group, channel_id=channel_id)
+        return None if row_id is None else await self.link(row_id)
+
+
+class LinkPrefetcher:
+    """A small ring of links from ``sampler`` that are already downloaded.
+
+    The ring is refilled in the background after every :meth:`get`, so the download for the
+    next command overlaps with handling the current one. ``fetch`` returns the body of a link,
+    or ``None`` if it could not be downloaded.
+    """
+
+    def __init__(
+        self,
+        sampler: LinkSampler,
+        fetch: Callable[[str], Awaitable[bytes | None]],
+        *,
+        size: int = 3,
+    ) -> None:
+        self.sampler = sampler
+        self.fetch = fetch
+        self.size = size
+
+        self._ring: deque[tuple[int, str, bytes]] = deque()
+        self._task: asyncio.Task[None] | None = None
+        self.metrics: Counter[str] = Counter()
+
+    def __repr__(self) -> str:
+        return f"<LinkPrefetcher ready={len(self._ring)}/{self.size} metrics={dict(self.metrics)}>"
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+    def fill(self) -> None:
+        """Start refilling the ring in the background, unless it is already being refilled."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._fill())
+
+    async def _download(self, row_id: int) -> tuple[str, bytes] | None:
+        link = await self.sampler.link(row_id)
+        if link is None:
+            return None
+        data = await self.fetch(link)
+        if data is None:
+            self.metrics["failed"] += 1
+            return None
+        return link, data
+
+    async def _fill(self) -> None:
+        failures = 0
+        while len(self._ring) < self.size and failures < self.size:
+            row_id = self.sampler.pick()
+            if row_id is None:
+                return
+            try:
+                result = await self._download(row_id)
+            except Exception:
+                log.exception("Failed to prefetch row %s of %s", row_id, self.sampler.table)
+                result = None
+
+            if result is None:
+                failures += 1
+                continue
+            self._ring.append((row_id, *result))
+            self.metrics["prefetched"] += 1
+
+    async def wait(self) -> None:
+        """Wait for the current refill, if any."""
+        if self._task is not None:
+            await asyncio.shield(self._task)
+
+    async def get(self, *, channel_id: int | None = None) -> tuple[str, bytes] | None:
+        """A ``(link, body)`` pair not recently sent to ``channel_id``."""
+        for _ in range(len(self._ring)):
+            row_id, link, data = self._ring.popleft()
+            if self.sampler.recently_sent(channel_id, row_id):
+                # still good for another channel
+                self._ring.append((row_id, link, data))
+                continue
+
+            self.sampler.mark_sent(channel_id, row_id)
+            self.metrics["hit"] += 1
+            self.fill()
+            return link, data
+
+        self.metrics["miss"] += 1
+        self.fill()
+        for _ in range(self.sampler.attempts):
+            row_id = self.sampler.pick(channel_id=channel_id)
+            if row_id is None:
+                return None
+            if result := await self._download(row_id):
+                return result
+        return None
+
+    def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._ring.clear()
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import datetime
+import logging
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Iterable, Mapping
+from typing import Any
+
+import aiosqlite
+
+log = logging.getLogger("utilities.sqlite")
+
+__all__ = ("Database", "DEFAULT_PRAGMAS")
+
+# Applied to every connection, ``journal_mode`` is persistent and only set by the writer.
+DEFAULT_PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    "cache_size": -16000,  # KiB
+    "temp_store": "MEMORY",
+    "mmap_size": 2**28,
+}
+
+Params = Iterable[Any] | Mapping[str, Any]
+
+
+class Database:
+    """``cached.sqlite`` behind one writer connection and a pool of read-only connections.
+
+    With WAL a reader never waits for the writer, so a bulk insert does not hold up a
+    scam link lookup. Every connection keeps its own prepared statement cache
+    (``cached_statements``). Queries slower than ``slow_query`` seconds are logged.
+
+    ``execute``/``executemany``/``executescript``/``commit`` go to the writer, as they did
+    when this was a bare :class:`aiosqlite.Connection`; use ``fetchone``/``fetchall``/
+    ``fetchval`` for plain reads.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        readers: int = 4,
+        pragmas: Mapping[str, str | int] | None = None,
+        cached_statements: int = 2**10,
+        slow_query: float = 0.1,
+    ) -> None:
+        self.path = path
+        self.readers = 0 if path == ":memory:" else readers
+        self.pragmas: dict[str, str | int] = {**DEFAULT_PRAGMAS, **(pragmas or {})}
+        self.cached_statements = cached_statements
+        self.slow_query = slow_query
+
+        self._writer: aiosqlite.Connection | None = None
+        self._readers: list[aiosqlite.Connection] = []
+        self._pool: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._write_lock = asyncio.Lock()
+
+        self.queries: Counter[str] = Counter()
+        self.query_time: Counter[str] = Counter()
+
+    def __repr__(self) -> str:
+        return f"<Database path={self.path!r} readers={len(self._readers)} queries={dict(self.queries)}>"
+
+    @property
+    def writer(self) -> aiosqlite.Connection:
+        if self._writer is None:
+            msg = "Database is not connected"
+            raise RuntimeError(msg)
+        return self._writer
+
+    async def _open(self, *, readonly: bool) -> aiosqlite.Connection:
+        if readonly:
+            conn = await aiosqlite.connect(
+                f"file:{self.path}?mode=ro",
+                uri=True,
+                iter_chunk_size=2**8,
+                cached_statements=self.cached_statements,
+            )
+        else:
+            conn = await aiosqlite.connect(self.path, iter_chunk_size=2**8, cached_statements=self.cached_statements)
+
+        for name, value in self.pragmas.items():
+            if readonly and name == "journal_mode":
+                continue
+            await conn.execute(f"PRAGMA {name} = {value}")
+        if readonly:
+            await conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    async def connect(self) -> Database:
+        self._writer = await self._open(readonly=False)
+        for _ in range(self.readers):
+            conn = await self._open(readonly=True)
+            self._readers.append(conn)
+            self._pool.put_nowait(conn)
+
+        log.info("Connected to %s with %s readers (%s)", self.path, len(self._readers), self.pragmas)
+        return self
+
+    @contextlib.asynccontextmanager
+    async def _timed(self, kind: str, query: str) -> AsyncIterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.queries[kind] += 1
+            self.query_time[kind] += elapsed
+            if elapsed > self.slow_query:
+                log.warning("Slow %s query (%.2fms): %s", kind, elapsed * 1000, query.strip())
+            else:
+                log.debug("%s query (%.2fms): %s", kind, elapsed * 1000, query.strip())
+
+    @contextlib.asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """A read-only connection from the pool, or the writer if there is no pool."""
+        if not self._readers:
+            yield self.writer
+            return
+
+        conn = await self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put_nowait(conn)
+
+    async def fetchall(self, query: str, params: Params = ()) -> list[Any]:
+        async with self.reader() as conn, self._timed("read", query):
+            async with conn.execute(query, params) as cursor:
+                return list(await cursor.fetchall())
+
+    async def fetchone(self, query: str, params: Params = ()) -> Any:
+        async with self.reader() as conn, self._timed("read", query):
+            async with conn.execute(query, params) as cursor:
+                return await cursor.fetchone()
+
+    async def fetchval(self, query: str, params: Params = (), *, default: Any = None) -> Any:
+        row = await self.fetchone(query, params)
+        return default if row is None else row[0]
+
+    async def execute(self, query: str, params: Params = ()) -> aiosqlite.Cursor:
+        async with self._write_lock, self._timed("write", query):
+            return await self.writer.execute(query, params)
+
+    async def executemany(self, query: str, params: Iterable[Params]) -> aiosqlite.Cursor:
+        async with self._write_lock, self._timed("write", query):
+            return await self.writer.executemany(query, params)
+
+    async def executescript(self, script: str) -> aiosqlite.Cursor:
+        async with self._write_lock, self._timed("write", script):
+            return await self.writer.executescript(script)
+
+    async def commit(self) -> None:
+        async with self._write_lock:
+            await self.writer.commit()
+
+    @contextlib.asynccontextmanager
+    async def transaction(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Hold the writer for a whole transaction. Commits on success, rolls back on error."""
+        async with self._write_lock:
+            try:
+                yield self.writer
+            except BaseException:
+                await self.writer.rollback()
+                raise
+            else:
+                await self.writer.commit()
+
+    async def prune(
+        self,
+        table: str,
+        *,
+        column: str = "created_at",
+        older_than: datetime.timedelta | None = None,
+        max_rows: int | None = None,
+    ) -> int:
+        """Delete rows of ``table`` older than ``older_than`` and all but the newest ``max_rows``."""
+        deleted = 0
+        async with self.transaction() as conn:
+            if older_than is not None:
+                cutoff = (datetime.datetime.now(datetime.timezone.utc) - older_than).strftime("%Y-%m-%d %H:%M:%S")
+                cursor = await conn.execute(f"DELETE FROM {table} WHERE {column} < ?", (cutoff,))
+                deleted += max(cursor.rowcount, 0)
+            if max_rows is not None:
+                cursor = await conn.execute(
+                    f"DELETE FROM {table} WHERE rowid NOT IN (SELECT rowid FROM {table} ORDER BY {column} DESC LIMIT ?)",
+                    (max_rows,),
+                )
+                deleted += max(cursor.rowcount, 0)
+
+        if deleted:
+            log.info("Pruned %s rows from %s", deleted, table)
+        return deleted
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            with contextlib.suppress(Exception):
+                await self._writer.execute("PRAGMA optimize")
+            await self._writer.close()
+            self._writer = None
+
+        for conn in self._readers:
+            await conn.close()
+        self._readers.clear()
+        self._pool = asyncio.Queue()
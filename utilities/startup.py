@@ -0,0 +1,145 @@
+"""Loads the extensions of the bot, and keeps track of how long each one took.
+
+Extensions are loaded concurrently. Importing a module is synchronous, so what overlaps is the
+time spent in ``cog_load`` waiting on the database with the imports of the other extensions.
+Extensions listed in ``lazy_extensions`` are not loaded before the bot connects; they are loaded
+once it is ready, so their heavy imports do not delay the gateway identify.
+
+Cogs can hand work that is not needed to answer the first message (cache warm ups, full
+collection scans) to :meth:`Startup.defer`; it runs after READY and is timed too.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import time
+import traceback
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TYPE_CHECKING, NamedTuple
+
+from discord.ext import commands
+
+if TYPE_CHECKING:
+    from core import Parrot
+
+log = logging.getLogger("utilities.startup")
+
+__all__ = ("ExtensionTiming", "Startup")
+
+# the extension whose setup is running in the current task, to attribute ``add_cog`` to it
+loading_extension: contextvars.ContextVar[str | None] = contextvars.ContextVar("loading_extension", default=None)
+
+
+class ExtensionTiming(NamedTuple):
+    name: str
+    # until the first cog is added: the import of the module and the construction of the cog
+    imported: float
+    # in ``add_cog``, mostly ``cog_load``
+    setup: float
+    total: float
+    lazy: bool = False
+    error: str | None = None
+
+
+class Startup:
+    def __init__(self, bot: Parrot, *, concurrency: int = 8) -> None:
+        self.bot = bot
+        self.concurrency = concurrency
+
+        self.started = time.perf_counter()
+        self.timings: dict[str, ExtensionTiming] = {}
+        self.warmups: dict[str, float] = {}
+        self.milestones: dict[str, float] = {}
+        self._reached: dict[str, asyncio.Event] = {}
+
+        self._first_cog: dict[str, float] = {}
+        self._cog_time: dict[str, float] = {}
+        self._deferred: list[tuple[str, Callable[[], Awaitable[object]]]] = []
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._ready = False
+
+    def __repr__(self) -> str:
+        return f"<Startup extensions={len(self.timings)} warmups={len(self.warmups)} milestones={self.milestones}>"
+
+    def mark(self, milestone: str) -> float:
+        """Record the seconds since the process started the bot, e.g. ``mark("ready")``."""
+        elapsed = self.milestones[milestone] = time.perf_counter() - self.started
+        log.info("Startup: %s after %.2fs", milestone, elapsed)
+        if (event := self._reached.get(milestone)) is not None:
+            event.set()
+        return elapsed
+
+    def reached(self, milestone: str) -> asyncio.Event:
+        """An event set once ``milestone`` is marked, already set if it was."""
+        if milestone not in self._reached:
+            self._reached[milestone] = asyncio.Event()
+            if milestone in self.milestones:
+                self._reached[milestone].set()
+        return self._reached[milestone]
+
+    def cog_added(self, extension: str, started: float, elapsed: float) -> None:
+        self._first_cog.setdefault(extension, started)
+        self._cog_time[extension] = self._cog_time.get(extension, 0) + elapsed
+
+    async def _load(self, name: str, *, lazy: bool) -> ExtensionTiming:
+        loading_extension.set(name)
+        start = time.perf_counter()
+        error = None
+        try:
+            await self.bot.load_extension(name)
+        except (commands.ExtensionFailed, commands.ExtensionNotFound, commands.NoEntryPointError) as e:
+            error = str(e)
+            traceback.print_exc()
+            log.error("Failed to load extension %s", name)
+        end = time.perf_counter()
+
+        timing = ExtensionTiming(
+            name,
+            imported=self._first_cog.get(name, end) - start,
+            setup=self._cog_time.get(name, 0),
+            total=end - start,
+            lazy=lazy,
+            error=error,
+        )
+        self.timings[name] = timing
+        log.info("Loaded extension %s in %.3fs (setup %.3fs)", name, timing.total, timing.setup)
+        return timing
+
+    async def load(self, extensions: Iterable[str], *, lazy: bool = False) -> list[ExtensionTiming]:
+        """Load ``extensions``, at most ``concurrency`` at a time. Failures are recorded, not raised."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def load(name: str) -> ExtensionTiming:
+            # gather runs each of these in its own task, so ``loading_extension`` does not leak
+            async with semaphore:
+                return await self._load(name, lazy=lazy)
+
+        return await asyncio.gather(*(load(name) for name in extensions))
+
+    def defer(self, name: str, warmup: Callable[[], Awaitable[object]]) -> None:
+        """Run ``warmup`` after READY, or right away if the bot is ready already."""
+        if self._ready:
+            task = asyncio.create_task(self._warm(name, warmup))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        else:
+            self._deferred.append((name, warmup))
+
+    async def _warm(self, name: str, warmup: Callable[[], Awaitable[object]]) -> None:
+        start = time.perf_counter()
+        try:
+            await warmup()
+        except Exception:
+            log.exception("Warm up %s failed", name)
+        self.warmups[name] = time.perf_counter() - start
+
+    async def run_deferred(self) -> None:
+        """Run every deferred warm up concurrently. Called once, when the bot is ready."""
+        self._ready = True
+        deferred, self._deferred = self._deferred, []
+        await asyncio.gather(*(self._warm(name, warmup) for name, warmup in deferred))
+
+    def slowest(self, count: int = 10) -> list[ExtensionTiming]:
+        return sorted(self.timings.values(), key=lambda timing: timing.total, reverse=True)[:count]
@@ -2,14 +2,16 @@ from __future__ import annotations
 
 import itertools
 import re
-from distutils.util import strtobool
 
-import numpy as np
-import pandas as pd
 import pyparsing
 from prettytable import PrettyTable
 from tabulate import tabulate
 
+from ..lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
 # dict of boolean operations
 # fmt: off
 OPERATIONS = {
@@ -28,6 +30,9 @@ OPERATIONS = {
 }
 # fmt: on
 
+TRUTHY = frozenset(("y", "yes", "t", "true", "on", "1"))
+FALSY = frozenset(("n", "no", "f", "false", "off", "0"))
+
 
 def recursive_map(func, data):
     """Recursively applies a map function to a list and all sublists."""
@@ -40,10 +45,12 @@ def string_to_bool(string):
     """Converts a string to boolean if string is either 'True' or 'False'
     otherwise returns it unchanged.
     """
-    try:
-        string = bool(strtobool(string))
-    except ValueError:
-        pass
+    # what ``distutils.util.strtobool`` accepted; importing distutils pulls in setuptools
+    value = string.lower()
+    if value in TRUTHY:
+        return True
+    if value in FALSY:
+        return False
     return string
 
 
@@ -0,0 +1,140 @@
+"""``wait_for`` that does not run every pending check on every event.
+
+discord.py keeps one list of ``(future, check)`` per event and calls every check in it for every
+event of that name, so a few hundred running games run a few hundred predicates for each message
+the bot sees. :class:`WaitRegistry` buckets the waits by ``(channel_id, user_id)`` as well, and an
+event is only checked against the waits for its channel and user, plus the waits that did not say.
+
+The check still decides; the bucket only narrows down which checks run. A wait scoped to a channel
+or user that the event cannot tell (see :data:`EVENT_KEYS`) falls back to the unscoped bucket.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from functools import partial
+from typing import Any, NamedTuple
+
+__all__ = ("EVENT_KEYS", "EventKey", "WaitRegistry")
+
+Check = Callable[..., bool]
+Waiter = tuple["asyncio.Future[Any]", Check]
+BucketKey = tuple[int | None, int | None]
+
+
+class EventKey(NamedTuple):
+    # (channel_id, user_id) of the event's arguments
+    get: Callable[..., BucketKey]
+    channel: bool = True
+    user: bool = True
+
+
+# fmt: off
+EVENT_KEYS: dict[str, EventKey] = {
+    "message"            : EventKey(lambda message: (message.channel.id, message.author.id)),
+    "message_delete"     : EventKey(lambda message: (message.channel.id, message.author.id)),
+    "message_edit"       : EventKey(lambda _, after: (after.channel.id, after.author.id)),
+    "reaction_add"       : EventKey(lambda reaction, user: (reaction.message.channel.id, user.id)),
+    "reaction_remove"    : EventKey(lambda reaction, user: (reaction.message.channel.id, user.id)),
+    "raw_reaction_add"   : EventKey(lambda payload: (payload.channel_id, payload.user_id)),
+    "raw_reaction_remove": EventKey(lambda payload: (payload.channel_id, payload.user_id)),
+    "typing"             : EventKey(lambda channel, user, _: (channel.id, user.id)),
+    "voice_state_update" : EventKey(lambda member, *_: (None, member.id), channel=False),
+    # dispatched by the highlight cog
+    "user_activity"      : EventKey(lambda channel, user: (channel.id, user.id)),
+}
+# fmt: on
+
+UNSCOPED: BucketKey = (None, None)
+
+
+def _always(*_: Any) -> bool:
+    return True
+
+
+class WaitRegistry:
+    def __init__(self) -> None:
+        self._waiters: dict[str, dict[BucketKey, list[Waiter]]] = {}
+        # how many checks ran, to compare with how many discord.py would have run
+        self.checks = 0
+        self.dispatched = 0
+
+    def __repr__(self) -> str:
+        return f"<WaitRegistry pending={len(self)} checks={self.checks}>"
+
+    def __len__(self) -> int:
+        return sum(len(waiters) for buckets in self._waiters.values() for waiters in buckets.values())
+
+    def pending(self, event: str) -> int:
+        return sum(len(waiters) for waiters in self._waiters.get(event, {}).values())
+
+    def wait_for(
+        self,
+        event: str,
+        *,
+        check: Check | None = None,
+        timeout: float | None = None,
+        channel_id: int | None = None,
+        user_id: int | None = None,
+    ) -> Any:
+        """Register a wait, and return the awaitable :meth:`discord.Client.wait_for` would."""
+        known = EVENT_KEYS.get(event)
+        key = UNSCOPED if known is None else (channel_id if known.channel else None, user_id if known.user else None)
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        waiter = (future, check or _always)
+        self._waiters.setdefault(event, {}).setdefault(key, []).append(waiter)
+        # timed out and cancelled waits leave right away, not on the next event in their bucket
+        future.add_done_callback(partial(self._discard, event, key, waiter))
+        return asyncio.wait_for(future, timeout)
+
+    def _discard(self, event: str, key: BucketKey, waiter: Waiter, _: asyncio.Future[Any]) -> None:
+        buckets = self._waiters.get(event)
+        waiters = buckets and buckets.get(key)
+        if not waiters:
+            return
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            return
+        if not waiters:
+            del buckets[key]
+            if not buckets:
+                del self._waiters[event]
+
+    def dispatch(self, event: str, args: tuple[Any, ...]) -> None:
+        buckets = self._waiters.get(event)
+        if not buckets:
+            return
+        self.dispatched += 1
+
+        known = EVENT_KEYS.get(event)
+        if known is None:
+            keys: dict[BucketKey, None] = {UNSCOPED: None}
+        else:
+            try:
+                channel_id, user_id = known.get(*args)
+            except AttributeError:
+                channel_id = user_id = None
+            keys = dict.fromkeys(((channel_id, user_id), (channel_id, None), (None, user_id), UNSCOPED))
+
+        for key in keys:
+            waiters = buckets.get(key)
+            if waiters:
+                # resolved futures remove themselves from the list from their done callback
+                for future, check in tuple(waiters):
+                    if not future.done():
+                        self._check(future, check, args)
+
+    def _check(self, future: asyncio.Future[Any], check: Check, args: tuple[Any, ...]) -> None:
+        self.checks += 1
+        try:
+            result = check(*args)
+        except Exception as e:
+            future.set_exception(e)
+            return
+
+        if result:
+            # the same shape as discord.py: nothing, the argument, or a tuple of them
+            future.set_result(None if not args else args[0] if len(args) == 1 else args)